@@ -0,0 +1,5 @@
+"""
+R³ Diary 백엔드 벤치마크
+
+backend/ 디렉토리에서 `python -m benchmarks.<모듈>` 로 실행합니다.
+"""
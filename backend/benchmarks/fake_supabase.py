@@ -0,0 +1,465 @@
+"""
+부하 테스트용 Supabase(Auth + PostgREST) 대역 서버
+
+실제 Supabase 프로젝트 대신 로컬에서 띄우는 인메모리 서버입니다.
+테이블과 기본값은 src/db/schema.sql 과 migrations/*.sql 의 CREATE TABLE 문에서 읽고,
+profiles / diary_recipients / daily_logs / survey_* 테이블에 결정적인 픽스처를 채웁니다.
+백엔드는 SUPABASE_URL만 이 서버로 돌리면 supabase-py 클라이언트를 그대로 사용합니다.
+
+지원 범위 (백엔드가 실제로 쓰는 부분만):
+    GET  /auth/v1/user                      Bearer 토큰 → 사용자
+    GET/POST/PATCH/DELETE /rest/v1/{table}  eq/neq/gt/gte/lt/lte/in/is 필터,
+                                            select, order, limit/offset, count=exact,
+                                            return=representation, merge-duplicates upsert
+RLS와 트랜잭션은 흉내내지 않습니다.
+
+    cd backend
+    python -m benchmarks.fake_supabase --port 54321 --users 500
+    SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=<출력된 anon key> uvicorn src.main:app
+"""
+import argparse
+import asyncio
+import base64
+import datetime
+import json
+import random
+import re
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+SCHEMA_FILES = [
+    Path(__file__).parent.parent / "src" / "db" / "schema.sql",
+    *sorted((Path(__file__).parent.parent / "src" / "db" / "migrations").glob("*.sql")),
+]
+
+# backend/daily/ 에 Markdown 파일이 있는 날짜 (markdown 시나리오가 404가 되지 않도록)
+FIXTURE_DATE = datetime.date(2026, 1, 31)
+ROLES = ["student", "office_worker", "freelancer"]
+BIRTH_PLACES = ["서울", "부산", "대구", "인천", "광주", "대전"]
+TOKEN_PREFIX = "loadtest-"
+
+_CREATE_TABLE = re.compile(r"CREATE TABLE (?:IF NOT EXISTS )?(\w+)\s*\((.*?)\n\);", re.S | re.I)
+_COLUMN = re.compile(r"^\s*(\w+)\s+([A-Za-z]+)(.*)$")
+_DEFAULT = re.compile(r"DEFAULT\s+('(?:[^']*)'(?:::\w+)?|[\w.]+\(\)|[\w.-]+)", re.I)
+_CONSTRAINT_WORDS = {"UNIQUE", "PRIMARY", "CONSTRAINT", "CHECK", "FOREIGN"}
+
+
+def _anon_key() -> str:
+    """supabase-py의 키 형식 검사를 통과하는 서명 없는 JWT 모양 키"""
+    def part(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    return f"{part({'alg': 'HS256', 'typ': 'JWT'})}.{part({'role': 'anon', 'iss': 'fake-supabase'})}.loadtest"
+
+
+ANON_KEY = _anon_key()
+
+
+def user_token(user_id: str) -> str:
+    """픽스처 사용자의 액세스 토큰"""
+    return f"{TOKEN_PREFIX}{user_id}"
+
+
+@dataclass
+class TableSchema:
+    """
+    CREATE TABLE 문에서 읽은 테이블 정의
+
+    Attributes:
+        name: 테이블 이름
+        columns: 컬럼 이름 (선언 순서)
+        defaults: 컬럼 → 기본값 생성 함수
+    """
+    name: str
+    columns: List[str]
+    defaults: Dict[str, Callable[[], Any]] = field(default_factory=dict)
+
+
+def _parse_default(expr: str) -> Optional[Callable[[], Any]]:
+    lowered = expr.lower()
+    if lowered.startswith("uuid_generate_v4") or lowered.startswith("gen_random_uuid"):
+        return lambda: str(uuid.uuid4())
+    if lowered.startswith("now"):
+        return lambda: datetime.datetime.now(datetime.timezone.utc).isoformat()
+    if expr.startswith("'"):
+        literal = expr[1:expr.index("'", 1)]
+        if expr.endswith("::jsonb") or expr.endswith("::json"):
+            value = json.loads(literal)
+            return lambda: json.loads(json.dumps(value))
+        return lambda: literal
+    if lowered in ("true", "false"):
+        return lambda: lowered == "true"
+    try:
+        number = int(expr)
+    except ValueError:
+        return None
+    return lambda: number
+
+
+def parse_schema(paths: List[Path] = SCHEMA_FILES) -> Dict[str, TableSchema]:
+    """
+    SQL 파일에서 테이블/컬럼/기본값 읽기
+
+    Args:
+        paths: 읽을 .sql 파일 목록
+
+    Returns:
+        테이블 이름 → TableSchema
+    """
+    tables: Dict[str, TableSchema] = {}
+    for path in paths:
+        for name, body in _CREATE_TABLE.findall(path.read_text(encoding="utf-8")):
+            table = TableSchema(name=name, columns=[])
+            for line in body.splitlines():
+                line = line.split("--", 1)[0]
+                match = _COLUMN.match(line)
+                if not match or match.group(1).upper() in _CONSTRAINT_WORDS:
+                    continue
+                column = match.group(1)
+                table.columns.append(column)
+                default = _DEFAULT.search(match.group(3))
+                factory = _parse_default(default.group(1)) if default else None
+                if factory is not None:
+                    table.defaults[column] = factory
+            tables[name] = table
+    return tables
+
+
+class FakeSupabaseStore:
+    """
+    테이블별 행 목록을 메모리에 보관하는 저장소
+
+    Attributes:
+        schema: 테이블 정의
+        tables: 테이블 이름 → 행 목록
+        users: 액세스 토큰 → GoTrue 사용자 JSON
+    """
+
+    def __init__(self, schema: Optional[Dict[str, TableSchema]] = None):
+        self.schema = schema if schema is not None else parse_schema()
+        self.tables: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.schema}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def new_row(self, table: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """기본값을 채운 새 행 (저장하지 않음)"""
+        schema = self.schema[table]
+        row = {column: None for column in schema.columns}
+        for column, factory in schema.defaults.items():
+            row[column] = factory()
+        row.update(values)
+        return row
+
+    def add_user(self, user_id: str, email: str, name: str) -> str:
+        """인증 사용자 등록 후 액세스 토큰 반환"""
+        token = user_token(user_id)
+        self.users[token] = {
+            "id": user_id,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "app_metadata": {"provider": "email"},
+            "user_metadata": {"name": name},
+            "created_at": "2025-01-01T00:00:00+00:00",
+        }
+        return token
+
+    def insert(self, table: str, rows: List[Dict[str, Any]], upsert_on: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """행 추가 (upsert_on이 있으면 해당 컬럼이 같은 행을 갱신)"""
+        saved = []
+        with self._lock:
+            existing = self.tables[table]
+            for values in rows:
+                if upsert_on:
+                    match = next((r for r in existing if all(r.get(c) == values.get(c) for c in upsert_on)), None)
+                    if match is not None:
+                        match.update(values)
+                        saved.append(match)
+                        continue
+                row = self.new_row(table, values)
+                existing.append(row)
+                saved.append(row)
+        return saved
+
+    def select(self, table: str, filters: List[Callable[[Dict[str, Any]], bool]]) -> List[Dict[str, Any]]:
+        rows = self.tables[table]
+        return [row for row in rows if all(f(row) for f in filters)]
+
+    def update(self, table: str, filters: List[Callable[[Dict[str, Any]], bool]], values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.select(table, filters)
+            for row in rows:
+                row.update(values)
+        return rows
+
+    def delete(self, table: str, filters: List[Callable[[Dict[str, Any]], bool]]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.select(table, filters)
+            removed = {id(row) for row in rows}
+            self.tables[table] = [row for row in self.tables[table] if id(row) not in removed]
+        return rows
+
+
+def seed_fixtures(store: FakeSupabaseStore, users: int = 100, seed: int = 0,
+                  log_date: datetime.date = FIXTURE_DATE) -> List[Dict[str, str]]:
+    """
+    결정적인 픽스처 채우기
+
+    사용자마다 profiles 1행, 기본 diary_recipients 1행, log_date의 daily_logs 1행을 만들고,
+    활성 설문 1개와 사용자 수만큼의 응답을 survey_* 테이블에 넣습니다.
+
+    Args:
+        store: 대상 저장소
+        users: 사용자 수
+        seed: 난수 시드
+        log_date: 일간 기록 날짜
+
+    Returns:
+        [{"user_id", "token", "role", "recipient_id"}] (부하 시나리오용)
+    """
+    rng = random.Random(seed)
+    accounts = []
+    survey_id = str(uuid.UUID(int=rng.getrandbits(128)))
+    store.insert("survey_configurations", [{
+        "id": survey_id,
+        "name": "부하 테스트 설문",
+        "status": "active",
+        "form_json": {"questions": [{"id": "q1", "type": "choice"}]},
+        "response_count": users,
+    }])
+
+    for index in range(users):
+        user_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        recipient_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        name = f"사용자{index:04d}"
+        role = rng.choice(ROLES)
+        birth = {
+            "birth_date": (datetime.date(1960, 1, 1) + datetime.timedelta(days=rng.randrange(18000))).isoformat(),
+            "birth_time": f"{rng.randrange(24):02d}:{rng.choice((0, 30)):02d}:00",
+            "gender": rng.choice(("male", "female")),
+            "birth_place": rng.choice(BIRTH_PLACES),
+        }
+        token = store.add_user(user_id, f"user{index:04d}@loadtest.local", name)
+        store.insert("profiles", [{"id": user_id, "name": name, "roles": [role], **birth}])
+        store.insert("diary_recipients", [{
+            "id": recipient_id, "owner_id": user_id, "name": name, "role": role,
+            "relationship": "self", "is_default": True, **birth,
+        }])
+        store.insert("daily_logs", [{
+            "profile_id": user_id, "date": log_date.isoformat(), "schedule": "09:00 회의",
+            "todos": ["운동", "독서"], "mood": rng.randint(1, 5), "energy": rng.randint(1, 5),
+        }])
+        store.insert("survey_responses", [{
+            "survey_id": survey_id, "user_id": user_id, "source": "web",
+            "response_data": {"q1": rng.choice("abc")},
+        }])
+        accounts.append({"user_id": user_id, "token": token, "role": role, "recipient_id": recipient_id})
+    return accounts
+
+
+# ============================================================================
+# PostgREST 쿼리 해석
+# ============================================================================
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+
+def _as_text(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _compare(left: Any, right: str) -> Tuple[Any, Any]:
+    if isinstance(left, (int, float)) and not isinstance(left, bool):
+        try:
+            return left, float(right)
+        except ValueError:
+            pass
+    return _as_text(left), right
+
+
+def _build_filter(column: str, expr: str) -> Callable[[Dict[str, Any]], bool]:
+    negate = expr.startswith("not.")
+    if negate:
+        expr = expr[4:]
+    op, _, operand = expr.partition(".")
+
+    if op == "eq":
+        test = lambda v: _as_text(v) == operand
+    elif op == "neq":
+        test = lambda v: _as_text(v) != operand
+    elif op in ("gt", "gte", "lt", "lte"):
+        def test(v):
+            if v is None:
+                return False
+            left, right = _compare(v, operand)
+            return {"gt": left > right, "gte": left >= right, "lt": left < right, "lte": left <= right}[op]
+    elif op == "in":
+        options = {item.strip().strip('"') for item in operand.strip("()").split(",")}
+        test = lambda v: _as_text(v) in options
+    elif op == "is":
+        test = lambda v: _as_text(v) == operand
+    else:
+        raise ValueError(f"지원하지 않는 연산자: {op}")
+
+    if negate:
+        return lambda row: not test(row.get(column))
+    return lambda row: test(row.get(column))
+
+
+def _parse_query(request: Request) -> Tuple[List[Callable[[Dict[str, Any]], bool]], Dict[str, str]]:
+    filters = []
+    options = {}
+    for key, value in request.query_params.multi_items():
+        if key in _RESERVED_PARAMS:
+            options[key] = value
+        else:
+            filters.append(_build_filter(key, value))
+    return filters, options
+
+
+def _project(rows: List[Dict[str, Any]], select: str) -> List[Dict[str, Any]]:
+    columns = [c.strip().strip('"') for c in select.split(",") if c.strip()]
+    if not columns or "*" in columns:
+        return [dict(row) for row in rows]
+    return [{c: row.get(c) for c in columns} for row in rows]
+
+
+def _order(rows: List[Dict[str, Any]], order: str) -> List[Dict[str, Any]]:
+    for term in reversed(order.split(",")):
+        column, *modifiers = term.split(".")
+        descending = "desc" in modifiers
+        rows = sorted(rows, key=lambda r: (r.get(column) is None, _as_text(r.get(column))), reverse=descending)
+    return rows
+
+
+def _prefer(request: Request) -> Dict[str, str]:
+    prefs = {}
+    for item in request.headers.get("prefer", "").split(","):
+        key, _, value = item.strip().partition("=")
+        if key:
+            prefs[key] = value
+    return prefs
+
+
+def _pgrst_error(status_code: int, code: str, message: str) -> JSONResponse:
+    return JSONResponse({"code": code, "message": message, "details": None, "hint": None}, status_code=status_code)
+
+
+def create_app(store: FakeSupabaseStore, latency_ms: float = 0.0) -> Starlette:
+    """
+    Auth + PostgREST 대역 ASGI 앱
+
+    Args:
+        store: 데이터 저장소
+        latency_ms: 응답마다 추가할 지연 (실제 Supabase 왕복 시간 모사)
+
+    Returns:
+        Starlette 앱
+    """
+    delay = latency_ms / 1000
+
+    async def _wait():
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def get_user(request: Request) -> Response:
+        await _wait()
+        token = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        user = store.users.get(token)
+        if user is None:
+            return JSONResponse({"code": 401, "error_code": "bad_jwt", "msg": "invalid JWT"}, status_code=401)
+        return JSONResponse(user)
+
+    async def table(request: Request) -> Response:
+        await _wait()
+        name = request.path_params["table"]
+        if name not in store.tables:
+            return _pgrst_error(404, "PGRST205", f"Could not find the table 'public.{name}' in the schema cache")
+        try:
+            filters, options = _parse_query(request)
+        except ValueError as e:
+            return _pgrst_error(400, "PGRST100", str(e))
+        prefer = _prefer(request)
+        method = request.method
+
+        if method == "GET":
+            rows = store.select(name, filters)
+            total = len(rows)
+            if "order" in options:
+                rows = _order(rows, options["order"])
+            offset = int(options.get("offset", 0))
+            limit = options.get("limit")
+            rows = rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+        elif method == "POST":
+            body = await request.json()
+            records = body if isinstance(body, list) else [body]
+            upsert_on = None
+            if prefer.get("resolution") == "merge-duplicates":
+                upsert_on = options.get("on_conflict", "id").split(",")
+            rows = store.insert(name, records, upsert_on)
+            total, offset = len(rows), 0
+        elif method == "PATCH":
+            rows = store.update(name, filters, await request.json())
+            total, offset = len(rows), 0
+        else:
+            rows = store.delete(name, filters)
+            total, offset = len(rows), 0
+
+        headers = {}
+        if prefer.get("count") == "exact" or method == "GET":
+            end = offset + len(rows) - 1
+            span = f"{offset}-{end}" if rows else "*"
+            headers["Content-Range"] = f"{span}/{total if prefer.get('count') == 'exact' else '*'}"
+
+        status_code = 201 if method == "POST" else 200
+        if method != "GET" and prefer.get("return") != "representation":
+            return Response(status_code=204 if method != "POST" else 201, headers=headers)
+
+        payload = _project(rows, options.get("select", "*"))
+        if "vnd.pgrst.object" in request.headers.get("accept", ""):
+            if len(payload) != 1:
+                return _pgrst_error(406, "PGRST116", "JSON object requested, multiple (or no) rows returned")
+            return JSONResponse(payload[0], status_code=status_code, headers=headers)
+        return JSONResponse(payload, status_code=status_code, headers=headers)
+
+    return Starlette(routes=[
+        Route("/auth/v1/user", get_user, methods=["GET"]),
+        Route("/rest/v1/{table}", table, methods=["GET", "POST", "PATCH", "DELETE"]),
+    ])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="부하 테스트용 Supabase 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--users", type=int, default=100, help="픽스처 사용자 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="응답마다 추가할 지연 (ms)")
+    parser.add_argument("--accounts", type=Path, help="사용자/토큰 목록을 저장할 JSON 경로 (loadtest --accounts)")
+    args = parser.parse_args(argv)
+
+    store = FakeSupabaseStore()
+    accounts = seed_fixtures(store, users=args.users, seed=args.seed)
+    if args.accounts:
+        args.accounts.write_text(json.dumps(accounts, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"SUPABASE_URL=http://{args.host}:{args.port}")
+    print(f"SUPABASE_KEY={ANON_KEY}")
+    uvicorn.run(create_app(store, latency_ms=args.latency_ms), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""
+콜드 스타트 import 시간 프로파일
+
+새 인터프리터에서 `python -X importtime -c "import <모듈>"` 을 실행하고
+stderr 출력을 파싱해 누적 시간이 큰 모듈과 무거운 의존성 로드 여부를 보고합니다.
+
+    cd backend
+    python -m benchmarks.import_profile --top 20
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# 앱 시작 시 로드되면 안 되는 무거운 의존성 (첫 요청 시 로드)
+HEAVY_MODULES = (
+    "numpy",
+    "markdown",
+    "weasyprint",
+    "reportlab",
+    "PIL",
+    "pypdf",
+    "konlpy",
+    "openai",
+    "generator",
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """-X importtime 한 줄 (마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    -X importtime stderr 출력 파싱
+
+    Args:
+        output: "import time: self [us] | cumulative | imported package" 형식의 텍스트
+
+    Returns:
+        ImportTiming 리스트 (출력 순서, 헤더/기타 줄은 무시)
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        timings.append(ImportTiming(
+            module=module,
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+            depth=(len(name) - len(module)) // 2,
+        ))
+    return timings
+
+
+def profile_imports(module: str = "src.main") -> List[ImportTiming]:
+    """
+    새 인터프리터에서 module을 import하며 import 시간 측정
+
+    Raises:
+        RuntimeError: import 실패
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def summarize(timings: List[ImportTiming], module: str = "src.main", top: int = 15) -> Dict[str, Any]:
+    """
+    프로파일 요약
+
+    Returns:
+        total_ms: module의 누적 import 시간
+        heavy_loaded: 로드된 HEAVY_MODULES 목록
+        top: 누적 시간 상위 모듈 [{module, self_ms, cumulative_ms}]
+    """
+    loaded = {t.module for t in timings}
+    total = next((t.cumulative_us for t in timings if t.module == module), 0)
+    slowest = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    return {
+        "total_ms": round(total / 1000, 1),
+        "heavy_loaded": [name for name in HEAVY_MODULES if name in loaded],
+        "top": [
+            {
+                "module": t.module,
+                "self_ms": round(t.self_us / 1000, 1),
+                "cumulative_ms": round(t.cumulative_us / 1000, 1),
+            }
+            for t in slowest
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 프로파일")
+    parser.add_argument("--module", default="src.main", help="import할 모듈")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    args = parser.parse_args()
+    report = summarize(profile_imports(args.module), args.module, args.top)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
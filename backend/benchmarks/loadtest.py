@@ -0,0 +1,404 @@
+"""
+아침 피크 트래픽 부하 테스트 러너
+
+Supabase 대역 서버(benchmarks.fake_supabase)와 API를 로컬에서 띄우고,
+일간/기간/Markdown/PDF 요청을 섞은 시나리오를 개방형(open-loop) 도착 모델로 재생해
+처리량과 p50/p95/p99 지연을 보고합니다.
+
+도착 시각은 미리 정해지고, 지연은 "보내야 했던 시각"부터 잽니다.
+클라이언트 동시성 한도에 걸려 대기한 시간도 지연에 포함되므로
+서버가 밀릴 때 지연이 실제보다 좋게 보이지 않습니다 (coordinated omission 보정).
+
+    cd backend
+    python -m benchmarks.loadtest --rate 30 --duration 60
+    python -m benchmarks.loadtest --mix daily=70,range=20,pdf=10 --output peak.json
+
+외부 서버를 대상으로 할 때는 대역 서버가 저장한 사용자 목록을 넘깁니다:
+
+    python -m benchmarks.fake_supabase --port 54321 --accounts accounts.json
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 --accounts accounts.json
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.fake_supabase import ANON_KEY, FIXTURE_DATE, FakeSupabaseStore, create_app, seed_fixtures
+
+Account = Dict[str, str]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    요청 종류
+
+    Attributes:
+        name: 보고서 키
+        path: (계정, 기준 날짜) → 요청 경로
+    """
+    name: str
+    path: Callable[[Account, datetime.date], str]
+
+
+def _month_range(day: datetime.date) -> Tuple[datetime.date, datetime.date]:
+    start = day.replace(day=1)
+    end = (start + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+    return start, end
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in (
+        Scenario("daily", lambda a, d: f"/api/daily/{d}?role={a['role']}"),
+        Scenario("markdown", lambda a, d: f"/api/daily/{d}/markdown"),
+        Scenario("range", lambda a, d: "/api/daily/range/{}/{}?role={}".format(*_month_range(d), a["role"])),
+        Scenario("monthly", lambda a, d: f"/api/content/monthly/{d.year}/{d.month}?role={a['role']}"),
+        Scenario("logs", lambda a, d: f"/api/logs/{d}"),
+        Scenario("pdf", lambda a, d: f"/api/pdf/daily/{d}?role={a['role']}"),
+        Scenario("health", lambda a, d: "/health"),
+    )
+}
+
+# 아침 피크: 대부분 오늘의 일간 콘텐츠, 일부는 월간 범위와 PDF 다운로드
+MIXES = {
+    "morning": {"daily": 50, "markdown": 15, "logs": 15, "range": 8, "monthly": 5, "pdf": 5, "health": 2},
+    "daily": {"daily": 1},
+    "range": {"range": 1},
+    "markdown": {"markdown": 1},
+    "pdf": {"pdf": 1},
+}
+
+# (구간 길이 비율, 최대 도착률 대비 비율): 출근 전 증가 → 피크 → 완만한 감소
+PEAK_PROFILE = [(0.2, 0.3), (0.2, 0.7), (0.4, 1.0), (0.2, 0.5)]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    요청 비율 해석
+
+    Args:
+        spec: MIXES 이름 또는 "daily=60,range=10" 형식
+
+    Returns:
+        시나리오 이름 → 가중치
+    """
+    if spec in MIXES:
+        return dict(MIXES[spec])
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def arrival_schedule(rate: float, duration: float, seed: int = 0,
+                     profile: List[Tuple[float, float]] = PEAK_PROFILE) -> List[float]:
+    """
+    포아송 도착 시각 (초, 시작 기준)
+
+    Args:
+        rate: 피크 구간 초당 요청 수
+        duration: 전체 시간 (초)
+        seed: 난수 시드
+        profile: [(구간 길이 비율, 도착률 비율)]
+
+    Returns:
+        오름차순 도착 시각 목록
+    """
+    rng = random.Random(seed)
+    arrivals = []
+    start = 0.0
+    for share, level in profile:
+        end = start + duration * share
+        stage_rate = rate * level
+        t = start
+        while stage_rate > 0:
+            t += rng.expovariate(stage_rate)
+            if t >= end:
+                break
+            arrivals.append(t)
+        start = end
+    return arrivals
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+@dataclass
+class Sample:
+    """
+    요청 한 건의 결과
+
+    Attributes:
+        scenario: 시나리오 이름
+        status: HTTP 상태 (연결 실패/타임아웃은 0)
+        latency_ms: 예정 시각부터 응답 본문 수신까지
+        error: 전송 오류 메시지
+    """
+    scenario: str
+    status: int
+    latency_ms: float
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.status == 0 or self.status >= 500
+
+
+def _stats(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(s.latency_ms for s in samples)
+    statuses: Dict[str, int] = {}
+    for s in samples:
+        key = str(s.status) if s.status else "transport_error"
+        statuses[key] = statuses.get(key, 0) + 1
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for s in samples if s.failed),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """
+    전체/시나리오별 처리량과 지연 분위수
+
+    Args:
+        samples: 요청 결과
+        elapsed: 실행 시간 (초)
+
+    Returns:
+        {"overall": {...}, "scenarios": {이름: {...}}}
+    """
+    by_scenario: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        by_scenario.setdefault(sample.scenario, []).append(sample)
+    return {
+        "overall": _stats(samples, elapsed),
+        "scenarios": {name: _stats(group, elapsed) for name, group in sorted(by_scenario.items())},
+    }
+
+
+async def run_load(
+    base_url: str,
+    accounts: List[Account],
+    mix: Dict[str, float],
+    rate: float,
+    duration: float,
+    concurrency: int = 64,
+    seed: int = 0,
+    target_date: datetime.date = FIXTURE_DATE,
+    timeout: float = 60.0,
+) -> Tuple[List[Sample], float]:
+    """
+    시나리오 재생
+
+    Args:
+        base_url: API 주소
+        accounts: 사용자 목록 ({"token", "role", ...})
+        mix: 시나리오 → 가중치
+        rate: 피크 초당 요청 수
+        duration: 실행 시간 (초)
+        concurrency: 동시에 열어 둘 최대 요청 수
+        seed: 도착 시각/사용자/시나리오 선택 시드
+        target_date: 요청 기준 날짜
+        timeout: 요청당 타임아웃 (초)
+
+    Returns:
+        (요청 결과 목록, 실제 실행 시간 초)
+    """
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    plan = [
+        (at, SCENARIOS[rng.choices(names, weights)[0]], rng.choice(accounts))
+        for at in arrival_schedule(rate, duration, seed)
+    ]
+    samples: List[Sample] = []
+    gate = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def fire(at: float, scenario: Scenario, account: Account) -> None:
+            async with gate:
+                headers = {"Authorization": f"Bearer {account['token']}"}
+                try:
+                    response = await client.get(scenario.path(account, target_date), headers=headers)
+                    sample = Sample(scenario.name, response.status_code, 0.0)
+                except httpx.HTTPError as e:
+                    sample = Sample(scenario.name, 0, 0.0, error=f"{type(e).__name__}: {e}")
+            sample.latency_ms = (loop.time() - started - at) * 1000
+            samples.append(sample)
+
+        tasks = []
+        for at, scenario, account in plan:
+            delay = started + at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(fire(at, scenario, account)))
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - started
+
+    return samples, elapsed
+
+
+def _serve(app, **config) -> Tuple[Any, threading.Thread, str]:
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", **config))
+    thread = threading.Thread(target=server.run, name="loadtest-server", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("서버 시작 실패")
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+@contextmanager
+def local_stack(users: int = 100, db_latency_ms: float = 20.0, calculator: str = "stub",
+                seed: int = 0) -> Iterator[Tuple[str, List[Account]]]:
+    """
+    Supabase 대역 서버 + API 서버를 같은 프로세스의 스레드로 실행
+
+    API는 환경변수를 대역 서버로 돌린 뒤 src.main을 임포트해 띄우며, PDF 라우터도 켭니다.
+    stub 계산기는 프로세스 내 패치이므로 이 모드에서만 적용됩니다.
+
+    Args:
+        users: 픽스처 사용자 수
+        db_latency_ms: 대역 서버 응답 지연
+        calculator: 사주 계산기 (stub/real)
+        seed: 픽스처 시드
+
+    Yields:
+        (API 주소, 계정 목록)
+    """
+    from benchmarks.suite import saju_calculator
+
+    store = FakeSupabaseStore()
+    accounts = seed_fixtures(store, users=users, seed=seed)
+    servers = []
+    overrides = {"SUPABASE_KEY": ANON_KEY, "ENABLE_PDF_ROUTES": "1"}
+    saved = {key: os.environ.get(key) for key in (*overrides, "SUPABASE_URL")}
+    try:
+        fake, fake_thread, fake_url = _serve(create_app(store, latency_ms=db_latency_ms))
+        servers.append((fake, fake_thread))
+        os.environ.update(overrides, SUPABASE_URL=fake_url)
+
+        from src.db.supabase import SupabaseClient
+        SupabaseClient._instance = None
+        SupabaseClient._service_instance = None
+        from src.main import app
+
+        with saju_calculator(calculator):
+            api, api_thread, api_url = _serve(app)
+            servers.append((api, api_thread))
+            yield api_url, accounts
+    finally:
+        for server, thread in reversed(servers):
+            server.should_exit = True
+            thread.join(timeout=10)
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _format_report(report: Dict[str, Any]) -> str:
+    header = f"{'scenario':<10} {'reqs':>6} {'err':>5} {'rps':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  statuses"
+    lines = [header, "-" * len(header)]
+    rows = [*report["scenarios"].items(), ("TOTAL", report["overall"])]
+    for name, s in rows:
+        lines.append(
+            f"{name:<10} {s['requests']:>6} {s['errors']:>5} {s['throughput_rps']:>7.1f} "
+            f"{s['p50_ms']:>7.1f}ms {s['p95_ms']:>7.1f}ms {s['p99_ms']:>7.1f}ms {s['max_ms']:>7.1f}ms  "
+            + " ".join(f"{k}×{v}" for k, v in s["statuses"].items())
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="아침 피크 부하 테스트")
+    parser.add_argument("--mix", default="morning", help=f"{'/'.join(MIXES)} 또는 daily=60,range=10 (기본 morning)")
+    parser.add_argument("--rate", type=float, default=20.0, help="피크 초당 요청 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="실행 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=64, help="최대 동시 요청 수")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=FIXTURE_DATE, help="요청 기준 날짜")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--base-url", help="이미 실행 중인 API 주소 (없으면 로컬 스택 실행)")
+    parser.add_argument("--accounts", type=Path, help="--base-url 사용 시 fake_supabase --accounts 로 저장한 계정 목록")
+    parser.add_argument("--users", type=int, default=100, help="로컬 스택 픽스처 사용자 수")
+    parser.add_argument("--db-latency-ms", type=float, default=20.0, help="로컬 스택 Supabase 대역 지연")
+    parser.add_argument("--calculator", choices=("stub", "real"), default="stub", help="로컬 스택 사주 계산기")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    load = dict(mix=mix, rate=args.rate, duration=args.duration, concurrency=args.concurrency,
+                seed=args.seed, target_date=args.date)
+
+    if args.base_url:
+        if not args.accounts:
+            parser.error("--base-url 사용 시 --accounts 가 필요합니다")
+        accounts = json.loads(args.accounts.read_text(encoding="utf-8"))
+        samples, elapsed = asyncio.run(run_load(args.base_url, accounts, **load))
+        target = args.base_url
+    else:
+        with local_stack(args.users, args.db_latency_ms, args.calculator, args.seed) as (base_url, accounts):
+            samples, elapsed = asyncio.run(run_load(base_url, accounts, **load))
+        target = "local"
+
+    report = summarize(samples, elapsed)
+    report["meta"] = {
+        "target": target,
+        "mix": mix,
+        "peak_rate": args.rate,
+        "duration_s": round(elapsed, 2),
+        "concurrency": args.concurrency,
+        "date": args.date.isoformat(),
+        "python": sys.version.split()[0],
+        "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    print(_format_report(report))
+    errors = sorted({s.error for s in samples if s.error})
+    for error in errors[:5]:
+        print(f"  ! {error}")
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+"""
+기문둔갑 결과 메모리/할당 벤치마크
+
+기간(기본 31일)의 시간대별 기문 결과를 모두 보관했을 때
+남아 있는 메모리와 할당 블록 수, 소요 시간을 측정합니다.
+
+    cd backend
+    python -m benchmarks.qimen_memory --days 31
+"""
+import argparse
+import datetime
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.rhythm.qimen import calculate_daily_qimen
+from src.rhythm.qimen_complete import get_daily_complete_qimen
+
+BIRTH_DATE = datetime.date(1971, 11, 17)
+START_DATE = datetime.date(2026, 1, 1)
+
+
+def _measure(build: Callable[[datetime.date], Any], days: int) -> Dict[str, float]:
+    """
+    start부터 days일 동안 build(날짜) 결과를 보관하며 측정
+
+    Returns:
+        retained_kib: 결과를 보관한 상태의 순 메모리 증가량 (KiB)
+        blocks: 순 할당 블록 수
+        seconds: 소요 시간
+    """
+    dates = [START_DATE + datetime.timedelta(days=i) for i in range(days)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+
+    retained: List[Any] = [build(target_date) for target_date in dates]
+
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del retained
+    return {
+        "retained_kib": round(size / 1024, 1),
+        "blocks": blocks,
+        "seconds": round(elapsed, 4),
+    }
+
+
+def run(days: int = 31) -> Dict[str, Dict[str, float]]:
+    """시간대별(12) / 완전(12 × 9궁) 기문 결과 측정"""
+    return {
+        "daily_qimen": _measure(lambda d: calculate_daily_qimen(BIRTH_DATE, d), days),
+        "complete_qimen": _measure(lambda d: get_daily_complete_qimen(BIRTH_DATE, d), days),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기문 결과 메모리/할당 벤치마크")
+    parser.add_argument("--days", type=int, default=31, help="측정 기간 (일)")
+    args = parser.parse_args()
+    print(json.dumps(run(args.days), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+응답 직렬화/압축 벤치마크
+
+기간 API와 같은 모양의 페이로드(기본 31일, 역할 변환 포함)를 만들어
+기존 경로(jsonable_encoder → json.dumps)와 orjson 직렬화, gzip/brotli 압축의
+호출당 시간과 전송 크기를 비교합니다.
+
+    cd backend
+    python -m benchmarks.serialization --days 31 --output serialization.json
+"""
+import argparse
+import datetime
+import json
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.suite import BIRTH_INFO, ROLE, TARGET_DATE, measure, saju_calculator
+from src.utils.compression import BROTLI_AVAILABLE
+from src.utils.responses import ORJSON_AVAILABLE, dumps
+
+DEFAULT_DAYS = 31
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+
+def build_range_payload(days: int = DEFAULT_DAYS, role: Optional[str] = ROLE) -> List[Dict[str, Any]]:
+    """
+    기간 API(/api/daily/range) 응답과 같은 구조의 페이로드 생성
+
+    saju_calculator() 컨텍스트 안에서 호출해야 합니다.
+    """
+    from src.content.assembly import assemble_daily_content
+    from src.rhythm.qimen import calculate_daily_qimen, get_daily_summary
+    from src.rhythm.saju import analyze_daily_fortune, calculate_saju
+    from src.translation import translate_daily_content
+
+    payload = []
+    for offset in range(days):
+        target_date = TARGET_DATE + datetime.timedelta(days=offset)
+        saju_data = calculate_saju(BIRTH_INFO, target_date)
+        daily_rhythm = analyze_daily_fortune(BIRTH_INFO, target_date, saju_data)
+        hourly = calculate_daily_qimen(BIRTH_INFO.birth_date, target_date)
+        summary = get_daily_summary(BIRTH_INFO.birth_date, target_date, hourly)
+        qimen_summary = {key: summary.get(key) for key in ("best_direction", "avoid_direction", "peak_hours")}
+        content = assemble_daily_content(target_date, saju_data, daily_rhythm, qimen_summary)
+        if role:
+            content = translate_daily_content(content, role)
+        payload.append({
+            "date": target_date.isoformat(),
+            "role": role,
+            "content": content,
+            "qimen_slots": [result.to_dict() for result in hourly],
+            **qimen_summary,
+        })
+    return payload
+
+
+def _jsonable_body(payload: Any) -> bytes:
+    """FastAPI 기본 경로 (응답 모델 없음): jsonable_encoder 복사 후 JSONResponse 렌더링"""
+    from fastapi.encoders import jsonable_encoder
+    from starlette.responses import JSONResponse
+
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def run(days: int = DEFAULT_DAYS, rounds: int = 9) -> Dict[str, Any]:
+    """
+    직렬화/압축 측정
+
+    Returns:
+        {days, orjson, brotli, sizes: {identity, gzip, br}, results: {케이스: 통계}}
+    """
+    with saju_calculator("stub"):
+        payload = build_range_payload(days)
+
+    before = _jsonable_body(payload)
+    body = dumps(payload)
+    if json.loads(before) != json.loads(body):
+        raise AssertionError("orjson 직렬화 결과가 기존 경로와 다릅니다")
+
+    cases = {
+        "jsonable_encoder": lambda: _jsonable_body(payload),
+        "orjson": lambda: dumps(payload),
+        "gzip": lambda: zlib.compress(body, GZIP_LEVEL),
+    }
+    sizes = {"identity": len(body), "gzip": len(zlib.compress(body, GZIP_LEVEL))}
+    if BROTLI_AVAILABLE:
+        import brotli
+
+        cases["br"] = lambda: brotli.compress(body, quality=BROTLI_QUALITY)
+        sizes["br"] = len(brotli.compress(body, quality=BROTLI_QUALITY))
+
+    return {
+        "days": days,
+        "orjson": ORJSON_AVAILABLE,
+        "brotli": BROTLI_AVAILABLE,
+        "sizes": sizes,
+        "results": {name: measure(func, rounds=rounds) for name, func in cases.items()},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="응답 직렬화/압축 벤치마크")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="기간 일수 (기본 31)")
+    parser.add_argument("--rounds", type=int, default=9, help="케이스당 측정 라운드 수")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = run(args.days, args.rounds)
+    print(f"{'case':<18}{'median(us)':>14}{'iqr(us)':>12}")
+    for name, stats in report["results"].items():
+        print(f"{name:<18}{stats['median_us']:>14.2f}{stats['iqr_us']:>12.2f}")
+    print("\n" + "  ".join(f"{name}={size:,}B" for name, size in report["sizes"].items()))
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
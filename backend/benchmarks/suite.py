@@ -0,0 +1,395 @@
+"""
+백엔드 핵심 경로 벤치마크 스위트
+
+고정된 출생 정보/날짜로 사주·운세·기문·콘텐츠 조립·번역·검증·PDF 렌더링을
+반복 측정하고, 결과를 JSON 기준선으로 저장하거나 두 결과를 비교합니다.
+사주 계산기는 기본적으로 기록된 CLI 출력(fixtures/saju_cli_output.json)으로
+대체되어 네트워크나 Node.js 없이 실행됩니다 (--calculator real 로 실제 CLI 사용).
+
+    cd backend
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.15
+"""
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.rhythm import saju
+from src.rhythm.models import BirthInfo, Gender
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SAJU_FIXTURE = FIXTURES_DIR / "saju_cli_output.json"
+
+BIRTH_INFO = BirthInfo(
+    name="벤치마크",
+    birth_date=datetime.date(1990, 5, 15),
+    birth_time=datetime.time(14, 30),
+    gender=Gender.MALE,
+    birth_place="서울",
+)
+TARGET_DATE = datetime.date(2026, 1, 20)
+TARGET_HOUR = 10
+ROLE = "student"
+
+CALCULATORS = ("stub", "real")
+DEFAULT_ROUNDS = 15
+DEFAULT_THRESHOLD = 0.15
+# 중앙값 차이가 이 값과 양쪽 IQR보다 작으면 잡음으로 간주
+MIN_DELTA_US = 1.0
+# 한 라운드가 이 시간 이상이 되도록 반복 횟수를 보정 (타이머 해상도/잡음 완화)
+MIN_ROUND_SECONDS = 0.005
+MAX_LOOPS = 10_000
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    측정 대상
+
+    Attributes:
+        name: 결과 키
+        func: 인자 없이 한 번 실행할 함수
+        description: 설명
+        skip_reason: 실행할 수 없는 이유 (있으면 측정하지 않음)
+    """
+    name: str
+    func: Optional[Callable[[], Any]]
+    description: str
+    skip_reason: Optional[str] = None
+
+
+@contextmanager
+def saju_calculator(mode: str = "stub") -> Iterator[None]:
+    """
+    사주 계산기 선택 (stub: 기록된 CLI 출력 사용, real: Node.js CLI 실행)
+
+    stub 모드에서도 JSON 파싱과 결과 구조화는 실제 코드 경로를 그대로 탑니다.
+    진입/종료 시 원국 캐시를 비워 측정 간 상태가 섞이지 않게 합니다.
+    """
+    if mode not in CALCULATORS:
+        raise ValueError(f"알 수 없는 계산기 모드: {mode}")
+
+    original = saju._run_calculator
+    if mode == "stub":
+        fixture_text = SAJU_FIXTURE.read_text(encoding="utf-8")
+        saju._run_calculator = lambda input_data: json.loads(fixture_text)
+    saju._saju_cache.clear()
+    try:
+        yield
+    finally:
+        saju._run_calculator = original
+        saju._saju_cache.clear()
+
+
+def measure(
+    func: Callable[[], Any],
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_seconds: float = MIN_ROUND_SECONDS,
+) -> Dict[str, float]:
+    """
+    호출당 실행 시간 측정
+
+    한 번 예열한 뒤 라운드당 반복 횟수(loops)를 보정하고, rounds번 측정한
+    라운드별 호출당 시간의 통계를 반환합니다. 측정 중에는 GC를 끕니다.
+
+    Returns:
+        min_us, median_us, mean_us, stdev_us, iqr_us, rounds, loops
+    """
+    func()
+
+    loops = 1
+    while loops < MAX_LOOPS:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - started >= min_round_seconds:
+            break
+        loops *= 2
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter_ns()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter_ns() - started) / loops / 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) >= 2 else [samples[0]] * 3
+    return {
+        "min_us": round(min(samples), 2),
+        "median_us": round(statistics.median(samples), 2),
+        "mean_us": round(statistics.fmean(samples), 2),
+        "stdev_us": round(statistics.stdev(samples), 2) if len(samples) >= 2 else 0.0,
+        "iqr_us": round(quartiles[2] - quartiles[0], 2),
+        "rounds": rounds,
+        "loops": loops,
+    }
+
+
+def _pdf_case(content: Dict[str, Any]) -> BenchmarkCase:
+    """PDF 렌더링 케이스 (WeasyPrint/시스템 라이브러리가 없으면 건너뜀)"""
+    description = "PDFGenerator.generate_daily_pdf (메모리 렌더링)"
+    sys.path.append(str(Path(__file__).parent.parent.parent / "pdf-generator"))
+    try:
+        from generator import PDFGenerator
+    except (ImportError, OSError) as e:
+        return BenchmarkCase("pdf_render_daily", None, description, skip_reason=f"PDF 렌더러 사용 불가: {e}")
+
+    generator = PDFGenerator(auto_reload=False)
+    return BenchmarkCase(
+        "pdf_render_daily",
+        lambda: generator.generate_daily_pdf(content, role=ROLE),
+        description,
+    )
+
+
+def build_cases() -> List[BenchmarkCase]:
+    """
+    벤치마크 케이스 목록 (입력은 고정 픽스처에서 한 번만 계산)
+
+    saju_calculator() 컨텍스트 안에서 호출해야 합니다.
+    """
+    from src.content.assembly import assemble_daily_content, assemble_monthly_content
+    from src.content.validator import (
+        validate_daily_content,
+        validate_monthly_content,
+        validate_translated_daily_content,
+    )
+    from src.rhythm import qimen, qimen_complete
+    from src.rhythm.saju import analyze_daily_fortune, analyze_monthly_rhythm, calculate_saju
+    from src.translation import translate_daily_content
+    from src.translation.translators import StudentTranslator
+
+    saju_data = calculate_saju(BIRTH_INFO, TARGET_DATE)
+    daily_rhythm = analyze_daily_fortune(BIRTH_INFO, TARGET_DATE, saju_data)
+    hourly = qimen.calculate_daily_qimen(BIRTH_INFO.birth_date, TARGET_DATE)
+    qimen_summary = qimen.get_daily_summary(BIRTH_INFO.birth_date, TARGET_DATE, hourly=hourly)
+    daily_content = assemble_daily_content(TARGET_DATE, saju_data, daily_rhythm, qimen_summary)
+    translated = translate_daily_content(daily_content, ROLE)
+    forbidden_terms = StudentTranslator().rules.forbidden_terms
+    monthly_rhythm = analyze_monthly_rhythm(BIRTH_INFO, TARGET_DATE.year, TARGET_DATE.month, saju_data)
+    monthly_content = assemble_monthly_content(TARGET_DATE.year, TARGET_DATE.month, monthly_rhythm)
+
+    def saju_cold():
+        saju._saju_cache.clear()
+        return calculate_saju(BIRTH_INFO, TARGET_DATE)
+
+    def daily_qimen():
+        qimen._hourly_results.cache_clear()
+        return qimen.calculate_daily_qimen(BIRTH_INFO.birth_date, TARGET_DATE)
+
+    def complete_qimen():
+        qimen_complete._complete_result.cache_clear()
+        qimen_complete._build_palaces.cache_clear()
+        return qimen_complete.calculate_complete_qimen(BIRTH_INFO.birth_date, TARGET_DATE, TARGET_HOUR)
+
+    return [
+        BenchmarkCase("saju_cold", saju_cold, "calculate_saju (원국 캐시 비움)"),
+        BenchmarkCase(
+            "saju_warm",
+            lambda: calculate_saju(BIRTH_INFO, TARGET_DATE),
+            "calculate_saju (원국 캐시 적중)",
+        ),
+        BenchmarkCase(
+            "daily_fortune",
+            lambda: analyze_daily_fortune(BIRTH_INFO, TARGET_DATE, saju_data),
+            "analyze_daily_fortune",
+        ),
+        BenchmarkCase("daily_qimen", daily_qimen, "calculate_daily_qimen (결과 캐시 비움)"),
+        BenchmarkCase("complete_qimen", complete_qimen, "calculate_complete_qimen (결과 캐시 비움)"),
+        BenchmarkCase(
+            "assemble_daily",
+            lambda: assemble_daily_content(TARGET_DATE, saju_data, daily_rhythm, qimen_summary),
+            "assemble_daily_content",
+        ),
+        BenchmarkCase(
+            "translate_daily",
+            lambda: translate_daily_content(daily_content, ROLE),
+            f"translate_daily_content ({ROLE})",
+        ),
+        BenchmarkCase(
+            "validate_daily",
+            lambda: validate_daily_content(daily_content),
+            "validate_daily_content",
+        ),
+        BenchmarkCase(
+            "validate_translated",
+            lambda: validate_translated_daily_content(daily_content, translated, forbidden_terms),
+            f"validate_translated_daily_content ({ROLE})",
+        ),
+        BenchmarkCase(
+            "validate_monthly",
+            lambda: validate_monthly_content(monthly_content),
+            "validate_monthly_content",
+        ),
+        _pdf_case(translated),
+    ]
+
+
+def run_suite(
+    calculator: str = "stub",
+    rounds: int = DEFAULT_ROUNDS,
+    only: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    스위트 실행
+
+    Args:
+        calculator: "stub" | "real"
+        rounds: 케이스당 측정 라운드 수
+        only: 실행할 케이스 이름 (None이면 전체)
+
+    Returns:
+        {"meta": {...}, "results": {케이스: 통계 | {"skipped": 이유}}}
+    """
+    results: Dict[str, Any] = {}
+    with saju_calculator(calculator):
+        for case in build_cases():
+            if only and case.name not in only:
+                continue
+            if case.skip_reason:
+                results[case.name] = {"description": case.description, "skipped": case.skip_reason}
+                continue
+            results[case.name] = {"description": case.description, **measure(case.func, rounds)}
+
+    return {
+        "meta": {
+            "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calculator": calculator,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_us: float = MIN_DELTA_US,
+) -> List[Dict[str, Any]]:
+    """
+    두 실행 결과의 중앙값 비교
+
+    상대 변화가 threshold를 넘고, 절대 차이가 min_delta_us와 양쪽 IQR보다
+    클 때만 회귀/개선으로 판단합니다.
+
+    Args:
+        baseline: 기준 결과 (run_suite 출력)
+        current: 비교 대상 결과
+        threshold: 회귀로 판단할 상대 증가율 (0.15 = 15% 느려짐)
+        min_delta_us: 잡음으로 간주할 최소 절대 차이 (마이크로초)
+
+    Returns:
+        케이스별 {name, status, baseline_us, current_us, ratio}
+        status: "regression" | "improvement" | "ok" | "skipped" | "missing" | "new"
+    """
+    base_results = baseline.get("results", {})
+    curr_results = current.get("results", {})
+    rows = []
+    for name in list(base_results) + [n for n in curr_results if n not in base_results]:
+        base = base_results.get(name)
+        curr = curr_results.get(name)
+        row: Dict[str, Any] = {"name": name, "baseline_us": None, "current_us": None, "ratio": None}
+        if base is None:
+            row["status"] = "new"
+        elif curr is None:
+            row["status"] = "missing"
+        elif "median_us" not in base or "median_us" not in curr:
+            row["status"] = "skipped"
+        else:
+            row["baseline_us"] = base["median_us"]
+            row["current_us"] = curr["median_us"]
+            row["ratio"] = round(curr["median_us"] / base["median_us"], 3) if base["median_us"] else None
+            noise = max(min_delta_us, base.get("iqr_us", 0.0), curr.get("iqr_us", 0.0))
+            significant = abs(curr["median_us"] - base["median_us"]) > noise
+            if significant and row["ratio"] is not None and row["ratio"] > 1 + threshold:
+                row["status"] = "regression"
+            elif significant and row["ratio"] is not None and row["ratio"] < 1 - threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _format_results(report: Dict[str, Any]) -> str:
+    lines = [f"{'case':<18}{'median(us)':>14}{'iqr(us)':>12}{'min(us)':>12}{'loops':>8}"]
+    for name, stats in report["results"].items():
+        if "skipped" in stats:
+            lines.append(f"{name:<18}  skipped: {stats['skipped']}")
+        else:
+            lines.append(
+                f"{name:<18}{stats['median_us']:>14.2f}{stats['iqr_us']:>12.2f}"
+                f"{stats['min_us']:>12.2f}{stats['loops']:>8}"
+            )
+    return "\n".join(lines)
+
+
+def _format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'case':<18}{'baseline(us)':>14}{'current(us)':>14}{'ratio':>8}  status"]
+    for row in rows:
+        base = f"{row['baseline_us']:.2f}" if row["baseline_us"] is not None else "-"
+        curr = f"{row['current_us']:.2f}" if row["current_us"] is not None else "-"
+        ratio = f"{row['ratio']:.3f}" if row["ratio"] is not None else "-"
+        lines.append(f"{row['name']:<18}{base:>14}{curr:>14}{ratio:>8}  {row['status']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="백엔드 핵심 경로 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--calculator", choices=CALCULATORS, default="stub", help="사주 계산기 (기본 stub)")
+    run_parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="케이스당 측정 라운드 수")
+    run_parser.add_argument("--only", nargs="+", help="실행할 케이스 이름")
+    run_parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로 (기준선)")
+
+    compare_parser = commands.add_parser("compare", help="두 결과 비교 (회귀 시 종료 코드 1)")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="회귀 판단 상대 증가율 (기본 0.15)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_suite(args.calculator, args.rounds, args.only)
+        print(_format_results(report))
+        if args.output:
+            args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            print(f"\n저장: {args.output}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    rows = compare(baseline, current, args.threshold)
+    print(_format_comparison(rows))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n회귀 ({args.threshold:.0%} 초과): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
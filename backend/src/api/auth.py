@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from supabase import Client
 from src.db.supabase import get_supabase
 from src.api.models import SignUpRequest, LoginRequest, ChangePasswordRequest, AuthResponse, ErrorResponse
+from src.utils.metrics import SUPABASE_LATENCY, observe
 
 
 class RefreshTokenRequest(BaseModel):
@@ -299,7 +300,8 @@ def get_current_user(
     token = authorization.split(" ")[1]
 
     try:
-        user = supabase.auth.get_user(token)
+        with observe(SUPABASE_LATENCY, operation="auth.get_user"):
+            user = supabase.auth.get_user(token)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -4,11 +4,11 @@ Daily Content API Endpoints
 from fastapi import APIRouter, Depends, HTTPException, status, Header, Query
 from fastapi.responses import Response, JSONResponse
 from supabase import Client
+import asyncio
 import datetime
 from datetime import date, time
-from typing import Optional
+from typing import List, Optional, Set
 import os
-from pathlib import Path
 from src.db.supabase import get_supabase, SupabaseClient
 from src.api.auth import get_current_user
 from src.api.models import DailyContentResponse
@@ -17,31 +17,41 @@ from src.rhythm.saju import calculate_saju, analyze_daily_fortune
 from src.rhythm.qimen import calculate_daily_qimen, get_daily_summary, HourlyQimenResult
 from src.content.assembly import assemble_daily_content
 from src.translation import translate_daily_content, Role
-from src.api.helpers import get_birth_data
+from src.api.helpers import cache_headers, content_etag, file_fingerprint, get_birth_data, not_modified
+from src.utils.responses import json_response
+from src.utils.singleflight import AsyncSingleFlight
+from src.utils.timing import span
+from src.content.markdown_cache import (
+    MARKDOWN_AVAILABLE,
+    get_markdown_cache,
+    resolve_daily_markdown,
+)
 
-# Import markdown library (install with: pip install markdown)
-try:
-    import markdown
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
+# 시작 시 daily/ Markdown 미리 변환 작업 (참조 유지용, main.py lifespan에서 시작)
+_prerender_task: Optional[asyncio.Task] = None
 
-router = APIRouter(prefix="/api/daily", tags=["Daily Content"])
+# 같은 입력(ETag)의 동시 일간 콘텐츠 생성 합치기
+_daily_flight = AsyncSingleFlight("daily_content")
 
-# Cache for markdown content (simple in-memory cache)
-_markdown_cache = {}
-_cache_timeout = 3600  # 1 hour in seconds
 
+async def start_markdown_prerender() -> None:
+    """
+    daily/ 디렉토리의 Markdown을 백그라운드에서 미리 읽고 HTML로 변환
+
+    앱 시작 시 한 번 호출합니다. 이미 진행 중인 작업이 있으면 새로 시작하지 않습니다.
+    """
+    global _prerender_task
+    if os.getenv("DAILY_MARKDOWN_PRERENDER", "1") == "0":
+        return
+    if _prerender_task is not None and not _prerender_task.done():
+        return
+    _prerender_task = asyncio.create_task(asyncio.to_thread(get_markdown_cache().prerender))
 
-def _cleanup_expired_cache():
-    """만료된 캐시 항목 정리"""
-    now = datetime.datetime.now().timestamp()
-    expired_keys = [
-        k for k, v in _markdown_cache.items()
-        if now - v["timestamp"] >= _cache_timeout
-    ]
-    for k in expired_keys:
-        del _markdown_cache[k]
+
+router = APIRouter(
+    prefix="/api/daily",
+    tags=["Daily Content"],
+)
 
 
 def _get_profile_data(user_id: str, supabase_db: Client) -> dict:
@@ -66,6 +76,7 @@ def _get_profile_data(user_id: str, supabase_db: Client) -> dict:
 async def get_daily_markdown(
     target_date: datetime.date,
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
@@ -94,48 +105,29 @@ async def get_daily_markdown(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
+    get_current_user(authorization, supabase_auth)
 
     try:
-        # 캐시 확인
-        cache_key = f"md_{user.id}_{target_date.isoformat()}"
-        if cache_key in _markdown_cache:
-            cached_data = _markdown_cache[cache_key]
-            if datetime.datetime.now().timestamp() - cached_data["timestamp"] < _cache_timeout:
-                return Response(
-                    content=cached_data["content"],
-                    media_type="text/markdown; charset=utf-8"
-                )
-
-        # backend/daily/ 디렉토리에서 마크다운 파일 찾기
-        daily_dir = Path(__file__).parent.parent.parent / "daily"
-        md_file = daily_dir / f"{target_date.isoformat()}_new_format.md"
-
-        # 파일이 없으면 기본 형식 파일도 확인
-        if not md_file.exists():
-            md_file = daily_dir / f"{target_date.isoformat()}.md"
-
-        if md_file.exists():
-            # 파일 읽기
-            markdown_content = md_file.read_text(encoding="utf-8")
-        else:
-            # 파일이 없으면 404 반환
+        # backend/daily/ 디렉토리의 마크다운 파일 (파일 버전 단위 공유 캐시)
+        md_file = resolve_daily_markdown(target_date.isoformat())
+        if md_file is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"{target_date.isoformat()} 날짜에 해당하는 콘텐츠를 찾을 수 없습니다."
             )
 
-        # 캐시 저장 (주기적 만료 정리)
-        if len(_markdown_cache) > 500:  # 500개 초과 시 정리
-            _cleanup_expired_cache()
-        _markdown_cache[cache_key] = {
-            "content": markdown_content,
-            "timestamp": datetime.datetime.now().timestamp()
-        }
+        # 파일이 바뀌지 않았으면 읽지 않고 304
+        fingerprint = file_fingerprint(md_file)
+        etag = content_etag("markdown", **fingerprint)
+        mtime = fingerprint["mtime_ns"] / 1e9
+        cached = not_modified(etag, if_none_match, last_modified=mtime)
+        if cached is not None:
+            return cached
 
         return Response(
-            content=markdown_content,
-            media_type="text/markdown; charset=utf-8"
+            content=get_markdown_cache().get_markdown(md_file),
+            media_type="text/markdown; charset=utf-8",
+            headers=cache_headers(etag, mtime),
         )
 
     except HTTPException:
@@ -153,6 +145,7 @@ async def get_daily_markdown(
 async def get_daily_markdown_html(
     target_date: datetime.date,
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
@@ -181,7 +174,7 @@ async def get_daily_markdown_html(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
+    get_current_user(authorization, supabase_auth)
 
     if not MARKDOWN_AVAILABLE:
         raise HTTPException(
@@ -190,67 +183,29 @@ async def get_daily_markdown_html(
         )
 
     try:
-        # 캐시 확인
-        cache_key = f"html_{user.id}_{target_date.isoformat()}"
-        if cache_key in _markdown_cache:
-            cached_data = _markdown_cache[cache_key]
-            if datetime.datetime.now().timestamp() - cached_data["timestamp"] < _cache_timeout:
-                return JSONResponse(content=cached_data["content"])
-
-        # backend/daily/ 디렉토리에서 마크다운 파일 찾기
-        daily_dir = Path(__file__).parent.parent.parent / "daily"
-        md_file = daily_dir / f"{target_date.isoformat()}_new_format.md"
-
-        # 파일이 없으면 기본 형식 파일도 확인
-        if not md_file.exists():
-            md_file = daily_dir / f"{target_date.isoformat()}.md"
-
-        if md_file.exists():
-            # 파일 읽기
-            markdown_content = md_file.read_text(encoding="utf-8")
-        else:
-            # 파일이 없으면 404 반환
+        # backend/daily/ 디렉토리의 마크다운 파일 (파일 버전당 한 번만 HTML 변환)
+        md_file = resolve_daily_markdown(target_date.isoformat())
+        if md_file is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"{target_date.isoformat()} 날짜에 해당하는 콘텐츠를 찾을 수 없습니다."
             )
 
-        # Markdown → HTML 변환
-        html_content = markdown.markdown(
-            markdown_content,
-            extensions=['extra', 'nl2br', 'sane_lists']
-        )
-
-        # 기본 스타일링 클래스 추가
-        html_with_classes = html_content.replace(
-            '<h1>', '<h1 class="text-3xl font-bold mb-4">'
-        ).replace(
-            '<h2>', '<h2 class="text-2xl font-semibold mb-3 mt-6">'
-        ).replace(
-            '<h3>', '<h3 class="text-xl font-medium mb-2 mt-4">'
-        ).replace(
-            '<ul>', '<ul class="list-disc list-inside mb-4 space-y-1">'
-        ).replace(
-            '<ol>', '<ol class="list-decimal list-inside mb-4 space-y-1">'
-        ).replace(
-            '<p>', '<p class="mb-3 leading-relaxed">'
-        ).replace(
-            '<hr>', '<hr class="my-6 border-gray-300">'
+        fingerprint = file_fingerprint(md_file)
+        etag = content_etag("markdown_html", date=target_date, **fingerprint)
+        mtime = fingerprint["mtime_ns"] / 1e9
+        cached = not_modified(etag, if_none_match, last_modified=mtime)
+        if cached is not None:
+            return cached
+
+        return JSONResponse(
+            content={
+                "html": get_markdown_cache().get_html(md_file),
+                "date": target_date.isoformat()
+            },
+            headers=cache_headers(etag, mtime),
         )
 
-        response_data = {
-            "html": html_with_classes,
-            "date": target_date.isoformat()
-        }
-
-        # 캐시 저장
-        _markdown_cache[cache_key] = {
-            "content": response_data,
-            "timestamp": datetime.datetime.now().timestamp()
-        }
-
-        return JSONResponse(content=response_data)
-
     except HTTPException:
         raise
     except Exception as e:
@@ -262,12 +217,123 @@ async def get_daily_markdown_html(
         )
 
 
+def _build_daily_response(profile: dict, target_date: datetime.date, role: Optional[Role]) -> dict:
+    """
+    일간 콘텐츠 파이프라인 (사주 → 운세 → 기문 → 조립 → 역할 변환)
+
+    동기 함수라 워커 스레드에서 실행합니다 (get_daily_content 참고).
+
+    Args:
+        profile: 출생 정보 프로필
+        target_date: 대상 날짜
+        role: 역할 (None이면 중립 콘텐츠)
+
+    Returns:
+        DailyContentResponse 형태의 dict (동시 요청끼리 공유되므로 수정 금지)
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    # 2. BirthInfo 생성
+    birth_info = BirthInfo(
+        name=profile["name"],
+        birth_date=datetime.date.fromisoformat(profile["birth_date"]),
+        birth_time=datetime.time.fromisoformat(profile["birth_time"]),
+        gender=Gender(profile["gender"]),
+        birth_place=profile["birth_place"]
+    )
+    logger.info(f"BirthInfo created: {birth_info.name}, {birth_info.birth_date}, {birth_info.birth_time}")
+
+    # 3. 사주 계산 (내부 계산)
+    with span("saju"):
+        saju_result = calculate_saju(birth_info, target_date)
+
+    if not saju_result:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사주 계산에 실패했습니다."
+        )
+    logger.info(f"Saju calculation completed for {target_date}")
+
+    # 4. 일간 리듬 분석 (내부 해석)
+    with span("fortune"):
+        daily_rhythm = analyze_daily_fortune(birth_info, target_date, saju_result)
+
+    if not daily_rhythm:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일간 리듬 분석에 실패했습니다."
+        )
+    logger.info(f"Daily rhythm analysis completed")
+
+    # 5. 기문둔갑 시간/방위 계산 (콘텐츠 생성 전에 실행)
+    qimen_slots = None
+    best_direction = None
+    avoid_direction = None
+    peak_hours = None
+    qimen_summary = {}
+    try:
+        with span("qimen"):
+            qimen_results = calculate_daily_qimen(birth_info.birth_date, target_date)
+            qimen_slots = [r.to_dict() for r in qimen_results]
+            summary = get_daily_summary(birth_info.birth_date, target_date, qimen_results)
+        best_direction = summary.get("best_direction")
+        avoid_direction = summary.get("avoid_direction")
+        peak_hours = summary.get("peak_hours")
+        qimen_summary = {
+            "best_direction": best_direction,
+            "avoid_direction": avoid_direction,
+            "peak_hours": peak_hours,
+        }
+    except Exception as qimen_err:
+        # 기문 계산 실패 시 기존 데이터 사용 (non-blocking)
+        import logging
+        logging.getLogger(__name__).warning(f"기문둔갑 계산 실패: {qimen_err}")
+
+    # 6. 사용자 노출 콘텐츠 생성 (기문 데이터 포함)
+    with span("assembly"):
+        daily_content = assemble_daily_content(target_date, saju_result, daily_rhythm, qimen_summary)
+
+    if not daily_content:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일간 콘텐츠 조합에 실패했습니다."
+        )
+    logger.info(f"Daily content assembled successfully")
+
+    # 콘텐츠 필수 필드 확인
+    required_fields = ['summary', 'keywords', 'rhythm_description']
+    missing_fields = [field for field in required_fields if not daily_content.get(field)]
+    if missing_fields:
+        logger.warning(f"Missing fields in daily content: {missing_fields}")
+
+    # 7. 역할별 변환 (role 파라미터가 있으면)
+    if role:
+        with span("translation"):
+            daily_content = translate_daily_content(daily_content, role.value)
+
+    # 8. 응답 생성 (기문 데이터 포함)
+    response_data = {
+        "date": target_date.isoformat(),
+        "role": role.value if role else None,
+        "content": daily_content,
+        "qimen_slots": qimen_slots,
+        "best_direction": best_direction,
+        "avoid_direction": avoid_direction,
+        "peak_hours": peak_hours
+    }
+    logger.info(f"Response prepared - has content: {bool(daily_content)}, has fourPillars: {bool(daily_content.get('fourPillars'))}")
+    return response_data
+
+
 @router.get("/{target_date}", response_model=DailyContentResponse)
 async def get_daily_content(
     target_date: datetime.date,
+    response: Response,
     role: Optional[Role] = Query(None, description="역할 (student, office_worker, freelancer)"),
     recipient_id: Optional[str] = Query(None, description="대상자 ID (없으면 본인 프로필 사용)"),
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
@@ -297,144 +363,289 @@ async def get_daily_content(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase_auth)
+        user_id = user.id
 
-    token = authorization.split(" ")[1]
-    supabase_db = SupabaseClient.create_user_db_client(token)
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
 
     try:
         # 1. 프로필 데이터 조회 (RLS 적용)
-        profile = get_birth_data(user_id, recipient_id, supabase_db)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+        # 입력(계산 버전/출생 정보/날짜/역할)이 같으면 파이프라인 없이 304
+        etag = content_etag("daily", profile, date=target_date, role=role)
+        cached = not_modified(etag, if_none_match, response)
+        if cached is not None:
+            return cached
 
         import logging
         logger = logging.getLogger(__name__)
         logger.info(f"Profile loaded for user {user_id}: {profile.get('name')}")
 
-        # 2. BirthInfo 생성
-        birth_info = BirthInfo(
-            name=profile["name"],
-            birth_date=datetime.date.fromisoformat(profile["birth_date"]),
-            birth_time=datetime.time.fromisoformat(profile["birth_time"]),
-            gender=Gender(profile["gender"]),
-            birth_place=profile["birth_place"]
+        # 2~8. 파이프라인은 워커 스레드에서 실행 (이벤트 루프를 막지 않음)
+        # 같은 입력(ETag)으로 동시에 들어온 요청은 진행 중인 계산 하나를 공유
+        return await _daily_flight.do(
+            etag, lambda: asyncio.to_thread(_build_daily_response, profile, target_date, role)
         )
-        logger.info(f"BirthInfo created: {birth_info.name}, {birth_info.birth_date}, {birth_info.birth_time}")
 
-        # 3. 사주 계산 (내부 계산)
-        saju_result = calculate_saju(birth_info, target_date)
+    except HTTPException:
+        raise
+    except Exception as e:
+        import logging
+        logging.getLogger(__name__).error(f"일간 콘텐츠 생성 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일간 콘텐츠를 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        )
 
-        if not saju_result:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="사주 계산에 실패했습니다."
-            )
-        logger.info(f"Saju calculation completed for {target_date}")
 
-        # 4. 일간 리듬 분석 (내부 해석)
-        daily_rhythm = analyze_daily_fortune(birth_info, target_date, saju_result)
+# 최적 시간대 검색 최대 기간 (일)
+MAX_WINDOW_SEARCH_DAYS = 366
 
-        if not daily_rhythm:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="일간 리듬 분석에 실패했습니다."
-            )
-        logger.info(f"Daily rhythm analysis completed")
-
-        # 5. 기문둔갑 시간/방위 계산 (콘텐츠 생성 전에 실행)
-        qimen_slots = None
-        best_direction = None
-        avoid_direction = None
-        peak_hours = None
-        qimen_summary = {}
-        try:
-            qimen_results = calculate_daily_qimen(birth_info.birth_date, target_date)
-            qimen_slots = [
-                {
-                    "hour_start": r.hour_start,
-                    "hour_end": r.hour_end,
-                    "quality": r.quality,
-                    "direction": r.direction,
-                    "direction_en": r.direction_en,
-                    "energy_level": r.energy_level,
-                    "label": r.label
-                }
-                for r in qimen_results
-            ]
-            summary = get_daily_summary(birth_info.birth_date, target_date)
-            best_direction = summary.get("best_direction")
-            avoid_direction = summary.get("avoid_direction")
-            peak_hours = summary.get("peak_hours")
-            qimen_summary = {
-                "best_direction": best_direction,
-                "avoid_direction": avoid_direction,
-                "peak_hours": peak_hours,
-            }
-        except Exception as qimen_err:
-            # 기문 계산 실패 시 기존 데이터 사용 (non-blocking)
-            import logging
-            logging.getLogger(__name__).warning(f"기문둔갑 계산 실패: {qimen_err}")
-
-        # 6. 사용자 노출 콘텐츠 생성 (기문 데이터 포함)
-        daily_content = assemble_daily_content(target_date, saju_result, daily_rhythm, qimen_summary)
 
-        if not daily_content:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="일간 콘텐츠 조합에 실패했습니다."
-            )
-        logger.info(f"Daily content assembled successfully")
+@router.get("/qimen/best-windows")
+async def get_best_windows(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    response: Response,
+    k: int = Query(5, ge=1, le=50),
+    quality: Optional[str] = Query(None),
+    direction: Optional[str] = Query(None),
+    min_energy: int = Query(1, ge=1, le=10),
+    recipient_id: Optional[str] = Query(None),
+    authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    supabase_auth: Client = Depends(get_supabase),
+):
+    """
+    기간 내 최적 시간대 상위 K개 조회
 
-        # 콘텐츠 필수 필드 확인
-        required_fields = ['summary', 'keywords', 'rhythm_description']
-        missing_fields = [field for field in required_fields if not daily_content.get(field)]
-        if missing_fields:
-            logger.warning(f"Missing fields in daily content: {missing_fields}")
+    날짜별 시간대 정보를 미리 계산한 인덱스에서 검색하므로
+    기간이 길어도 날짜별 계산을 반복하지 않습니다.
 
-        # 7. 역할별 변환 (role 파라미터가 있으면)
-        if role:
-            daily_content = translate_daily_content(daily_content, role.value)
+    Args:
+        start_date: 시작 날짜
+        end_date: 종료 날짜 (최대 366일)
+        k: 반환할 시간대 수 (1-50)
+        quality: good | neutral | avoid (optional)
+        direction: 방위 (예: "북동" 또는 "NE", optional)
+        min_energy: 최소 에너지 레벨 (1-10)
+        authorization: Bearer {access_token}
 
-        # 8. 응답 생성 (기문 데이터 포함)
-        response_data = {
-            "date": target_date.isoformat(),
-            "role": role.value if role else None,
-            "content": daily_content,
-            "qimen_slots": qimen_slots,
-            "best_direction": best_direction,
-            "avoid_direction": avoid_direction,
-            "peak_hours": peak_hours
-        }
-        logger.info(f"Response prepared - has content: {bool(daily_content)}, has fourPillars: {bool(daily_content.get('fourPillars'))}")
-        return response_data
+    Returns:
+        {start_date, end_date, windows: [{date, hour_start, hour_end, quality,
+        direction, direction_en, energy_level, label}]}
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).error(f"일간 콘텐츠 생성 오류: {str(e)}", exc_info=True)
+    Example:
+        GET /api/daily/qimen/best-windows?start_date=2026-03-02&end_date=2026-03-08&quality=good&k=3
+    """
+    # 인증 확인
+    if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="일간 콘텐츠를 생성하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다."
+        )
+
+    user = get_current_user(authorization, supabase_auth)
+    token = authorization.split(" ")[1]
+    supabase_db = SupabaseClient.create_user_db_client(token)
+
+    delta = (end_date - start_date).days
+    if delta < 0 or delta >= MAX_WINDOW_SEARCH_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"날짜 범위는 최대 {MAX_WINDOW_SEARCH_DAYS}일까지 가능합니다."
+        )
+
+    profile = get_birth_data(user.id, recipient_id, supabase_db)
+
+    etag = content_etag(
+        "best_windows", profile, start_date=start_date, end_date=end_date, k=k,
+        quality=quality, direction=direction, min_energy=min_energy,
+    )
+    cached = not_modified(etag, if_none_match, response)
+    if cached is not None:
+        return cached
+
+    # numpy 기반 인덱스는 첫 요청에서 로드 (콜드 스타트 단축)
+    from src.rhythm.qimen_index import find_best_windows
+
+    try:
+        windows = find_best_windows(
+            datetime.date.fromisoformat(profile["birth_date"]),
+            start_date,
+            end_date,
+            k=k,
+            quality=quality,
+            direction=direction,
+            min_energy=min_energy,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "windows": windows,
+    }
+
+
+def _range_summaries(
+    birth_info: BirthInfo, start_date: datetime.date, end_date: datetime.date
+) -> tuple:
+    """
+    기간 요약 필드 (일진, 일별 에너지, 운세 점수)를 배열로 한 번에 계산
+
+    세운이 연도마다 다르므로 사주는 연도별로 한 번만 계산하고,
+    연도 구간마다 compute_rhythm_arrays / daily_fortune_arrays를 적용합니다.
+
+    Args:
+        birth_info: 출생 정보
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        (날짜별 요약 리스트, 연도 → calculate_saju 결과)
+    """
+    from src.rhythm.calendar_rhythm import compute_rhythm_arrays, daily_fortune_arrays
+
+    summaries = []
+    saju_by_year = {}
+    for year in range(start_date.year, end_date.year + 1):
+        segment_start = max(start_date, datetime.date(year, 1, 1))
+        segment_end = min(end_date, datetime.date(year, 12, 31))
+        with span("saju"):
+            saju_by_year[year] = calculate_saju(birth_info, segment_start)
+        with span("rhythm_arrays"):
+            arrays = compute_rhythm_arrays(segment_start, segment_end, saju_by_year[year])
+            scores = daily_fortune_arrays(arrays, saju_by_year[year])
+        for index in range(len(arrays)):
+            summaries.append({
+                "day_energy": int(arrays.energy[index]),
+                "day_pillar": arrays.day_pillar(index),
+                "scores": {key: int(scores[key][index]) for key in ("energy", "focus", "social", "decision")},
+            })
+    return summaries, saju_by_year
+
+
+def _build_daily_range(
+    profile: dict,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    role: Optional[Role],
+    full_dates: Optional[Set[datetime.date]] = None,
+) -> list:
+    """
+    기간별 일간 콘텐츠
+
+    요약 필드(day_energy, day_pillar, scores)는 모든 날짜에 대해 배열로 계산하고,
+    운세 → 기문 → 조립 → 역할 변환 파이프라인은 전체 콘텐츠가 필요한 날짜에만 실행합니다.
+
+    Args:
+        profile: 출생 정보 프로필
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        role: 역할 (None이면 중립 콘텐츠)
+        full_dates: 전체 콘텐츠를 만들 날짜 (None이면 모든 날짜)
+
+    Returns:
+        날짜별 일간 콘텐츠 리스트 (요약만 있는 날짜는 content 등이 None)
+    """
+    # BirthInfo 생성
+    birth_info = BirthInfo(
+        name=profile["name"],
+        birth_date=datetime.date.fromisoformat(profile["birth_date"]),
+        birth_time=datetime.time.fromisoformat(profile["birth_time"]),
+        gender=Gender(profile["gender"]),
+        birth_place=profile["birth_place"]
+    )
+
+    summaries, saju_by_year = _range_summaries(birth_info, start_date, end_date)
+
+    results = []
+    current_date = start_date
+    for summary in summaries:
+        entry = {
+            "date": current_date.isoformat(),
+            "role": role.value if role else None,
+            "content": None,
+            "qimen_slots": None,
+            "best_direction": None,
+            "avoid_direction": None,
+            "peak_hours": None,
+            **summary,
+        }
+
+        if full_dates is None or current_date in full_dates:
+            # 리듬 분석 → 기문둔갑 → 콘텐츠 생성 (사주는 연도별 결과 재사용)
+            saju_result = saju_by_year[current_date.year]
+            with span("fortune"):
+                daily_rhythm = analyze_daily_fortune(birth_info, current_date, saju_result)
+
+            # 기문둔갑 계산 (non-blocking)
+            loop_qimen_summary = {}
+            try:
+                with span("qimen"):
+                    loop_qimen_results = calculate_daily_qimen(birth_info.birth_date, current_date)
+                    entry["qimen_slots"] = [r.to_dict() for r in loop_qimen_results]
+                    loop_summary = get_daily_summary(birth_info.birth_date, current_date, loop_qimen_results)
+                loop_qimen_summary = {
+                    "best_direction": loop_summary.get("best_direction"),
+                    "avoid_direction": loop_summary.get("avoid_direction"),
+                    "peak_hours": loop_summary.get("peak_hours"),
+                }
+            except Exception as e:
+                import logging
+                logging.getLogger(__name__).warning(f"Qimen calculation failed for {current_date}: {e}")
+
+            with span("assembly"):
+                daily_content = assemble_daily_content(current_date, saju_result, daily_rhythm, loop_qimen_summary)
+
+            # 역할별 변환
+            if role:
+                with span("translation"):
+                    daily_content = translate_daily_content(daily_content, role.value)
+
+            entry["content"] = daily_content
+            entry.update(loop_qimen_summary)
+
+        results.append(entry)
+
+        # 다음 날로 이동
+        current_date += datetime.timedelta(days=1)
+
+    return results
 
 
 @router.get("/range/{start_date}/{end_date}")
 async def get_daily_content_range(
     start_date: datetime.date,
     end_date: datetime.date,
+    response: Response,
     role: Optional[Role] = Query(None),
     recipient_id: Optional[str] = Query(None),
+    detail: str = Query("full", pattern="^(full|summary)$"),
+    full_dates: Optional[List[datetime.date]] = Query(None),
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
     기간별 일간 콘텐츠 조회
 
+    모든 날짜에 요약 필드(day_energy, day_pillar, scores)가 포함됩니다.
+    detail=summary이면 전체 콘텐츠(content, qimen_slots, 방위/시간)는
+    full_dates에 지정한 날짜에만 생성하고 나머지 날짜는 None입니다.
+
     Args:
         start_date: 시작 날짜
         end_date: 종료 날짜
         role: 역할 (optional)
+        detail: full (모든 날짜 전체 콘텐츠, 기본값) 또는 summary
+        full_dates: detail=summary일 때 전체 콘텐츠를 만들 날짜 (반복 지정)
         authorization: Bearer {access_token}
 
     Returns:
@@ -447,6 +658,9 @@ async def get_daily_content_range(
     Example:
         GET /api/daily/range/2026-01-01/2026-01-31?role=office_worker
         → 2026년 1월 전체 일간 콘텐츠 (직장인용)
+
+        GET /api/daily/range/2026-01-01/2026-01-31?detail=summary&full_dates=2026-01-20
+        → 1월 요약 + 20일만 전체 콘텐츠
     """
     # 인증 확인
     if not authorization or not authorization.startswith("Bearer "):
@@ -455,11 +669,12 @@ async def get_daily_content_range(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase_auth)
+        user_id = user.id
 
-    token = authorization.split(" ")[1]
-    supabase_db = SupabaseClient.create_user_db_client(token)
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
 
     try:
         # 날짜 범위 검증 (최대 31일)
@@ -471,72 +686,21 @@ async def get_daily_content_range(
             )
 
         # 프로필 데이터 조회 (RLS 적용)
-        profile = get_birth_data(user_id, recipient_id, supabase_db)
-
-        # BirthInfo 생성
-        birth_info = BirthInfo(
-            name=profile["name"],
-            birth_date=datetime.date.fromisoformat(profile["birth_date"]),
-            birth_time=datetime.time.fromisoformat(profile["birth_time"]),
-            gender=Gender(profile["gender"]),
-            birth_place=profile["birth_place"]
-        )
-
-        # 기간별 콘텐츠 생성
-        results = []
-        current_date = start_date
-        while current_date <= end_date:
-            # 사주 계산 → 리듬 분석 → 기문둔갑 → 콘텐츠 생성
-            saju_result = calculate_saju(birth_info, current_date)
-            daily_rhythm = analyze_daily_fortune(birth_info, current_date, saju_result)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
 
-            # 기문둔갑 계산 (non-blocking)
-            loop_qimen_summary = {}
-            loop_qimen_slots = None
-            try:
-                loop_qimen_results = calculate_daily_qimen(birth_info.birth_date, current_date)
-                loop_qimen_slots = [
-                    {
-                        "hour_start": r.hour_start,
-                        "hour_end": r.hour_end,
-                        "quality": r.quality,
-                        "direction": r.direction,
-                        "direction_en": r.direction_en,
-                        "energy_level": r.energy_level,
-                        "label": r.label
-                    }
-                    for r in loop_qimen_results
-                ]
-                loop_summary = get_daily_summary(birth_info.birth_date, current_date)
-                loop_qimen_summary = {
-                    "best_direction": loop_summary.get("best_direction"),
-                    "avoid_direction": loop_summary.get("avoid_direction"),
-                    "peak_hours": loop_summary.get("peak_hours"),
-                }
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).warning(f"Qimen calculation failed for {current_date}: {e}")
-
-            daily_content = assemble_daily_content(current_date, saju_result, daily_rhythm, loop_qimen_summary)
-
-            # 역할별 변환
-            if role:
-                daily_content = translate_daily_content(daily_content, role.value)
-
-            results.append({
-                "date": current_date.isoformat(),
-                "role": role.value if role else None,
-                "content": daily_content,
-                "qimen_slots": loop_qimen_slots,
-                "best_direction": loop_qimen_summary.get("best_direction"),
-                "avoid_direction": loop_qimen_summary.get("avoid_direction"),
-                "peak_hours": loop_qimen_summary.get("peak_hours"),
-            })
-
-            # 다음 날로 이동
-            current_date += datetime.timedelta(days=1)
+        selected_dates = set(full_dates or []) if detail == "summary" else None
+        etag = content_etag(
+            "daily_range", profile, start_date=start_date, end_date=end_date, role=role,
+            full_dates=None if selected_dates is None else sorted(d.isoformat() for d in selected_dates),
+        )
+        cached = not_modified(etag, if_none_match, response)
+        if cached is not None:
+            return cached
 
-        return results
+        # 날짜별 파이프라인은 워커 스레드에서 실행 (이벤트 루프를 막지 않음)
+        results = await asyncio.to_thread(_build_daily_range, profile, start_date, end_date, role, selected_dates)
+        return json_response(results, response)
 
     except HTTPException:
         raise
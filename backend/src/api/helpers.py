@@ -3,8 +3,22 @@
 콘텐츠 생성 파이프라인에서 공통으로 사용하는 유틸리티
 """
 from fastapi import HTTPException, status
+from fastapi.responses import Response, FileResponse
+from starlette.background import BackgroundTask
 from supabase import Client
-from typing import Optional
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+from src.utils.metrics import SUPABASE_LATENCY, observe
 
 
 def get_birth_data(
@@ -32,7 +46,8 @@ def get_birth_data(
     """
     if recipient_id:
         # diary_recipients 테이블에서 조회
-        result = supabase_db.table("diary_recipients").select("*").eq("id", recipient_id).execute()
+        with observe(SUPABASE_LATENCY, operation="select.diary_recipients"):
+            result = supabase_db.table("diary_recipients").select("*").eq("id", recipient_id).execute()
 
         if not result.data:
             raise HTTPException(
@@ -59,7 +74,8 @@ def get_birth_data(
         }
     else:
         # profiles 테이블에서 조회 (기존 동작)
-        result = supabase_db.table("profiles").select("*").eq("id", user_id).execute()
+        with observe(SUPABASE_LATENCY, operation="select.profiles"):
+            result = supabase_db.table("profiles").select("*").eq("id", user_id).execute()
 
         if not result.data:
             raise HTTPException(
@@ -76,3 +92,216 @@ def get_birth_data(
             "birth_place": profile.get("birth_place", ""),
             "role": profile.get("roles", ["office_worker"])[0] if profile.get("roles") else "office_worker",
         }
+
+
+def _remove_file(path: str) -> None:
+    """전송이 끝난 임시 파일 삭제"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def share_pdf_output(output: Any) -> Any:
+    """
+    single-flight로 공유받은 렌더링 결과를 호출자 전용으로 복제.
+
+    메모리 PDF는 그대로 쓰고, 임시 파일 PDF는 응답마다 전송 후 삭제되므로
+    같은 파일을 가리키는 링크(불가하면 복사본)를 새로 만듭니다.
+
+    Args:
+        output: data 또는 path를 가진 렌더링 결과
+
+    Returns:
+        호출자가 전송 후 삭제해도 되는 렌더링 결과
+    """
+    if not output.path:
+        return output
+    path = f"{output.path}.{uuid.uuid4().hex[:8]}.pdf"
+    try:
+        os.link(output.path, path)
+    except OSError:
+        shutil.copyfile(output.path, path)
+    return dataclasses.replace(output, path=path)
+
+
+def pdf_response(output: Any, filename: str) -> Response:
+    """
+    렌더링 결과(PDFOutput)를 다운로드 응답으로 변환.
+
+    메모리에서 렌더링된 PDF는 그대로 전송하고,
+    임시 파일로 내려진 큰 PDF는 파일 스트리밍 후 백그라운드 작업으로 삭제합니다.
+
+    Args:
+        output: data(bytes) 또는 path(str)를 가진 렌더링 결과
+        filename: 다운로드 파일명
+
+    Returns:
+        Response: application/pdf 응답
+    """
+    if output.path:
+        return FileResponse(
+            path=output.path,
+            media_type="application/pdf",
+            filename=filename,
+            background=BackgroundTask(_remove_file, output.path),
+        )
+
+    quoted = quote(filename)
+    if quoted != filename:
+        disposition = f"attachment; filename*=utf-8''{quoted}"
+    else:
+        disposition = f'attachment; filename="{filename}"'
+    return Response(
+        content=output.data,
+        media_type="application/pdf",
+        headers={"Content-Disposition": disposition},
+    )
+
+
+# ============================================================================
+# HTTP 조건부 캐싱 (ETag / Cache-Control)
+# ============================================================================
+
+# 콘텐츠를 계산하는 코드/데이터 (내용이 바뀌면 모든 ETag가 바뀜)
+# 계산(rhythm/사주 계산기), 문장 생성(content/skills), 번역, 응답 조립(api) 전부 포함
+_SRC_DIR = Path(__file__).parent.parent
+_SAJU_CALCULATOR_DIR = _SRC_DIR.parent / "saju-calculator"
+CONTENT_SOURCE_DIRS = [
+    _SRC_DIR / "rhythm",
+    _SRC_DIR / "content",
+    _SRC_DIR / "translation",
+    _SRC_DIR / "skills",
+    _SRC_DIR / "api",
+    _SAJU_CALCULATOR_DIR / "cli.js",
+    _SAJU_CALCULATOR_DIR / "dist",
+    _SAJU_CALCULATOR_DIR / "src",
+    _SAJU_CALCULATOR_DIR / "package-lock.json",
+]
+CONTENT_SOURCE_SUFFIXES = {".py", ".json", ".js", ".ts"}
+CONTENT_SOURCE_EXCLUDED_DIRS = {"__pycache__", "node_modules"}
+
+# 출생 정보 중 콘텐츠에 영향을 주는 필드
+PROFILE_FINGERPRINT_FIELDS = ("name", "birth_date", "birth_time", "gender", "birth_place", "role")
+
+
+@lru_cache(maxsize=1)
+def content_version() -> str:
+    """
+    계산 버전 (CONTENT_SOURCE_DIRS 코드/데이터 내용 해시 + CONTENT_VERSION 환경변수)
+
+    배포마다 코드가 바뀌면 자동으로 새 버전이 되어 이전 ETag가 무효화됩니다.
+    여러 인스턴스가 같은 코드를 실행하면 같은 값이 나옵니다.
+    코드 밖의 변경(DB 데이터, 의존성 업데이트 등)은 배포 시 CONTENT_VERSION을 올려 무효화합니다.
+    """
+    digest = hashlib.sha256()
+    for source in CONTENT_SOURCE_DIRS:
+        paths = [source] if source.is_file() else sorted(source.rglob("*"))
+        for path in paths:
+            if (
+                path.suffix in CONTENT_SOURCE_SUFFIXES
+                and path.is_file()
+                and not CONTENT_SOURCE_EXCLUDED_DIRS.intersection(path.parts)
+            ):
+                digest.update(path.relative_to(source.parent).as_posix().encode("utf-8"))
+                digest.update(path.read_bytes())
+
+    version = digest.hexdigest()[:16]
+    configured = os.getenv("CONTENT_VERSION")
+    return f"{configured}-{version}" if configured else version
+
+
+def content_cache_control() -> str:
+    """
+    콘텐츠 응답의 Cache-Control (개인 캐시만, CONTENT_CACHE_MAX_AGE초 후 재검증)
+
+    기본 max-age=0: 브라우저는 매번 If-None-Match로 재검증하고,
+    바뀌지 않았으면 파이프라인 없이 304를 받습니다.
+    """
+    max_age = int(os.getenv("CONTENT_CACHE_MAX_AGE", "0"))
+    return f"private, max-age={max_age}, must-revalidate"
+
+
+def file_fingerprint(path: Path) -> Dict[str, Any]:
+    """파일 버전 (이름, 수정 시각, 크기) - 인스턴스 간에도 같은 값"""
+    stat = os.stat(path)
+    return {"file": Path(path).name, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def content_etag(kind: str, profile: Optional[dict] = None, **params: Any) -> str:
+    """
+    콘텐츠 입력 지문으로 만든 약한 ETag
+
+    파이프라인 결과가 아니라 입력(계산 버전, 출생 정보, 요청 인자)을 해시하므로
+    콘텐츠를 생성하기 전에 계산할 수 있습니다.
+
+    Args:
+        kind: 엔드포인트 종류 (예: "daily", "monthly_pdf")
+        profile: get_birth_data 결과 (None이면 제외)
+        **params: 날짜, 역할 등 응답을 결정하는 나머지 인자
+
+    Returns:
+        W/"..." 형식의 ETag
+    """
+    payload = {
+        "version": content_version(),
+        "kind": kind,
+        "profile": {k: profile.get(k) for k in PROFILE_FINGERPRINT_FIELDS} if profile else None,
+        "params": params,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return f'W/"{hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 (약한 비교, "*" 허용)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str, last_modified: Optional[float] = None) -> Dict[str, str]:
+    """
+    조건부 캐싱 헤더
+
+    Args:
+        etag: content_etag 결과
+        last_modified: 원본 수정 시각 (epoch 초, 파일 기반 응답만)
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": content_cache_control(),
+        "Vary": "Authorization",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified(
+    etag: str,
+    if_none_match: Optional[str],
+    response: Optional[Response] = None,
+    last_modified: Optional[float] = None,
+) -> Optional[Response]:
+    """
+    클라이언트 사본이 최신이면 304 응답, 아니면 캐싱 헤더만 설정하고 None
+
+    Args:
+        etag: content_etag 결과
+        if_none_match: 요청의 If-None-Match 헤더
+        response: 헤더를 붙일 응답 (dict를 반환하는 엔드포인트의 주입 Response)
+        last_modified: 원본 수정 시각 (epoch 초)
+
+    Returns:
+        304 Response 또는 None (이어서 콘텐츠 생성)
+    """
+    headers = cache_headers(etag, last_modified)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if response is not None:
+        response.headers.update(headers)
+    return None
@@ -0,0 +1,33 @@
+"""
+Metrics API Endpoint
+Prometheus 스크레이프용 /metrics
+"""
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import Response
+
+from src.utils.metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(None)):
+    """
+    Prometheus 텍스트 노출 형식 메트릭
+
+    METRICS_TOKEN 환경변수가 설정되어 있으면 `Authorization: Bearer {METRICS_TOKEN}` 필요
+
+    Raises:
+        HTTPException 401: 토큰 불일치
+    """
+    token = os.getenv("METRICS_TOKEN")
+    if token and not hmac.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다."
+        )
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
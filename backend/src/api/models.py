@@ -176,6 +176,42 @@ class DailyLogResponse(BaseModel):
     updated_at: str
 
 
+# ============================================================================
+# PDF Job Models
+# ============================================================================
+
+class PDFJobCreate(BaseModel):
+    """
+    비동기 PDF 작업 생성 요청
+
+    - monthly: 본인/대상자 월간 PDF (year, month, recipient_id)
+    - customer_monthly: 고객 프로필 월간 PDF (customer_id, year, month)
+    - customer_period: 고객 프로필 기간 PDF (customer_id, start_date, end_date)
+    """
+    kind: str = Field(..., pattern="^(monthly|customer_monthly|customer_period)$")
+    year: Optional[int] = Field(None, ge=2000, le=2100)
+    month: Optional[int] = Field(None, ge=1, le=12)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    role: Optional[Role] = None
+    recipient_id: Optional[str] = None
+    customer_id: Optional[str] = None
+
+
+class PDFJobResponse(BaseModel):
+    """비동기 PDF 작업 상태"""
+    job_id: str
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    progress: float
+    message: str
+    filename: str
+    size: int = 0
+    error: Optional[str] = None
+    status_url: str
+    result_url: Optional[str] = None
+
+
 # ============================================================================
 # Common Response Models
 # ============================================================================
@@ -1,8 +1,9 @@
 """
 Monthly/Yearly Content API Endpoints
 """
+import asyncio
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Header, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Query, Response
 from supabase import Client
 import datetime
 from datetime import date, time
@@ -13,7 +14,9 @@ from src.rhythm.models import BirthInfo, Gender
 from src.rhythm.saju import calculate_saju, analyze_monthly_rhythm, analyze_yearly_rhythm
 from src.content.assembly import assemble_monthly_content, assemble_yearly_content
 from src.translation.models import Role
-from src.api.helpers import get_birth_data
+from src.api.helpers import content_etag, get_birth_data, not_modified
+from src.utils.responses import json_response
+from src.utils.timing import span
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +45,11 @@ def _get_profile_data(user_id: str, supabase_db: Client) -> dict:
 async def get_monthly_content(
     year: int,
     month: int,
+    response: Response,
     role: Optional[Role] = Query(None),
     recipient_id: Optional[str] = Query(None),
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
@@ -69,11 +74,12 @@ async def get_monthly_content(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase_auth)
+        user_id = user.id
 
-    token = authorization.split(" ")[1]
-    supabase_db = SupabaseClient.create_user_db_client(token)
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
 
     try:
         # 날짜 검증
@@ -89,7 +95,14 @@ async def get_monthly_content(
             )
 
         # 프로필 조회 (RLS 적용)
-        profile = get_birth_data(user_id, recipient_id, supabase_db)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+        # 입력(계산 버전/출생 정보/연월/역할)이 같으면 파이프라인 없이 304
+        etag = content_etag("monthly", profile, year=year, month=month, role=role)
+        cached = not_modified(etag, if_none_match, response)
+        if cached is not None:
+            return cached
 
         # BirthInfo 생성
         birth_info = BirthInfo(
@@ -102,25 +115,29 @@ async def get_monthly_content(
 
         # 사주 계산 (대표 날짜 사용)
         target_date = datetime.date(year, month, 1)
-        saju_result = calculate_saju(birth_info, target_date)
+        with span("saju"):
+            saju_result = calculate_saju(birth_info, target_date)
 
         # 월간 리듬 분석
-        monthly_rhythm = analyze_monthly_rhythm(birth_info, year, month, saju_result)
+        with span("rhythm"):
+            monthly_rhythm = analyze_monthly_rhythm(birth_info, year, month, saju_result)
 
         # 월간 콘텐츠 조립
-        monthly_content = assemble_monthly_content(year, month, monthly_rhythm)
+        with span("assembly"):
+            monthly_content = assemble_monthly_content(year, month, monthly_rhythm)
 
         # 역할별 번역 적용
         if role:
             from src.translation.translator import translate_monthly_content
-            monthly_content = translate_monthly_content(monthly_content, role.value)
+            with span("translation"):
+                monthly_content = translate_monthly_content(monthly_content, role.value)
 
-        return {
+        return json_response({
             "year": year,
             "month": month,
             "role": role.value if role else None,
             "content": monthly_content
-        }
+        }, response)
 
     except HTTPException:
         raise
@@ -132,12 +149,57 @@ async def get_monthly_content(
         )
 
 
+def _build_yearly_content(profile: dict, year: int, role: Optional[Role]) -> dict:
+    """
+    연간 콘텐츠 파이프라인 (사주 → 연간 리듬 → 조립 → 역할별 번역)
+
+    Args:
+        profile: 출생 정보 프로필
+        year: 연도
+        role: 역할 (None이면 중립 콘텐츠)
+
+    Returns:
+        연간 콘텐츠
+    """
+    # BirthInfo 생성
+    birth_info = BirthInfo(
+        name=profile["name"],
+        birth_date=datetime.date.fromisoformat(profile["birth_date"]),
+        birth_time=datetime.time.fromisoformat(profile["birth_time"]),
+        gender=Gender(profile["gender"]),
+        birth_place=profile["birth_place"]
+    )
+
+    # 사주 계산 (대표 날짜 사용)
+    target_date = datetime.date(year, 1, 1)
+    with span("saju"):
+        saju_result = calculate_saju(birth_info, target_date)
+
+    # 연간 리듬 분석
+    with span("rhythm"):
+        yearly_rhythm = analyze_yearly_rhythm(birth_info, year, saju_result)
+
+    # 연간 콘텐츠 조립
+    with span("assembly"):
+        yearly_content = assemble_yearly_content(year, yearly_rhythm)
+
+    # 역할별 번역 적용
+    if role:
+        from src.translation.translator import translate_yearly_content
+        with span("translation"):
+            yearly_content = translate_yearly_content(yearly_content, role.value)
+
+    return yearly_content
+
+
 @router.get("/yearly/{year}")
 async def get_yearly_content(
     year: int,
+    response: Response,
     role: Optional[Role] = Query(None),
     recipient_id: Optional[str] = Query(None),
     authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     supabase_auth: Client = Depends(get_supabase),
 ):
     """
@@ -161,11 +223,12 @@ async def get_yearly_content(
             detail="인증이 필요합니다."
         )
 
-    user = get_current_user(authorization, supabase_auth)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase_auth)
+        user_id = user.id
 
-    token = authorization.split(" ")[1]
-    supabase_db = SupabaseClient.create_user_db_client(token)
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
 
     try:
         # 연도 검증
@@ -176,9 +239,91 @@ async def get_yearly_content(
             )
 
         # 프로필 조회 (RLS 적용)
-        profile = get_birth_data(user_id, recipient_id, supabase_db)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+        etag = content_etag("yearly", profile, year=year, role=role)
+        cached = not_modified(etag, if_none_match, response)
+        if cached is not None:
+            return cached
+
+        # 사주 → 연간 리듬 → 조립 → 번역은 워커 스레드에서 실행 (이벤트 루프를 막지 않음)
+        yearly_content = await asyncio.to_thread(_build_yearly_content, profile, year, role)
+
+        return json_response({
+            "year": year,
+            "role": role.value if role else None,
+            "content": yearly_content
+        }, response)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"연간 콘텐츠 생성 중 오류가 발생했습니다: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="연간 콘텐츠 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+@router.get("/yearly/{year}/heatmap")
+async def get_yearly_heatmap(
+    year: int,
+    response: Response,
+    recipient_id: Optional[str] = Query(None),
+    authorization: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    supabase_auth: Client = Depends(get_supabase),
+):
+    """
+    연간 일별 점수 히트맵 조회
+
+    월간 API를 12번 호출하지 않고 한 번에 1년치 일별 점수를 숫자 배열로 반환합니다.
+    배열의 i번째 값은 start_date + i일의 값입니다.
+
+    Args:
+        year: 연도 (2000-2100)
+        recipient_id: 대상자 ID (optional)
+        authorization: Bearer {access_token}
+
+    Returns:
+        {year, start_date, days, energy, focus, social, decision, relation, relation_codes}
+        (점수는 1-5, relation은 relation_codes의 인덱스)
+
+    Example:
+        GET /api/content/yearly/2026/heatmap
+    """
+    # 인증 확인
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다."
+        )
+
+    with span("auth"):
+        user = get_current_user(authorization, supabase_auth)
+        user_id = user.id
+
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
+
+    try:
+        # 연도 검증
+        if year < 2000 or year > 2100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="연도는 2000-2100 범위여야 합니다."
+            )
+
+        # 프로필 조회 (RLS 적용)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+        etag = content_etag("yearly_heatmap", profile, year=year)
+        cached = not_modified(etag, if_none_match, response)
+        if cached is not None:
+            return cached
 
-        # BirthInfo 생성
         birth_info = BirthInfo(
             name=profile["name"],
             birth_date=datetime.date.fromisoformat(profile["birth_date"]),
@@ -187,32 +332,21 @@ async def get_yearly_content(
             birth_place=profile["birth_place"]
         )
 
-        # 사주 계산 (대표 날짜 사용)
-        target_date = datetime.date(year, 1, 1)
-        saju_result = calculate_saju(birth_info, target_date)
+        # 원국은 캐시되고 세운은 연 단위이므로 1월 1일 기준 한 번이면 충분
+        with span("saju"):
+            saju_result = calculate_saju(birth_info, datetime.date(year, 1, 1))
 
-        # 연간 리듬 분석
-        yearly_rhythm = analyze_yearly_rhythm(birth_info, year, saju_result)
+        from src.rhythm.calendar_rhythm import yearly_heatmap
 
-        # 연간 콘텐츠 조립
-        yearly_content = assemble_yearly_content(year, yearly_rhythm)
-
-        # 역할별 번역 적용
-        if role:
-            from src.translation.translator import translate_yearly_content
-            yearly_content = translate_yearly_content(yearly_content, role.value)
-
-        return {
-            "year": year,
-            "role": role.value if role else None,
-            "content": yearly_content
-        }
+        with span("heatmap"):
+            heatmap = yearly_heatmap(year, saju_result)
+        return json_response(heatmap, response)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"연간 콘텐츠 생성 중 오류가 발생했습니다: {e}", exc_info=True)
+        logger.error(f"연간 히트맵 생성 중 오류가 발생했습니다: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="연간 콘텐츠 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+            detail="연간 히트맵 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
         )
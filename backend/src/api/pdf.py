@@ -3,18 +3,24 @@ PDF API Endpoints
 일간/월간 콘텐츠 PDF 생성 API
 """
 from fastapi import APIRouter, Header, Query, HTTPException, Depends
-from fastapi.responses import FileResponse
 from supabase import Client
 from typing import Optional
+import asyncio
 import datetime
 import os
 import sys
 from pathlib import Path
-import tempfile
 
 # PDF Generator import
 sys.path.append(str(Path(__file__).parent.parent.parent.parent / "pdf-generator"))
-from generator import PDFGenerator
+from render_pool import (
+    PDFOutput,
+    get_render_pool,
+    shutdown_render_pool,
+    PDFQueueFullError,
+    PDFRenderTimeoutError,
+)
+from pdf_cache import css_version, get_pdf_cache, render_with_cache, template_version
 
 # Backend imports
 from src.api.auth import get_current_user
@@ -23,12 +29,23 @@ from src.rhythm.models import BirthInfo, Gender
 from src.rhythm.saju import calculate_saju, analyze_daily_fortune, analyze_monthly_rhythm
 from src.content.assembly import assemble_daily_content, assemble_monthly_content
 from src.translation import translate_daily_content, Role
-from src.api.helpers import get_birth_data
+from src.api.helpers import (
+    cache_headers,
+    content_etag,
+    file_fingerprint,
+    get_birth_data,
+    not_modified,
+    pdf_response,
+    share_pdf_output,
+)
+from src.utils.metrics import PDF_RENDER_LATENCY, observe
+from src.utils.singleflight import AsyncSingleFlight
+from src.utils.timing import span
 
-router = APIRouter(prefix="/api/pdf", tags=["PDF"])
+router = APIRouter(prefix="/api/pdf", tags=["PDF"], on_shutdown=[shutdown_render_pool])
 
-# PDF Generator 인스턴스
-pdf_generator = PDFGenerator()
+# 같은 입력(ETag)의 동시 PDF 생성(콘텐츠 조립 + 렌더링) 합치기
+_pdf_flight = AsyncSingleFlight("pdf")
 
 
 def _get_profile_data(user_id: str, supabase: Client) -> dict:
@@ -44,6 +61,167 @@ def _get_profile_data(user_id: str, supabase: Client) -> dict:
     return result.data[0]
 
 
+def _validate_year_month(year: int, month: int) -> None:
+    """연도/월 범위 검증 (내부 헬퍼)"""
+    if year < 2000 or year > 2100:
+        raise HTTPException(
+            status_code=400,
+            detail="연도는 2000-2100 범위여야 합니다."
+        )
+    if month < 1 or month > 12:
+        raise HTTPException(
+            status_code=400,
+            detail="월은 1-12 범위여야 합니다."
+        )
+
+
+def build_monthly_content(
+    user_id: str,
+    token: str,
+    recipient_id: Optional[str],
+    year: int,
+    month: int,
+    profile: Optional[dict] = None
+) -> dict:
+    """
+    월간 PDF용 콘텐츠 생성 (동기 PDF 엔드포인트와 비동기 작업 API 공용)
+
+    Args:
+        user_id: 인증된 사용자 ID
+        token: 사용자 액세스 토큰 (RLS 적용 DB 클라이언트 생성용)
+        recipient_id: 대상자 ID (None이면 본인 프로필)
+        year: 연도
+        month: 월
+        profile: 이미 조회한 get_birth_data 결과 (없으면 조회)
+
+    Returns:
+        월간 콘텐츠 딕셔너리
+    """
+    # 프로필 조회
+    if profile is None:
+        supabase_db = SupabaseClient.create_user_db_client(token)
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+    # BirthInfo 생성
+    birth_info = BirthInfo(
+        name=profile["name"],
+        birth_date=datetime.date.fromisoformat(profile["birth_date"]),
+        birth_time=datetime.time.fromisoformat(profile["birth_time"]),
+        gender=Gender(profile["gender"]),
+        birth_place=profile["birth_place"]
+    )
+
+    # 사주 계산 및 월간 리듬 분석
+    target_date = datetime.date(year, month, 1)
+    with span("saju"):
+        saju_result = calculate_saju(birth_info, target_date)
+    with span("rhythm"):
+        monthly_rhythm = analyze_monthly_rhythm(birth_info, year, month, saju_result)
+
+    # 월간 콘텐츠 생성
+    # TODO: Phase 4에서 월간 번역 추가 필요
+    with span("assembly"):
+        return assemble_monthly_content(year, month, monthly_rhythm)
+
+
+async def _render_pdf(method: str, **kwargs) -> PDFOutput:
+    """
+    렌더링 풀에서 PDF 생성 (이벤트 루프를 막지 않음, 캐시 우선)
+
+    Raises:
+        HTTPException: 대기열 초과(503), 시간 초과(504)
+    """
+    try:
+        with span("render"), observe(PDF_RENDER_LATENCY, method=method):
+            return await render_with_cache(get_render_pool(), get_pdf_cache(), method, **kwargs)
+    except PDFQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "10"},
+        )
+    except PDFRenderTimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="PDF 생성 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+def _pdf_etag(kind: str, profile: Optional[dict] = None, **params) -> str:
+    """PDF ETag (콘텐츠 입력 + 템플릿/CSS 버전)"""
+    return content_etag(kind, profile, template=template_version(), css=css_version(), **params)
+
+
+def build_daily_content(profile: dict, target_date: datetime.date, role: Optional[Role]) -> dict:
+    """
+    일간 PDF용 콘텐츠 생성 (사주 → 운세 → 조립 → 역할 변환)
+
+    Args:
+        profile: get_birth_data 결과
+        target_date: 대상 날짜
+        role: 역할 (None이면 중립 콘텐츠)
+
+    Returns:
+        일간 콘텐츠 딕셔너리
+    """
+    # BirthInfo 생성
+    birth_info = BirthInfo(
+        name=profile["name"],
+        birth_date=datetime.date.fromisoformat(profile["birth_date"]),
+        birth_time=datetime.time.fromisoformat(profile["birth_time"]),
+        gender=Gender(profile["gender"]),
+        birth_place=profile["birth_place"]
+    )
+
+    # 사주 계산 및 리듬 분석
+    with span("saju"):
+        saju_result = calculate_saju(birth_info, target_date)
+    with span("fortune"):
+        daily_rhythm = analyze_daily_fortune(birth_info, target_date, saju_result)
+
+    # 콘텐츠 생성
+    with span("assembly"):
+        daily_content = assemble_daily_content(target_date, saju_result, daily_rhythm)
+
+    # 역할별 변환
+    if role:
+        with span("translation"):
+            daily_content = translate_daily_content(daily_content, role.value)
+    return daily_content
+
+
+async def _render_daily_pdf(profile: dict, target_date: datetime.date, role: Optional[Role]) -> PDFOutput:
+    """일간 콘텐츠 생성(워커 스레드) 후 PDF 렌더링"""
+    daily_content = await asyncio.to_thread(build_daily_content, profile, target_date, role)
+    return await _render_pdf(
+        "generate_daily_pdf",
+        content=daily_content,
+        role=role.value if role else None,
+        is_markdown=False
+    )
+
+
+async def _render_monthly_pdf(
+    user_id: str,
+    token: str,
+    recipient_id: Optional[str],
+    year: int,
+    month: int,
+    role: Optional[Role],
+    profile: dict,
+) -> PDFOutput:
+    """월간 콘텐츠 생성(워커 스레드) 후 PDF 렌더링"""
+    monthly_content = await asyncio.to_thread(
+        build_monthly_content, user_id, token, recipient_id, year, month, profile=profile
+    )
+    return await _render_pdf(
+        "generate_monthly_pdf",
+        content=monthly_content,
+        role=role.value if role else None
+    )
+
+
 @router.get("/daily/{target_date}")
 async def generate_daily_pdf(
     target_date: datetime.date,
@@ -51,6 +229,7 @@ async def generate_daily_pdf(
     use_markdown: bool = Query(False, description="Markdown 파일 사용 여부"),
     recipient_id: Optional[str] = Query(None),
     authorization: str = Header(...),
+    if_none_match: Optional[str] = Header(None),
     supabase: Client = Depends(get_supabase)
 ):
     """
@@ -76,11 +255,12 @@ async def generate_daily_pdf(
     ```
     """
     # 1. 사용자 인증
-    user = get_current_user(authorization, supabase)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase)
+        user_id = user.id
 
-    token = authorization.split(" ")[1]
-    supabase_db = SupabaseClient.create_user_db_client(token)
+        token = authorization.split(" ")[1]
+        supabase_db = SupabaseClient.create_user_db_client(token)
 
     try:
         # 2. Markdown 파일 사용 또는 기존 생성 로직
@@ -94,78 +274,48 @@ async def generate_daily_pdf(
                     detail=f"Markdown 파일을 찾을 수 없습니다: {md_file_path}"
                 )
 
+            etag = _pdf_etag("daily_pdf_markdown", role=role, **file_fingerprint(md_file_path))
+            cached = not_modified(etag, if_none_match)
+            if cached is not None:
+                return cached
+
             with open(md_file_path, 'r', encoding='utf-8') as f:
                 md_content = f.read()
 
-            # 7. 임시 PDF 파일 생성
-            with tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=".pdf",
-                prefix=f"diary_{target_date}_"
-            ) as tmp_file:
-                output_path = tmp_file.name
-
-            # 8. PDF 생성 (Markdown mode)
-            pdf_generator.generate_daily_pdf(
+            # 7. PDF 생성 (Markdown mode, 메모리 렌더링)
+            output = await _pdf_flight.do(etag, lambda: _render_pdf(
+                "generate_daily_pdf",
                 content=md_content,
-                output_path=output_path,
                 role=role.value if role else None,
                 is_markdown=True
-            )
+            ), share=share_pdf_output)
 
         else:
             # Existing logic: Generate from DB
             # 2. 프로필 조회
-            profile = get_birth_data(user_id, recipient_id, supabase_db)
-
-            # 3. BirthInfo 생성
-            birth_info = BirthInfo(
-                name=profile["name"],
-                birth_date=datetime.date.fromisoformat(profile["birth_date"]),
-                birth_time=datetime.time.fromisoformat(profile["birth_time"]),
-                gender=Gender(profile["gender"]),
-                birth_place=profile["birth_place"]
+            with span("profile"):
+                profile = get_birth_data(user_id, recipient_id, supabase_db)
+
+            # 입력이 같으면 콘텐츠 생성/렌더링 없이 304
+            etag = _pdf_etag("daily_pdf", profile, date=target_date, role=role)
+            cached = not_modified(etag, if_none_match)
+            if cached is not None:
+                return cached
+
+            # 3~7. 콘텐츠 생성(워커 스레드) 후 PDF 렌더링, 동시에 들어온 같은 요청은 결과 공유
+            output = await _pdf_flight.do(
+                etag, lambda: _render_daily_pdf(profile, target_date, role), share=share_pdf_output
             )
 
-            # 4. 사주 계산 및 리듬 분석
-            saju_result = calculate_saju(birth_info, target_date)
-            daily_rhythm = analyze_daily_fortune(birth_info, target_date, saju_result)
-
-            # 5. 콘텐츠 생성
-            daily_content = assemble_daily_content(target_date, saju_result, daily_rhythm)
-
-            # 6. 역할별 변환
-            if role:
-                daily_content = translate_daily_content(daily_content, role.value)
-
-            # 7. 임시 PDF 파일 생성
-            with tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=".pdf",
-                prefix=f"diary_{target_date}_"
-            ) as tmp_file:
-                output_path = tmp_file.name
-
-            # 8. PDF 생성
-            pdf_generator.generate_daily_pdf(
-                content=daily_content,
-                output_path=output_path,
-                role=role.value if role else None,
-                is_markdown=False
-            )
-
-        # 9. 파일 다운로드 응답
+        # 8. 다운로드 응답 (큰 PDF는 임시 파일 스트리밍 후 삭제)
         filename = f"R3_Diary_{target_date}"
         if role:
             filename += f"_{role.value}"
         filename += ".pdf"
 
-        return FileResponse(
-            path=output_path,
-            media_type="application/pdf",
-            filename=filename,
-            background=None  # 파일 전송 후 자동 삭제
-        )
+        download = pdf_response(output, filename)
+        download.headers.update(cache_headers(etag))
+        return download
 
     except HTTPException:
         raise
@@ -185,6 +335,7 @@ async def generate_monthly_pdf(
     role: Optional[Role] = Query(None, description="역할 (학생/직장인/프리랜서)"),
     recipient_id: Optional[str] = Query(None),
     authorization: str = Header(...),
+    if_none_match: Optional[str] = Header(None),
     supabase: Client = Depends(get_supabase)
 ):
     """
@@ -204,80 +355,40 @@ async def generate_monthly_pdf(
     ```
     """
     # 1. 사용자 인증
-    user = get_current_user(authorization, supabase)
-    user_id = user.id
+    with span("auth"):
+        user = get_current_user(authorization, supabase)
+        user_id = user.id
 
     try:
         # 2. 연도/월 검증
-        if year < 2000 or year > 2100:
-            raise HTTPException(
-                status_code=400,
-                detail="연도는 2000-2100 범위여야 합니다."
-            )
-        if month < 1 or month > 12:
-            raise HTTPException(
-                status_code=400,
-                detail="월은 1-12 범위여야 합니다."
-            )
+        _validate_year_month(year, month)
 
-        # 2.5. DB 클라이언트 생성
+        # 3. 프로필 조회 (입력이 같으면 콘텐츠 생성/렌더링 없이 304)
         token = authorization.split(" ")[1]
-        supabase_db = SupabaseClient.create_user_db_client(token)
-
-        # 3. 프로필 조회
-        profile = get_birth_data(user_id, recipient_id, supabase_db)
-
-        # 4. BirthInfo 생성
-        birth_info = BirthInfo(
-            name=profile["name"],
-            birth_date=datetime.date.fromisoformat(profile["birth_date"]),
-            birth_time=datetime.time.fromisoformat(profile["birth_time"]),
-            gender=Gender(profile["gender"]),
-            birth_place=profile["birth_place"]
+        with span("profile"):
+            profile = get_birth_data(user_id, recipient_id, SupabaseClient.create_user_db_client(token))
+
+        etag = _pdf_etag("monthly_pdf", profile, year=year, month=month, role=role)
+        cached = not_modified(etag, if_none_match)
+        if cached is not None:
+            return cached
+
+        # 4~8. 사주 계산, 월간 콘텐츠 생성(워커 스레드) 후 PDF 렌더링 (동시 요청은 결과 공유)
+        output = await _pdf_flight.do(
+            etag,
+            lambda: _render_monthly_pdf(user_id, token, recipient_id, year, month, role, profile),
+            share=share_pdf_output,
         )
 
-        # 5. 사주 계산 및 월간 리듬 분석
-        target_date = datetime.date(year, month, 1)
-        saju_result = calculate_saju(birth_info, target_date)
-        monthly_rhythm = analyze_monthly_rhythm(birth_info, year, month, saju_result)
-
-        # 6. 월간 콘텐츠 생성
-        monthly_content = assemble_monthly_content(year, month, monthly_rhythm)
-
-        # 7. 역할별 변환 (월간은 Phase 4에서 TODO)
-        # TODO: Phase 4에서 월간 번역 추가 필요
-        # if role:
-        #     monthly_content = translate_monthly_content(monthly_content, role.value)
-
-        # 8. 임시 PDF 파일 생성
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".pdf",
-            prefix=f"diary_{year}_{month:02d}_"
-        ) as tmp_file:
-            output_path = tmp_file.name
-
-        # 9. PDF 생성
-        pdf_generator.generate_monthly_pdf(
-            year=year,
-            month=month,
-            content=monthly_content,
-            output_path=output_path,
-            role=role.value if role else None
-        )
-
-        # 10. 파일 다운로드 응답
+        # 9. 다운로드 응답 (큰 PDF는 임시 파일 스트리밍 후 삭제)
         filename = f"R3_Diary_{year}_{month:02d}"
         if role:
             filename += f"_{role.value}"
         filename += ".pdf"
 
-        return FileResponse(
-            path=output_path,
-            media_type="application/pdf",
-            filename=filename,
-            background=None  # 파일 전송 후 자동 삭제
-        )
+        download = pdf_response(output, filename)
+        download.headers.update(cache_headers(etag))
+        return download
 
     except HTTPException:
         raise
@@ -4,18 +4,24 @@ PDF Customer API Endpoints
 Task 5: Customer profile-based personalized PDF generation
 Generates PDFs using PersonalizationEngine with CustomerProfile data
 """
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, Header
 from supabase import Client
-from typing import Optional
+from typing import List, Optional
+import asyncio
 import datetime
-import tempfile
 import sys
 from pathlib import Path
 
 # PDF Generator import
 sys.path.append(str(Path(__file__).parent.parent.parent.parent / "pdf-generator"))
-from generator import PDFGenerator
+from render_pool import (
+    PDFOutput,
+    get_render_pool,
+    shutdown_render_pool,
+    PDFQueueFullError,
+    PDFRenderTimeoutError,
+)
+from pdf_cache import css_version, get_pdf_cache, render_with_cache, template_version
 
 # Backend imports
 from src.db.supabase import get_supabase, get_customer_profile
@@ -23,18 +29,177 @@ from src.skills.personalization_engine.personalizer import PersonalizationEngine
 from src.skills.personalization_engine.models import CustomerProfile
 from src.content.char_optimizer import CharOptimizer
 from src.api.auth import get_current_user
+from src.api.helpers import cache_headers, content_etag, not_modified, pdf_response, share_pdf_output
+from src.utils.metrics import PDF_RENDER_LATENCY, observe
+from src.utils.singleflight import AsyncSingleFlight
 
-router = APIRouter(prefix="/api/pdf/customer", tags=["PDF Customer"])
+router = APIRouter(prefix="/api/pdf/customer", tags=["PDF Customer"], on_shutdown=[shutdown_render_pool])
 
 # Instances
-pdf_generator = PDFGenerator()
 personalization_engine = PersonalizationEngine()
 
+# Concurrent requests with the same ETag share one generation + render
+_pdf_flight = AsyncSingleFlight("customer_pdf")
+
+
+async def load_customer_profile(user_id: str) -> CustomerProfile:
+    """
+    Load and validate a CustomerProfile
+
+    Raises:
+        HTTPException: profile not found (404) or invalid profile data (400)
+    """
+    profile_data = await get_customer_profile(user_id)
+
+    if not profile_data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Customer profile not found: {user_id}"
+        )
+
+    try:
+        return CustomerProfile(**profile_data)
+    except Exception as e:
+        import logging
+        logging.getLogger(__name__).error(f"Invalid profile data for user {user_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=400,
+            detail="프로필 데이터 형식이 올바르지 않습니다."
+        )
+
+
+def generate_day_content(customer_profile: CustomerProfile, target_date: datetime.date) -> dict:
+    """
+    Generate one day of personalized content for a multi-day document
+
+    Days that fail to generate get a placeholder so the document keeps its page order.
+    """
+    success, content, errors = personalization_engine.generate_daily_content(
+        customer_profile=customer_profile,
+        target_date=target_date
+    )
+
+    if success and content:
+        return content.schema_output
+
+    # Use placeholder if generation fails
+    print(f"[Warning] Failed to generate content for {target_date}: {errors}")
+    return {
+        "date": target_date.strftime("%Y-%m-%d"),
+        "summary": "콘텐츠 생성 실패",
+    }
+
+
+async def _render_pdf(method: str, **kwargs) -> PDFOutput:
+    """
+    Render a PDF in the worker pool without blocking the event loop (cache first)
+
+    Raises:
+        HTTPException: queue full (503) or render timeout (504)
+    """
+    try:
+        with observe(PDF_RENDER_LATENCY, method=method):
+            return await render_with_cache(get_render_pool(), get_pdf_cache(), method, **kwargs)
+    except PDFQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "10"},
+        )
+    except PDFRenderTimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="PDF 생성 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+def _customer_pdf_etag(kind: str, customer_profile: CustomerProfile, **params) -> str:
+    """ETag from the customer profile, request params and template/CSS versions"""
+    return content_etag(
+        kind,
+        customer=customer_profile.model_dump(mode="json"),
+        template=template_version(),
+        css=css_version(),
+        **params,
+    )
+
+
+def build_customer_daily_content(user_id: str, customer_profile: CustomerProfile, target_date: datetime.date) -> dict:
+    """
+    Generate and validate one day of personalized content for the daily PDF
+
+    Raises:
+        HTTPException: content generation failed (500)
+    """
+    # 3. Generate personalized content using PersonalizationEngine
+    success, content, errors = personalization_engine.generate_daily_content(
+        customer_profile=customer_profile,
+        target_date=target_date
+    )
+
+    if not success or content is None:
+        error_msg = ", ".join(errors) if errors else "Unknown generation error"
+        raise HTTPException(
+            status_code=500,
+            detail=f"Content generation failed: {error_msg}"
+        )
+
+    # 4. Get schema output
+    daily_content = content.schema_output
+
+    # 5. Validate with CharOptimizer
+    is_valid, total_chars, issues = CharOptimizer.validate_page(daily_content)
+
+    if not is_valid:
+        # Log issues but don't fail (allow PDF generation with warnings)
+        print(f"[Warning] Content validation issues for {user_id} on {target_date}:")
+        for issue in issues:
+            print(f"  - {issue.get('message', issue)}")
+
+    print(f"[PDF Generation] User: {user_id}, Date: {target_date}, "
+          f"Total chars: {total_chars}, Valid: {is_valid}")
+    return daily_content
+
+
+async def _render_customer_daily_pdf(
+    user_id: str, customer_profile: CustomerProfile, target_date: datetime.date
+) -> PDFOutput:
+    """Generate daily content in a worker thread, then render it in the worker pool"""
+    daily_content = await asyncio.to_thread(build_customer_daily_content, user_id, customer_profile, target_date)
+    return await _render_pdf(
+        "generate_daily_pdf",
+        content=daily_content,
+        role=customer_profile.primary_role.value
+    )
+
+
+def _month_contents(customer_profile: CustomerProfile, year: int, month: int) -> List[dict]:
+    """Generate content for every day of the month (placeholders for failed days)"""
+    from calendar import monthrange
+
+    days_in_month = monthrange(year, month)[1]
+    return [
+        generate_day_content(customer_profile, datetime.date(year, month, day))
+        for day in range(1, days_in_month + 1)
+    ]
+
+
+async def _render_customer_monthly_pdf(customer_profile: CustomerProfile, year: int, month: int) -> PDFOutput:
+    """Generate the month's content in a worker thread, then render all pages as one document"""
+    daily_contents = await asyncio.to_thread(_month_contents, customer_profile, year, month)
+    return await _render_pdf(
+        "generate_period_pdf",
+        contents=daily_contents,
+        role=customer_profile.primary_role.value,
+        title=f"{year}년 {month}월"
+    )
+
 
 @router.get("/{user_id}/daily/{target_date}")
 async def generate_customer_daily_pdf(
     user_id: str,
     target_date: datetime.date,
+    if_none_match: Optional[str] = Header(None),
     supabase: Client = Depends(get_supabase)
 ):
     """
@@ -52,78 +217,26 @@ async def generate_customer_daily_pdf(
              --output diary_2026-01-30.pdf
     """
     try:
-        # 1. Load CustomerProfile from Supabase
-        profile_data = await get_customer_profile(user_id)
-
-        if not profile_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Customer profile not found: {user_id}"
-            )
-
-        # 2. Convert to CustomerProfile model
-        try:
-            customer_profile = CustomerProfile(**profile_data)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Invalid profile data for user {user_id}: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=400,
-                detail="프로필 데이터 형식이 올바르지 않습니다."
-            )
-
-        # 3. Generate personalized content using PersonalizationEngine
-        success, content, errors = personalization_engine.generate_daily_content(
-            customer_profile=customer_profile,
-            target_date=target_date
-        )
-
-        if not success or content is None:
-            error_msg = ", ".join(errors) if errors else "Unknown generation error"
-            raise HTTPException(
-                status_code=500,
-                detail=f"Content generation failed: {error_msg}"
-            )
-
-        # 4. Get schema output
-        daily_content = content.schema_output
-
-        # 5. Validate with CharOptimizer
-        is_valid, total_chars, issues = CharOptimizer.validate_page(daily_content)
-
-        if not is_valid:
-            # Log issues but don't fail (allow PDF generation with warnings)
-            print(f"[Warning] Content validation issues for {user_id} on {target_date}:")
-            for issue in issues:
-                print(f"  - {issue.get('message', issue)}")
-
-        print(f"[PDF Generation] User: {user_id}, Date: {target_date}, "
-              f"Total chars: {total_chars}, Valid: {is_valid}")
-
-        # 6. Create temporary PDF file
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".pdf",
-            prefix=f"diary_{user_id}_{target_date}_"
-        ) as tmp_file:
-            output_path = tmp_file.name
-
-        # 7. Generate PDF using WeasyPrint template
-        pdf_generator.generate_daily_pdf(
-            content=daily_content,
-            output_path=output_path,
-            role=customer_profile.primary_role.value
+        # 1~2. Load CustomerProfile from Supabase
+        customer_profile = await load_customer_profile(user_id)
+
+        # Unchanged profile/date: 304 without generating or rendering
+        etag = _customer_pdf_etag("customer_daily_pdf", customer_profile, date=target_date)
+        cached = not_modified(etag, if_none_match)
+        if cached is not None:
+            return cached
+
+        # 3~6. Generate content (worker thread) and render the PDF
+        output = await _pdf_flight.do(
+            etag, lambda: _render_customer_daily_pdf(user_id, customer_profile, target_date), share=share_pdf_output
         )
 
-        # 8. Return PDF file response
+        # 7. Return PDF response (large PDFs stream from a temp file that is then removed)
         filename = f"R3_Diary_{customer_profile.name}_{target_date}.pdf"
 
-        return FileResponse(
-            path=output_path,
-            media_type="application/pdf",
-            filename=filename,
-            background=None  # Auto-delete after sending
-        )
+        download = pdf_response(output, filename)
+        download.headers.update(cache_headers(etag))
+        return download
 
     except HTTPException:
         raise
@@ -141,6 +254,7 @@ async def generate_customer_monthly_pdf(
     user_id: str,
     year: int,
     month: int,
+    if_none_match: Optional[str] = Header(None),
     supabase: Client = Depends(get_supabase)
 ):
     """
@@ -172,84 +286,24 @@ async def generate_customer_monthly_pdf(
             )
 
         # 2. Load CustomerProfile
-        profile_data = await get_customer_profile(user_id)
+        customer_profile = await load_customer_profile(user_id)
 
-        if not profile_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Customer profile not found: {user_id}"
-            )
+        etag = _customer_pdf_etag("customer_monthly_pdf", customer_profile, year=year, month=month)
+        cached = not_modified(etag, if_none_match)
+        if cached is not None:
+            return cached
 
-        try:
-            customer_profile = CustomerProfile(**profile_data)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Invalid profile data for user {user_id}: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=400,
-                detail="프로필 데이터 형식이 올바르지 않습니다."
-            )
-
-        # 3. Generate content for all days in month
-        from calendar import monthrange
-        from datetime import date, timedelta
-
-        days_in_month = monthrange(year, month)[1]
-        start_date = date(year, month, 1)
-        end_date = date(year, month, days_in_month)
-
-        daily_contents = []
-        for day in range(1, days_in_month + 1):
-            target_date = date(year, month, day)
-
-            success, content, errors = personalization_engine.generate_daily_content(
-                customer_profile=customer_profile,
-                target_date=target_date
-            )
-
-            if success and content:
-                daily_contents.append(content.schema_output)
-            else:
-                # Use placeholder if generation fails
-                print(f"[Warning] Failed to generate content for {target_date}: {errors}")
-                daily_contents.append({
-                    "date": target_date.strftime("%Y-%m-%d"),
-                    "summary": "콘텐츠 생성 실패",
-                })
-
-        # 4. Build monthly content structure
-        monthly_content = {
-            "year": year,
-            "month": month,
-            "daily_pages": daily_contents,
-        }
-
-        # 5. Create temporary PDF file
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".pdf",
-            prefix=f"diary_{user_id}_{year}_{month:02d}_"
-        ) as tmp_file:
-            output_path = tmp_file.name
-
-        # 6. Generate PDF
-        pdf_generator.generate_monthly_pdf(
-            year=year,
-            month=month,
-            content=monthly_content,
-            output_path=output_path,
-            role=customer_profile.primary_role.value
+        # 3~4. Generate every day's content (worker thread) and render all pages as one document
+        output = await _pdf_flight.do(
+            etag, lambda: _render_customer_monthly_pdf(customer_profile, year, month), share=share_pdf_output
         )
 
-        # 7. Return PDF file response
+        # 5. Return PDF response (large PDFs stream from a temp file that is then removed)
         filename = f"R3_Diary_{customer_profile.name}_{year}_{month:02d}.pdf"
 
-        return FileResponse(
-            path=output_path,
-            media_type="application/pdf",
-            filename=filename,
-            background=None
-        )
+        download = pdf_response(output, filename)
+        download.headers.update(cache_headers(etag))
+        return download
 
     except HTTPException:
         raise
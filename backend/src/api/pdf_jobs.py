@@ -0,0 +1,253 @@
+"""
+PDF Job API Endpoints
+긴 문서(월간/기간/고객 배치 PDF)를 위한 비동기 PDF 작업 API
+
+동기 PDF 엔드포인트는 문서 전체를 렌더링할 때까지 응답하지 않아
+프록시 타임아웃에 걸립니다. 작업 API는 즉시 job_id를 반환하고
+클라이언트가 상태를 폴링한 뒤 결과를 내려받습니다.
+
+    POST /api/pdf/jobs                 → 202, 작업 생성
+    GET  /api/pdf/jobs                 → 내 작업 목록
+    GET  /api/pdf/jobs/{job_id}        → 상태/진행률
+    GET  /api/pdf/jobs/{job_id}/result → 결과 PDF
+"""
+from fastapi import APIRouter, Header, HTTPException, Depends
+from fastapi.responses import FileResponse
+from supabase import Client
+from typing import List, Optional
+import asyncio
+import datetime
+import os
+import sys
+from pathlib import Path
+
+# PDF Generator import
+sys.path.append(str(Path(__file__).parent.parent.parent.parent / "pdf-generator"))
+from render_pool import PDFOutput, get_render_pool, shutdown_render_pool
+from pdf_cache import get_pdf_cache, render_with_cache
+from pdf_jobs import (
+    JOB_SUCCEEDED,
+    PDFJob,
+    PDFJobLimitError,
+    ProgressCallback,
+    get_job_manager,
+    shutdown_job_manager,
+)
+
+# Backend imports
+from src.api.auth import get_current_user
+from src.api.helpers import cache_headers, content_etag, file_fingerprint, not_modified
+from src.api.models import PDFJobCreate, PDFJobResponse
+from src.api.pdf import build_monthly_content
+from src.api.pdf_customer import load_customer_profile, generate_day_content
+from src.db.supabase import get_supabase
+from src.utils.metrics import PDF_RENDER_LATENCY, observe
+
+router = APIRouter(
+    prefix="/api/pdf/jobs",
+    tags=["PDF Jobs"],
+    on_shutdown=[shutdown_job_manager, shutdown_render_pool],
+)
+
+# 기간 PDF 최대 일수
+MAX_PERIOD_DAYS = 366
+
+# 비동기 작업의 렌더링 타임아웃 (동기 요청보다 길게)
+ASYNC_RENDER_TIMEOUT = float(os.getenv("PDF_ASYNC_JOB_TIMEOUT", "600"))
+
+
+def _job_response(job: PDFJob) -> PDFJobResponse:
+    """작업 상태 → 응답 모델"""
+    status_url = f"{router.prefix}/{job.id}"
+    return PDFJobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status,
+        progress=round(job.progress, 3),
+        message=job.message,
+        filename=job.filename,
+        size=job.size,
+        error=job.error,
+        status_url=status_url,
+        result_url=f"{status_url}/result" if job.status == JOB_SUCCEEDED else None,
+    )
+
+
+async def _render(method: str, **kwargs) -> PDFOutput:
+    """작업용 렌더링 (캐시 우선, 긴 타임아웃)"""
+    with observe(PDF_RENDER_LATENCY, method=method):
+        return await render_with_cache(
+            get_render_pool(), get_pdf_cache(), method, timeout=ASYNC_RENDER_TIMEOUT, **kwargs
+        )
+
+
+def _period_dates(request: PDFJobCreate) -> List[datetime.date]:
+    """요청의 기간(월 또는 start~end)을 날짜 목록으로 변환"""
+    if request.kind == "customer_monthly":
+        if request.year is None or request.month is None:
+            raise HTTPException(status_code=400, detail="year와 month가 필요합니다.")
+        from calendar import monthrange
+        days = monthrange(request.year, request.month)[1]
+        return [datetime.date(request.year, request.month, day) for day in range(1, days + 1)]
+
+    if request.start_date is None or request.end_date is None:
+        raise HTTPException(status_code=400, detail="start_date와 end_date가 필요합니다.")
+    total = (request.end_date - request.start_date).days + 1
+    if total < 1:
+        raise HTTPException(status_code=400, detail="end_date는 start_date 이후여야 합니다.")
+    if total > MAX_PERIOD_DAYS:
+        raise HTTPException(status_code=400, detail=f"기간은 최대 {MAX_PERIOD_DAYS}일입니다.")
+    return [request.start_date + datetime.timedelta(days=i) for i in range(total)]
+
+
+def _monthly_job(user_id: str, token: str, request: PDFJobCreate):
+    """본인/대상자 월간 PDF 작업 본문"""
+    if request.year is None or request.month is None:
+        raise HTTPException(status_code=400, detail="year와 month가 필요합니다.")
+    role = request.role.value if request.role else None
+
+    async def build(report: ProgressCallback) -> PDFOutput:
+        report(0.1, "월간 콘텐츠 생성 중")
+        content = await asyncio.to_thread(
+            build_monthly_content, user_id, token, request.recipient_id, request.year, request.month
+        )
+        report(0.8, "PDF 렌더링 중")
+        return await _render("generate_monthly_pdf", content=content, role=role)
+
+    filename = f"R3_Diary_{request.year}_{request.month:02d}"
+    if role:
+        filename += f"_{role}"
+    return filename + ".pdf", build
+
+
+async def _customer_period_job(request: PDFJobCreate):
+    """고객 프로필 월간/기간 PDF 작업 본문 (날짜별 진행률 보고)"""
+    if not request.customer_id:
+        raise HTTPException(status_code=400, detail="customer_id가 필요합니다.")
+    dates = _period_dates(request)
+    customer_profile = await load_customer_profile(request.customer_id)
+
+    if request.kind == "customer_monthly":
+        title = f"{request.year}년 {request.month}월"
+        filename = f"R3_Diary_{customer_profile.name}_{request.year}_{request.month:02d}.pdf"
+    else:
+        title = f"{dates[0]} ~ {dates[-1]}"
+        filename = f"R3_Diary_{customer_profile.name}_{dates[0]}_{dates[-1]}.pdf"
+
+    async def build(report: ProgressCallback) -> PDFOutput:
+        contents = []
+        for index, target_date in enumerate(dates):
+            contents.append(await asyncio.to_thread(generate_day_content, customer_profile, target_date))
+            report(0.8 * (index + 1) / len(dates), f"콘텐츠 생성 중 ({index + 1}/{len(dates)})")
+        report(0.8, "PDF 렌더링 중")
+        return await _render(
+            "generate_period_pdf",
+            contents=contents,
+            role=customer_profile.primary_role.value,
+            title=title
+        )
+
+    return filename, build
+
+
+@router.post("", response_model=PDFJobResponse, status_code=202)
+async def create_pdf_job(
+    request: PDFJobCreate,
+    authorization: str = Header(...),
+    supabase: Client = Depends(get_supabase)
+):
+    """
+    PDF 렌더링 작업 생성
+
+    - **kind**: monthly | customer_monthly | customer_period
+    - **year/month**: monthly, customer_monthly
+    - **start_date/end_date**: customer_period (최대 366일)
+    - **customer_id**: customer_* 작업의 고객 프로필 ID
+
+    사용자별 동시 작업 수를 넘으면 429를 반환합니다.
+
+    **사용 예시**:
+    ```bash
+    curl -X POST -H "Authorization: Bearer {token}" -H "Content-Type: application/json" \\
+         -d '{"kind": "monthly", "year": 2026, "month": 1}' \\
+         http://localhost:8000/api/pdf/jobs
+    ```
+    """
+    user = get_current_user(authorization, supabase)
+
+    if request.kind == "monthly":
+        token = authorization.split(" ")[1]
+        filename, build = _monthly_job(user.id, token, request)
+    else:
+        filename, build = await _customer_period_job(request)
+
+    try:
+        job = get_job_manager().create(user.id, request.kind, filename, build)
+    except PDFJobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+
+    return _job_response(job)
+
+
+@router.get("", response_model=List[PDFJobResponse])
+async def list_pdf_jobs(
+    authorization: str = Header(...),
+    supabase: Client = Depends(get_supabase)
+):
+    """내 PDF 작업 목록 (최근 생성 순)"""
+    user = get_current_user(authorization, supabase)
+    return [_job_response(job) for job in get_job_manager().store.list_for_owner(user.id)]
+
+
+@router.get("/{job_id}", response_model=PDFJobResponse)
+async def get_pdf_job(
+    job_id: str,
+    authorization: str = Header(...),
+    supabase: Client = Depends(get_supabase)
+):
+    """PDF 작업 상태 및 진행률 조회"""
+    user = get_current_user(authorization, supabase)
+    job = get_job_manager().get(job_id, owner=user.id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return _job_response(job)
+
+
+@router.get("/{job_id}/result")
+async def download_pdf_job_result(
+    job_id: str,
+    authorization: str = Header(...),
+    if_none_match: Optional[str] = Header(None),
+    supabase: Client = Depends(get_supabase)
+):
+    """
+    완료된 작업의 PDF 다운로드
+
+    진행 중이면 409(Retry-After), 실패했으면 409와 실패 사유를 반환합니다.
+    """
+    user = get_current_user(authorization, supabase)
+    manager = get_job_manager()
+    job = manager.get(job_id, owner=user.id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    if job.is_active:
+        raise HTTPException(
+            status_code=409,
+            detail=f"PDF가 아직 준비되지 않았습니다 ({int(job.progress * 100)}%)",
+            headers={"Retry-After": "5"},
+        )
+
+    path = manager.result_path(job)
+    if path is None:
+        raise HTTPException(status_code=409, detail=job.error or "PDF 결과가 없습니다.")
+
+    # 작업 결과는 바뀌지 않으므로 작업 ID + 파일 버전으로 재검증
+    etag = content_etag("pdf_job", job=job.id, **file_fingerprint(path))
+    cached = not_modified(etag, if_none_match)
+    if cached is not None:
+        return cached
+
+    download = FileResponse(path=path, media_type="application/pdf", filename=job.filename)
+    download.headers.update(cache_headers(etag))
+    return download
@@ -7,6 +7,8 @@ Content Assembly Engine
 - validator.py: DAILY_CONTENT_SCHEMA.json 검증
 - assembly.py: 리듬 신호 → 콘텐츠 블록 변환
 - models.py: 콘텐츠 데이터 모델 (Pydantic)
+- dedup.py: 동일 입력 사용자 그룹화 (배치 중복 제거)
+- metrics.py: 단일 순회 글자 수 분석 (검증기 공용)
 """
 
 from .models import (
@@ -30,8 +32,10 @@ from .models import (
     RelationshipsSocial,
     SeasonalEnvironment,
 )
-from .validator import validate_daily_content
+from .metrics import ContentMetrics, analyze_content
+from .validator import validate_daily_content, validate_translated_daily_content
 from .assembly import assemble_daily_content, assemble_monthly_content, assemble_yearly_content
+from .dedup import content_fingerprint, group_by_fingerprint, assemble_daily_content_batch
 
 __all__ = [
     # 기존 모델들
@@ -56,7 +60,13 @@ __all__ = [
     "SeasonalEnvironment",
     # 함수들
     "validate_daily_content",
+    "validate_translated_daily_content",
     "assemble_daily_content",
     "assemble_monthly_content",
     "assemble_yearly_content",
+    "content_fingerprint",
+    "group_by_fingerprint",
+    "assemble_daily_content_batch",
+    "ContentMetrics",
+    "analyze_content",
 ]
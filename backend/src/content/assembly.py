@@ -10,6 +10,8 @@ import datetime
 from datetime import date, time
 from typing import Dict, Any
 
+from ..utils.timing import span
+
 
 def assemble_daily_content(
     target_date: datetime.date,
@@ -57,18 +59,66 @@ def assemble_daily_content(
     rhythm_question = _generate_rhythm_question(daily_rhythm)
 
     # 10-19. 라이프스타일 블록 (스키마 필수 항목)
-    health_sports = _generate_daily_health_sports(daily_rhythm, saju_data)
-    meal_nutrition = _generate_daily_meal_nutrition(daily_rhythm, saju_data)
-    fashion_beauty = _generate_daily_fashion_beauty(daily_rhythm, saju_data)
-    shopping_finance = _generate_daily_shopping_finance(daily_rhythm, saju_data)
-    living_space = _generate_daily_living_space(daily_rhythm, saju_data)
-    daily_routines = _generate_daily_routines(daily_rhythm, saju_data)
-    digital_comm = _generate_digital_communication(daily_rhythm, saju_data)
-    hobbies = _generate_hobbies_creativity(daily_rhythm, saju_data)
-    relationships = _generate_relationships_social(daily_rhythm, saju_data)
-    seasonal = _generate_seasonal_environment(daily_rhythm, saju_data, target_date)
+    with span("assembly_lifestyle"):
+        health_sports = _generate_daily_health_sports(daily_rhythm, saju_data)
+        meal_nutrition = _generate_daily_meal_nutrition(daily_rhythm, saju_data)
+        fashion_beauty = _generate_daily_fashion_beauty(daily_rhythm, saju_data)
+        shopping_finance = _generate_daily_shopping_finance(daily_rhythm, saju_data)
+        living_space = _generate_daily_living_space(daily_rhythm, saju_data)
+        daily_routines = _generate_daily_routines(daily_rhythm, saju_data)
+        digital_comm = _generate_digital_communication(daily_rhythm, saju_data)
+        hobbies = _generate_hobbies_creativity(daily_rhythm, saju_data)
+        relationships = _generate_relationships_social(daily_rhythm, saju_data)
+        seasonal = _generate_seasonal_environment(daily_rhythm, saju_data, target_date)
 
     # 사주 데이터를 프론트엔드 형식으로 변환
+    display_fields = _build_saju_display_fields(saju_data)
+
+    content = {
+        "date": target_date.strftime("%Y-%m-%d"),
+        "summary": summary,
+        "keywords": keywords,
+        "rhythm_description": rhythm_description,
+        "focus_caution": focus_caution,
+        "action_guide": action_guide,
+        "time_direction": time_direction,
+        "state_trigger": state_trigger,
+        "meaning_shift": meaning_shift,
+        "rhythm_question": rhythm_question,
+        # 라이프스타일 블록 (스키마 요구사항)
+        "daily_health_sports": health_sports,
+        "daily_meal_nutrition": meal_nutrition,
+        "daily_fashion_beauty": fashion_beauty,
+        "daily_shopping_finance": shopping_finance,
+        "daily_living_space": living_space,
+        "daily_routines": daily_routines,
+        "digital_communication": digital_comm,
+        "hobbies_creativity": hobbies,
+        "relationships_social": relationships,
+        "seasonal_environment": seasonal,
+        # 사주 원본 데이터 (프론트엔드 표시용, 영문 키로 변환)
+        "fourPillars": display_fields["fourPillars"],
+        "gyeokGuk": display_fields["gyeokGuk"],
+        "yongSin": display_fields["yongSin"],
+    }
+
+    # 좌측 페이지 최소 700자 보장
+    with span("assembly_padding"):
+        content = _ensure_minimum_content_length(content, daily_rhythm)
+
+    # DEBUG: 원본 텍스트 로깅
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.debug(f"[ASSEMBLY DEBUG] fashion_beauty.style: {content['daily_fashion_beauty'].get('style', 'N/A')}")
+    logger.debug(f"[ASSEMBLY DEBUG] daily_routines.morning: {content['daily_routines'].get('morning', 'N/A')}")
+    logger.debug(f"[ASSEMBLY DEBUG] meaning_shift: {content['meaning_shift'][:100]}")
+    logger.debug(f"[ASSEMBLY DEBUG] rhythm_question: {content['rhythm_question']}")
+
+    return content
+
+
+def _build_saju_display_fields(saju_data: Dict[str, Any]) -> Dict[str, Any]:
+    """사주 원본 데이터를 프론트엔드 표시용 필드(영문 키)로 변환"""
     four_pillars = None
     if saju_data and "사주" in saju_data:
         saju = saju_data["사주"]
@@ -107,47 +157,12 @@ def assemble_daily_content(
             "yongSin": saju_data["용신"].get("용신", [])
         }
 
-    content = {
-        "date": target_date.strftime("%Y-%m-%d"),
-        "summary": summary,
-        "keywords": keywords,
-        "rhythm_description": rhythm_description,
-        "focus_caution": focus_caution,
-        "action_guide": action_guide,
-        "time_direction": time_direction,
-        "state_trigger": state_trigger,
-        "meaning_shift": meaning_shift,
-        "rhythm_question": rhythm_question,
-        # 라이프스타일 블록 (스키마 요구사항)
-        "daily_health_sports": health_sports,
-        "daily_meal_nutrition": meal_nutrition,
-        "daily_fashion_beauty": fashion_beauty,
-        "daily_shopping_finance": shopping_finance,
-        "daily_living_space": living_space,
-        "daily_routines": daily_routines,
-        "digital_communication": digital_comm,
-        "hobbies_creativity": hobbies,
-        "relationships_social": relationships,
-        "seasonal_environment": seasonal,
-        # 사주 원본 데이터 (프론트엔드 표시용, 영문 키로 변환)
+    return {
         "fourPillars": four_pillars,
         "gyeokGuk": gyeok_guk,
         "yongSin": yong_sin,
     }
 
-    # 좌측 페이지 최소 700자 보장
-    content = _ensure_minimum_content_length(content, daily_rhythm)
-
-    # DEBUG: 원본 텍스트 로깅
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.debug(f"[ASSEMBLY DEBUG] fashion_beauty.style: {content['daily_fashion_beauty'].get('style', 'N/A')}")
-    logger.debug(f"[ASSEMBLY DEBUG] daily_routines.morning: {content['daily_routines'].get('morning', 'N/A')}")
-    logger.debug(f"[ASSEMBLY DEBUG] meaning_shift: {content['meaning_shift'][:100]}")
-    logger.debug(f"[ASSEMBLY DEBUG] rhythm_question: {content['rhythm_question']}")
-
-    return content
-
 
 def _generate_summary(daily_rhythm: Dict[str, Any]) -> str:
     """하루 요약 생성"""
@@ -7,6 +7,8 @@ Validates per-block and total page character counts against configurable targets
 
 from typing import Dict, Any, List, Tuple, Optional
 
+from .metrics import ContentMetrics, analyze_content
+
 
 # Per-block character count targets for A5 left page
 # Target: ~1000 chars total (fits A5 left page with 10pt font, ~45 chars/line, ~50 lines)
@@ -56,12 +58,16 @@ class CharOptimizer:
         return is_valid, actual_count, target_range
 
     @staticmethod
-    def validate_page(content: Dict[str, Any]) -> Tuple[bool, int, List[Dict[str, Any]]]:
+    def validate_page(
+        content: Dict[str, Any],
+        metrics: Optional[ContentMetrics] = None,
+    ) -> Tuple[bool, int, List[Dict[str, Any]]]:
         """
         Validate total character count for entire left page.
 
         Args:
             content: Daily content dictionary with all blocks
+            metrics: Precomputed analyze_content() result (computed here if omitted)
 
         Returns:
             Tuple of (is_valid, total_chars, issues_list)
@@ -69,6 +75,9 @@ class CharOptimizer:
             - total_chars: Total character count for left page
             - issues_list: List of validation issues (if any)
         """
+        if metrics is None:
+            metrics = analyze_content(content)
+
         issues = []
         total_chars = 0
 
@@ -94,9 +103,8 @@ class CharOptimizer:
                 })
                 continue
 
-            # Calculate character count based on content type
-            block_content = content[content_key]
-            block_chars = CharOptimizer._calculate_block_chars(block_content)
+            # Character count from the single-pass analysis (same rules as _calculate_block_chars)
+            block_chars = metrics.block_chars.get(content_key, 0)
 
             # Validate block
             is_valid, actual_count, target_range = CharOptimizer.validate_block(
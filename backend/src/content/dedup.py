@@ -0,0 +1,172 @@
+"""
+일간 콘텐츠 중복 제거 (배치용)
+
+assemble_daily_content의 사용자 노출 텍스트는 소수의 파생 입력값에만 의존합니다:
+에너지/집중력/사회운/결정력, 주요 흐름, 기회/도전 요소, 유리한 시간/방향,
+일간 천간, 격국 강약, 용신, 성격 조언, 날짜, 기문 요약.
+
+같은 날 이 입력값이 동일한 사용자들은 동일한 페이지를 받으므로,
+야간 배치에서는 입력값 지문(fingerprint)으로 사용자를 묶어
+페이지를 한 번만 조합/번역한 뒤 각 사용자에게 나눠줍니다.
+
+사주 원본 표시용 필드(fourPillars, gyeokGuk, yongSin)는 사용자마다 다르므로
+지문에서 제외하고, 나눠줄 때 사용자별로 다시 채웁니다.
+"""
+import datetime
+import hashlib
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..translation import translate_daily_content
+from .assembly import assemble_daily_content, _build_saju_display_fields
+
+
+# 지문에 포함되는 일간 리듬 필드 (assembly.py가 읽는 키)
+_RHYTHM_KEYS = (
+    "에너지_수준",
+    "집중력",
+    "사회운",
+    "결정력",
+    "주요_흐름",
+    "기회_요소",
+    "도전_요소",
+    "유리한_시간",
+    "주의_시간",
+    "유리한_방향",
+)
+
+
+def fingerprint_inputs(
+    target_date: datetime.date,
+    saju_data: Dict[str, Any],
+    daily_rhythm: Dict[str, Any],
+    qimen_summary: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    콘텐츠 텍스트에 영향을 주는 입력값만 추출
+
+    Args:
+        target_date: 대상 날짜
+        saju_data: 사주 계산 결과 (calculate_saju 반환값)
+        daily_rhythm: 일간 리듬 분석 결과 (analyze_daily_fortune 반환값)
+        qimen_summary: 기문둔갑 요약 (best_direction, avoid_direction, peak_hours)
+
+    Returns:
+        정규화된 입력값 딕셔너리
+    """
+    saju_data = saju_data or {}
+    traits = saju_data.get("성격", {}).get("dayMasterTraits", {}) or {}
+    qimen_summary = qimen_summary or {}
+
+    return {
+        "date": target_date.isoformat(),
+        "rhythm": {key: daily_rhythm.get(key) for key in _RHYTHM_KEYS},
+        "day_stem": saju_data.get("사주", {}).get("일주", {}).get("천간", ""),
+        "strength": saju_data.get("격국", {}).get("강약", ""),
+        "yongsin": list(saju_data.get("용신", {}).get("용신", []))[:2],
+        "advice": traits.get("advice", ""),
+        "weaknesses": list(traits.get("weaknesses", []))[:2],
+        "qimen": {
+            "best_direction": qimen_summary.get("best_direction"),
+            "avoid_direction": qimen_summary.get("avoid_direction"),
+            "peak_hours": qimen_summary.get("peak_hours"),
+        },
+    }
+
+
+def content_fingerprint(
+    target_date: datetime.date,
+    saju_data: Dict[str, Any],
+    daily_rhythm: Dict[str, Any],
+    qimen_summary: Optional[Dict[str, Any]] = None,
+    role: Optional[str] = None,
+) -> str:
+    """
+    일간 콘텐츠 지문 계산
+
+    지문이 같으면 assemble_daily_content(+ 역할 번역) 결과의 텍스트가 동일합니다.
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    payload = fingerprint_inputs(target_date, saju_data, daily_rhythm, qimen_summary)
+    payload["role"] = role
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def group_by_fingerprint(entries: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """
+    배치 항목을 지문별로 묶기
+
+    Args:
+        entries: 항목 리스트. 각 항목은 target_date, saju_data, daily_rhythm,
+                 qimen_summary(선택), role(선택) 키를 가집니다.
+
+    Returns:
+        {지문: [항목 인덱스, ...]} (삽입 순서 유지)
+    """
+    groups: Dict[str, List[int]] = {}
+    for idx, entry in enumerate(entries):
+        key = content_fingerprint(
+            entry["target_date"],
+            entry.get("saju_data", {}),
+            entry["daily_rhythm"],
+            entry.get("qimen_summary"),
+            entry.get("role"),
+        )
+        groups.setdefault(key, []).append(idx)
+    return groups
+
+
+def assemble_daily_content_batch(
+    entries: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    여러 사용자의 일간 콘텐츠를 중복 제거하여 조합
+
+    지문이 같은 그룹마다 한 번만 조합/번역하고, 사주 표시용 필드만
+    사용자별로 다시 채웁니다. 결과는 입력과 같은 순서입니다.
+
+    ⚠️ 같은 그룹의 결과는 중첩 블록(dict/list)을 공유합니다.
+    결과를 수정해야 한다면 먼저 복사하세요.
+
+    Args:
+        entries: group_by_fingerprint와 같은 형식의 항목 리스트
+
+    Returns:
+        (contents, stats)
+        - contents: 항목별 일간 콘텐츠 리스트
+        - stats: {"total", "unique", "dedup_ratio"}
+    """
+    groups = group_by_fingerprint(entries)
+    contents: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+
+    for indices in groups.values():
+        first = entries[indices[0]]
+        page = assemble_daily_content(
+            first["target_date"],
+            first.get("saju_data", {}),
+            first["daily_rhythm"],
+            first.get("qimen_summary"),
+        )
+        role = first.get("role")
+        if role:
+            page = translate_daily_content(page, role)
+
+        for idx in indices:
+            if idx == indices[0]:
+                contents[idx] = page
+                continue
+            shared = dict(page)
+            shared.update(_build_saju_display_fields(entries[idx].get("saju_data", {})))
+            contents[idx] = shared
+
+    total = len(entries)
+    unique = len(groups)
+    stats = {
+        "total": total,
+        "unique": unique,
+        "dedup_ratio": round(total / unique, 2) if unique else 0.0,
+    }
+    return contents, stats
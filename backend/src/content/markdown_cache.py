@@ -0,0 +1,201 @@
+"""
+날짜별 Markdown / HTML 공유 캐시
+
+backend/daily/{date}.md 파일은 모든 사용자에게 같은 내용이므로
+사용자별이 아니라 파일 버전(경로, inode, mtime, 크기) 단위로 캐시합니다.
+
+- 파일이 바뀌면 stat 결과가 달라져 자동으로 새 버전을 읽습니다.
+- Markdown → HTML 변환은 파일 버전당 한 번만 수행합니다.
+- 항목 수 상한을 넘으면 가장 오래 사용하지 않은 파일부터 제거합니다 (LRU).
+- prerender()로 디렉토리 전체를 미리 읽고 변환해 둘 수 있습니다.
+"""
+import importlib.util
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+# markdown 모듈 자체는 첫 변환 시점에 import (콜드 스타트 단축)
+MARKDOWN_AVAILABLE = importlib.util.find_spec("markdown") is not None
+
+logger = logging.getLogger(__name__)
+
+# backend/daily/
+DAILY_DIR = Path(__file__).parent.parent.parent / "daily"
+
+MARKDOWN_EXTENSIONS = ["extra", "nl2br", "sane_lists"]
+
+# 태그별 기본 스타일링 클래스
+HTML_TAG_CLASSES = {
+    "h1": "text-3xl font-bold mb-4",
+    "h2": "text-2xl font-semibold mb-3 mt-6",
+    "h3": "text-xl font-medium mb-2 mt-4",
+    "ul": "list-disc list-inside mb-4 space-y-1",
+    "ol": "list-decimal list-inside mb-4 space-y-1",
+    "p": "mb-3 leading-relaxed",
+    "hr": "my-6 border-gray-300",
+}
+_TAG_PATTERN = re.compile(r"<(" + "|".join(HTML_TAG_CLASSES) + r")>")
+
+# 파일 버전 키: (inode, mtime_ns, size)
+FileVersion = Tuple[int, int, int]
+
+
+def render_markdown_html(markdown_text: str) -> str:
+    """
+    Markdown → 스타일 클래스가 붙은 HTML
+
+    Args:
+        markdown_text: Markdown 원문
+
+    Returns:
+        HTML 문자열
+
+    Raises:
+        RuntimeError: markdown 라이브러리 미설치
+    """
+    if not MARKDOWN_AVAILABLE:
+        raise RuntimeError("markdown 라이브러리가 설치되지 않았습니다. 'pip install markdown'을 실행하세요.")
+    import markdown
+
+    html = markdown.markdown(markdown_text, extensions=MARKDOWN_EXTENSIONS)
+    return _TAG_PATTERN.sub(
+        lambda match: f'<{match.group(1)} class="{HTML_TAG_CLASSES[match.group(1)]}">', html
+    )
+
+
+def resolve_daily_markdown(date_str: str, directory: Path = DAILY_DIR) -> Optional[Path]:
+    """
+    날짜의 Markdown 파일 경로 ({date}_new_format.md 우선, 없으면 {date}.md)
+
+    Returns:
+        파일 경로 (둘 다 없으면 None)
+    """
+    for name in (f"{date_str}_new_format.md", f"{date_str}.md"):
+        path = directory / name
+        if path.is_file():
+            return path
+    return None
+
+
+@dataclass
+class _Entry:
+    version: FileVersion
+    text: str
+    html: Optional[str] = None
+
+
+class MarkdownCache:
+    """
+    프로세스 전역 Markdown/HTML 캐시 (파일 버전 키, LRU)
+
+    Args:
+        max_entries: 보관할 파일 수 상한
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # 경로 → 최신 버전 항목 (오래 사용하지 않은 순서)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _version(path: Path) -> FileVersion:
+        stat = os.stat(path)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _entry(self, path: Path) -> _Entry:
+        """현재 파일 버전의 항목 (없거나 바뀌었으면 다시 읽음)"""
+        key = str(path)
+        version = self._version(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = _Entry(version=version, text=path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get_markdown(self, path: Path) -> str:
+        """
+        Markdown 원문
+
+        Raises:
+            FileNotFoundError: 파일 없음
+        """
+        return self._entry(path).text
+
+    def get_html(self, path: Path) -> str:
+        """
+        변환된 HTML (파일 버전당 한 번만 변환)
+
+        Raises:
+            FileNotFoundError: 파일 없음
+            RuntimeError: markdown 라이브러리 미설치
+        """
+        entry = self._entry(path)
+        if entry.html is None:
+            # 동시에 변환되더라도 결과가 같으므로 잠금 없이 기록
+            entry.html = render_markdown_html(entry.text)
+            self.renders += 1
+        return entry.html
+
+    def prerender(self, directory: Path = DAILY_DIR) -> int:
+        """
+        디렉토리의 모든 .md 파일을 읽고 HTML로 변환해 둠
+
+        Returns:
+            변환한 파일 수
+        """
+        count = 0
+        for path in sorted(Path(directory).glob("*.md"))[-self.max_entries:]:
+            try:
+                if MARKDOWN_AVAILABLE:
+                    self.get_html(path)
+                else:
+                    self.get_markdown(path)
+                count += 1
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Markdown 미리 읽기 실패 ({path.name}): {e}")
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_markdown_cache: Optional[MarkdownCache] = None
+_markdown_cache_lock = threading.Lock()
+
+
+def get_markdown_cache() -> MarkdownCache:
+    """
+    프로세스 전역 Markdown 캐시 (최초 호출 시 환경변수로 설정)
+
+    - MARKDOWN_CACHE_MAX_ENTRIES: 보관할 파일 수 상한 (기본 256)
+    """
+    global _markdown_cache
+    with _markdown_cache_lock:
+        if _markdown_cache is None:
+            _markdown_cache = MarkdownCache(
+                max_entries=int(os.getenv("MARKDOWN_CACHE_MAX_ENTRIES", "256"))
+            )
+        return _markdown_cache
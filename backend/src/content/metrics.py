@@ -0,0 +1,146 @@
+"""
+콘텐츠 글자 수 분석기 (단일 순회)
+
+validator.py, char_optimizer.py, translation의 의미 보존 검증이
+각자 콘텐츠 트리를 다시 순회하며 길이를 세던 것을 한 번의 순회로 합칩니다.
+
+analyze_content()의 결과(ContentMetrics)를 세 검증기에 넘기면
+같은 콘텐츠를 다시 순회하지 않습니다.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Iterable, Optional
+
+from ..utils.term_scanner import get_term_scanner
+
+
+# 좌측 페이지 글자 수에 포함되는 필드 (validator 기준)
+LEFT_PAGE_FIELDS = (
+    "summary",
+    "rhythm_description",
+    "focus_caution.focus",
+    "focus_caution.caution",
+    "action_guide.do",
+    "action_guide.avoid",
+    "time_direction.notes",
+    "state_trigger.how_to",
+    "meaning_shift",
+    "rhythm_question",
+)
+
+# 의미 보존 검증에 쓰는 핵심 필드 (translator 기준)
+CORE_FIELDS = (
+    "summary",
+    "rhythm_description",
+    "meaning_shift",
+    "rhythm_question",
+    "focus_caution.focus",
+    "focus_caution.caution",
+    "action_guide.do",
+    "action_guide.avoid",
+    "state_trigger.how_to",
+)
+
+
+@dataclass
+class ContentMetrics:
+    """콘텐츠 한 건의 글자 수 분석 결과"""
+    # 최상위 블록별 글자 수 (CharOptimizer 블록 정의: 문자열, 문자열 리스트, 1단계 dict)
+    block_chars: Dict[str, int] = field(default_factory=dict)
+    # 필드별 글자 수 ("summary", "time_direction.notes", "action_guide.do" 등)
+    field_lengths: Dict[str, int] = field(default_factory=dict)
+    # 발견된 금지 용어 (forbidden_terms를 넘긴 경우에만)
+    forbidden_hits: List[str] = field(default_factory=list)
+    # 전체 텍스트 (금지 용어 검사용, 공백으로 연결)
+    text: str = ""
+
+    def length(self, path: str) -> int:
+        """필드 글자 수 (없으면 0)"""
+        return self.field_lengths.get(path, 0)
+
+    def sum_lengths(self, paths: Iterable[str]) -> int:
+        """여러 필드 글자 수 합계"""
+        return sum(self.field_lengths.get(p, 0) for p in paths)
+
+    @property
+    def left_page_length(self) -> int:
+        """좌측 페이지 총 글자 수 (validator 기준)"""
+        return self.sum_lengths(LEFT_PAGE_FIELDS)
+
+    @property
+    def core_length(self) -> int:
+        """핵심 블록 총 글자 수 (의미 보존 검증 기준)"""
+        return self.sum_lengths(CORE_FIELDS)
+
+
+def analyze_content(
+    content: Dict[str, Any],
+    forbidden_terms: Optional[Iterable[str]] = None,
+) -> ContentMetrics:
+    """
+    콘텐츠 트리를 한 번 순회하여 블록/필드 글자 수와 금지 용어를 계산
+
+    Args:
+        content: 일간 콘텐츠 딕셔너리
+        forbidden_terms: 검사할 금지 용어 (None이면 검사 생략)
+
+    Returns:
+        ContentMetrics
+    """
+    metrics = ContentMetrics()
+    parts: List[str] = []
+
+    for key, value in content.items():
+        if isinstance(value, str):
+            block = len(value)
+            metrics.field_lengths[key] = block
+            parts.append(value)
+        elif isinstance(value, list):
+            block = _list_chars(value, parts)
+            metrics.field_lengths[key] = block
+        elif isinstance(value, dict):
+            block = 0
+            for sub_key, sub_value in value.items():
+                path = f"{key}.{sub_key}"
+                if isinstance(sub_value, str):
+                    metrics.field_lengths[path] = len(sub_value)
+                    block += len(sub_value)
+                    parts.append(sub_value)
+                elif isinstance(sub_value, list):
+                    sub_len = _list_chars(sub_value, parts)
+                    metrics.field_lengths[path] = sub_len
+                    block += sub_len
+                else:
+                    _collect_text(sub_value, parts)
+        else:
+            block = 0
+        metrics.block_chars[key] = block
+
+    metrics.text = " ".join(parts)
+    if forbidden_terms:
+        metrics.forbidden_hits = get_term_scanner(tuple(forbidden_terms)).found_terms(metrics.text)
+
+    return metrics
+
+
+def _list_chars(items: List[Any], parts: List[str]) -> int:
+    """문자열 항목 글자 수 합계 (중첩 항목은 텍스트만 수집)"""
+    total = 0
+    for item in items:
+        if isinstance(item, str):
+            total += len(item)
+            parts.append(item)
+        else:
+            _collect_text(item, parts)
+    return total
+
+
+def _collect_text(obj: Any, parts: List[str]) -> None:
+    """글자 수 집계 대상이 아닌 깊은 값에서 텍스트만 수집"""
+    if isinstance(obj, str):
+        parts.append(obj)
+    elif isinstance(obj, list):
+        for item in obj:
+            _collect_text(item, parts)
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            _collect_text(v, parts)
@@ -3,21 +3,29 @@ DAILY_CONTENT_SCHEMA.json 검증기
 
 생성된 콘텐츠가 스키마를 준수하는지 검증합니다.
 """
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Tuple, Optional
 from .char_optimizer import CharOptimizer
+from .metrics import ContentMetrics, analyze_content
+from ..translation.translator import validate_semantic_preservation
 
 
-def validate_daily_content(content: Dict[str, Any]) -> Tuple[bool, List[str]]:
+def validate_daily_content(
+    content: Dict[str, Any],
+    metrics: Optional[ContentMetrics] = None,
+) -> Tuple[bool, List[str]]:
     """
     일간 콘텐츠가 DAILY_CONTENT_SCHEMA.json을 준수하는지 검증
 
     Args:
         content: 검증할 콘텐츠 딕셔너리
+        metrics: analyze_content() 결과 (없으면 한 번 계산하여 모든 글자 수 검증에 재사용)
 
     Returns:
         (is_valid, errors): 검증 성공 여부와 에러 메시지 리스트
     """
     errors = []
+    if metrics is None:
+        metrics = analyze_content(content)
 
     # 필수 필드 검증
     required_fields = [
@@ -126,16 +134,16 @@ def validate_daily_content(content: Dict[str, Any]) -> Tuple[bool, List[str]]:
             errors.append("rhythm_question은 최소 10자 이상이어야 합니다")
 
     # 좌측 페이지 최소 글자 수 검증
-    left_page_length = _calculate_left_page_length(content)
+    left_page_length = _calculate_left_page_length(content, metrics)
     if left_page_length < 400:
         errors.append(f"좌측 페이지 총 글자 수 부족: {left_page_length}자 (최소 400자 필요)")
 
     # 설명형 문단 존재 여부 검증
-    if not _has_explanatory_paragraphs(content):
+    if not _has_explanatory_paragraphs(content, metrics):
         errors.append("좌측 페이지에 설명형 문단이 필요합니다 (카드 전용 요약만으로는 불충분)")
 
     # CharOptimizer를 사용한 블록별 글자 수 검증
-    char_valid, total_chars, char_issues = CharOptimizer.validate_page(content)
+    char_valid, total_chars, char_issues = CharOptimizer.validate_page(content, metrics)
     if not char_valid:
         for issue in char_issues:
             errors.append(issue.get("message", "글자 수 검증 실패"))
@@ -144,72 +152,83 @@ def validate_daily_content(content: Dict[str, Any]) -> Tuple[bool, List[str]]:
     return is_valid, errors
 
 
-def _is_valid_date_format(date_str: str) -> bool:
-    """YYYY-MM-DD 형식 검증"""
-    import re
-    pattern = r"^\d{4}-\d{2}-\d{2}$"
-    return bool(re.match(pattern, date_str))
-
+def validate_translated_daily_content(
+    original: Dict[str, Any],
+    translated: Dict[str, Any],
+    forbidden_terms: Optional[Iterable[str]] = None,
+) -> Tuple[bool, List[str]]:
+    """
+    역할 번역된 일간 콘텐츠 검증 (스키마/글자 수 + 의미 보존 + 금지 용어)
 
-def _calculate_left_page_length(content: Dict[str, Any]) -> int:
-    """좌측 페이지 총 글자 수 계산"""
-    total_length = 0
+    원본과 번역본을 각각 한 번만 analyze_content()로 분석하고,
+    그 결과를 validate_daily_content, CharOptimizer.validate_page,
+    validate_semantic_preservation에 넘겨 콘텐츠를 다시 순회하지 않습니다.
 
-    # summary
-    total_length += len(content.get("summary", ""))
+    Args:
+        original: 번역 전 원본 콘텐츠
+        translated: 번역된 콘텐츠
+        forbidden_terms: 역할별 금지 용어 (None이면 검사 생략)
 
-    # rhythm_description (주요 설명 블록)
-    total_length += len(content.get("rhythm_description", ""))
+    Returns:
+        (is_valid, errors): 검증 성공 여부와 에러 메시지 리스트
+    """
+    original_metrics = analyze_content(original)
+    translated_metrics = analyze_content(translated, forbidden_terms)
 
-    # focus_caution의 모든 항목
-    fc = content.get("focus_caution", {})
-    for item in fc.get("focus", []):
-        total_length += len(item)
-    for item in fc.get("caution", []):
-        total_length += len(item)
+    _, errors = validate_daily_content(translated, translated_metrics)
+    _, semantic_issues = validate_semantic_preservation(
+        original, translated, original_metrics, translated_metrics
+    )
+    errors.extend(semantic_issues)
+    errors.extend(f"금지 용어 발견: '{term}'" for term in translated_metrics.forbidden_hits)
 
-    # action_guide의 모든 항목
-    ag = content.get("action_guide", {})
-    for item in ag.get("do", []):
-        total_length += len(item)
-    for item in ag.get("avoid", []):
-        total_length += len(item)
+    return len(errors) == 0, errors
 
-    # time_direction의 notes (설명)
-    td = content.get("time_direction", {})
-    total_length += len(td.get("notes", ""))
 
-    # state_trigger의 how_to (설명)
-    st = content.get("state_trigger", {})
-    total_length += len(st.get("how_to", ""))
+def _is_valid_date_format(date_str: str) -> bool:
+    """YYYY-MM-DD 형식 검증"""
+    import re
+    pattern = r"^\d{4}-\d{2}-\d{2}$"
+    return bool(re.match(pattern, date_str))
 
-    # meaning_shift (의미 전환 설명)
-    total_length += len(content.get("meaning_shift", ""))
 
-    # rhythm_question
-    total_length += len(content.get("rhythm_question", ""))
+def _calculate_left_page_length(
+    content: Dict[str, Any],
+    metrics: Optional[ContentMetrics] = None,
+) -> int:
+    """
+    좌측 페이지 총 글자 수 계산
 
-    return total_length
+    summary, rhythm_description, focus_caution/action_guide 항목,
+    time_direction.notes, state_trigger.how_to, meaning_shift, rhythm_question의 합계
+    """
+    if metrics is None:
+        metrics = analyze_content(content)
+    return metrics.left_page_length
 
 
-def _has_explanatory_paragraphs(content: Dict[str, Any]) -> bool:
+def _has_explanatory_paragraphs(
+    content: Dict[str, Any],
+    metrics: Optional[ContentMetrics] = None,
+) -> bool:
     """설명형 문단 존재 여부 확인"""
+    if metrics is None:
+        metrics = analyze_content(content)
+
     # rhythm_description이 충분히 긴지 확인 (최소 200자)
-    if len(content.get("rhythm_description", "")) >= 200:
+    if metrics.length("rhythm_description") >= 200:
         return True
 
     # meaning_shift가 충분히 긴지 확인 (최소 80자)
-    if len(content.get("meaning_shift", "")) >= 80:
+    if metrics.length("meaning_shift") >= 80:
         return True
 
     # time_direction.notes가 충분히 긴지 확인
-    td = content.get("time_direction", {})
-    if len(td.get("notes", "")) >= 30:
+    if metrics.length("time_direction.notes") >= 30:
         return True
 
     # state_trigger.how_to가 충분히 긴지 확인
-    st = content.get("state_trigger", {})
-    if len(st.get("how_to", "")) >= 30:
+    if metrics.length("state_trigger.how_to") >= 30:
         return True
 
     return False
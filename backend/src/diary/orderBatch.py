@@ -0,0 +1,465 @@
+"""
+Bulk Print-Order Batch for Diary System
+
+Turns a directory (or manifest file) of order JSON documents
+(OrderInput, see ORDER_INPUT_SPEC.md) into print-ready period diary PDFs.
+
+- Orders for the same recipient run together in one worker process, so the
+  per-process saju cache and personalization engine are shared between them
+- Recipient groups render in parallel in a process pool
+- manifest.json in the output directory records status, page count, file
+  size and SHA-256 checksum of every order, rewritten after each group
+- Re-running resumes: orders that are already done, whose input has not
+  changed and whose PDF is intact are skipped
+
+Usage:
+    python orderBatch.py <orders_dir|orders.json> --output <dir> [--workers N] [--force]
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from simplePdfConverter import SimplePdfConverter
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+DURATION_MONTHS = {"1m": 1, "3m": 3, "6m": 6, "1y": 12}
+CALENDAR_TYPES = ("solar", "lunar")
+GENDERS = ("male", "female")
+RENDER_MODES = ("standard", "large")
+DEFAULT_BIRTH_PLACE = "서울"
+BIRTH_FIELDS = ('year', 'month', 'day', 'hour', 'minute')
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+
+# ============================================================
+# Order helpers (mirror orderDiaryBuilder.ts)
+# ============================================================
+
+def validate_order(order: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate an OrderInput
+
+    Returns:
+        Error message (ORDER_INPUT_SPEC.md wording), or None when valid
+    """
+    if not str(order.get('customerName') or '').strip():
+        return '고객명(customerName)이 필요합니다'
+
+    birth = order.get('birth')
+    if not birth:
+        return '출생 정보(birth)가 필요합니다'
+    if not isinstance(birth, dict):
+        return '출생 정보(birth)는 객체여야 합니다'
+    if not birth.get('year') or not birth.get('month') or not birth.get('day'):
+        return '출생 년월일(birth.year/month/day)이 필요합니다'
+
+    start_date = str(order.get('startDate') or '').strip()
+    if not start_date:
+        return '시작 날짜(startDate)가 필요합니다'
+    if not order.get('durationType'):
+        return '기간 타입(durationType)이 필요합니다'
+
+    if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', start_date):
+        return 'startDate는 YYYY-MM-DD 형식이어야 합니다'
+    try:
+        date.fromisoformat(start_date)
+    except ValueError:
+        return '유효하지 않은 시작 날짜입니다'
+
+    # JSON 문자열("1990")이나 true가 숫자 비교까지 가지 않도록 정수만 허용
+    for field in BIRTH_FIELDS:
+        value = birth.get(field)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            return '출생 정보(birth.year/month/day/hour/minute)는 정수여야 합니다'
+
+    if not 1900 <= birth['year'] <= date.today().year:
+        return '출생 연도가 유효하지 않습니다 (1900-현재)'
+    if not 1 <= birth['month'] <= 12:
+        return '출생 월이 유효하지 않습니다 (1-12)'
+    if not 1 <= birth['day'] <= 31:
+        return '출생 일이 유효하지 않습니다 (1-31)'
+    if birth.get('hour') is not None and not 0 <= birth['hour'] <= 23:
+        return '출생 시간이 유효하지 않습니다 (0-23)'
+    if birth.get('minute') is not None and not 0 <= birth['minute'] <= 59:
+        return '출생 분이 유효하지 않습니다 (0-59)'
+
+    if not isinstance(order['durationType'], str) or order['durationType'] not in DURATION_MONTHS:
+        return '기간 타입은 1m, 3m, 6m, 1y 중 하나여야 합니다'
+    if order.get('calendarType') not in CALENDAR_TYPES:
+        return '달력 유형은 solar, lunar 중 하나여야 합니다'
+    if order.get('gender') not in GENDERS:
+        return '성별은 male, female 중 하나여야 합니다'
+    if (order.get('renderMode') or 'standard') not in RENDER_MODES:
+        return '렌더링 모드는 standard, large 중 하나여야 합니다'
+
+    # 콘텐츠 엔진은 양력 생년월일만 계산하므로 음력을 양력처럼 처리하지 않고 거절
+    if order['calendarType'] == 'lunar':
+        return '음력(lunar) 생년월일은 아직 지원하지 않습니다 (양력으로 변환해 solar로 주문)'
+
+    return None
+
+
+def calculate_period(start_date: str, duration_type: str) -> Tuple[date, date, int]:
+    """
+    Period end date (calendar months, clamped to month end) and total days, both ends inclusive
+    """
+    start = date.fromisoformat(start_date)
+    end = start + relativedelta(months=DURATION_MONTHS[duration_type])
+    return start, end, (end - start).days + 1
+
+
+def order_file_name(order: Dict[str, Any]) -> str:
+    """PDF file name: YYYYMMDD_customerSafe_duration_mode.pdf"""
+    safe = re.sub(r'[<>:"/\\|?*]', '_', order['customerName'])
+    safe = re.sub(r'\s+', '_', safe)
+    safe = re.sub(r'_{2,}', '_', safe).strip('_')[:20] or 'customer'
+    mode = order.get('renderMode') or 'standard'
+    return f"{order['startDate'].replace('-', '')}_{safe}_{order['durationType']}_{mode}.pdf"
+
+
+def order_input_hash(order: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical order JSON (detects changed orders on resume)"""
+    encoded = json.dumps(order, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def recipient_key(order: Dict[str, Any]) -> str:
+    """Orders with the same key share saju/profile caches"""
+    birth = order.get('birth')
+    if not isinstance(birth, dict):
+        birth = {}
+    return json.dumps(
+        [birth.get(k) for k in BIRTH_FIELDS]
+        + [order.get('gender'), order.get('calendarType'), order.get('birthPlace')]
+    )
+
+
+def load_orders(source: str) -> List[Dict[str, Any]]:
+    """
+    Load orders from a directory of order JSON files or one manifest file
+
+    A manifest file holds a list of orders or {"orders": [...]}.
+    Every order gets an orderId: its own, the file name, or its position.
+    """
+    path = Path(source)
+    orders = []
+
+    if path.is_dir():
+        for order_file in sorted(path.glob('*.json')):
+            with open(order_file, 'r', encoding='utf-8') as f:
+                order = json.load(f)
+            order.setdefault('orderId', order_file.stem)
+            orders.append(order)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        items = data.get('orders', []) if isinstance(data, dict) else data
+        for index, order in enumerate(items):
+            order.setdefault('orderId', f"order_{index + 1:04d}")
+            orders.append(order)
+
+    ids = [order['orderId'] for order in orders]
+    duplicates = sorted({order_id for order_id in ids if ids.count(order_id) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate orderId: {', '.join(duplicates)}")
+
+    return orders
+
+
+# ============================================================
+# Worker side
+# ============================================================
+
+_engine = None
+
+
+def _get_engine():
+    """Personalization engine shared by every order in this worker process"""
+    global _engine
+    if _engine is None:
+        from src.skills.personalization_engine.personalizer import PersonalizationEngine
+        _engine = PersonalizationEngine()
+    return _engine
+
+
+def _build_period_data(order: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute daily content for every day of the order (PeriodDiaryResult)
+
+    The order must have passed validate_order (solar birth date, male/female).
+    """
+    from src.skills.personalization_engine.models import CustomerProfile
+
+    birth = order['birth']
+    birth_time = None
+    if birth.get('hour') is not None:
+        birth_time = f"{birth['hour']:02d}:{birth.get('minute') or 0:02d}"
+
+    profile = CustomerProfile(
+        id=hashlib.sha1(recipient_key(order).encode('utf-8')).hexdigest()[:12],
+        name=order['customerName'],
+        birth_date=date(birth['year'], birth['month'], birth['day']),
+        birth_time=birth_time,
+        gender=order['gender'],
+        birth_place=order.get('birthPlace') or DEFAULT_BIRTH_PLACE
+    )
+
+    start, end, total_days = calculate_period(order['startDate'], order['durationType'])
+    engine = _get_engine()
+    entries = []
+
+    for offset in range(total_days):
+        target_date = start + timedelta(days=offset)
+        success, content, errors = engine.generate_daily_content(profile, target_date)
+        if not success or content is None:
+            raise RuntimeError(f"Content generation failed for {target_date}: {', '.join(errors)}")
+
+        schema = content.schema_output
+        entries.append({
+            "date": target_date.isoformat(),
+            "calendar": {"weekday": WEEKDAYS[target_date.weekday()]},
+            "content": {
+                "summary": schema.get("summary", ""),
+                "keywords": schema.get("keywords", []),
+                "rhythmDescription": schema.get("rhythm_description", ""),
+                "focusCaution": schema.get("focus_caution", {}),
+                "actionGuide": schema.get("action_guide", {}),
+                "timeDirection": schema.get("time_direction", {}),
+                "rhythmQuestion": schema.get("rhythm_question", "")
+            }
+        })
+
+    return {
+        "startDate": start.isoformat(),
+        "endDate": end.isoformat(),
+        "durationType": order['durationType'],
+        "totalDays": total_days,
+        "ownerLabel": order.get('ownerLabel') or order['customerName'],
+        "productTitle": order.get('productTitle') or '라이프 리듬 다이어리',
+        "entries": entries
+    }
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _process_order(order: Dict[str, Any], output_dir: str, file_name: str) -> Dict[str, Any]:
+    """Validate, compute content and render one order; never raises (failures become manifest entries)"""
+    entry = {
+        "orderId": order.get('orderId'),
+        "customerName": order.get('customerName')
+    }
+
+    try:
+        entry["inputHash"] = order_input_hash(order)
+
+        error = validate_order(order)
+        if error:
+            return {**entry, "status": "failed", "error": f"주문 입력 검증 실패: {error}"}
+
+        data = _build_period_data(order)
+
+        final_path = Path(output_dir) / file_name
+        part_path = Path(output_dir) / f".{order['orderId']}.part.pdf"
+
+        # Month chunks render sequentially here; parallelism is across orders
+        converter = SimplePdfConverter(mode=order.get('renderMode') or 'standard')
+        result = converter.convert_period_data_to_pdf(data, str(part_path), max_workers=1)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+        # Atomic rename: a PDF under its final name is always complete
+        os.replace(part_path, final_path)
+
+        return {
+            **entry,
+            "status": "done",
+            "pdf": file_name,
+            "startDate": data["startDate"],
+            "endDate": data["endDate"],
+            "totalDays": data["totalDays"],
+            "pageCount": result["pageCount"],
+            "fileSize": final_path.stat().st_size,
+            "sha256": _file_sha256(final_path),
+            "completedAt": datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        return {**entry, "status": "failed", "error": str(e)}
+
+
+def _process_recipient_group(
+    orders: List[Dict[str, Any]],
+    output_dir: str,
+    file_names: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """Process all orders of one recipient in a single worker (process pool task)"""
+    return [_process_order(order, output_dir, file_names[order['orderId']]) for order in orders]
+
+
+# ============================================================
+# Batch driver
+# ============================================================
+
+def _safe_file_name(order: Dict[str, Any]) -> str:
+    """order_file_name for orders that may not have passed validation yet"""
+    try:
+        return order_file_name(order)
+    except (KeyError, TypeError, AttributeError):
+        return f"{order['orderId']}.pdf"
+
+
+def load_manifest(output_dir: str) -> Dict[str, Any]:
+    """Load manifest.json from the output directory (empty manifest if missing)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"version": MANIFEST_VERSION, "orders": {}}
+
+
+def _write_manifest(output_dir: str, manifest: Dict[str, Any]) -> None:
+    manifest["updatedAt"] = datetime.now().isoformat()
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp = path.with_suffix('.json.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def _is_finished(order: Dict[str, Any], entry: Optional[Dict[str, Any]], output_dir: str) -> bool:
+    """Done in a previous run with the same input and an intact PDF"""
+    if not entry or entry.get("status") != "done":
+        return False
+    if entry.get("inputHash") != order_input_hash(order):
+        return False
+    pdf_path = Path(output_dir) / entry.get("pdf", "")
+    return pdf_path.is_file() and pdf_path.stat().st_size == entry.get("fileSize")
+
+
+def run_batch(
+    source: str,
+    output_dir: str,
+    workers: Optional[int] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Run a print-order batch
+
+    Args:
+        source: Directory of order JSON files, or a manifest file of orders
+        output_dir: Directory for PDFs and manifest.json
+        workers: Worker processes (default: CPU count); 1 runs in this process
+        force: Re-render orders that are already done
+
+    Returns:
+        Summary with total/skipped/done/failed counts and the manifest path
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    orders = load_orders(source)
+    manifest = load_manifest(output_dir)
+    entries = manifest.setdefault("orders", {})
+
+    pending = [
+        order for order in orders
+        if force or not _is_finished(order, entries.get(order['orderId']), output_dir)
+    ]
+
+    # Spec file names, with the orderId appended where two orders would collide
+    names = {order['orderId']: _safe_file_name(order) for order in orders}
+    counts: Dict[str, int] = {}
+    for name in names.values():
+        counts[name] = counts.get(name, 0) + 1
+    file_names = {
+        order_id: name if counts[name] == 1 else f"{name[:-4]}_{order_id}.pdf"
+        for order_id, name in names.items()
+    }
+
+    # Group by recipient so per-process caches are reused across their orders
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for order in pending:
+        groups.setdefault(recipient_key(order), []).append(order)
+
+    summary = {
+        "total": len(orders),
+        "skipped": len(orders) - len(pending),
+        "done": 0,
+        "failed": 0,
+        "manifest": str(Path(output_dir) / MANIFEST_NAME)
+    }
+
+    def record(results: List[Dict[str, Any]]) -> None:
+        for result in results:
+            entries[result["orderId"]] = result
+            summary["done" if result["status"] == "done" else "failed"] += 1
+        _write_manifest(output_dir, manifest)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(groups)))
+
+    if groups and workers == 1:
+        for group in groups.values():
+            record(_process_recipient_group(group, output_dir, file_names))
+    elif groups:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_process_recipient_group, group, output_dir, file_names): group
+                for group in groups.values()
+            }
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # A crashed worker fails only its own group, not the whole batch
+                    results = [
+                        {"orderId": order['orderId'], "customerName": order.get('customerName'),
+                         "inputHash": order_input_hash(order), "status": "failed", "error": str(e)}
+                        for order in futures[future]
+                    ]
+                record(results)
+    else:
+        _write_manifest(output_dir, manifest)
+
+    return summary
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render print-ready diary PDFs for a batch of orders")
+    parser.add_argument("source", help="Directory of order JSON files, or a JSON file with a list of orders")
+    parser.add_argument("--output", required=True, help="Output directory for PDFs and manifest.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-render orders that are already done")
+    args = parser.parse_args()
+
+    summary = run_batch(args.source, args.output, workers=args.workers, force=args.force)
+    print(
+        f"[DONE] {summary['done']} rendered, {summary['skipped']} skipped, "
+        f"{summary['failed']} failed (of {summary['total']})"
+    )
+    print(f"   Manifest: {summary['manifest']}")
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
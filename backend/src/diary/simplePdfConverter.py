@@ -4,6 +4,8 @@ No external dependencies required - pure Python solution
 """
 import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -18,6 +20,11 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.fonts import addMapping
 import re
 
+try:
+    from pypdf import PdfWriter
+except ImportError:  # Without pypdf, period diaries are built as a single story
+    PdfWriter = None
+
 
 class SimplePdfConverter:
     """Convert diary data to PDF using ReportLab"""
@@ -91,6 +98,12 @@ class SimplePdfConverter:
                 bulletIndent=8,
                 spaceAfter=3
             ),
+            'Small': ParagraphStyle(
+                'Small',
+                parent=base_styles['Normal'],
+                fontSize=small_size,
+                textColor=colors.HexColor('#718096')
+            ),
             'Date': ParagraphStyle(
                 'Date',
                 parent=base_styles['Normal'],
@@ -191,13 +204,26 @@ class SimplePdfConverter:
                 "error": str(e)
             }
     
-    def convert_period_json_to_pdf(self, json_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    def convert_period_json_to_pdf(
+        self,
+        json_path: str,
+        output_path: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Convert period diary JSON bundle to PDF
         
+        Months are rendered as independent chunks (in a process pool when
+        there is more than one month) and concatenated, so memory is bounded
+        by one month instead of the whole period. Index page numbers are
+        resolved from the actual chunk page counts before the front matter
+        is rendered.
+        
         Args:
             json_path: Path to JSON file with PeriodDiaryResult
             output_path: Optional output path for PDF
+            max_workers: Month chunk workers (default: PERIOD_PDF_WORKERS env or CPU count).
+                1 renders chunks sequentially in this process.
             
         Returns:
             Result dictionary with success status and file path
@@ -218,80 +244,36 @@ class SimplePdfConverter:
             if not output_path:
                 output_path = str(json_file.with_suffix('.pdf'))
             
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                topMargin=2*cm,
-                bottomMargin=2*cm,
-                leftMargin=2*cm,
-                rightMargin=2*cm
-            )
-            
-            # Build content
-            story = []
-            
-            # Add cover page
-            story.extend(self._build_cover_page(data))
-            story.append(PageBreak())
-            
-            # Calculate page numbers for index
-            entries = data.get('entries', [])
-            total_days = data.get('totalDays', len(entries))
-            page_map = self._calculate_page_numbers(data)
-            
-            # Add index pages
-            story.extend(self._build_index_pages(data, page_map))
-            story.append(PageBreak())
-            
-            # Group entries by month and add month dividers
-            month_groups = self._group_by_month(entries)
-            
-            for month_key, month_entries in month_groups.items():
-                # Add month divider
-                story.extend(self._build_month_divider(month_key, month_entries))
-                story.append(PageBreak())
-                
-                # Add monthly summary (only for multi-month periods)
-                if total_days > 30:
-                    story.extend(self._build_monthly_summary(month_key, month_entries))
-                    story.append(PageBreak())
-                
-                # Group month entries by week and add weekly summaries
-                week_groups = self._group_by_week(month_entries)
-                
-                for week_key, week_entries in week_groups.items():
-                    # Add daily pages for this week
-                    for entry in week_entries:
-                        story.extend(self._build_daily_content(entry))
-                        story.append(PageBreak())
-                    
-                    # Add weekly summary (only for periods longer than a week)
-                    if total_days > 7:
-                        story.extend(self._build_weekly_summary(week_key, week_entries))
-                        story.append(PageBreak())
-                        # Add weekly reflection page after summary
-                        story.extend(self._build_weekly_reflection(week_key, week_entries))
-                        # Add page break except after the very last entry
-                        if not (month_key == list(month_groups.keys())[-1] and 
-                                week_key == list(week_groups.keys())[-1]):
-                            story.append(PageBreak())
-            
-            # Generate PDF
-            doc.build(story)
-            
-            # Calculate page count
-            month_count = len(month_groups)
-            monthly_summary_pages = month_count if total_days > 30 else 0
+            return self.convert_period_data_to_pdf(data, output_path, max_workers)
             
-            # Count weekly summaries
-            weekly_summary_count = 0
-            if total_days > 7:
-                for month_entries in month_groups.values():
-                    week_groups = self._group_by_week(month_entries)
-                    weekly_summary_count += len(week_groups)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def convert_period_data_to_pdf(
+        self,
+        data: Dict[str, Any],
+        output_path: str,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Convert an in-memory PeriodDiaryResult to PDF
+        
+        Args:
+            data: PeriodDiaryResult dictionary
+            output_path: Output path for PDF
+            max_workers: Month chunk workers (see convert_period_json_to_pdf)
             
-            page_count = 1 + month_count + monthly_summary_pages + weekly_summary_count + len(entries)
+        Returns:
+            Result dictionary with success status, file path and page count
+        """
+        try:
+            if PdfWriter is None:
+                page_count = self._build_period_single(data, output_path)
+            else:
+                page_count = self._build_period_chunked(data, output_path, max_workers)
             
             return {
                 "success": True,
@@ -306,6 +288,149 @@ class SimplePdfConverter:
                 "error": str(e)
             }
     
+    def _build_period_single(self, data: Dict[str, Any], output_path: str) -> int:
+        """Build the whole period as one story (single month, or pypdf unavailable)"""
+        doc = _DiaryDocTemplate(output_path)
+        
+        story = self._build_front_matter(data, self._calculate_page_numbers(data))
+        month_groups = self._group_by_month(data.get('entries', []))
+        total_days = data.get('totalDays', len(data.get('entries', [])))
+        month_keys = list(month_groups.keys())
+        
+        for month_key in month_keys:
+            story.extend(self._build_month_story(
+                month_key,
+                month_groups[month_key],
+                total_days,
+                is_last=month_key == month_keys[-1]
+            ))
+        
+        doc.build(story)
+        return doc.page
+    
+    def _build_period_chunked(
+        self,
+        data: Dict[str, Any],
+        output_path: str,
+        max_workers: Optional[int] = None
+    ) -> int:
+        """Render month chunks in parallel, then the front matter, and merge"""
+        entries = data.get('entries', [])
+        total_days = data.get('totalDays', len(entries))
+        month_groups = self._group_by_month(entries)
+        month_keys = list(month_groups.keys())
+        
+        if max_workers is None:
+            max_workers = int(os.getenv('PERIOD_PDF_WORKERS', '0')) or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(month_keys)))
+        
+        with tempfile.TemporaryDirectory(prefix='r3_period_') as tmp_dir:
+            jobs = [
+                (
+                    self.mode,
+                    month_key,
+                    month_groups[month_key],
+                    total_days,
+                    os.path.join(tmp_dir, f"month_{index:02d}.pdf")
+                )
+                for index, month_key in enumerate(month_keys)
+            ]
+            
+            if max_workers == 1:
+                chunks = [_render_month_chunk(*job) for job in jobs]
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    chunks = list(executor.map(_render_month_chunk, *zip(*jobs)))
+            
+            # Front matter length depends on the index, which depends on the
+            # page map: start from the estimate and re-render until stable.
+            front_path = os.path.join(tmp_dir, "front.pdf")
+            front_pages = 1 + self._index_page_count(entries)
+            
+            for _ in range(3):
+                page_map = _resolve_page_numbers(chunks, front_pages)
+                doc = _DiaryDocTemplate(front_path)
+                doc.build(self._build_front_matter(data, page_map, trailing_break=False))
+                if doc.page == front_pages:
+                    break
+                front_pages = doc.page
+            
+            writer = PdfWriter()
+            writer.append(front_path)
+            for chunk in chunks:
+                writer.append(chunk['path'])
+            with open(output_path, 'wb') as f:
+                writer.write(f)
+            writer.close()
+        
+        return front_pages + sum(chunk['pages'] for chunk in chunks)
+    
+    def _build_front_matter(
+        self,
+        data: Dict[str, Any],
+        page_map: Dict[str, int],
+        trailing_break: bool = True
+    ) -> List:
+        """Build cover and index pages"""
+        story = []
+        
+        # Add cover page
+        story.extend(self._build_cover_page(data))
+        story.append(PageBreak())
+        
+        # Add index pages
+        story.extend(self._build_index_pages(data, page_map))
+        if trailing_break:
+            story.append(PageBreak())
+        
+        return story
+    
+    def _build_month_story(
+        self,
+        month_key: str,
+        month_entries: List[Dict[str, Any]],
+        total_days: int,
+        is_last: bool
+    ) -> List:
+        """Build month divider, summaries and daily pages for one month"""
+        story = []
+        
+        # Add month divider
+        story.extend(self._build_month_divider(month_key, month_entries))
+        story.append(PageBreak())
+        
+        # Add monthly summary (only for multi-month periods)
+        if total_days > 30:
+            story.extend(self._build_monthly_summary(month_key, month_entries))
+            story.append(PageBreak())
+        
+        # Group month entries by week and add weekly summaries
+        week_groups = self._group_by_week(month_entries)
+        week_keys = list(week_groups.keys())
+        
+        for week_key in week_keys:
+            week_entries = week_groups[week_key]
+            
+            # Add daily pages for this week
+            for entry in week_entries:
+                daily = self._build_daily_content(entry)
+                # Lets _DiaryDocTemplate record the page each day starts on
+                daily[0].diary_date = entry['date']
+                story.extend(daily)
+                story.append(PageBreak())
+            
+            # Add weekly summary (only for periods longer than a week)
+            if total_days > 7:
+                story.extend(self._build_weekly_summary(week_key, week_entries))
+                story.append(PageBreak())
+                # Add weekly reflection page after summary
+                story.extend(self._build_weekly_reflection(week_key, week_entries))
+                # Add page break except after the very last entry
+                if not (is_last and week_key == week_keys[-1]):
+                    story.append(PageBreak())
+        
+        return story
+    
     def _group_by_month(self, entries: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group entries by month"""
         from collections import OrderedDict
@@ -417,8 +542,7 @@ class SimplePdfConverter:
         
         # Index pages (based on entry count)
         entries = data.get('entries', [])
-        index_page_count = max(1, len(entries) // 25 + (1 if len(entries) % 25 else 0))
-        current_page += index_page_count
+        current_page += self._index_page_count(entries)
         
         # Group by month
         month_groups = self._group_by_month(entries)
@@ -441,12 +565,16 @@ class SimplePdfConverter:
                     page_map[entry['date']] = current_page
                     current_page += 1
                 
-                # Weekly summary (for periods > 7 days)
+                # Weekly summary and reflection (for periods > 7 days)
                 if total_days > 7:
-                    current_page += 1
+                    current_page += 2
         
         return page_map
     
+    def _index_page_count(self, entries: List[Dict[str, Any]]) -> int:
+        """Estimated number of index pages (25 rows per page)"""
+        return max(1, len(entries) // 25 + (1 if len(entries) % 25 else 0))
+    
     def _build_index_pages(self, data: Dict[str, Any], page_map: Dict[str, int]) -> List:
         """Build index pages with date and page number mapping"""
         story = []
@@ -768,8 +896,7 @@ class SimplePdfConverter:
         story.append(Spacer(1, 0.3*cm))
         
         # Owner line (using a simple line)
-        from reportlab.platypus import Drawing
-        from reportlab.graphics.shapes import Line
+        from reportlab.graphics.shapes import Drawing, Line
         
         drawing = Drawing(400, 20)
         drawing.add(Line(100, 10, 300, 10, strokeColor=colors.HexColor('#2c5aa0'), strokeWidth=1))
@@ -945,6 +1072,64 @@ class SimplePdfConverter:
         return story
 
 
+class _DiaryDocTemplate(SimpleDocTemplate):
+    """A4 diary document that records the page each daily entry starts on"""
+    
+    def __init__(self, output_path: str):
+        super().__init__(
+            output_path,
+            pagesize=A4,
+            topMargin=2*cm,
+            bottomMargin=2*cm,
+            leftMargin=2*cm,
+            rightMargin=2*cm
+        )
+        self.date_pages: Dict[str, int] = {}
+    
+    def afterFlowable(self, flowable):
+        date = getattr(flowable, 'diary_date', None)
+        if date and date not in self.date_pages:
+            self.date_pages[date] = self.page
+
+
+def _render_month_chunk(
+    mode: str,
+    month_key: str,
+    month_entries: List[Dict[str, Any]],
+    total_days: int,
+    output_path: str
+) -> Dict[str, Any]:
+    """
+    Render one month of a period diary to its own PDF (process pool worker)
+    
+    Returns:
+        {"path", "pages", "datePages"} where datePages are 1-based within the chunk
+    """
+    converter = SimplePdfConverter(mode=mode)
+    story = converter._build_month_story(month_key, month_entries, total_days, is_last=True)
+    while story and isinstance(story[-1], PageBreak):
+        story.pop()
+    
+    doc = _DiaryDocTemplate(output_path)
+    doc.build(story)
+    return {
+        "path": output_path,
+        "pages": doc.page,
+        "datePages": doc.date_pages
+    }
+
+
+def _resolve_page_numbers(chunks: List[Dict[str, Any]], front_pages: int) -> Dict[str, int]:
+    """Absolute page number of each date from rendered chunk page counts"""
+    page_map = {}
+    offset = front_pages
+    for chunk in chunks:
+        for date, page in chunk['datePages'].items():
+            page_map[date] = offset + page
+        offset += chunk['pages']
+    return page_map
+
+
 def main():
     """Test the simple PDF converter"""
     converter = SimplePdfConverter()
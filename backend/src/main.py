@@ -2,20 +2,38 @@
 R³ Diary System - FastAPI Backend
 Main application entry point
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+import importlib
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from src.utils.responses import FastJSONResponse
+
 # Load environment variables - 명시적 경로 지정
 _env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(dotenv_path=_env_path)
 
 _is_production = os.getenv("ENVIRONMENT", "development") == "production"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작/종료 훅
+
+    시작 작업은 라우터 on_startup이 아닌 여기에 둡니다
+    (include_router가 라우터 on_startup을 복사하고 lifespan도 병합해 두 번 실행됨).
+    """
+    from src.api.daily import start_markdown_prerender
+    await start_markdown_prerender()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="R³ Diary API",
@@ -24,8 +42,16 @@ app = FastAPI(
     docs_url=None if _is_production else "/docs",
     redoc_url=None if _is_production else "/redoc",
     openapi_url=None if _is_production else "/openapi.json",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 
+# 무거운 엔드포인트(PDF, 기간/연간 조회) 동시 처리 제한 + 503 거절 - ADMISSION_CONTROL=0으로 끔
+# CORS 안쪽에 두어 503 응답에도 CORS 헤더가 붙도록 가장 먼저 추가
+if os.getenv("ADMISSION_CONTROL", "1") == "1":
+    from src.utils.admission import AdmissionControlMiddleware
+    app.add_middleware(AdmissionControlMiddleware)
+
 # CORS configuration - 개발 환경용 (프로덕션에서는 환경변수 사용)
 _cors_origins_raw = os.getenv("CORS_ORIGINS", "http://localhost:5000")
 _cors_origins = [o.strip() for o in _cors_origins_raw.split(",") if o.strip()]
@@ -53,6 +79,25 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(SecurityHeadersMiddleware)
 
+# 큰 텍스트 응답 압축 (brotli 우선, gzip) - RESPONSE_COMPRESSION=0으로 끔 (프록시가 압축하는 경우)
+if os.getenv("RESPONSE_COMPRESSION", "1") == "1":
+    from src.utils.compression import CompressionMiddleware
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+    )
+
+# Prometheus 메트릭 (라우트별 지연/처리 중 요청 + /metrics) - METRICS_ENABLED=0으로 끔
+_metrics_enabled = os.getenv("METRICS_ENABLED", "1") == "1"
+if _metrics_enabled:
+    from src.utils.metrics import MetricsMiddleware
+    app.add_middleware(MetricsMiddleware)
+
+# 단계별 구간 타이밍 (Server-Timing 헤더 + 구조화 로그) - 비활성 시 span()은 no-op
+if os.getenv("SERVER_TIMING", "0") == "1":
+    from src.utils.timing import ServerTimingMiddleware
+    app.add_middleware(ServerTimingMiddleware)
+
 # OPTIONS 요청 전역 핸들러 (CORS preflight 명시적 처리)
 @app.options("/{full_path:path}")
 async def options_handler(request: Request, full_path: str):
@@ -92,23 +137,38 @@ async def root():
         "health": "/health"
     }
 
-# Import API routers
-from src.api import auth, profile, daily, monthly, logs, profiles, surveys, webhook, forms, recipients
-# PDF router disabled on Windows (WeasyPrint requires GTK+)
-# from src.api import pdf
-
-# Register API routers
-app.include_router(auth.router)
-app.include_router(profile.router)
-app.include_router(daily.router)
-app.include_router(monthly.router)
-app.include_router(logs.router)
-app.include_router(profiles.router)
-app.include_router(surveys.router)
-app.include_router(webhook.router)
-app.include_router(forms.router)
-app.include_router(recipients.router)
-# app.include_router(pdf.router)
+# API routers (모듈 경로) - 무거운 의존성(numpy, markdown, PDF 생성기)은 각 모듈이 첫 요청 시 로드
+API_ROUTERS = [
+    "src.api.auth",
+    "src.api.profile",
+    "src.api.daily",
+    "src.api.monthly",
+    "src.api.logs",
+    "src.api.profiles",
+    "src.api.surveys",
+    "src.api.webhook",
+    "src.api.forms",
+    "src.api.recipients",
+]
+# PDF routers require WeasyPrint (GTK+) at render time - opt in with ENABLE_PDF_ROUTES=1
+PDF_ROUTERS = [
+    "src.api.pdf",
+    "src.api.pdf_customer",
+    "src.api.pdf_jobs",
+]
+
+
+def _include_routers(modules):
+    """Import router modules by path and register them"""
+    for module_name in modules:
+        app.include_router(importlib.import_module(module_name).router)
+
+
+_include_routers(API_ROUTERS)
+if _metrics_enabled:
+    _include_routers(["src.api.metrics"])
+if os.getenv("ENABLE_PDF_ROUTES", "0") == "1":
+    _include_routers(PDF_ROUTERS)
 
 if __name__ == "__main__":
     import uvicorn
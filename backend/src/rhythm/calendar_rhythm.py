@@ -0,0 +1,305 @@
+"""
+일진(日辰) 배열 계산 모듈
+
+월간/연간/기간 리듬 분석에서 날짜마다 반복하던 천간·지지·오행 계산을
+NumPy 배열로 한 번에 수행합니다.
+
+- 날짜 범위 → 일진 천간/지지 인덱스 배열 (60간지 순환)
+- 천간/지지 오행, 일간(日干)과의 오행 관계, 일별 에너지 배열
+- 월별 집계 (평균 에너지 등)
+
+오행 인덱스: 木=0, 火=1, 土=2, 金=3, 水=4
+"""
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+# 甲子日 기준점 (saju.analyze_daily_fortune과 동일)
+JIAZI_DATE = datetime.date(1900, 1, 31)
+
+HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+EARTHLY_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+
+# 천간 인덱스 → 오행
+STEM_ELEMENT = np.array([0, 0, 1, 1, 2, 2, 3, 3, 4, 4], dtype=np.int8)
+# 지지 인덱스 → 계절 오행 (子水 丑土 寅卯木 辰土 巳午火 未土 申酉金 戌土 亥水)
+BRANCH_ELEMENT = np.array([4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4], dtype=np.int8)
+
+# 한국어 오행 → 인덱스
+ELEMENT_INDEX = {"목": 0, "화": 1, "토": 2, "금": 3, "수": 4}
+
+# 일간 대비 당일 천간의 오행 관계 코드 = (당일 오행 - 일간 오행) mod 5
+#   0 비화(比和), 1 내가 생함(食傷), 2 내가 극함(財), 3 내가 극받음(官殺), 4 내가 생받음(印)
+RELATION_BI = 0
+RELATION_SHENG_OUT = 1
+RELATION_KE_OUT = 2
+RELATION_KE_IN = 3
+RELATION_SHENG_IN = 4
+RELATION_NAMES = ["bi", "sheng_out", "ke_out", "ke_in", "sheng_in"]
+
+# 관계 코드별 월간 일별 기본 에너지 (인성/재성 4, 관살 2, 나머지 3)
+RELATION_ENERGY = np.array([3, 3, 4, 2, 4], dtype=np.int8)
+
+# 관계 코드별 일간 운세 에너지 조정 (analyze_daily_fortune: 인성/재성 +1, 식상/관살 -1)
+RELATION_ADJUSTMENT = np.array([0, -1, 1, -1, 1], dtype=np.int8)
+
+# 월별 주도 오행 (절기 기준 간소화, 인덱스 0 = 1월)
+MONTH_ELEMENT = np.array([4, 4, 0, 0, 1, 1, 2, 3, 3, 2, 4, 4], dtype=np.int8)
+
+
+@dataclass
+class RhythmArrays:
+    """
+    날짜 범위의 일별 리듬 배열 (모든 배열은 길이 = 일수)
+
+    Attributes:
+        start: 시작 날짜
+        dates: 날짜 (datetime64[D])
+        stem: 일진 천간 인덱스 (0-9)
+        branch: 일진 지지 인덱스 (0-11)
+        stem_element: 천간 오행
+        branch_element: 지지 계절 오행
+        relation: 일간과의 오행 관계 코드 (일간을 모르면 -1)
+        energy: 일별 에너지 (1-5)
+    """
+    start: datetime.date
+    dates: np.ndarray
+    stem: np.ndarray
+    branch: np.ndarray
+    stem_element: np.ndarray
+    branch_element: np.ndarray
+    relation: np.ndarray
+    energy: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def energy_by_day(self) -> Dict[int, int]:
+        """일(day of month) → 에너지 (한 달 범위에서 사용)"""
+        days = (self.dates - self.dates.astype("datetime64[M]")).astype(int) + 1
+        return dict(zip(days.tolist(), self.energy.tolist()))
+
+    def energy_summary(self) -> Dict[str, Any]:
+        """
+        에너지 요약 통계
+
+        Returns:
+            평균, 최고/최저 에너지와 해당 날짜 목록, 에너지 단계별 일수
+        """
+        if not len(self):
+            return {"평균": 3.0, "최고": 3, "최저": 3, "최고일": [], "최저일": [], "분포": {}}
+        high = int(self.energy.max())
+        low = int(self.energy.min())
+        counts = np.bincount(self.energy, minlength=6)
+        return {
+            "평균": round(float(self.energy.mean()), 2),
+            "최고": high,
+            "최저": low,
+            "최고일": _isoformat(self.dates[self.energy == high]),
+            "최저일": _isoformat(self.dates[self.energy == low]),
+            "분포": {level: int(counts[level]) for level in range(1, 6)},
+        }
+
+    def monthly_mean_energy(self) -> Dict[int, float]:
+        """월(1-12) → 해당 월 일평균 에너지 (범위에 포함된 월만)"""
+        months = self.dates.astype("datetime64[M]").astype(int) % 12
+        totals = np.bincount(months, weights=self.energy, minlength=12)
+        counts = np.bincount(months, minlength=12)
+        return {
+            int(m) + 1: round(float(totals[m] / counts[m]), 2)
+            for m in np.flatnonzero(counts)
+        }
+
+    def day_pillar(self, index: int) -> Dict[str, Any]:
+        """index번째 날의 일진 정보 (analyze_daily_fortune의 "일진" 형식)"""
+        relation = int(self.relation[index])
+        return {
+            "천간": HEAVENLY_STEMS[int(self.stem[index])],
+            "지지": EARTHLY_BRANCHES[int(self.branch[index])],
+            "관계": RELATION_NAMES[relation] if relation >= 0 else "bi",
+            "에너지": int(self.energy[index]),
+        }
+
+
+def _isoformat(dates: np.ndarray) -> List[str]:
+    return [str(d) for d in dates]
+
+
+def _element_adjustment(saju_data: Dict[str, Any]) -> np.ndarray:
+    """
+    오행별 용신(+1)/기신(-1) 보정 여부
+
+    Returns:
+        (5, 2) bool 배열: [:, 0] 용신 오행, [:, 1] 기신 오행
+    """
+    yongsin_data = saju_data.get("용신", {})
+    flags = np.zeros((5, 2), dtype=bool)
+    for column, key in enumerate(("용신", "기신")):
+        for name in yongsin_data.get(key, []):
+            if name in ELEMENT_INDEX:
+                flags[ELEMENT_INDEX[name], column] = True
+    return flags
+
+
+def apply_element_adjustment(
+    energy: np.ndarray,
+    element: np.ndarray,
+    saju_data: Dict[str, Any]
+) -> np.ndarray:
+    """
+    용신 오행이면 +1 (최대 5), 이어서 기신 오행이면 -1 (최소 1)
+
+    Args:
+        energy: 기본 에너지 배열
+        element: 같은 길이의 오행 인덱스 배열
+        saju_data: 사주명리 계산 결과 (용신/기신 사용)
+
+    Returns:
+        보정된 에너지 배열
+    """
+    flags = _element_adjustment(saju_data)
+    energy = np.where(flags[element, 0], np.minimum(5, energy + 1), energy)
+    energy = np.where(flags[element, 1], np.maximum(1, energy - 1), energy)
+    return energy.astype(np.int8)
+
+
+def compute_rhythm_arrays(
+    start: datetime.date,
+    end: datetime.date,
+    saju_data: Dict[str, Any]
+) -> RhythmArrays:
+    """
+    날짜 범위(start~end, 포함)의 일별 리듬 배열 계산
+
+    Args:
+        start: 시작 날짜
+        end: 종료 날짜 (포함)
+        saju_data: 사주명리 계산 결과 (calculate_saju 반환값)
+
+    Returns:
+        RhythmArrays
+    """
+    total = max((end - start).days + 1, 0)
+    offsets = np.arange(total, dtype=np.int64) + (start - JIAZI_DATE).days
+    dates = np.datetime64(start, "D") + np.arange(total)
+
+    stem = (offsets % 10).astype(np.int8)
+    branch = (offsets % 12).astype(np.int8)
+    stem_element = STEM_ELEMENT[stem]
+    branch_element = BRANCH_ELEMENT[branch]
+
+    dayjugan = saju_data.get("사주", {}).get("일주", {}).get("천간", "")
+    if dayjugan in HEAVENLY_STEMS:
+        master = STEM_ELEMENT[HEAVENLY_STEMS.index(dayjugan)]
+        relation = ((stem_element - master) % 5).astype(np.int8)
+        energy = RELATION_ENERGY[relation]
+    else:
+        relation = np.full(total, -1, dtype=np.int8)
+        energy = np.full(total, 3, dtype=np.int8)
+
+    return RhythmArrays(
+        start=start,
+        dates=dates,
+        stem=stem,
+        branch=branch,
+        stem_element=stem_element,
+        branch_element=branch_element,
+        relation=relation,
+        energy=apply_element_adjustment(energy, stem_element, saju_data),
+    )
+
+
+def month_rhythm_arrays(year: int, month: int, saju_data: Dict[str, Any]) -> RhythmArrays:
+    """해당 월 전체의 일별 리듬 배열"""
+    start = datetime.date(year, month, 1)
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    return compute_rhythm_arrays(start, next_month - datetime.timedelta(days=1), saju_data)
+
+
+def year_rhythm_arrays(year: int, saju_data: Dict[str, Any]) -> RhythmArrays:
+    """해당 연도 전체의 일별 리듬 배열"""
+    return compute_rhythm_arrays(datetime.date(year, 1, 1), datetime.date(year, 12, 31), saju_data)
+
+
+def month_element_energy(saju_data: Dict[str, Any]) -> np.ndarray:
+    """
+    월별 주도 오행 기반 월 에너지 (길이 12, 인덱스 0 = 1월)
+
+    기본 3에 용신/기신 보정을 적용합니다.
+    """
+    base = np.full(12, 3, dtype=np.int8)
+    return apply_element_adjustment(base, MONTH_ELEMENT, saju_data)
+
+
+def daily_fortune_arrays(arrays: RhythmArrays, saju_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    일간 운세 점수 배열 (analyze_daily_fortune의 날짜별 점수를 한 번에 계산)
+
+    원국/세운 기반 값은 범위 전체에 공통이므로 saju_data는 같은 해의
+    calculate_saju 결과여야 합니다.
+
+    Args:
+        arrays: compute_rhythm_arrays 결과
+        saju_data: 사주명리 계산 결과
+
+    Returns:
+        {"energy", "focus", "social", "decision", "relation"} → 길이 = 일수 배열
+        (relation은 일간을 모르면 비화(0)로 처리)
+    """
+    yongsin_data = saju_data.get("용신", {})
+    ohhaeng = saju_data.get("오행", {})
+    dominant = max(ohhaeng.items(), key=lambda x: x[1])[0] if ohhaeng else "목"
+
+    base_energy = 3
+    if saju_data.get("세운") and dominant in yongsin_data.get("용신", []):
+        base_energy = 4
+    elif saju_data.get("세운") and dominant in yongsin_data.get("기신", []):
+        base_energy = 2
+
+    sipsung = saju_data.get("십성", {})
+    focus = 3 + (sipsung.get("식신", 0) + sipsung.get("상관", 0)) // 2
+    social = 3 + (sipsung.get("정관", 0) + sipsung.get("편관", 0)) // 2
+    decision = 3 + (sipsung.get("비견", 0) + sipsung.get("겁재", 0)) // 2
+
+    relation = np.where(arrays.relation < 0, RELATION_BI, arrays.relation).astype(np.int8)
+    focus_arr = np.full(len(arrays), focus, dtype=np.int16)
+    focus_arr = np.where(relation == RELATION_SHENG_IN, np.minimum(5, focus_arr + 1), focus_arr)
+    focus_arr = np.where(relation == RELATION_KE_IN, np.maximum(1, focus_arr - 1), focus_arr)
+    social_arr = np.full(len(arrays), social, dtype=np.int16)
+    social_arr = np.where(relation == RELATION_SHENG_OUT, np.minimum(5, social_arr + 1), social_arr)
+    decision_arr = np.full(len(arrays), decision, dtype=np.int16)
+    decision_arr = np.where(relation == RELATION_KE_OUT, np.minimum(5, decision_arr + 1), decision_arr)
+
+    return {
+        "energy": np.clip(base_energy + RELATION_ADJUSTMENT[relation], 1, 5).astype(np.int8),
+        "focus": np.clip(focus_arr, 1, 5).astype(np.int8),
+        "social": np.clip(social_arr, 1, 5).astype(np.int8),
+        "decision": np.clip(decision_arr, 1, 5).astype(np.int8),
+        "relation": relation,
+    }
+
+
+def yearly_heatmap(year: int, saju_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    연간 일별 점수 히트맵 (JSON 직렬화용 정수 리스트)
+
+    Args:
+        year: 연도
+        saju_data: 해당 연도 calculate_saju 결과
+
+    Returns:
+        날짜 순서(1월 1일부터)의 energy/focus/social/decision/relation 리스트와
+        관계 코드 범례
+    """
+    arrays = year_rhythm_arrays(year, saju_data)
+    scores = daily_fortune_arrays(arrays, saju_data)
+    heatmap: Dict[str, Any] = {
+        "year": year,
+        "start_date": arrays.start.isoformat(),
+        "days": len(arrays),
+    }
+    heatmap.update({key: values.tolist() for key, values in scores.items()})
+    heatmap["relation_codes"] = RELATION_NAMES
+    return heatmap
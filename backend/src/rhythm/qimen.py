@@ -5,7 +5,8 @@
 8문(八門), 9궁(九宮), 일주(日柱) 기반 시간대별 길흉 산출
 """
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import date
 
 
@@ -13,15 +14,61 @@ from datetime import date
 # 데이터클래스
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HourlyQimenResult:
-    hour_start: int   # 시작 시각 (0-23)
-    hour_end: int     # 종료 시각 (2-25, 자시는 23→1로 표기)
-    quality: str      # "good" | "neutral" | "avoid"
-    direction: str    # 한국어 방위
-    direction_en: str # 영문 코드
-    energy_level: int # 1-10
-    label: str        # 사용자 노출 라벨 (전문용어 금지)
+    """
+    시간대(시진)별 기문 결과
+
+    문/궁은 정수 코드로만 보관하고, 사용자 노출 문자열(방위, 라벨)은
+    속성 접근·직렬화 시점에 상수 테이블에서 가져옵니다.
+    같은 局/보정값의 결과는 캐시되어 날짜 간에 공유되므로 불변입니다.
+    """
+    slot: int          # 시간 슬롯 인덱스 (0-11, 자시~해시)
+    gate_code: int     # 8문 인덱스 (EIGHT_GATES)
+    palace_num: int    # 9궁 번호 (1-9)
+    energy_level: int  # 1-10
+
+    @property
+    def hour_start(self) -> int:
+        """시작 시각 (0-23)"""
+        return TWELVE_BRANCHES[self.slot][1]
+
+    @property
+    def hour_end(self) -> int:
+        """종료 시각 (자시는 23→1로 표기)"""
+        return TWELVE_BRANCHES[self.slot][2]
+
+    @property
+    def quality(self) -> str:
+        """길흉 (good | neutral | avoid)"""
+        return EIGHT_GATES[self.gate_code][1]
+
+    @property
+    def direction(self) -> str:
+        """한국어 방위"""
+        return PALACE_DIRECTIONS[self.palace_num][0]
+
+    @property
+    def direction_en(self) -> str:
+        """영문 방위 코드"""
+        return PALACE_DIRECTIONS[self.palace_num][1]
+
+    @property
+    def label(self) -> str:
+        """사용자 노출 라벨 (전문용어 금지)"""
+        return EIGHT_GATES[self.gate_code][2]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 dict (hour_start, hour_end, quality, direction, direction_en, energy_level, label)"""
+        return {
+            "hour_start": self.hour_start,
+            "hour_end": self.hour_end,
+            "quality": self.quality,
+            "direction": self.direction,
+            "direction_en": self.direction_en,
+            "energy_level": self.energy_level,
+            "label": self.label,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -260,38 +307,49 @@ def calculate_daily_qimen(birth_date: date, target_date: date) -> List[HourlyQim
     relation = _wuxing_relation(birth_stem, today_stem)
     energy_bonus = {"sheng": 2, "ke": -2, "bi": 0}[relation]
 
-    results: List[HourlyQimenResult] = []
+    return list(_hourly_results(ju_number, is_yang_dun, energy_bonus))
+
 
-    for slot_idx, (branch_name, h_start, h_end) in enumerate(TWELVE_BRANCHES):
+@lru_cache(maxsize=None)
+def _hourly_results(ju_number: int, is_yang_dun: bool, energy_bonus: int) -> Tuple[HourlyQimenResult, ...]:
+    """
+    局/양둔 여부/에너지 보정값 → 12개 시간대 결과 (9局 × 2 × 3 = 최대 54가지, 공유 캐시)
+    """
+    results = []
+    for slot_idx in range(len(TWELVE_BRANCHES)):
         # 4) 해당 슬롯의 8문 결정 (旬/局 기반)
         gate_idx = _gate_for_hour_slot(slot_idx, ju_number, is_yang_dun)
-        gate_name, quality, label = EIGHT_GATES[gate_idx]
 
         # 5) 9궁 방위 결정 (旬/局 기반)
         palace_no = _palace_for_hour_slot(slot_idx, ju_number, is_yang_dun)
-        direction_ko, direction_en = PALACE_DIRECTIONS[palace_no]
 
         # 6) 에너지 레벨 계산 (1~10 범위 클램프)
-        base_energy = GATE_BASE_ENERGY[gate_name]
+        base_energy = GATE_BASE_ENERGY[EIGHT_GATES[gate_idx][0]]
         energy = max(1, min(10, base_energy + energy_bonus))
 
         results.append(HourlyQimenResult(
-            hour_start=h_start,
-            hour_end=h_end,
-            quality=quality,
-            direction=direction_ko,
-            direction_en=direction_en,
+            slot=slot_idx,
+            gate_code=gate_idx,
+            palace_num=palace_no,
             energy_level=energy,
-            label=label,
         ))
 
-    return results
+    return tuple(results)
 
 
-def get_daily_summary(birth_date: date, target_date: date) -> Dict[str, str]:
+def get_daily_summary(
+    birth_date: date,
+    target_date: date,
+    hourly: Optional[List[HourlyQimenResult]] = None,
+) -> Dict[str, str]:
     """
     하루 요약: 최고 방위, 피할 방위, 최고 시간대 반환
 
+    Args:
+        birth_date:  출생일
+        target_date: 분석 대상 날짜
+        hourly:      이미 계산한 calculate_daily_qimen 결과 (없으면 계산)
+
     Returns:
         {
             "best_direction":  "북동",
@@ -299,7 +357,8 @@ def get_daily_summary(birth_date: date, target_date: date) -> Dict[str, str]:
             "peak_hours":      "09-11시",
         }
     """
-    hourly = calculate_daily_qimen(birth_date, target_date)
+    if hourly is None:
+        hourly = calculate_daily_qimen(birth_date, target_date)
 
     # 에너지 최고 슬롯
     best = max(hourly, key=lambda r: r.energy_level)
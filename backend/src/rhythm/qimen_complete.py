@@ -5,8 +5,9 @@
 8문(八門), 9궁(九宮), 9성(九星), 8신(八神) 완전 계산
 천반(天盤), 지반(地盤), 인반(人盤), 신반(神盤) 4층 구조
 """
-from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, List, Dict, Tuple, Optional
 from datetime import date, datetime
 import math
 
@@ -15,31 +16,101 @@ import math
 # 데이터클래스
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QimenPalace:
-    """기문둔갑 궁(宮) 정보"""
-    palace_num: int         # 궁 번호 (1-9)
-    direction_ko: str       # 한국어 방위
-    direction_en: str       # 영문 코드
-    gate: str              # 8문 (휴문, 생문 등)
-    star: str              # 9성 (천봉, 천임 등) 
-    deity: str             # 8신 (직부, 등사 등)
-    earthly_plate_gan: str # 지반 천간
-    heavenly_plate_gan: str # 천반 천간
+    """
+    기문둔갑 궁(宮) 정보
+
+    문/성/신/천간은 정수 코드로 보관하고 이름은 속성으로 조회합니다
+    (코드 -1은 빈 문자열). 같은 局·시간 조합의 궁은 캐시되어 공유되므로 불변입니다.
+    """
+    palace_num: int        # 궁 번호 (1-9)
+    gate_code: int         # 8문 인덱스 (GATE_NAMES)
+    star_code: int         # 9성 인덱스 (STAR_NAMES)
+    deity_code: int        # 8신 인덱스 (DEITY_NAMES)
+    earth_code: int        # 지반 천간 인덱스 (HEAVENLY_STEMS)
+    heaven_code: int       # 천반 천간 인덱스 (HEAVENLY_STEMS)
     quality_score: int     # 종합 길흉 점수 (0-100)
 
+    @property
+    def direction_ko(self) -> str:
+        """한국어 방위"""
+        return LUOSHU_PALACE[self.palace_num]["dir_ko"]
+
+    @property
+    def direction_en(self) -> str:
+        """영문 코드"""
+        return LUOSHU_PALACE[self.palace_num]["dir_en"]
+
+    @property
+    def gate(self) -> str:
+        """8문 (휴문, 생문 등)"""
+        return _name(GATE_NAMES, self.gate_code)
+
+    @property
+    def star(self) -> str:
+        """9성 (천봉, 천임 등)"""
+        return _name(STAR_NAMES, self.star_code)
+
+    @property
+    def deity(self) -> str:
+        """8신 (직부, 등사 등)"""
+        return _name(DEITY_NAMES, self.deity_code)
+
+    @property
+    def earthly_plate_gan(self) -> str:
+        """지반 천간"""
+        return _name(HEAVENLY_STEMS, self.earth_code)
+
+    @property
+    def heavenly_plate_gan(self) -> str:
+        """천반 천간"""
+        return _name(HEAVENLY_STEMS, self.heaven_code)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict (문자열 필드로 변환)"""
+        return {
+            "palace_num": self.palace_num,
+            "direction_ko": self.direction_ko,
+            "direction_en": self.direction_en,
+            "gate": self.gate,
+            "star": self.star,
+            "deity": self.deity,
+            "earthly_plate_gan": self.earthly_plate_gan,
+            "heavenly_plate_gan": self.heavenly_plate_gan,
+            "quality_score": self.quality_score,
+        }
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompleteQimenResult:
-    """완전한 기문둔갑 분석 결과"""
+    """완전한 기문둔갑 분석 결과 (불변, 같은 局·시간 조합은 공유)"""
     hour_start: int        # 시작 시각 (0-23)
     hour_end: int         # 종료 시각
-    hour_branch: str      # 시지 (子丑寅卯...)
-    palaces: List[QimenPalace]  # 9개 궁 정보
+    hour_branch: str      # 시지 (자축인묘...)
+    target_hour: int      # 분석 대상 시간 (0-23)
+    palaces: Tuple[QimenPalace, ...]  # 9개 궁 정보
     best_palace: QimenPalace    # 최적 궁
     avoid_palace: QimenPalace   # 회피 궁
     overall_quality: str  # "excellent", "good", "neutral", "bad"
-    user_guidance: str    # 사용자 가이드 문구
+
+    @property
+    def user_guidance(self) -> str:
+        """사용자 가이드 문구"""
+        return _build_guidance(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict (궁 정보와 가이드 문구 포함)"""
+        return {
+            "hour_start": self.hour_start,
+            "hour_end": self.hour_end,
+            "hour_branch": self.hour_branch,
+            "palaces": [palace.to_dict() for palace in self.palaces],
+            "best_palace": self.best_palace.to_dict(),
+            "avoid_palace": self.avoid_palace.to_dict(),
+            "overall_quality": self.overall_quality,
+            "user_guidance": self.user_guidance,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -88,6 +159,11 @@ NINE_STARS = {
 EIGHT_DEITIES_YANG = ["직부", "등사", "태음", "육합", "백호", "현무", "구지", "구천"]
 EIGHT_DEITIES_YIN = ["직부", "등사", "태음", "육합", "구천", "구지", "현무", "백호"]
 
+# 이름 ↔ 정수 코드 테이블 (궁 레코드는 코드만 보관)
+GATE_NAMES = list(EIGHT_GATES)
+STAR_NAMES = list(NINE_STARS)
+DEITY_NAMES = list(EIGHT_DEITIES_YANG)
+
 DEITY_QUALITIES = {
     "직부": 95,  # 직부(直符) - 주신, 최고 길신
     "등사": 35,  # 등사(騰蛇) - 변화와 속임
@@ -103,6 +179,16 @@ DEITY_QUALITIES = {
 HEAVENLY_STEMS = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
 HIDDEN_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
 
+def _name(names: List[str], code: int) -> str:
+    """코드 → 이름 (-1은 빈 문자열)"""
+    return names[code] if code >= 0 else ""
+
+
+def _code(names: List[str], name: str) -> int:
+    """이름 → 코드 (없으면 -1)"""
+    return names.index(name) if name in names else -1
+
+
 # 12지지
 EARTHLY_BRANCHES = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
 
@@ -431,7 +517,7 @@ def calculate_complete_qimen(
     """
     # 1. 일간지와 시간지 계산
     day_stem, day_branch = _get_day_stem_branch(target_date)
-    hour_stem, hour_branch = _get_hour_stem_branch(day_stem, target_hour)
+    hour_stem, _ = _get_hour_stem_branch(day_stem, target_hour)
     
     # 2. 양둔/음둔 결정
     is_yang_dun = _determine_yang_yin_dun(target_date)
@@ -439,33 +525,23 @@ def calculate_complete_qimen(
     # 3. 局數 계산
     ju_number = _calculate_ju_number(day_stem, day_branch, is_yang_dun, target_date)
     
-    # 4. 각 요소 배치
-    palace_rotation = _rotate_palaces(ju_number, is_yang_dun)
-    gate_map = _arrange_gates(ju_number, is_yang_dun)
-    star_map = _arrange_stars(hour_stem, is_yang_dun)
-    deity_map = _arrange_deities(hour_branch, is_yang_dun)
-    earth_plate, heaven_plate = _arrange_stems_on_plates(ju_number, hour_stem)
+    # 4. 결과는 (局, 양둔/음둔, 시간, 시간대)로만 결정되므로 캐시된 결과를 공유
+    return _complete_result(ju_number, is_yang_dun, hour_stem, target_hour)
+
+
+@lru_cache(maxsize=4096)
+def _complete_result(
+    ju_number: int,
+    is_yang_dun: bool,
+    hour_stem: str,
+    target_hour: int
+) -> CompleteQimenResult:
+    """局/양둔 여부/시간/시각 → 분석 결과 (9局 × 2 × 10 × 24 이내)"""
+    hour_branches = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
+    hour_idx = (target_hour + 1) // 2 % 12
+    current_hour_branch = hour_branches[hour_idx]
     
-    # 5. 9궁 정보 생성
-    palaces = []
-    for palace_num in range(1, 10):
-        palace_info = LUOSHU_PALACE[palace_num]
-        
-        palace = QimenPalace(
-            palace_num=palace_num,
-            direction_ko=palace_info["dir_ko"],
-            direction_en=palace_info["dir_en"],
-            gate=gate_map.get(palace_num, ""),
-            star=star_map.get(palace_num, ""),
-            deity=deity_map.get(palace_num, ""),
-            earthly_plate_gan=earth_plate.get(palace_num, ""),
-            heavenly_plate_gan=heaven_plate.get(palace_num, ""),
-            quality_score=0  # 일단 0으로 초기화
-        )
-        
-        # 종합 점수 계산
-        palace.quality_score = _calculate_palace_quality(palace)
-        palaces.append(palace)
+    palaces = _build_palaces(ju_number, is_yang_dun, hour_stem, current_hour_branch)
     
     # 6. 최적/회피 궁 결정
     best_palace = max(palaces, key=lambda p: p.quality_score)
@@ -482,26 +558,6 @@ def calculate_complete_qimen(
     else:
         overall_quality = "bad"
     
-    # 8. 사용자 가이드 생성
-    hour_branches = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-    hour_idx = (target_hour + 1) // 2 % 12
-    current_hour_branch = hour_branches[hour_idx]
-    
-    guidance = f"{target_hour:02d}시({current_hour_branch}시)는 "
-    
-    if overall_quality == "excellent":
-        guidance += "매우 좋은 시간입니다. "
-        guidance += f"{best_palace.direction_ko}쪽이 특히 유리합니다."
-    elif overall_quality == "good":
-        guidance += "좋은 시간입니다. "
-        guidance += f"{best_palace.direction_ko}쪽을 활용하세요."
-    elif overall_quality == "neutral":
-        guidance += "평범한 시간입니다. "
-        guidance += f"{avoid_palace.direction_ko}쪽은 피하는 것이 좋습니다."
-    else:
-        guidance += "주의가 필요한 시간입니다. "
-        guidance += f"중요한 일은 피하고 {best_palace.direction_ko}쪽에서 휴식을 취하세요."
-    
     # 시작/종료 시간 계산
     if hour_idx == 0:  # 자시
         hour_start = 23
@@ -514,14 +570,64 @@ def calculate_complete_qimen(
         hour_start=hour_start,
         hour_end=hour_end,
         hour_branch=current_hour_branch,
+        target_hour=target_hour,
         palaces=palaces,
         best_palace=best_palace,
         avoid_palace=avoid_palace,
         overall_quality=overall_quality,
-        user_guidance=guidance
     )
 
 
+@lru_cache(maxsize=4096)
+def _build_palaces(
+    ju_number: int,
+    is_yang_dun: bool,
+    hour_stem: str,
+    hour_branch: str
+) -> Tuple[QimenPalace, ...]:
+    """각 요소 배치 → 9궁 정보 (코드화된 불변 레코드)"""
+    gate_map = _arrange_gates(ju_number, is_yang_dun)
+    star_map = _arrange_stars(hour_stem, is_yang_dun)
+    deity_map = _arrange_deities(hour_branch, is_yang_dun)
+    earth_plate, heaven_plate = _arrange_stems_on_plates(ju_number, hour_stem)
+    
+    palaces = []
+    for palace_num in range(1, 10):
+        palace = QimenPalace(
+            palace_num=palace_num,
+            gate_code=_code(GATE_NAMES, gate_map.get(palace_num, "")),
+            star_code=_code(STAR_NAMES, star_map.get(palace_num, "")),
+            deity_code=_code(DEITY_NAMES, deity_map.get(palace_num, "")),
+            earth_code=_code(HEAVENLY_STEMS, earth_plate.get(palace_num, "")),
+            heaven_code=_code(HEAVENLY_STEMS, heaven_plate.get(palace_num, "")),
+            quality_score=0,
+        )
+        # 종합 점수 계산
+        palaces.append(replace(palace, quality_score=_calculate_palace_quality(palace)))
+    
+    return tuple(palaces)
+
+
+def _build_guidance(result: CompleteQimenResult) -> str:
+    """사용자 가이드 문구 생성 (직렬화 시점에 호출)"""
+    guidance = f"{result.target_hour:02d}시({result.hour_branch}시)는 "
+    
+    if result.overall_quality == "excellent":
+        guidance += "매우 좋은 시간입니다. "
+        guidance += f"{result.best_palace.direction_ko}쪽이 특히 유리합니다."
+    elif result.overall_quality == "good":
+        guidance += "좋은 시간입니다. "
+        guidance += f"{result.best_palace.direction_ko}쪽을 활용하세요."
+    elif result.overall_quality == "neutral":
+        guidance += "평범한 시간입니다. "
+        guidance += f"{result.avoid_palace.direction_ko}쪽은 피하는 것이 좋습니다."
+    else:
+        guidance += "주의가 필요한 시간입니다. "
+        guidance += f"중요한 일은 피하고 {result.best_palace.direction_ko}쪽에서 휴식을 취하세요."
+    
+    return guidance
+
+
 def get_daily_complete_qimen(
     birth_date: date,
     target_date: date
@@ -0,0 +1,201 @@
+"""
+기문둔갑 최적 시간대 검색 인덱스
+내부 계산 전용 - 사용자에게 직접 노출 금지
+
+"이번 주 중 가장 좋은 시간"을 찾으려면 날짜마다 calculate_daily_qimen을
+호출해 12개 슬롯을 훑어야 했습니다. 이 모듈은 연 단위로 슬롯별
+8문·9궁·에너지를 (일수, 12) 배열로 미리 계산해 두고,
+임의 기간의 상위 K개 시간대를 배열 연산으로 찾습니다.
+
+에너지는 출생일 천간의 오행에만 의존하므로 인덱스는
+(출생일 오행, 연도) 단위로 캐시됩니다.
+"""
+import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .qimen import (
+    EIGHT_GATES,
+    GATE_BASE_ENERGY,
+    PALACE_DIRECTIONS,
+    STEM_WUXING,
+    TWELVE_BRANCHES,
+    _JIAZI_DATE,
+    _get_day_ganzhi,
+)
+
+# 8문 인덱스 → quality / 라벨 / 기준 에너지
+GATE_QUALITY = [quality for _, quality, _ in EIGHT_GATES]
+GATE_LABEL = [label for _, _, label in EIGHT_GATES]
+GATE_ENERGY = np.array([GATE_BASE_ENERGY[name] for name, _, _ in EIGHT_GATES], dtype=np.int8)
+
+SLOT_HOURS = [(h_start, h_end) for _, h_start, h_end in TWELVE_BRANCHES]
+SLOTS = np.arange(12, dtype=np.int16)
+
+# 양둔(陽遁) 월: 11~5월
+_YANG_DUN_MONTHS = np.array([m in (11, 12, 1, 2, 3, 4, 5) for m in range(1, 13)])
+
+# (당일 오행 - 출생 오행) mod 5 → 에너지 보정 (비화 0, 상생 +2, 상극 -2)
+_RELATION_BONUS = np.array([0, 2, -2, -2, 2], dtype=np.int8)
+
+QUALITIES = ("good", "neutral", "avoid")
+
+
+@dataclass
+class QimenIndex:
+    """
+    한 해의 기문 슬롯 인덱스 (배열 shape = (일수, 12), 열은 자시~해시)
+
+    Attributes:
+        year: 연도
+        gate: 8문 인덱스 (0-7)
+        palace: 9궁 번호 (1-9)
+        energy: 에너지 레벨 (1-10)
+    """
+    year: int
+    gate: np.ndarray
+    palace: np.ndarray
+    energy: np.ndarray
+
+    @property
+    def start(self) -> datetime.date:
+        return datetime.date(self.year, 1, 1)
+
+    def slot(self, day_index: int, slot_index: int) -> Dict[str, Any]:
+        """(날짜 인덱스, 슬롯 인덱스) → calculate_daily_qimen 슬롯과 같은 필드의 dict"""
+        gate = int(self.gate[day_index, slot_index])
+        direction, direction_en = PALACE_DIRECTIONS[int(self.palace[day_index, slot_index])]
+        hour_start, hour_end = SLOT_HOURS[slot_index]
+        return {
+            "date": (self.start + datetime.timedelta(days=day_index)).isoformat(),
+            "hour_start": hour_start,
+            "hour_end": hour_end,
+            "quality": GATE_QUALITY[gate],
+            "direction": direction,
+            "direction_en": direction_en,
+            "energy_level": int(self.energy[day_index, slot_index]),
+            "label": GATE_LABEL[gate],
+        }
+
+
+def build_qimen_index(birth_element: int, year: int) -> QimenIndex:
+    """
+    한 해의 기문 슬롯 인덱스 계산 (calculate_daily_qimen과 같은 규칙)
+
+    Args:
+        birth_element: 출생일 천간 오행 인덱스 (木=0 … 水=4)
+        year: 연도
+
+    Returns:
+        QimenIndex
+    """
+    start = datetime.date(year, 1, 1)
+    days = (datetime.date(year + 1, 1, 1) - start).days
+    dates = np.datetime64(start, "D") + np.arange(days)
+    months = dates.astype("datetime64[M]").astype(int) % 12
+    offsets = (np.arange(days) + (start - _JIAZI_DATE).days) % 60
+
+    # 旬/局 (60갑자 내 旬 인덱스는 0-5이므로 局 = 旬 + 1, 음둔은 역순)
+    is_yang = _YANG_DUN_MONTHS[months][:, None]
+    sun_index = (offsets // 10)[:, None]
+    ju = np.where(is_yang, sun_index + 1, 9 - sun_index)
+
+    gate_base = (ju - 1) * 2
+    gate = np.where(is_yang, gate_base + SLOTS, gate_base + (11 - SLOTS)) % 8
+    palace = np.where(is_yang, (ju - 1 + SLOTS) % 9, (9 - ju + (8 - SLOTS)) % 9) + 1
+
+    day_element = (offsets % 10) // 2
+    bonus = _RELATION_BONUS[(day_element - birth_element) % 5][:, None]
+    energy = np.clip(GATE_ENERGY[gate] + bonus, 1, 10)
+
+    return QimenIndex(
+        year=year,
+        gate=gate.astype(np.int8),
+        palace=palace.astype(np.int8),
+        energy=energy.astype(np.int8),
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_index(birth_element: int, year: int) -> QimenIndex:
+    return build_qimen_index(birth_element, year)
+
+
+def get_qimen_index(birth_date: datetime.date, year: int) -> QimenIndex:
+    """출생일 기준 연간 인덱스 (프로세스 내 캐시)"""
+    birth_stem, _ = _get_day_ganzhi(birth_date)
+    return _cached_index(STEM_WUXING[birth_stem], year)
+
+
+def find_best_windows(
+    birth_date: datetime.date,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    k: int = 5,
+    quality: Optional[str] = None,
+    direction: Optional[str] = None,
+    min_energy: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    기간 내 에너지가 높은 시간대 상위 K개 검색
+
+    에너지가 같으면 이른 날짜·시간대가 먼저 옵니다.
+
+    Args:
+        birth_date: 출생일
+        start_date: 시작 날짜
+        end_date: 종료 날짜 (포함)
+        k: 반환할 시간대 수
+        quality: "good" | "neutral" | "avoid" 필터 (optional)
+        direction: 방위 필터, 한국어("북동") 또는 영문 코드("NE") (optional)
+        min_energy: 최소 에너지 레벨
+
+    Returns:
+        시간대 dict 리스트 (date, hour_start, hour_end, quality, direction,
+        direction_en, energy_level, label)
+
+    Raises:
+        ValueError: 알 수 없는 quality/direction
+    """
+    if quality is not None and quality not in QUALITIES:
+        raise ValueError(f"알 수 없는 quality: {quality}")
+    palace_filter = None
+    if direction is not None:
+        for palace_no, names in PALACE_DIRECTIONS.items():
+            if direction in names:
+                palace_filter = palace_no
+                break
+        else:
+            raise ValueError(f"알 수 없는 방위: {direction}")
+
+    gate_filter = None
+    if quality is not None:
+        gate_filter = np.array([q == quality for q in GATE_QUALITY])
+
+    candidates = []  # (-energy, year, day_index, slot, index)
+    for year in range(start_date.year, end_date.year + 1):
+        index = get_qimen_index(birth_date, year)
+        first = max(start_date, index.start)
+        last = min(end_date, datetime.date(year, 12, 31))
+        lo = (first - index.start).days
+        hi = (last - index.start).days + 1
+
+        energy = index.energy[lo:hi]
+        mask = energy >= min_energy
+        if gate_filter is not None:
+            mask &= gate_filter[index.gate[lo:hi]]
+        if palace_filter is not None:
+            mask &= index.palace[lo:hi] == palace_filter
+
+        day_idx, slot_idx = np.nonzero(mask)
+        values = energy[day_idx, slot_idx]
+        # 에너지 내림차순, 동점은 날짜/시간 순 (nonzero가 이미 날짜·슬롯 순이므로 안정 정렬)
+        top = np.argsort(-values, kind="stable")[:k]
+        for value, day, slot in zip(values[top].tolist(), (day_idx[top] + lo).tolist(), slot_idx[top].tolist()):
+            candidates.append((-value, year, day, slot, index))
+
+    candidates.sort(key=lambda c: c[:4])
+    return [index.slot(day, slot) for _, _, day, slot, index in candidates[:k]]
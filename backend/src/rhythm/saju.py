@@ -19,6 +19,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import date as date_type
 from .models import BirthInfo, RhythmSignal
+from ..utils.metrics import SAJU_CACHE_REQUESTS, SAJU_CALCULATOR_LATENCY, SAJU_CALCULATOR_RUNS
+from ..utils.timing import span
+from ..utils.singleflight import SingleFlight
 
 
 def _convert_ohaeng_to_user_friendly(ohaeng_list: List[str], context: str) -> List[str]:
@@ -59,21 +62,23 @@ def _convert_ohaeng_to_user_friendly(ohaeng_list: List[str], context: str) -> Li
 # 사주 원국 계산 캐시 (같은 출생 정보는 동일한 원국 반환)
 _saju_cache: Dict[str, Any] = {}
 _SAJU_CACHE_MAX = 200  # 최대 200개 사용자 캐시
+_saju_flight = SingleFlight("saju")
 
 
-def calculate_saju(birth_info: BirthInfo, target_date: datetime.date) -> Dict[str, Any]:
+def _run_calculator(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    사주명리 계산 (Node.js subprocess 실행)
+    Node.js 사주 계산기 CLI 실행 (벤치마크/테스트에서 교체 가능한 경계)
 
     Args:
-        birth_info: 출생 정보
-        target_date: 분석 대상 날짜
+        input_data: CLI 입력 (year, month, day, hour, minute, gender, isLunar, birthPlace)
 
     Returns:
-        사주명리 계산 결과 (내부 전문 용어 사용)
+        CLI가 출력한 JSON (CompleteSajuData)
 
     Raises:
-        RuntimeError: Node.js 실행 실패 또는 계산 오류
+        RuntimeError: CLI 없음 또는 실행 실패
+        subprocess.TimeoutExpired: 10초 초과
+        json.JSONDecodeError: 출력 파싱 실패
     """
     # Node.js CLI 경로 (saju-calculator 사용)
     current_dir = Path(__file__).parent.parent.parent  # backend/
@@ -82,9 +87,48 @@ def calculate_saju(birth_info: BirthInfo, target_date: datetime.date) -> Dict[st
     if not cli_path.exists():
         raise RuntimeError(f"사주 계산기 CLI를 찾을 수 없습니다: {cli_path}")
 
+    try:
+        with SAJU_CALCULATOR_LATENCY.time():
+            result = subprocess.run(
+                ["node", str(cli_path)],
+                input=json.dumps(input_data),
+                capture_output=True,
+                text=True,
+                encoding='utf-8',  # UTF-8 인코딩 명시
+                timeout=10,  # 10초 타임아웃
+            )
+    except subprocess.TimeoutExpired:
+        SAJU_CALCULATOR_RUNS.inc(outcome="timeout")
+        raise
+
+    if result.returncode != 0:
+        SAJU_CALCULATOR_RUNS.inc(outcome="error")
+        error_msg = result.stderr or "Unknown error"
+        raise RuntimeError(f"사주 계산 실패: {error_msg}")
+    SAJU_CALCULATOR_RUNS.inc(outcome="ok")
+
+    # 결과 파싱
+    return json.loads(result.stdout)
+
+
+def calculate_saju(birth_info: BirthInfo, target_date: datetime.date) -> Dict[str, Any]:
+    """
+    사주명리 계산 (Node.js subprocess 실행)
+
+    Args:
+        birth_info: 출생 정보
+        target_date: 분석 대상 날짜
+
+    Returns:
+        사주명리 계산 결과 (내부 전문 용어 사용)
+
+    Raises:
+        RuntimeError: Node.js 실행 실패 또는 계산 오류
+    """
     # 캐시 키: 출생 정보 기반 (target_date 제외 - 원국은 불변)
     cache_key = f"{birth_info.birth_date}_{birth_info.birth_time}_{birth_info.gender.value}_{birth_info.birth_place}"
     if cache_key in _saju_cache:
+        SAJU_CACHE_REQUESTS.inc(result="hit")
         cached_base = _saju_cache[cache_key]
         # 세운 정보만 target_date에 맞게 재매핑
         saju_data = dict(cached_base)
@@ -98,6 +142,8 @@ def calculate_saju(birth_info: BirthInfo, target_date: datetime.date) -> Dict[st
         saju_data["세운"] = target_year_sewoon
         return saju_data
 
+    SAJU_CACHE_REQUESTS.inc(result="miss")
+
     # 입력 데이터 준비
     input_data = {
         "year": birth_info.birth_date.year,
@@ -111,22 +157,9 @@ def calculate_saju(birth_info: BirthInfo, target_date: datetime.date) -> Dict[st
     }
 
     try:
-        # Node.js CLI 실행
-        result = subprocess.run(
-            ["node", str(cli_path)],
-            input=json.dumps(input_data),
-            capture_output=True,
-            text=True,
-            encoding='utf-8',  # UTF-8 인코딩 명시
-            timeout=10,  # 10초 타임아웃
-        )
-
-        if result.returncode != 0:
-            error_msg = result.stderr or "Unknown error"
-            raise RuntimeError(f"사주 계산 실패: {error_msg}")
-
-        # 결과 파싱
-        saju_data = json.loads(result.stdout)
+        # 같은 출생 정보로 동시에 들어온 계산은 Node.js 실행 한 번을 공유
+        with span("saju_node"):
+            saju_data = _saju_flight.do(cache_key, lambda: _run_calculator(input_data))
 
         # 대상 날짜의 일진 정보 추가 (세운 계산)
         target_year_sewoon = None
@@ -450,8 +483,6 @@ def analyze_monthly_rhythm(
     Returns:
         월간 리듬 해석 (내부 표현)
     """
-    import calendar
-
     # 월주 정보 (사주팔자에서 월주 추출)
     month_pillar = saju_data.get("사주", {}).get("월주", {})
     month_gan = month_pillar.get("천간", "")
@@ -511,59 +542,12 @@ def analyze_monthly_rhythm(
     # 상위 3개만 선택
     priorities = priorities[:3]
 
-    # 일별 에너지 수준 계산 (일진 기반)
-    import datetime as _dt
-    days_in_month = calendar.monthrange(year, month)[1]
-    daily_energy = {}
-
-    _JIAZI_DATE = _dt.date(1900, 1, 31)
-    HEAVENLY_STEMS_WUXING = {
-        "甲": 0, "乙": 0,  # 木
-        "丙": 1, "丁": 1,  # 火
-        "戊": 2, "己": 2,  # 土
-        "庚": 3, "辛": 3,  # 金
-        "壬": 4, "癸": 4,  # 水
-    }
-    ALL_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
-    SHENG_MAP = {0: 1, 1: 2, 2: 3, 3: 4, 4: 0}
-    KE_MAP = {0: 2, 1: 3, 2: 4, 3: 0, 4: 1}
-
-    # 일간(사주 일주 천간) 가져오기
-    dayjugan = saju_data.get("사주", {}).get("일주", {}).get("천간", "")
+    # 일별 에너지 수준 계산 (일진 기반, 한 달 전체를 배열로 계산)
+    # numpy는 콜드 스타트 비용이 커서 호출 시점에 import
+    from .calendar_rhythm import month_rhythm_arrays
 
-    for day in range(1, days_in_month + 1):
-        target_day = _dt.date(year, month, day)
-        delta = (target_day - _JIAZI_DATE).days
-        today_stem = ALL_STEMS[delta % 10]
-
-        # 일간과 당일 천간의 오행 관계로 에너지 결정
-        base_energy = 3
-        if dayjugan in HEAVENLY_STEMS_WUXING and today_stem in HEAVENLY_STEMS_WUXING:
-            wa = HEAVENLY_STEMS_WUXING[dayjugan]
-            wb = HEAVENLY_STEMS_WUXING[today_stem]
-            if SHENG_MAP[wb] == wa:      # 오늘이 나를 생함 (인성) → 에너지 +1
-                base_energy = 4
-            elif KE_MAP[wb] == wa:       # 오늘이 나를 극함 (관살) → 에너지 -1
-                base_energy = 2
-            elif SHENG_MAP[wa] == wb:    # 내가 오늘을 생함 (식상) → 보통
-                base_energy = 3
-            elif KE_MAP[wa] == wb:       # 내가 오늘을 극함 (재성) → 약간 활동적
-                base_energy = 4
-        # 용신 오행과 당일 오행이 일치하면 추가 보정
-        if today_stem in HEAVENLY_STEMS_WUXING:
-            wb = HEAVENLY_STEMS_WUXING[today_stem]
-            # 용신 오행 인덱스 (한국어 → 숫자)
-            yongsin_wuxing = {"목": 0, "화": 1, "토": 2, "금": 3, "수": 4}
-            for yong in yongsin_list:
-                if yongsin_wuxing.get(yong) == wb:
-                    base_energy = min(5, base_energy + 1)
-                    break
-            for gi in gisin_list:
-                if yongsin_wuxing.get(gi) == wb:
-                    base_energy = max(1, base_energy - 1)
-                    break
-
-        daily_energy[day] = base_energy
+    day_arrays = month_rhythm_arrays(year, month, saju_data)
+    daily_energy = day_arrays.energy_by_day()
 
     # 기회/도전 요소
     # 오행 용어를 사용자 친화적 표현으로 변환
@@ -589,6 +573,7 @@ def analyze_monthly_rhythm(
         "주제": main_theme,
         "우선순위": priorities,
         "일별_에너지": daily_energy,
+        "에너지_요약": day_arrays.energy_summary(),
         "기회_요소": opportunities,
         "도전_요소": challenges,
         "월주_정보": {
@@ -651,37 +636,18 @@ def analyze_yearly_rhythm(
         10: "정리와 마무리", 11: "성찰", 12: "다음 준비"
     }
 
-    # 용신/기신 오행 인덱스 매핑
-    _yongsin_wuxing = {"목": 0, "화": 1, "토": 2, "금": 3, "수": 4}
-    # 월별 주도 오행 (절기 기준 간소화)
-    _month_wuxing = {
-        1: 4, 2: 4,   # 수(Water) - 겨울
-        3: 0, 4: 0,   # 목(Wood) - 봄
-        5: 1, 6: 1,   # 화(Fire) - 여름
-        7: 2, 8: 3,   # 토(Earth)/금(Metal) - 환절기/가을
-        9: 3, 10: 2,  # 금(Metal)/토(Earth) - 가을/환절기
-        11: 4, 12: 4, # 수(Water) - 겨울
-    }
+    # 월별 주도 오행(절기 기준 간소화)에 용신/기신 보정, 일진 기반 일평균 에너지
+    from .calendar_rhythm import month_element_energy, year_rhythm_arrays
 
-    for month in range(1, 13):
-        month_wx = _month_wuxing.get(month, 2)
-        base_score = 3
-
-        # 용신 오행과 월 오행이 일치하면 +1
-        for yong in yongsin_list:
-            if _yongsin_wuxing.get(yong) == month_wx:
-                base_score = min(5, base_score + 1)
-                break
-        # 기신 오행과 월 오행이 일치하면 -1
-        for gi in gisin_list:
-            if _yongsin_wuxing.get(gi) == month_wx:
-                base_score = max(1, base_score - 1)
-                break
+    month_energy = month_element_energy(saju_data)
+    daily_mean = year_rhythm_arrays(year, saju_data).monthly_mean_energy()
 
+    for month in range(1, 13):
         monthly_signals[month] = {
             "월": month,
             "테마": month_themes.get(month, "균형"),
-            "에너지": base_score,
+            "에너지": int(month_energy[month - 1]),
+            "일평균_에너지": daily_mean.get(month, 3.0),
         }
 
     yearly_analysis = {
@@ -8,6 +8,23 @@ import datetime
 from typing import List, Dict, Any
 from .models import BirthInfo, RhythmSignal, MonthlyRhythmSignal, YearlyRhythmSignal
 from .saju import calculate_saju, analyze_daily_fortune, analyze_monthly_rhythm, analyze_yearly_rhythm
+from ..utils.term_scanner import TermScanner
+
+
+# 오행 전문 용어 → 사용자 친화적 표현
+_OHAENG_REPLACEMENTS = {
+    "목 오행 활용": "성장·확장 에너지 활용",
+    "화 오행 활용": "활동·소통 에너지 활용",
+    "토 오행 활용": "안정·정리 에너지 활용",
+    "금 오행 활용": "결단·실행 에너지 활용",
+    "수 오행 활용": "계획·휴식 에너지 활용",
+    "목 오행 주의": "과도한 확장 주의",
+    "화 오행 주의": "과열·충동 주의",
+    "토 오행 주의": "과도한 고집 주의",
+    "금 오행 주의": "지나친 단호함 주의",
+    "수 오행 주의": "과도한 소극성 주의",
+}
+_OHAENG_SCRUBBER = TermScanner([], replacements=_OHAENG_REPLACEMENTS)
 
 
 class RhythmAnalyzer:
@@ -228,23 +245,9 @@ class RhythmAnalyzer:
         사용자 친화적 표현으로 대체한다.
 
         예: "목 오행 활용" → "성장·확장 에너지 활용"
+        (문장 안에 포함된 표현도 한 번의 스캔으로 치환)
         """
-        ohaeng_map = {
-            "목 오행 활용": "성장·확장 에너지 활용",
-            "화 오행 활용": "활동·소통 에너지 활용",
-            "토 오행 활용": "안정·정리 에너지 활용",
-            "금 오행 활용": "결단·실행 에너지 활용",
-            "수 오행 활용": "계획·휴식 에너지 활용",
-            "목 오행 주의": "과도한 확장 주의",
-            "화 오행 주의": "과열·충동 주의",
-            "토 오행 주의": "과도한 고집 주의",
-            "금 오행 주의": "지나친 단호함 주의",
-            "수 오행 주의": "과도한 소극성 주의",
-        }
-        result = []
-        for item in items:
-            result.append(ohaeng_map.get(item, item))
-        return result
+        return [_OHAENG_SCRUBBER.scrub(item) for item in items]
 
     def _ohaeng_to_user_keyword(self, ohaeng_list: List[str]) -> List[str]:
         """
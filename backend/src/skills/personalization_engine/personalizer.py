@@ -19,6 +19,7 @@ from .profile_analyzer import ProfileAnalyzer
 from .content_mapper import ContentMapper
 from .content_generator import ContentBlockGenerator
 from .rhythm_integrator import RhythmIntegrator
+from ...utils.term_scanner import TermScanner
 
 # Internal terminology that must NOT appear in user-facing content
 _FORBIDDEN_TERMS = [
@@ -26,6 +27,7 @@ _FORBIDDEN_TERMS = [
     "천을귀인", "역마", "공망", "NLP", "알고리즘", "엔진",
     "계산 모듈", "분석 모듈", "사주", "기문", "명리",
 ]
+_FORBIDDEN_SCANNER = TermScanner(_FORBIDDEN_TERMS)
 
 
 class PersonalizationEngine:
@@ -184,10 +186,9 @@ class PersonalizationEngine:
         # Only check user-facing text fields, exclude internal data keys
         user_facing = {k: v for k, v in schema.items() if k != "date"}
         text_blob = _flatten_to_text(user_facing)
-        for term in _FORBIDDEN_TERMS:
-            if term in text_blob:
-                issues.append(f"Forbidden term found: '{term}'")
-                term_ok = False
+        for term in _FORBIDDEN_SCANNER.found_terms(text_blob):
+            issues.append(f"Forbidden term found: '{term}'")
+            term_ok = False
 
         passed = block_ok and char_ok and term_ok
         # personalization is a soft check
@@ -7,6 +7,7 @@ Bridge between the existing rhythm analysis system and the personalization engin
 import datetime
 from typing import Dict, Any
 from .models import CustomerProfile, Role
+from ...utils.term_scanner import TermScanner
 
 # Import existing rhythm modules
 try:
@@ -101,15 +102,12 @@ class RhythmIntegrator:
 
     @classmethod
     def _scrub_text(cls, text: str) -> str:
-        """Replace internal terms with user-friendly alternatives."""
-        # Apply specific replacements first (longer phrases)
-        for internal, replacement in sorted(cls._TERM_REPLACEMENTS.items(), key=lambda x: len(x[0]), reverse=True):
-            text = text.replace(internal, replacement)
-        # Remove any remaining forbidden terms
-        for term in cls._INTERNAL_TERMS:
-            if term in text:
-                text = text.replace(term, "흐름")
-        return text
+        """Replace internal terms with user-friendly alternatives.
+
+        Single pass, leftmost-longest: specific phrases from _TERM_REPLACEMENTS
+        win over the bare terms they contain; any other internal term becomes "흐름".
+        """
+        return _SCRUBBER.scrub(text)
 
     @staticmethod
     def adapt_rhythm_to_role(rhythm: Dict[str, Any], role: Role) -> Dict[str, Any]:
@@ -219,3 +217,11 @@ class RhythmIntegrator:
             "challenges": challenges_pool[idx],
             "saju_data": {},
         }
+
+
+# Compiled once for all RhythmIntegrator instances
+_SCRUBBER = TermScanner(
+    RhythmIntegrator._INTERNAL_TERMS,
+    replacements=RhythmIntegrator._TERM_REPLACEMENTS,
+    default_replacement="흐름",
+)
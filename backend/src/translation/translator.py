@@ -9,9 +9,13 @@ Role Translation Layer
 - office_worker (직장인): 업무/관계/결정/보고
 - freelancer (프리랜서/자영업): 결정/계약/창작/체력
 """
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from copy import deepcopy
 
+if TYPE_CHECKING:
+    # content 패키지가 translation을 import하므로 타입 검사 시에만 import
+    from ..content.metrics import ContentMetrics
+
 
 # 역할별 표현 매핑
 ROLE_EXPRESSIONS = {
@@ -524,7 +528,9 @@ def translate_yearly_content(
 
 def validate_semantic_preservation(
     original: Dict[str, Any],
-    translated: Dict[str, Any]
+    translated: Dict[str, Any],
+    original_metrics: Optional["ContentMetrics"] = None,
+    translated_metrics: Optional["ContentMetrics"] = None,
 ) -> tuple[bool, list]:
     """
     의미 불변성 검증
@@ -534,6 +540,8 @@ def validate_semantic_preservation(
     Args:
         original: 원본 콘텐츠
         translated: 번역된 콘텐츠
+        original_metrics: 원본의 analyze_content() 결과 (없으면 여기서 계산)
+        translated_metrics: 번역본의 analyze_content() 결과 (없으면 여기서 계산)
 
     Returns:
         (검증 통과 여부, 차이점 메시지 리스트)
@@ -569,8 +577,8 @@ def validate_semantic_preservation(
         issues.append("피할 행동 개수 불일치")
 
     # 5. 콘텐츠 길이 비교 (±30% 이내여야 함)
-    orig_len = _calculate_content_length(original)
-    trans_len = _calculate_content_length(translated)
+    orig_len = _calculate_content_length(original, original_metrics)
+    trans_len = _calculate_content_length(translated, translated_metrics)
 
     if orig_len > 0:
         ratio = abs(trans_len - orig_len) / orig_len
@@ -590,31 +598,15 @@ def validate_semantic_preservation(
     return (len(issues) == 0, issues)
 
 
-def _calculate_content_length(content: Dict[str, Any]) -> int:
-    """콘텐츠 총 길이 계산"""
-    total = 0
-
-    total += len(content.get("summary", ""))
-    total += len(content.get("rhythm_description", ""))
-    total += len(content.get("meaning_shift", ""))
-    total += len(content.get("rhythm_question", ""))
-
-    # Focus/Caution
-    fc = content.get("focus_caution", {})
-    for item in fc.get("focus", []):
-        total += len(item)
-    for item in fc.get("caution", []):
-        total += len(item)
-
-    # Action Guide
-    ag = content.get("action_guide", {})
-    for item in ag.get("do", []):
-        total += len(item)
-    for item in ag.get("avoid", []):
-        total += len(item)
-
-    # State Trigger
-    st = content.get("state_trigger", {})
-    total += len(st.get("how_to", ""))
+def _calculate_content_length(content: Dict[str, Any], metrics: Optional["ContentMetrics"] = None) -> int:
+    """
+    콘텐츠 총 길이 계산
 
-    return total
+    summary, rhythm_description, meaning_shift, rhythm_question,
+    focus_caution/action_guide 항목, state_trigger.how_to의 합계
+    """
+    if metrics is None:
+        # content 패키지가 translation을 import하므로 순환 import를 피해 지연 import
+        from ..content.metrics import analyze_content
+        metrics = analyze_content(content)
+    return metrics.core_length
@@ -6,6 +6,7 @@ from copy import deepcopy
 from typing import Dict, List, Tuple, Any
 
 from ..models import RoleAdaptationRules, TranslationContext, TranslationResult
+from ...utils.term_scanner import TermScanner, get_term_scanner
 
 
 class BaseTranslator(ABC):
@@ -41,9 +42,8 @@ class BaseTranslator(ABC):
         translated = self._adjust_tone(translated)
 
         # forbidden term check
-        for term in self.rules.forbidden_terms:
-            if term in translated:
-                issues.append(f"금지 용어 발견: '{term}' in {block_type}")
+        for term in self._forbidden_scanner.found_terms(translated):
+            issues.append(f"금지 용어 발견: '{term}' in {block_type}")
 
         return (len(issues) == 0, translated, issues)
 
@@ -154,13 +154,17 @@ class BaseTranslator(ABC):
         """톤 조정 (서브클래스에서 오버라이드 가능)"""
         return text
 
+    @property
+    def _forbidden_scanner(self) -> TermScanner:
+        """역할별 금지 용어 스캐너 (용어 목록별로 한 번만 컴파일)"""
+        return get_term_scanner(tuple(self.rules.forbidden_terms))
+
     def _check_forbidden_terms(self, content: Dict[str, Any]) -> List[str]:
         """금지 용어 검사"""
         issues: List[str] = []
         text_blob = _extract_all_text(content)
-        for term in self.rules.forbidden_terms:
-            if term in text_blob:
-                issues.append(f"금지 용어 '{term}' 발견 (역할: {self.role})")
+        for term in self._forbidden_scanner.found_terms(text_blob):
+            issues.append(f"금지 용어 '{term}' 발견 (역할: {self.role})")
         return issues
 
     def validate_translation(
@@ -0,0 +1,242 @@
+"""
+부하 제어 (admission control / load shedding)
+
+PDF 생성, 31일 기간 조회, 연간 조회는 요청 하나가 CPU를 수 초씩 씁니다.
+급증 시 이들이 워커를 모두 차지해 /api/logs, /health 같은 가벼운 엔드포인트까지
+느려지지 않도록, 무거운 엔드포인트만 클래스별로 동시 처리 수를 제한합니다.
+
+- 슬롯이 없으면 제한된 대기열에서 기다리고, 대기열이 가득 차거나 대기 시간이 지나면
+  503 + Retry-After로 즉시 거절합니다.
+- 대기열은 사용자(Authorization, 없으면 클라이언트 IP)별로 나뉘고, 슬롯이 비면
+  사용자 간 라운드 로빈으로 넘겨 한 사용자의 연속 요청이 다른 사용자를 밀어내지 않습니다.
+- 분류되지 않은 경로는 아무 비용 없이 통과합니다.
+
+클래스별 설정 (환경변수, NAME은 PDF/HEAVY):
+    ADMISSION_{NAME}_CONCURRENCY     동시 처리 수
+    ADMISSION_{NAME}_QUEUE           전체 대기열 길이
+    ADMISSION_{NAME}_QUEUE_PER_USER  사용자당 대기 요청 수
+    ADMISSION_{NAME}_TIMEOUT         최대 대기 시간 (초)
+    ADMISSION_{NAME}_RETRY_AFTER     거절 시 Retry-After (초)
+"""
+import asyncio
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Hashable, List, Optional, Pattern
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from src.utils.metrics import ADMISSION_ACTIVE, ADMISSION_QUEUED, ADMISSION_REJECTED, ADMISSION_WAIT
+
+REJECT_DETAIL = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+
+class AdmissionRejected(Exception):
+    """대기열 초과 또는 대기 시간 초과로 요청을 받지 않음"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class EndpointClass:
+    """
+    부하 제어 대상 엔드포인트 묶음
+
+    Attributes:
+        name: 클래스 이름 (메트릭 레이블, 환경변수 접두사)
+        pattern: 대상 경로 정규식
+        max_concurrency: 동시 처리 수
+        max_queue: 전체 대기열 길이 (0이면 대기 없이 거절)
+        max_queue_per_user: 사용자당 대기 요청 수
+        queue_timeout: 최대 대기 시간 (초)
+        retry_after: 거절 응답의 Retry-After (초)
+    """
+    name: str
+    pattern: Pattern[str]
+    max_concurrency: int
+    max_queue: int
+    max_queue_per_user: int
+    queue_timeout: float
+    retry_after: int
+
+
+# (이름, 경로, 동시 처리, 대기열, 사용자당 대기, 대기 시간, Retry-After)
+# PDF 비동기 작업 API(/api/pdf/jobs)는 작업 등록/조회만 하므로 제외
+DEFAULT_CLASSES = [
+    ("pdf", r"^/api/pdf/(?!jobs(/|$))", 2, 16, 2, 15.0, 10),
+    ("heavy", r"^/api/(daily/range/[^/]+/[^/]+|content/yearly/\d+)/?$", 2, 8, 2, 5.0, 5),
+]
+
+
+def load_endpoint_classes() -> List[EndpointClass]:
+    """기본 클래스에 환경변수 설정을 덮어 반환"""
+    classes = []
+    for name, pattern, concurrency, queue, per_user, timeout, retry_after in DEFAULT_CLASSES:
+        prefix = f"ADMISSION_{name.upper()}_"
+        classes.append(EndpointClass(
+            name=name,
+            pattern=re.compile(pattern),
+            max_concurrency=int(os.getenv(prefix + "CONCURRENCY", str(concurrency))),
+            max_queue=int(os.getenv(prefix + "QUEUE", str(queue))),
+            max_queue_per_user=int(os.getenv(prefix + "QUEUE_PER_USER", str(per_user))),
+            queue_timeout=float(os.getenv(prefix + "TIMEOUT", str(timeout))),
+            retry_after=int(os.getenv(prefix + "RETRY_AFTER", str(retry_after))),
+        ))
+    return classes
+
+
+class FairLimiter:
+    """
+    사용자별 공정 대기열을 가진 동시 처리 제한기 (이벤트 루프 하나에서 사용)
+
+    Args:
+        endpoint_class: 제한 설정
+    """
+
+    def __init__(self, endpoint_class: EndpointClass):
+        self.spec = endpoint_class
+        self.active = 0
+        self.queued = 0
+        # 사용자 → 대기 Future (OrderedDict 순서가 라운드 로빈 순서)
+        self._waiters: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+
+    async def acquire(self, user: Hashable) -> None:
+        """
+        슬롯 획득 (없으면 대기)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 참(queue_full/user_queue_full) 또는 대기 시간 초과(timeout)
+        """
+        if self.active < self.spec.max_concurrency and self.queued == 0:
+            self._set_active(self.active + 1)
+            return
+
+        if self.queued >= self.spec.max_queue:
+            raise AdmissionRejected("queue_full")
+        user_queue = self._waiters.get(user)
+        if user_queue is not None and len(user_queue) >= self.spec.max_queue_per_user:
+            raise AdmissionRejected("user_queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(user, deque()).append(waiter)
+        self._set_queued(self.queued + 1)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.spec.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 취소/시간 초과와 동시에 슬롯을 넘겨받았으면 되돌려 줌
+                self.release()
+            else:
+                waiter.cancel()
+                self._discard(user, waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise AdmissionRejected("timeout")
+            raise
+        finally:
+            ADMISSION_WAIT.observe(time.perf_counter() - started, endpoint_class=self.spec.name)
+
+    def release(self) -> None:
+        """슬롯 반환 (대기 중인 다음 사용자에게 라운드 로빈으로 넘김)"""
+        while self._waiters:
+            user, user_queue = next(iter(self._waiters.items()))
+            waiter = user_queue.popleft()
+            self._set_queued(self.queued - 1)
+            if user_queue:
+                self._waiters.move_to_end(user)
+            else:
+                del self._waiters[user]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._set_active(self.active - 1)
+
+    def _discard(self, user: Hashable, waiter: asyncio.Future) -> None:
+        user_queue = self._waiters.get(user)
+        if user_queue is None or waiter not in user_queue:
+            return
+        user_queue.remove(waiter)
+        self._set_queued(self.queued - 1)
+        if not user_queue:
+            del self._waiters[user]
+
+    def _set_active(self, value: int) -> None:
+        self.active = value
+        ADMISSION_ACTIVE.set(value, endpoint_class=self.spec.name)
+
+    def _set_queued(self, value: int) -> None:
+        self.queued = value
+        ADMISSION_QUEUED.set(value, endpoint_class=self.spec.name)
+
+
+def _user_key(scope) -> str:
+    """공정 대기열 사용자 키 (토큰 해시, 없으면 클라이언트 IP)"""
+    authorization = Headers(scope=scope).get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+    client = scope.get("client")
+    return client[0] if client else ""
+
+
+class AdmissionControlMiddleware:
+    """
+    무거운 엔드포인트 동시 처리 제한 ASGI 미들웨어
+
+    Args:
+        app: ASGI 앱
+        classes: 엔드포인트 클래스 (없으면 load_endpoint_classes())
+    """
+
+    def __init__(self, app, classes: Optional[List[EndpointClass]] = None):
+        self.app = app
+        self.classes = load_endpoint_classes() if classes is None else classes
+        self._limiters: Dict[str, FairLimiter] = {}
+
+    def limiter(self, name: str) -> FairLimiter:
+        """클래스 이름의 제한기 (첫 요청 시 생성)"""
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            spec = next(c for c in self.classes if c.name == name)
+            limiter = self._limiters[name] = FairLimiter(spec)
+        return limiter
+
+    def classify(self, path: str) -> Optional[EndpointClass]:
+        """경로가 속한 클래스 (없으면 None)"""
+        for endpoint_class in self.classes:
+            if endpoint_class.pattern.match(path):
+                return endpoint_class
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint_class = self.classify(scope["path"])
+        if endpoint_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.limiter(endpoint_class.name)
+        try:
+            await limiter.acquire(_user_key(scope))
+        except AdmissionRejected as e:
+            ADMISSION_REJECTED.inc(endpoint_class=endpoint_class.name, reason=e.reason)
+            response = JSONResponse(
+                {"detail": REJECT_DETAIL},
+                status_code=503,
+                headers={"Retry-After": str(endpoint_class.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -0,0 +1,196 @@
+"""
+응답 압축 미들웨어 (brotli / gzip)
+
+Accept-Encoding을 협상해 brotli(있으면 우선)나 gzip으로 큰 텍스트 응답을 압축합니다.
+기간/연간 JSON은 반복되는 한글 문구가 많아 압축률이 매우 높습니다 (31일 범위 약 50배).
+
+- minimum_size 미만 응답, 이미 Content-Encoding이 있는 응답, PDF/이미지 등
+  텍스트가 아닌 응답, 304/204는 그대로 보냅니다.
+- 본문이 여러 조각으로 오면(BaseHTTPMiddleware/StreamingResponse) 임계값까지 모은 뒤
+  점진 압축으로 이어서 보냅니다.
+- ETag는 약한 검증자(W/)라 압축 후에도 그대로 유효합니다.
+
+brotli 패키지가 없으면 gzip만 사용합니다.
+"""
+import importlib.util
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+
+if BROTLI_AVAILABLE:
+    import brotli
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding → {코딩: q값}"""
+    encodings = {}
+    for item in header.split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        encodings[name.lower()] = q
+    return encodings
+
+
+def choose_encoding(header: Optional[str], brotli_enabled: bool = BROTLI_AVAILABLE) -> Optional[str]:
+    """
+    사용할 압축 방식 선택 (q값이 같으면 br > gzip)
+
+    Args:
+        header: 요청의 Accept-Encoding
+        brotli_enabled: brotli 사용 가능 여부
+
+    Returns:
+        "br" / "gzip" / None (압축 안 함)
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli_enabled else ["gzip"]
+    best, best_q = None, 0.0
+    for encoding in candidates:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Encoder:
+    """점진 압축기 (gzip: zlib, br: brotli.Compressor)"""
+
+    __slots__ = ("_compressor", "_brotli")
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self._brotli = encoding == "br"
+        if self._brotli:
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli:
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        if self._brotli:
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def _is_compressible(headers: MutableHeaders, status: int) -> bool:
+    if status < 200 or status in (204, 304) or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    brotli/gzip 응답 압축 ASGI 미들웨어
+
+    Args:
+        app: ASGI 앱
+        minimum_size: 이 크기(바이트) 이상인 본문만 압축
+        gzip_level: gzip 압축 수준 (1-9)
+        brotli_quality: brotli 품질 (0-11, 동적 응답은 4-5가 속도/크기 균형점)
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        buffer = bytearray()
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_start(compress: bool, length: Optional[int] = None) -> None:
+            headers = MutableHeaders(scope=start_message)
+            if compress:
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if length is None:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(length)
+            await send(start_message)
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                if not _is_compressible(MutableHeaders(scope=message), message["status"]):
+                    passthrough = True
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is not None:
+                chunk = encoder.compress(body)
+                if not more_body:
+                    chunk += encoder.finish()
+                if chunk or not more_body:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            buffer.extend(body)
+            if more_body and len(buffer) < self.minimum_size:
+                return
+
+            if len(buffer) < self.minimum_size:
+                # 작은 응답은 원본 그대로
+                passthrough = True
+                await send_start(compress=False)
+                await send({"type": "http.response.body", "body": bytes(buffer), "more_body": False})
+                return
+
+            encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+            chunk = encoder.compress(bytes(buffer))
+            buffer.clear()
+            if not more_body:
+                chunk += encoder.finish()
+                await send_start(compress=True, length=len(chunk))
+            else:
+                await send_start(compress=True)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
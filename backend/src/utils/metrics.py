@@ -0,0 +1,406 @@
+"""
+Prometheus 호환 메트릭 (텍스트 노출 형식 0.0.4)
+
+외부 의존성 없이 Counter / Gauge / Histogram과 스크레이프 시점 수집기(collector)를
+제공합니다. 요청 지연/처리 중 요청은 MetricsMiddleware가, 엔진 통계(사주 계산기,
+캐시, PDF 풀, Supabase 호출)는 각 모듈의 계측과 등록된 수집기가 채웁니다.
+
+    GET /metrics  →  render_metrics() 결과 (text/plain; version=0.0.4)
+"""
+import bisect
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 지연 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PDF_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# (이름 접미사, 레이블, 값) - 수집기가 반환하는 샘플
+Sample = Tuple[str, Dict[str, str], float]
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블별 값을 보관하는 메트릭 공통부"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요 (받음: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터 (이름은 _total로 끝나야 함)"""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [("", self._labels(key), value) for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    """증감 가능한 현재 값"""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [("", self._labels(key), value) for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (_bucket / _sum / _count)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수 (+Inf 포함), 합계, 개수]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """블록 실행 시간을 관측 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self) -> List[Sample]:
+        samples: List[Sample] = []
+        with self._lock:
+            items = [(key, list(state[0]), state[1], state[2]) for key, state in self._values.items()]
+        for key, counts, total, count in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                samples.append(("_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, count))
+        return samples
+
+
+# 수집기: 스크레이프 시점에 (이름, 타입, 설명, 샘플 목록)을 반환
+CollectedMetric = Tuple[str, str, str, List[Sample]]
+Collector = Callable[[], Iterable[CollectedMetric]]
+
+
+class MetricsRegistry:
+    """메트릭과 수집기 등록부"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Collector) -> Collector:
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def collect(self) -> List[CollectedMetric]:
+        collected = [
+            (metric.name, metric.type_name, metric.documentation, metric.samples())
+            for metric in self._metrics.values()
+        ]
+        for collector in list(self._collectors):
+            collected.extend(collector())
+        return collected
+
+    def render(self) -> str:
+        """텍스트 노출 형식으로 직렬화"""
+        lines = []
+        for name, type_name, documentation, samples in self.collect():
+            lines.append(f"# HELP {name} {_escape(documentation)}")
+            lines.append(f"# TYPE {name} {type_name}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# -- HTTP ------------------------------------------------------------------
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "r3_http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "r3_http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route")
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge("r3_http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+# -- 엔진 ------------------------------------------------------------------
+
+SAJU_CALCULATOR_RUNS = REGISTRY.counter(
+    "r3_saju_calculator_runs_total", "Node.js 사주 계산기 프로세스 실행 수", ("outcome",)
+)
+SAJU_CALCULATOR_LATENCY = REGISTRY.histogram(
+    "r3_saju_calculator_duration_seconds", "Node.js 사주 계산기 실행 시간 (초)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+SAJU_CACHE_REQUESTS = REGISTRY.counter(
+    "r3_saju_cache_requests_total", "사주 원국 캐시 조회 수", ("result",)
+)
+PDF_RENDER_LATENCY = REGISTRY.histogram(
+    "r3_pdf_render_duration_seconds", "PDF 렌더링 시간 (캐시 조회 포함, 초)", ("method", "outcome"),
+    buckets=PDF_BUCKETS,
+)
+SINGLEFLIGHT_CALLS = REGISTRY.counter(
+    "r3_singleflight_calls_total", "single-flight 호출 수 (leader: 직접 계산, shared: 진행 중 결과 공유)",
+    ("flight", "result"),
+)
+ADMISSION_ACTIVE = REGISTRY.gauge(
+    "r3_admission_active", "부하 제어 대상 엔드포인트에서 처리 중인 요청 수", ("endpoint_class",)
+)
+ADMISSION_QUEUED = REGISTRY.gauge(
+    "r3_admission_queued", "부하 제어 대기열에서 기다리는 요청 수", ("endpoint_class",)
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "r3_admission_rejected_total", "부하 제어로 거절(503)된 요청 수", ("endpoint_class", "reason")
+)
+ADMISSION_WAIT = REGISTRY.histogram(
+    "r3_admission_wait_seconds", "부하 제어 대기열 대기 시간 (초)", ("endpoint_class",),
+)
+SUPABASE_LATENCY = REGISTRY.histogram(
+    "r3_supabase_request_duration_seconds", "Supabase 호출 시간 (초)", ("operation", "outcome"),
+)
+
+
+@contextmanager
+def observe(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """
+    블록 실행 시간을 outcome(ok/error) 레이블과 함께 관측
+
+    Args:
+        histogram: ("outcome", ...) 레이블을 가진 히스토그램
+        labels: outcome 외 레이블
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        histogram.observe(time.perf_counter() - started, outcome=outcome, **labels)
+
+
+def _lru_cache_samples(caches: Dict[str, Callable]) -> Tuple[List[Sample], List[Sample], List[Sample]]:
+    hits, misses, entries = [], [], []
+    for name, func in caches.items():
+        info = func.cache_info()
+        hits.append(("", {"cache": name}, info.hits))
+        misses.append(("", {"cache": name}, info.misses))
+        entries.append(("", {"cache": name}, info.currsize))
+    return hits, misses, entries
+
+
+def _collect_engine_caches() -> List[CollectedMetric]:
+    """기문 lru_cache / Markdown / 사주 원국 캐시 통계 (이미 로드된 모듈만)"""
+    caches: Dict[str, Callable] = {}
+    qimen = sys.modules.get("src.rhythm.qimen")
+    if qimen is not None:
+        caches["qimen_hourly"] = qimen._hourly_results
+    qimen_complete = sys.modules.get("src.rhythm.qimen_complete")
+    if qimen_complete is not None:
+        caches["qimen_complete"] = qimen_complete._complete_result
+        caches["qimen_palaces"] = qimen_complete._build_palaces
+    qimen_index = sys.modules.get("src.rhythm.qimen_index")
+    if qimen_index is not None:
+        caches["qimen_index"] = qimen_index._cached_index
+    hits, misses, entries = _lru_cache_samples(caches)
+
+    markdown_cache = sys.modules.get("src.content.markdown_cache")
+    if markdown_cache is not None and markdown_cache._markdown_cache is not None:
+        cache = markdown_cache._markdown_cache
+        hits.append(("", {"cache": "markdown"}, cache.hits))
+        misses.append(("", {"cache": "markdown"}, cache.misses))
+        entries.append(("", {"cache": "markdown"}, len(cache)))
+
+    saju = sys.modules.get("src.rhythm.saju")
+    if saju is not None:
+        entries.append(("", {"cache": "saju"}, len(saju._saju_cache)))
+
+    return [
+        ("r3_cache_hits_total", "counter", "엔진 캐시 적중 수", hits),
+        ("r3_cache_misses_total", "counter", "엔진 캐시 미스 수", misses),
+        ("r3_cache_entries", "gauge", "엔진 캐시 항목 수", entries),
+    ]
+
+
+def _collect_render_pool() -> List[CollectedMetric]:
+    """PDF 렌더링 풀 대기열/누적 통계 (풀이 생성된 경우만)"""
+    render_pool = sys.modules.get("render_pool")
+    pool = getattr(render_pool, "_render_pool", None) if render_pool is not None else None
+    if pool is None:
+        return []
+    stats = pool.stats()
+    return [
+        ("r3_pdf_queue_depth", "gauge", "PDF 렌더링 실행 중 + 대기 작업 수", [("", {}, stats["pending"])]),
+        ("r3_pdf_queue_capacity", "gauge", "PDF 렌더링 대기열 상한", [("", {}, stats["max_queue"])]),
+        ("r3_pdf_pool_workers", "gauge", "PDF 렌더링 워커 프로세스 수", [("", {}, pool.max_workers)]),
+        ("r3_pdf_jobs_total", "counter", "PDF 렌더링 작업 결과 수", [
+            ("", {"outcome": outcome}, stats[outcome])
+            for outcome in ("completed", "failed", "timeouts", "rejected")
+        ]),
+        ("r3_pdf_pool_restarts_total", "counter", "PDF 렌더링 풀 재시작 수", [("", {}, stats["restarts"])]),
+    ]
+
+
+REGISTRY.add_collector(_collect_engine_caches)
+REGISTRY.add_collector(_collect_render_pool)
+
+
+def render_metrics() -> str:
+    """전역 레지스트리의 텍스트 노출 형식"""
+    return REGISTRY.render()
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수/지연 히스토그램과 처리 중 요청 수를 기록하는 ASGI 미들웨어
+
+    route 레이블은 경로 템플릿(/api/daily/{target_date})이며, 매칭되지 않은 요청은
+    카디널리티를 막기 위해 "unmatched"로 묶습니다.
+    """
+
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_LATENCY.observe(time.perf_counter() - started, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
@@ -0,0 +1,87 @@
+"""
+orjson 기반 JSON 응답
+
+기간/연간 응답은 한글 텍스트가 깊게 중첩된 큰 dict라서 기본 경로
+(jsonable_encoder로 한 번 복사한 뒤 json.dumps)가 직렬화 시간의 대부분을 차지합니다.
+FastJSONResponse는 orjson으로 바로 바이트를 만들고, 엔드포인트가 json_response()로
+직접 반환하면 jsonable_encoder와 응답 모델 재검증도 건너뜁니다.
+
+orjson이 없으면 표준 json으로 동작합니다 (결과 JSON은 같음).
+
+    return json_response({"year": year, "content": yearly_content}, response)
+"""
+import decimal
+import importlib.util
+from typing import Any, Mapping, Optional
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """orjson이 기본으로 모르는 타입 변환 (pydantic 모델은 재검증 없이 덤프)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSON 바이트 직렬화 (UTF-8, 공백 없음)
+
+    Args:
+        content: dict/list/pydantic 모델 등 (date, Enum, numpy 배열 포함 가능)
+
+    Returns:
+        JSON 바이트
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    from fastapi.encoders import jsonable_encoder
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 렌더링하는 JSONResponse (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FastJSONResponse:
+    """
+    엔드포인트에서 바로 반환할 JSON 응답
+
+    FastAPI의 jsonable_encoder 복사와 response_model 재검증을 거치지 않습니다.
+
+    Args:
+        content: 응답 본문
+        response: FastAPI가 주입한 Response (ETag 등 이미 설정한 헤더를 옮겨 담음)
+        status_code: HTTP 상태 코드
+        headers: 추가 헤더
+
+    Returns:
+        FastJSONResponse
+    """
+    result = FastJSONResponse(content, status_code=status_code, headers=headers)
+    if response is not None:
+        result.headers.raw.extend(
+            (name, value) for name, value in response.headers.raw if name != b"content-length"
+        )
+    return result
@@ -0,0 +1,149 @@
+"""
+Single-flight 요청 합치기
+
+같은 입력의 계산이 동시에 여러 번 시작되면(여러 기기에서 동시에 앱을 열거나
+프론트엔드가 요청을 두 번 보내는 경우, 자정에 같은 날짜를 여는 경우)
+첫 호출(leader)만 계산하고 나머지는 진행 중인 결과를 기다려 공유합니다.
+결과를 저장하지는 않으므로 계산이 끝난 뒤의 호출은 다시 계산합니다 (캐시와 별개).
+
+- SingleFlight: 스레드용 (사주 계산기처럼 워커 스레드에서 호출되는 동기 함수)
+- AsyncSingleFlight: 이벤트 루프용 (콘텐츠 조립 / PDF 렌더링 코루틴)
+
+공유된 결과는 같은 객체이므로 호출자는 결과를 수정하지 않아야 합니다.
+
+    saju_flight = SingleFlight("saju")
+    result = saju_flight.do(cache_key, lambda: _run_calculator(input_data))
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.utils.metrics import SINGLEFLIGHT_CALLS
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 동기 호출"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    스레드 간 동일 키 호출 합치기
+
+    Args:
+        name: 메트릭 레이블
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        """진행 중인 키 수"""
+        return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        key의 계산이 진행 중이면 그 결과를 기다리고, 아니면 func()를 실행
+
+        Args:
+            key: 계산 입력을 나타내는 키
+            func: 인자 없는 계산 함수
+
+        Returns:
+            func() 결과 (예외도 대기 중인 호출자 모두에게 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLEFLIGHT_CALLS.inc(flight=self.name, result="shared")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        SINGLEFLIGHT_CALLS.inc(flight=self.name, result="leader")
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    이벤트 루프 안의 동일 키 코루틴 합치기
+
+    계산은 별도 태스크로 실행되어, 먼저 요청한 클라이언트의 연결이 끊겨도
+    기다리는 다른 요청의 계산은 취소되지 않습니다.
+
+    Args:
+        name: 메트릭 레이블
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def in_flight(self) -> int:
+        """진행 중인 키 수"""
+        return len(self._tasks)
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+        share: Optional[Callable[[T], T]] = None,
+    ) -> T:
+        """
+        key의 계산이 진행 중이면 그 결과를 기다리고, 아니면 func()를 태스크로 실행
+
+        Args:
+            key: 계산 입력을 나타내는 키 (예: content_etag)
+            func: 코루틴을 반환하는 인자 없는 함수
+            share: 결과를 공유받는 호출자용 복제 함수 (예: 임시 파일 PDF는 호출자마다 링크)
+                결과를 받은 직후 이벤트 루프에 제어를 넘기기 전에 호출됩니다.
+
+        Returns:
+            계산 결과
+        """
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        shared = task is not None and not task.done() and task.get_loop() is loop
+        if shared:
+            SINGLEFLIGHT_CALLS.inc(flight=self.name, result="shared")
+        else:
+            SINGLEFLIGHT_CALLS.inc(flight=self.name, result="leader")
+            task = loop.create_task(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        result = await asyncio.shield(task)
+        if shared and share is not None:
+            return share(result)
+        return result
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 요청이 모두 취소된 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,167 @@
+"""
+다중 용어 스캐너 (Aho-Corasick)
+
+내부 용어 노출 검사와 치환을 용어 목록 루프(`term in text`, 용어별 replace) 대신
+한 번 컴파일한 오토마톤으로 텍스트를 한 번만 훑어 처리합니다.
+
+- find_all(): 겹치는 매치까지 모두 (오프셋 포함)
+- found_terms(): 등장한 용어 목록 (`[t for t in terms if t in text]`와 동일)
+- scrub(): 가장 왼쪽-가장 긴 매치 기준 비중첩 치환
+"""
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TermMatch:
+    """용어 매치 결과 (text[start:end] == term)"""
+    term: str
+    start: int
+    end: int
+
+
+class TermScanner:
+    """
+    컴파일된 다중 용어 매처
+
+    Args:
+        terms: 검사할 용어 목록 (순서가 found_terms 결과 순서가 됩니다)
+        replacements: 용어별 치환 문자열 (scrub용). 키도 검사 대상에 포함됩니다.
+        default_replacement: replacements에 없는 용어의 치환 문자열 (None이면 그대로 둠)
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        replacements: Optional[Dict[str, str]] = None,
+        default_replacement: Optional[str] = None,
+    ):
+        self.replacements: Dict[str, str] = dict(replacements or {})
+        self.default_replacement = default_replacement
+
+        ordered: List[str] = []
+        for term in list(terms) + list(self.replacements):
+            if term and term not in ordered:
+                ordered.append(term)
+        self.terms: Tuple[str, ...] = tuple(ordered)
+        self._order = {term: idx for idx, term in enumerate(self.terms)}
+
+        # goto / fail / output 테이블
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        for term in self.terms:
+            self._insert(term)
+        self._build_links()
+
+    def _insert(self, term: str) -> None:
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(term)
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                # 접미사 용어도 같은 위치에서 매치되도록 출력 병합
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> List[TermMatch]:
+        """
+        텍스트의 모든 용어 매치 (겹치는 매치 포함)
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            끝 위치 순서의 TermMatch 리스트
+        """
+        matches: List[TermMatch] = []
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for idx, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for term in out[state]:
+                matches.append(TermMatch(term, idx + 1 - len(term), idx + 1))
+        return matches
+
+    def found_terms(self, text: str) -> List[str]:
+        """등장한 용어 목록 (중복 없이 용어 목록 순서)"""
+        seen = {m.term for m in self.find_all(text)}
+        return sorted(seen, key=self._order.__getitem__)
+
+    def contains_any(self, text: str) -> bool:
+        """용어가 하나라도 등장하는지 여부"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+    def leftmost_longest(self, text: str) -> List[TermMatch]:
+        """가장 왼쪽-가장 긴 기준의 비중첩 매치 (시작 위치 순서)"""
+        candidates = sorted(self.find_all(text), key=lambda m: (m.start, -(m.end - m.start)))
+        selected: List[TermMatch] = []
+        cursor = 0
+        for match in candidates:
+            if match.start >= cursor:
+                selected.append(match)
+                cursor = match.end
+        return selected
+
+    def scrub(self, text: str) -> str:
+        """
+        용어를 치환한 텍스트 반환
+
+        replacements에 있는 용어는 해당 문자열로, 나머지는 default_replacement로 치환합니다.
+        default_replacement가 None이면 replacements에 없는 용어는 그대로 둡니다.
+        """
+        pieces: List[str] = []
+        cursor = 0
+        for match in self.leftmost_longest(text):
+            replacement = self.replacements.get(match.term, self.default_replacement)
+            if replacement is None:
+                continue
+            pieces.append(text[cursor:match.start])
+            pieces.append(replacement)
+            cursor = match.end
+        if not pieces:
+            return text
+        pieces.append(text[cursor:])
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=64)
+def get_term_scanner(terms: Tuple[str, ...]) -> TermScanner:
+    """
+    검사 전용 스캐너 (용어 튜플별로 한 번만 컴파일)
+
+    Args:
+        terms: 용어 튜플
+
+    Returns:
+        TermScanner
+    """
+    return TermScanner(terms)
@@ -0,0 +1,167 @@
+"""
+요청 단위 구간 타이머 (Server-Timing)
+
+엔드포인트와 파이프라인 모듈은 단계마다 `with span("saju"):` 로 구간을 표시하고,
+ServerTimingMiddleware가 요청마다 기록기를 만들어 응답에 Server-Timing 헤더를
+붙이고 구조화된 타이밍 로그를 남깁니다.
+
+미들웨어가 설치되지 않았거나(SERVER_TIMING=0, 기본) 요청 밖에서 호출되면
+span()은 ContextVar 조회 한 번 후 공유 no-op 객체를 반환하므로 비용이 거의 없습니다.
+
+    with span("saju"):
+        saju_result = calculate_saju(birth_info, target_date)
+
+    Server-Timing: auth;dur=12.3, profile;dur=40.1, saju;dur=3.2, total;dur=61.0
+"""
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+# Server-Timing 메트릭 이름은 HTTP token이어야 함
+_INVALID_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+_current_recorder: ContextVar[Optional["TimingRecorder"]] = ContextVar("timing_recorder", default=None)
+
+
+class TimingRecorder:
+    """
+    한 요청의 구간 기록 (같은 이름은 시간을 합산)
+
+    Attributes:
+        spans: 이름 → [누적 ms, 호출 수, 최초 깊이] (처음 기록된 순서 유지)
+    """
+
+    __slots__ = ("spans", "depth")
+
+    def __init__(self):
+        self.spans: Dict[str, List[Any]] = {}
+        self.depth = 0
+
+    def add(self, name: str, duration_ms: float, depth: int = 0) -> None:
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [duration_ms, 1, depth]
+        else:
+            entry[0] += duration_ms
+            entry[1] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """이름 → {ms, count, depth}"""
+        return {
+            name: {"ms": round(ms, 2), "count": count, "depth": depth}
+            for name, (ms, count, depth) in self.spans.items()
+        }
+
+    def header_value(self, total_ms: Optional[float] = None) -> str:
+        """Server-Timing 헤더 값 (total_ms가 있으면 마지막에 total 추가)"""
+        metrics = [
+            f"{_INVALID_NAME_CHARS.sub('_', name)};dur={ms:.1f}"
+            for name, (ms, _, _) in self.spans.items()
+        ]
+        if total_ms is not None:
+            metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "started", "depth")
+
+    def __init__(self, recorder: TimingRecorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.depth = self.recorder.depth
+        self.recorder.depth += 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = (time.perf_counter() - self.started) * 1000
+        self.recorder.depth -= 1
+        self.recorder.add(self.name, elapsed, self.depth)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """
+    구간 타이머 컨텍스트 매니저
+
+    Args:
+        name: 구간 이름 (예: "auth", "saju", "assembly")
+
+    Returns:
+        요청 기록기가 있으면 측정 span, 없으면 no-op
+    """
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return _NOOP_SPAN
+    return _Span(recorder, name)
+
+
+def current_recorder() -> Optional[TimingRecorder]:
+    """현재 요청의 기록기 (타이밍 비활성 시 None)"""
+    return _current_recorder.get()
+
+
+class ServerTimingMiddleware:
+    """
+    요청마다 TimingRecorder를 열고 Server-Timing 헤더와 타이밍 로그를 남기는 ASGI 미들웨어
+
+    앱 전체 시간(total)은 응답 시작 시점까지이며, 구간에 포함되지 않은 나머지는
+    프레임워크 처리(검증/직렬화 등)입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        recorder = TimingRecorder()
+        token = _current_recorder.set(recorder)
+        started = time.perf_counter()
+        response = {"status": None, "total_ms": None}
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                response["status"] = message["status"]
+                response["total_ms"] = total_ms
+                MutableHeaders(scope=message).append("Server-Timing", recorder.header_value(total_ms))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_recorder.reset(token)
+            total_ms = response["total_ms"]
+            logger.info(json.dumps({
+                "event": "request_timing",
+                "method": scope.get("method"),
+                "path": scope.get("path"),
+                "status": response["status"],
+                "total_ms": round(total_ms, 2) if total_ms is not None else None,
+                "spans": recorder.as_dict(),
+            }, ensure_ascii=False))
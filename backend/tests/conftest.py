@@ -187,6 +187,59 @@ def sample_profile_data():
     }
 
 
+# 라우터 단위 API 테스트용 출생 정보 프로필
+STUB_PROFILE = {
+    "name": "테스트",
+    "birth_date": "1990-05-15",
+    "birth_time": "14:30:00",
+    "gender": "male",
+    "birth_place": "서울",
+    "role": "student",
+}
+
+
+@pytest.fixture
+def stub_router_client(monkeypatch):
+    """
+    API 라우터 모듈 하나만 올린 테스트 클라이언트 팩토리
+
+    인증(get_current_user), 사용자 DB 클라이언트, 프로필 조회(get_birth_data)를
+    모듈에 있는 것만 스텁으로 바꾸고 get_supabase 의존성을 None으로 덮어씁니다.
+
+    Args (팩토리):
+        module: 라우터 모듈 (예: src.api.daily)
+        profile: get_birth_data가 반환할 프로필 (호출마다 복사)
+        user_id: 사용자 ID, 또는 요청마다 호출해 ID를 얻는 함수
+        middleware: app.add_middleware에 넘길 미들웨어 클래스들
+
+    Returns:
+        TestClient (시작 훅이 필요하면 with 블록으로 사용, ASGI 앱은 client.app)
+    """
+    from fastapi import FastAPI
+    from types import SimpleNamespace
+    from src.db.supabase import get_supabase
+
+    def build(module, profile=None, user_id="user-1", middleware=()):
+        profile = STUB_PROFILE if profile is None else profile
+        next_user_id = user_id if callable(user_id) else (lambda: user_id)
+
+        monkeypatch.setattr(module, "get_current_user",
+                            lambda authorization, supabase: SimpleNamespace(id=next_user_id()))
+        if hasattr(module, "SupabaseClient"):
+            monkeypatch.setattr(module.SupabaseClient, "create_user_db_client", lambda token: None)
+        if hasattr(module, "get_birth_data"):
+            monkeypatch.setattr(module, "get_birth_data", lambda user_id, recipient_id, db: dict(profile))
+
+        app = FastAPI()
+        for middleware_class in middleware:
+            app.add_middleware(middleware_class)
+        app.include_router(module.router)
+        app.dependency_overrides[get_supabase] = lambda: None
+        return TestClient(app)
+
+    return build
+
+
 # 테스트 시작/종료 훅
 def pytest_configure(config):
     """pytest 시작 시 설정"""
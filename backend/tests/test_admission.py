@@ -0,0 +1,147 @@
+"""
+부하 제어 (동시 처리 제한 / 공정 대기열 / 503 거절) 테스트
+"""
+import asyncio
+import re
+import time
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.utils.admission import (
+    AdmissionControlMiddleware,
+    AdmissionRejected,
+    EndpointClass,
+    FairLimiter,
+    load_endpoint_classes,
+)
+from src.utils.metrics import ADMISSION_REJECTED
+
+
+def _spec(**overrides) -> EndpointClass:
+    values = dict(
+        name="test", pattern=re.compile(r"^/api/pdf/"), max_concurrency=1, max_queue=4,
+        max_queue_per_user=2, queue_timeout=1.0, retry_after=7,
+    )
+    values.update(overrides)
+    return EndpointClass(**values)
+
+
+def test_classify_and_env_overrides(monkeypatch):
+    middleware = AdmissionControlMiddleware(app=None)
+    expected = {
+        "/api/pdf/daily/2026-01-20": "pdf",
+        "/api/pdf/customer/u1/monthly/2026/1": "pdf",
+        "/api/pdf/jobs": None,
+        "/api/pdf/jobs/abc/result": None,
+        "/api/daily/range/2026-01-01/2026-01-31": "heavy",
+        "/api/content/yearly/2026": "heavy",
+        "/api/content/yearly/2026/heatmap": None,
+        "/api/daily/2026-01-20": None,
+        "/api/logs": None,
+        "/health": None,
+    }
+    for path, name in expected.items():
+        endpoint_class = middleware.classify(path)
+        assert (endpoint_class.name if endpoint_class else None) == name, path
+
+    monkeypatch.setenv("ADMISSION_PDF_CONCURRENCY", "5")
+    monkeypatch.setenv("ADMISSION_HEAVY_RETRY_AFTER", "30")
+    classes = {c.name: c for c in load_endpoint_classes()}
+    assert classes["pdf"].max_concurrency == 5
+    assert classes["heavy"].retry_after == 30
+
+
+def test_fair_round_robin_between_users():
+    limiter = FairLimiter(_spec(max_queue=8, max_queue_per_user=4))
+    order = []
+
+    async def request(user, label):
+        await limiter.acquire(user)
+        order.append(label)
+        await asyncio.sleep(0.01)
+        limiter.release()
+
+    async def scenario():
+        await limiter.acquire("holder")
+        tasks = []
+        for user, label in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"), ("c", "c1")]:
+            tasks.append(asyncio.create_task(request(user, label)))
+            await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["a1", "b1", "c1", "a2", "a3"]
+    assert (limiter.active, limiter.queued) == (0, 0)
+
+
+def test_queue_limits_timeout_and_cancel():
+    async def scenario():
+        limiter = FairLimiter(_spec(max_queue=2, max_queue_per_user=1, queue_timeout=0.05))
+        await limiter.acquire("holder")
+
+        waiting = asyncio.create_task(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as user_full:
+            await limiter.acquire("a")
+        assert user_full.value.reason == "user_queue_full"
+
+        other = asyncio.create_task(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as queue_full:
+            await limiter.acquire("c")
+        assert queue_full.value.reason == "queue_full"
+
+        other.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await other
+        with pytest.raises(AdmissionRejected) as timed_out:
+            await waiting
+        assert timed_out.value.reason == "timeout"
+        assert limiter.queued == 0
+
+        limiter.release()
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_middleware_sheds_heavy_and_keeps_cheap_fast():
+    async def heavy(request):
+        await asyncio.sleep(0.3)
+        return JSONResponse({"ok": True})
+
+    async def health(request):
+        return JSONResponse({"status": "healthy"})
+
+    app = Starlette(routes=[Route("/api/pdf/daily/{day}", heavy), Route("/health", health)])
+    spec = _spec(name="pdf_test", max_queue=1, max_queue_per_user=1, queue_timeout=5.0)
+    middleware = AdmissionControlMiddleware(app, classes=[spec])
+
+    async def timed(client, path, token):
+        started = time.perf_counter()
+        response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+        return response, time.perf_counter() - started
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            storm = [asyncio.create_task(timed(client, "/api/pdf/daily/1", f"user-{i}")) for i in range(4)]
+            await asyncio.sleep(0.05)
+            health_response, health_seconds = await timed(client, "/health", "user-0")
+            return await asyncio.gather(*storm), health_response, health_seconds
+
+    storm, health_response, health_seconds = asyncio.run(scenario())
+    statuses = sorted(response.status_code for response, _ in storm)
+    assert statuses == [200, 200, 503, 503]
+    rejected = next(response for response, _ in storm if response.status_code == 503)
+    assert rejected.headers["retry-after"] == "7"
+    assert rejected.json()["detail"]
+    assert health_response.status_code == 200
+    assert health_seconds < 0.1
+    assert ADMISSION_REJECTED.value(endpoint_class="pdf_test", reason="queue_full") == 2
+    assert middleware.limiter("pdf_test").active == 0
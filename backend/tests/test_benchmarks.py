@@ -0,0 +1,80 @@
+"""
+벤치마크 스위트(benchmarks.suite) 테스트
+"""
+import json
+
+from benchmarks import suite
+from src.rhythm import saju
+
+
+def _result(median, iqr=0.5):
+    return {"median_us": median, "iqr_us": iqr}
+
+
+def test_stub_calculator_is_offline_and_restored():
+    original = saju._run_calculator
+    with suite.saju_calculator("stub"):
+        result = saju.calculate_saju(suite.BIRTH_INFO, suite.TARGET_DATE)
+        assert result["사주"]["일주"]["간지"] == "갑자"
+        assert result["세운"]["year"] == 2026
+    assert saju._run_calculator is original
+    assert saju._saju_cache == {}
+
+
+def test_measure_statistics():
+    stats = suite.measure(lambda: sum(range(100)), rounds=5, min_round_seconds=0.0005)
+    assert stats["rounds"] == 5
+    assert stats["loops"] >= 1
+    assert 0 < stats["min_us"] <= stats["median_us"]
+    assert stats["iqr_us"] >= 0
+
+
+def test_run_suite_subset():
+    report = suite.run_suite(rounds=3, only=["saju_cold", "saju_warm", "validate_daily"])
+    assert report["meta"]["calculator"] == "stub"
+    assert list(report["results"]) == ["saju_cold", "saju_warm", "validate_daily"]
+    for stats in report["results"].values():
+        assert stats["median_us"] > 0
+
+
+def test_compare_statuses():
+    baseline = {"results": {
+        "slower": _result(100.0),
+        "faster": _result(100.0),
+        "steady": _result(100.0),
+        "noisy": _result(2.0, iqr=3.0),
+        "pdf": {"skipped": "PDF 렌더러 사용 불가"},
+        "removed": _result(10.0),
+    }}
+    current = {"results": {
+        "slower": _result(130.0),
+        "faster": _result(60.0),
+        "steady": _result(105.0),
+        "noisy": _result(4.0, iqr=3.0),
+        "pdf": {"skipped": "PDF 렌더러 사용 불가"},
+        "added": _result(1.0),
+    }}
+    rows = {row["name"]: row for row in suite.compare(baseline, current, threshold=0.15)}
+    assert {name: row["status"] for name, row in rows.items()} == {
+        "slower": "regression",
+        "faster": "improvement",
+        "steady": "ok",
+        "noisy": "ok",
+        "pdf": "skipped",
+        "removed": "missing",
+        "added": "new",
+    }
+    assert rows["slower"]["ratio"] == 1.3
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps({"results": {"case": _result(100.0)}}), encoding="utf-8")
+
+    current.write_text(json.dumps({"results": {"case": _result(110.0)}}), encoding="utf-8")
+    assert suite.main(["compare", str(baseline), str(current)]) == 0
+
+    current.write_text(json.dumps({"results": {"case": _result(150.0)}}), encoding="utf-8")
+    assert suite.main(["compare", str(baseline), str(current), "--threshold", "0.2"]) == 1
+    assert "case" in capsys.readouterr().out
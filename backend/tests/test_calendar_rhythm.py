@@ -0,0 +1,220 @@
+"""
+일진 배열 계산(calendar_rhythm) 테스트
+
+배열 계산 결과가 날짜별 반복 계산과 같은지 확인합니다.
+"""
+import datetime
+
+import pytest
+
+from src.rhythm.calendar_rhythm import (
+    RELATION_NAMES,
+    compute_rhythm_arrays,
+    month_element_energy,
+    month_rhythm_arrays,
+    year_rhythm_arrays,
+    yearly_heatmap,
+)
+from src.rhythm.models import BirthInfo, Gender
+from src.rhythm.saju import analyze_monthly_rhythm, analyze_yearly_rhythm
+
+STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+STEM_WUXING = {s: i // 2 for i, s in enumerate(STEMS)}
+SHENG_MAP = {0: 1, 1: 2, 2: 3, 3: 4, 4: 0}
+KE_MAP = {0: 2, 1: 3, 2: 4, 3: 0, 4: 1}
+ELEMENTS = {"목": 0, "화": 1, "토": 2, "금": 3, "수": 4}
+MONTH_WUXING = {1: 4, 2: 4, 3: 0, 4: 0, 5: 1, 6: 1, 7: 2, 8: 3, 9: 3, 10: 2, 11: 4, 12: 4}
+
+BIRTH_INFO = BirthInfo(
+    name="테스트",
+    birth_date=datetime.date(1990, 5, 15),
+    birth_time=datetime.time(14, 30),
+    gender=Gender.MALE,
+    birth_place="서울",
+)
+
+
+def _saju(dayjugan, yongsin, gisin):
+    return {
+        "사주": {"일주": {"천간": dayjugan}},
+        "용신": {"용신": yongsin, "기신": gisin},
+    }
+
+
+def _adjust(energy, element, saju_data):
+    if any(ELEMENTS.get(y) == element for y in saju_data["용신"]["용신"]):
+        energy = min(5, energy + 1)
+    if any(ELEMENTS.get(g) == element for g in saju_data["용신"]["기신"]):
+        energy = max(1, energy - 1)
+    return energy
+
+
+def _scalar_day(target, saju_data):
+    """기존 analyze_monthly_rhythm의 날짜별 계산"""
+    stem = STEMS[(target - datetime.date(1900, 1, 31)).days % 10]
+    dayjugan = saju_data["사주"]["일주"]["천간"]
+    wb = STEM_WUXING[stem]
+    energy = 3
+    if dayjugan in STEM_WUXING:
+        wa = STEM_WUXING[dayjugan]
+        if SHENG_MAP[wb] == wa:
+            energy = 4
+        elif KE_MAP[wb] == wa:
+            energy = 2
+        elif KE_MAP[wa] == wb:
+            energy = 4
+    return _adjust(energy, wb, saju_data)
+
+
+SAJU_CASES = [
+    _saju(dayjugan, yongsin, gisin)
+    for dayjugan in STEMS + [""]
+    for yongsin, gisin in [([], []), (["목", "수"], ["금"]), (["화"], ["화"]), (["토"], ["목", "수"])]
+]
+
+
+@pytest.mark.parametrize("saju_data", SAJU_CASES)
+def test_year_arrays_match_scalar_loop(saju_data):
+    arrays = year_rhythm_arrays(2024, saju_data)
+    assert len(arrays) == 366
+    day = datetime.date(2024, 1, 1)
+    for energy in arrays.energy.tolist():
+        assert energy == _scalar_day(day, saju_data)
+        day += datetime.timedelta(days=1)
+
+
+def test_relation_codes():
+    # 甲(木) 일간: 丙丁(火)=식상, 戊己(土)=재성, 庚辛(金)=관살, 壬癸(水)=인성
+    arrays = compute_rhythm_arrays(
+        datetime.date(1900, 1, 31), datetime.date(1900, 2, 9), _saju("甲", [], [])
+    )
+    names = [RELATION_NAMES[r] for r in arrays.relation.tolist()]
+    assert names == ["bi", "bi", "sheng_out", "sheng_out", "ke_out", "ke_out",
+                     "ke_in", "ke_in", "sheng_in", "sheng_in"]
+    assert arrays.day_pillar(0)["천간"] == "甲"
+    assert arrays.day_pillar(0)["지지"] == "子"
+
+
+def test_month_element_energy_matches_scalar():
+    for saju_data in SAJU_CASES:
+        expected = [_adjust(3, MONTH_WUXING[m], saju_data) for m in range(1, 13)]
+        assert month_element_energy(saju_data).tolist() == expected
+
+
+def test_monthly_rhythm_uses_arrays():
+    saju_data = _saju("丙", ["목"], ["수"])
+    monthly = analyze_monthly_rhythm(BIRTH_INFO, 2026, 2, saju_data)
+
+    daily = monthly["일별_에너지"]
+    assert list(daily) == list(range(1, 29))
+    assert daily == {
+        d: _scalar_day(datetime.date(2026, 2, d), saju_data) for d in range(1, 29)
+    }
+    summary = monthly["에너지_요약"]
+    assert summary["평균"] == pytest.approx(sum(daily.values()) / 28, abs=0.01)
+    assert sum(summary["분포"].values()) == 28
+    assert all(daily[int(d[-2:])] == summary["최고"] for d in summary["최고일"])
+
+
+def test_yearly_rhythm_monthly_means():
+    saju_data = _saju("庚", ["토"], ["화"])
+    yearly = analyze_yearly_rhythm(BIRTH_INFO, 2026, saju_data)
+
+    signals = yearly["월별_신호"]
+    assert sorted(signals) == list(range(1, 13))
+    for month in (1, 2, 12):
+        days = month_rhythm_arrays(2026, month, saju_data).energy
+        assert signals[month]["일평균_에너지"] == round(float(days.mean()), 2)
+        assert signals[month]["에너지"] == _adjust(3, MONTH_WUXING[month], saju_data)
+
+
+FORTUNE_SAJU = {
+    "사주": {"일주": {"천간": "辛"}},
+    "용신": {"용신": ["토", "금"], "기신": ["화"]},
+    "오행": {"목": 1, "화": 2, "토": 3, "금": 1, "수": 1},
+    "십성": {"식신": 2, "상관": 1, "정관": 3, "편관": 2, "비견": 0, "겁재": 1},
+    "세운": {"year": 2026, "score": 60},
+    "격국": {},
+    "신살": {},
+}
+
+
+@pytest.mark.parametrize("saju_data", [
+    FORTUNE_SAJU,
+    {**FORTUNE_SAJU, "세운": None},
+    {**FORTUNE_SAJU, "사주": {}, "십성": {"식신": 9}},
+])
+def test_yearly_heatmap_matches_daily_fortune(saju_data):
+    from src.rhythm.saju import analyze_daily_fortune
+
+    heatmap = yearly_heatmap(2026, saju_data)
+    assert heatmap["days"] == 365
+    assert heatmap["start_date"] == "2026-01-01"
+
+    day = datetime.date(2026, 1, 1)
+    for i in range(heatmap["days"]):
+        fortune = analyze_daily_fortune(BIRTH_INFO, day, saju_data)
+        assert heatmap["energy"][i] == fortune["에너지_수준"]
+        assert heatmap["focus"][i] == fortune["집중력"]
+        assert heatmap["social"][i] == fortune["사회운"]
+        assert heatmap["decision"][i] == fortune["결정력"]
+        assert heatmap["relation_codes"][heatmap["relation"][i]] == fortune["일진"]["관계"]
+        day += datetime.timedelta(days=1)
+
+
+def test_heatmap_endpoint(monkeypatch, stub_router_client):
+    from src.api import monthly as api
+
+    monkeypatch.setattr(api, "calculate_saju", lambda birth_info, target_date: FORTUNE_SAJU)
+
+    with stub_router_client(api) as client:
+        headers = {"Authorization": "Bearer token"}
+        response = client.get("/api/content/yearly/2028/heatmap", headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["days"] == 366
+        assert len(body["energy"]) == len(body["relation"]) == 366
+        assert client.get("/api/content/yearly/1999/heatmap", headers=headers).status_code == 400
+        assert client.get("/api/content/yearly/2026/heatmap").status_code == 401
+
+
+def test_range_summary_assembles_only_full_dates(monkeypatch, stub_router_client):
+    from benchmarks.suite import saju_calculator
+    from src.api import daily as api
+    from src.rhythm.saju import analyze_daily_fortune, calculate_saju
+
+    assembled = []
+    original_assemble = api.assemble_daily_content
+
+    def counting_assemble(target_date, *args):
+        assembled.append(target_date)
+        return original_assemble(target_date, *args)
+
+    monkeypatch.setattr(api, "assemble_daily_content", counting_assemble)
+
+    headers = {"Authorization": "Bearer token"}
+    with saju_calculator("stub"), stub_router_client(api) as client:
+        summary = client.get(
+            "/api/daily/range/2025-12-30/2026-01-02?detail=summary&full_dates=2026-01-01", headers=headers
+        )
+        assert summary.status_code == 200
+        assert assembled == [datetime.date(2026, 1, 1)]
+
+        full = client.get("/api/daily/range/2025-12-30/2026-01-02", headers=headers)
+        assert full.status_code == 200
+        assert len(assembled) == 5
+
+        assert client.get("/api/daily/range/2026-01-01/2026-01-02?detail=brief", headers=headers).status_code == 422
+
+        days = summary.json()
+        assert [d["date"] for d in days] == ["2025-12-30", "2025-12-31", "2026-01-01", "2026-01-02"]
+        assert [d["content"] is not None for d in days] == [False, False, True, False]
+        assert days[2] == full.json()[2]
+        for day in days:
+            target = datetime.date.fromisoformat(day["date"])
+            fortune = analyze_daily_fortune(BIRTH_INFO, target, calculate_saju(BIRTH_INFO, target))
+            assert day["scores"] == {
+                "energy": fortune["에너지_수준"], "focus": fortune["집중력"],
+                "social": fortune["사회운"], "decision": fortune["결정력"],
+            }
+            assert day["day_pillar"]["관계"] == fortune["일진"]["관계"]
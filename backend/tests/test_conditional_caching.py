@@ -0,0 +1,169 @@
+"""
+HTTP 조건부 캐싱 (ETag / If-None-Match / Cache-Control) 테스트
+"""
+import shutil
+
+import pytest
+from fastapi import Response
+
+from src.api import helpers
+
+PROFILE = {
+    "name": "테스트", "birth_date": "1990-05-15", "birth_time": "14:30:00",
+    "gender": "male", "birth_place": "서울", "role": "student",
+}
+AUTH = {"Authorization": "Bearer token"}
+
+
+def test_content_etag_fingerprint(monkeypatch):
+    etag = helpers.content_etag("daily", PROFILE, date="2026-01-20", role="student")
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == helpers.content_etag("daily", dict(PROFILE, id="ignored"), role="student", date="2026-01-20")
+    assert etag != helpers.content_etag("daily", PROFILE, date="2026-01-20", role="office_worker")
+    assert etag != helpers.content_etag("daily", dict(PROFILE, birth_time="09:00:00"), date="2026-01-20", role="student")
+    assert etag != helpers.content_etag("monthly", PROFILE, date="2026-01-20", role="student")
+
+    monkeypatch.setenv("CONTENT_VERSION", "next-release")
+    helpers.content_version.cache_clear()
+    try:
+        assert helpers.content_etag("daily", PROFILE, date="2026-01-20", role="student") != etag
+    finally:
+        monkeypatch.delenv("CONTENT_VERSION")
+        helpers.content_version.cache_clear()
+    assert helpers.content_etag("daily", PROFILE, date="2026-01-20", role="student") == etag
+
+
+def test_skills_change_invalidates_customer_pdf_etag(monkeypatch, tmp_path):
+    pdf_customer = pytest.importorskip("src.api.pdf_customer")
+    from src.skills.personalization_engine.models import CustomerProfile
+
+    skills_dir = helpers._SRC_DIR / "skills"
+    assert skills_dir in helpers.CONTENT_SOURCE_DIRS
+    copied = tmp_path / "skills"
+    shutil.copytree(skills_dir, copied, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(helpers, "CONTENT_SOURCE_DIRS",
+                        [copied if d == skills_dir else d for d in helpers.CONTENT_SOURCE_DIRS])
+    monkeypatch.delenv("CONTENT_VERSION", raising=False)
+
+    profile = CustomerProfile(id="c1", name="테스트", birth_date="1990-05-15", gender="female")
+    helpers.content_version.cache_clear()
+    try:
+        before = pdf_customer._customer_pdf_etag("customer_daily_pdf", profile, date="2026-01-20")
+        with open(copied / "personalization_engine" / "content_generator.py", "a", encoding="utf-8") as f:
+            f.write("\n# 문구 수정\n")
+        helpers.content_version.cache_clear()
+        after = pdf_customer._customer_pdf_etag("customer_daily_pdf", profile, date="2026-01-20")
+    finally:
+        helpers.content_version.cache_clear()
+
+    assert after != before
+
+
+def test_etag_matching_and_headers(monkeypatch):
+    etag = 'W/"abc"'
+    assert helpers.etag_matches('"abc"', etag)
+    assert helpers.etag_matches('"x", W/"abc"', etag)
+    assert helpers.etag_matches("*", etag)
+    assert not helpers.etag_matches('"abcd"', etag)
+    assert not helpers.etag_matches(None, etag)
+
+    response = Response()
+    assert helpers.not_modified(etag, '"other"', response) is None
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "private, max-age=0, must-revalidate"
+    assert response.headers["vary"] == "Authorization"
+
+    monkeypatch.setenv("CONTENT_CACHE_MAX_AGE", "300")
+    cached = helpers.not_modified(etag, etag, last_modified=0)
+    assert cached.status_code == 304
+    assert cached.body == b""
+    assert cached.headers["cache-control"] == "private, max-age=300, must-revalidate"
+    assert cached.headers["last-modified"] == "Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+def test_daily_304_skips_pipeline(monkeypatch, stub_router_client):
+    from benchmarks.suite import saju_calculator
+    from src.api import daily as api
+
+    calls = []
+    original = api.calculate_saju
+    monkeypatch.setattr(api, "calculate_saju", lambda *args: calls.append(args) or original(*args))
+    profile = dict(PROFILE)
+    client = stub_router_client(api, profile)
+
+    with saju_calculator("stub"):
+        first = client.get("/api/daily/2026-01-20?role=student", headers=AUTH)
+        etag = first.headers["etag"]
+        again = client.get("/api/daily/2026-01-20?role=student", headers={**AUTH, "If-None-Match": etag})
+        other_role = client.get("/api/daily/2026-01-20?role=freelancer", headers={**AUTH, "If-None-Match": etag})
+
+        profile["birth_time"] = "08:00:00"
+        changed = client.get("/api/daily/2026-01-20?role=student", headers={**AUTH, "If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("private")
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert other_role.status_code == 200
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert len(calls) == 3
+
+
+def test_monthly_and_yearly_304(monkeypatch, stub_router_client):
+    from benchmarks.suite import saju_calculator
+    from src.api import monthly as api
+
+    client = stub_router_client(api, PROFILE)
+    with saju_calculator("stub"):
+        for path in ("/api/content/monthly/2026/1?role=student", "/api/content/yearly/2026"):
+            first = client.get(path, headers=AUTH)
+            assert first.status_code == 200, path
+            again = client.get(path, headers={**AUTH, "If-None-Match": first.headers["etag"]})
+            assert again.status_code == 304, path
+
+
+def test_markdown_etag_follows_file(monkeypatch, tmp_path, stub_router_client):
+    from src.api import daily as api
+
+    md_file = tmp_path / "2026-01-31.md"
+    md_file.write_text("# 오늘", encoding="utf-8")
+    monkeypatch.setattr(api, "resolve_daily_markdown", lambda date_str: md_file)
+    client = stub_router_client(api, PROFILE)
+
+    first = client.get("/api/daily/2026-01-31/markdown", headers=AUTH)
+    assert first.status_code == 200
+    assert "last-modified" in first.headers
+    etag = first.headers["etag"]
+    assert client.get("/api/daily/2026-01-31/markdown", headers={**AUTH, "If-None-Match": etag}).status_code == 304
+
+    md_file.write_text("# 오늘 (수정)", encoding="utf-8")
+    changed = client.get("/api/daily/2026-01-31/markdown", headers={**AUTH, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.text == "# 오늘 (수정)"
+
+
+def test_pdf_304_skips_render(monkeypatch, stub_router_client):
+    api = pytest.importorskip("src.api.pdf")
+    from render_pool import PDFOutput
+
+    from benchmarks.suite import saju_calculator
+
+    renders = []
+
+    async def fake_render(method, **kwargs):
+        renders.append(method)
+        return PDFOutput(size=4, data=b"%PDF")
+
+    monkeypatch.setattr(api, "_render_pdf", fake_render)
+    client = stub_router_client(api, PROFILE)
+
+    with saju_calculator("stub"):
+        first = client.get("/api/pdf/daily/2026-01-20?role=student", headers=AUTH)
+        again = client.get("/api/pdf/daily/2026-01-20?role=student",
+                           headers={**AUTH, "If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/pdf"
+    assert again.status_code == 304
+    assert renders == ["generate_daily_pdf"]
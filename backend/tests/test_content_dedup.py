@@ -0,0 +1,88 @@
+"""
+일간 콘텐츠 중복 제거 테스트
+"""
+import pytest
+from datetime import date
+from src.content.assembly import assemble_daily_content
+from src.content.dedup import (
+    content_fingerprint,
+    group_by_fingerprint,
+    assemble_daily_content_batch,
+)
+from src.translation import translate_daily_content
+
+
+@pytest.fixture
+def daily_rhythm():
+    return {
+        "에너지_수준": 4,
+        "집중력": 3,
+        "사회운": 4,
+        "결정력": 3,
+        "유리한_시간": ["오늘 09-11시 (巳시)", "오후 2-4시"],
+        "주의_시간": ["오늘 21-23시 (亥시, 충 시간대)"],
+        "유리한_방향": ["동쪽"],
+        "주요_흐름": "봄의 에너지, 중화 상태",
+        "기회_요소": ["성장과 창의성"],
+        "도전_요소": ["완벽주의"],
+    }
+
+
+def _saju(day_stem="甲", year_stem="庚"):
+    return {
+        "사주": {
+            "년주": {"천간": year_stem, "지지": "午"},
+            "월주": {"천간": "戊", "지지": "寅"},
+            "일주": {"천간": day_stem, "지지": "子"},
+            "시주": {"천간": "辛", "지지": "未"},
+        },
+        "격국": {"일간": day_stem, "강약": "중화", "계절": "봄"},
+        "용신": {"용신": ["목"], "기신": ["금"]},
+    }
+
+
+class TestContentFingerprint:
+    def test_same_inputs_same_fingerprint(self, daily_rhythm):
+        a = content_fingerprint(date(2026, 3, 1), _saju(), daily_rhythm)
+        b = content_fingerprint(date(2026, 3, 1), _saju(year_stem="壬"), dict(daily_rhythm))
+        assert a == b  # 년주는 텍스트에 영향 없음
+
+    def test_text_inputs_change_fingerprint(self, daily_rhythm):
+        base = content_fingerprint(date(2026, 3, 1), _saju(), daily_rhythm)
+        assert base != content_fingerprint(date(2026, 3, 2), _saju(), daily_rhythm)
+        assert base != content_fingerprint(date(2026, 3, 1), _saju(day_stem="丙"), daily_rhythm)
+        assert base != content_fingerprint(date(2026, 3, 1), _saju(), daily_rhythm, role="student")
+        assert base != content_fingerprint(
+            date(2026, 3, 1), _saju(), daily_rhythm, {"best_direction": "북"}
+        )
+
+    def test_group_by_fingerprint(self, daily_rhythm):
+        entries = [
+            {"target_date": date(2026, 3, 1), "saju_data": _saju(), "daily_rhythm": daily_rhythm},
+            {"target_date": date(2026, 3, 1), "saju_data": _saju(day_stem="丙"), "daily_rhythm": daily_rhythm},
+            {"target_date": date(2026, 3, 1), "saju_data": _saju(year_stem="壬"), "daily_rhythm": daily_rhythm},
+        ]
+        groups = group_by_fingerprint(entries)
+        assert sorted(groups.values()) == [[0, 2], [1]]
+
+
+class TestAssembleDailyContentBatch:
+    @pytest.mark.parametrize("role", [None, "student"])
+    def test_batch_matches_individual_assembly(self, daily_rhythm, role):
+        entries = [
+            {"target_date": date(2026, 3, 1), "saju_data": _saju(year_stem=s), "daily_rhythm": daily_rhythm, "role": role}
+            for s in ("庚", "壬", "甲")
+        ]
+        contents, stats = assemble_daily_content_batch(entries)
+
+        assert stats == {"total": 3, "unique": 1, "dedup_ratio": 3.0}
+        for entry, content in zip(entries, contents):
+            expected = assemble_daily_content(entry["target_date"], entry["saju_data"], daily_rhythm)
+            if role:
+                expected = translate_daily_content(expected, role)
+            assert content == expected
+
+    def test_empty_batch(self):
+        contents, stats = assemble_daily_content_batch([])
+        assert contents == []
+        assert stats["unique"] == 0
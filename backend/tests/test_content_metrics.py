@@ -0,0 +1,117 @@
+"""
+단일 순회 콘텐츠 분석기 테스트
+"""
+import pytest
+from datetime import date
+from src.content.assembly import assemble_daily_content
+from src.content.char_optimizer import CharOptimizer, BLOCK_CHAR_TARGETS
+from src.content.metrics import analyze_content
+from src.content import metrics as content_metrics
+from src.content import validator
+from src.content.validator import (
+    validate_daily_content,
+    validate_translated_daily_content,
+    _calculate_left_page_length,
+    _has_explanatory_paragraphs,
+)
+from src.translation.translator import (
+    _calculate_content_length,
+    translate_daily_content,
+    validate_semantic_preservation,
+)
+
+
+@pytest.fixture
+def content():
+    daily_rhythm = {
+        "에너지_수준": 4,
+        "집중력": 3,
+        "사회운": 4,
+        "결정력": 3,
+        "유리한_시간": ["오늘 09-11시 (巳시)"],
+        "주의_시간": ["오늘 21-23시 (亥시)"],
+        "유리한_방향": ["동쪽"],
+        "주요_흐름": "봄의 에너지, 중화 상태",
+        "기회_요소": ["성장과 창의성"],
+        "도전_요소": ["완벽주의"],
+    }
+    return assemble_daily_content(date(2026, 1, 20), {}, daily_rhythm)
+
+
+def test_block_chars_match_char_optimizer(content):
+    metrics = analyze_content(content)
+    for block in BLOCK_CHAR_TARGETS:
+        assert metrics.block_chars[block] == CharOptimizer._calculate_block_chars(content[block])
+
+
+def test_left_page_length(content):
+    metrics = analyze_content(content)
+    expected = (
+        len(content["summary"])
+        + len(content["rhythm_description"])
+        + sum(len(i) for i in content["focus_caution"]["focus"])
+        + sum(len(i) for i in content["focus_caution"]["caution"])
+        + sum(len(i) for i in content["action_guide"]["do"])
+        + sum(len(i) for i in content["action_guide"]["avoid"])
+        + len(content["time_direction"]["notes"])
+        + len(content["state_trigger"]["how_to"])
+        + len(content["meaning_shift"])
+        + len(content["rhythm_question"])
+    )
+    assert metrics.left_page_length == expected
+    assert _calculate_left_page_length(content) == expected
+
+
+def test_core_length_excludes_notes(content):
+    metrics = analyze_content(content)
+    notes = len(content["time_direction"]["notes"])
+    assert metrics.core_length == metrics.left_page_length - notes
+    assert _calculate_content_length(content) == metrics.core_length
+
+
+def test_missing_fields_count_as_zero():
+    metrics = analyze_content({"summary": "짧은 요약"})
+    assert metrics.length("rhythm_description") == 0
+    assert metrics.left_page_length == len("짧은 요약")
+    assert not _has_explanatory_paragraphs({"summary": "짧은 요약"})
+
+
+def test_forbidden_terms_scan_nested_text():
+    metrics = analyze_content(
+        {"summary": "평범한 하루", "extra": {"deep": [{"text": "오늘은 사주 흐름"}]}},
+        forbidden_terms=["사주", "운세"],
+    )
+    assert metrics.forbidden_hits == ["사주"]
+
+
+def test_validators_reuse_precomputed_metrics(content):
+    metrics = analyze_content(content)
+    assert validate_daily_content(content, metrics) == validate_daily_content(content)
+    assert CharOptimizer.validate_page(content, metrics) == CharOptimizer.validate_page(content)
+
+
+def test_translated_pipeline_analyzes_each_content_once(content, monkeypatch):
+    translated = translate_daily_content(content, "student")
+    analyzed = []
+
+    def counting_analyze(target, forbidden_terms=None):
+        analyzed.append(target)
+        return analyze_content(target, forbidden_terms)
+
+    monkeypatch.setattr(validator, "analyze_content", counting_analyze)
+    monkeypatch.setattr(content_metrics, "analyze_content", counting_analyze)
+
+    is_valid, errors = validate_translated_daily_content(content, translated)
+    assert len(analyzed) == 2
+    assert analyzed[0] is content and analyzed[1] is translated
+
+    expected = validate_daily_content(translated)[1] + validate_semantic_preservation(content, translated)[1]
+    assert errors == expected
+    assert is_valid == (not expected)
+
+
+def test_translated_pipeline_reports_forbidden_hits(content):
+    translated = dict(content, summary=content["summary"] + " 보고서 정리")
+    _, errors = validate_translated_daily_content(content, translated, forbidden_terms=["보고서", "상사"])
+    assert "금지 용어 발견: '보고서'" in errors
+    assert not any("상사" in error for error in errors)
@@ -0,0 +1,106 @@
+"""
+부하 테스트 키트(benchmarks.fake_supabase / benchmarks.loadtest) 테스트
+"""
+import asyncio
+
+import pytest
+from supabase import create_client
+
+from benchmarks import loadtest
+from benchmarks.fake_supabase import ANON_KEY, FakeSupabaseStore, create_app, parse_schema, seed_fixtures
+
+
+@pytest.fixture
+def fake_supabase():
+    store = FakeSupabaseStore()
+    accounts = seed_fixtures(store, users=5)
+    server, thread, url = loadtest._serve(create_app(store))
+    try:
+        yield store, accounts, create_client(url, ANON_KEY)
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+def test_schema_tables_and_defaults():
+    schema = parse_schema()
+    for table in ("profiles", "diary_recipients", "daily_logs", "survey_configurations", "survey_responses"):
+        assert table in schema
+    logs = schema["daily_logs"]
+    assert logs.columns[:3] == ["id", "profile_id", "date"]
+    assert logs.defaults["todos"]() == []
+    assert schema["diary_recipients"].defaults["is_default"]() is False
+
+
+def test_fake_postgrest_with_supabase_client(fake_supabase):
+    store, accounts, client = fake_supabase
+    user_id = accounts[0]["user_id"]
+
+    assert client.auth.get_user(accounts[0]["token"]).user.id == user_id
+
+    profile = client.table("profiles").select("*").eq("id", user_id).execute().data
+    assert profile[0]["roles"] == [accounts[0]["role"]]
+
+    recipients = client.table("diary_recipients").select("id").eq("owner_id", user_id).eq("is_default", True).execute()
+    assert recipients.data == [{"id": accounts[0]["recipient_id"]}]
+
+    page = client.table("survey_responses").select("*", count="exact").range(0, 1).order("submitted_at", desc=True).execute()
+    assert (page.count, len(page.data)) == (5, 2)
+
+    created = client.table("daily_logs").insert({"profile_id": user_id, "date": "2026-02-01", "mood": 3}).execute()
+    assert created.data[0]["todos"] == []
+    updated = client.table("daily_logs").update({"mood": 5}).eq("profile_id", user_id).eq("date", "2026-02-01").execute()
+    assert updated.data[0]["mood"] == 5
+    client.table("daily_logs").delete().eq("date", "2026-02-01").execute()
+    assert len(store.tables["daily_logs"]) == 5
+
+    survey_id = store.tables["survey_configurations"][0]["id"]
+    client.table("survey_configurations").upsert({"id": survey_id, "name": "x", "status": "archived"}).execute()
+    assert [row["status"] for row in store.tables["survey_configurations"]] == ["archived"]
+
+
+def test_arrival_schedule_follows_peak_profile():
+    arrivals = loadtest.arrival_schedule(rate=100, duration=10, seed=1)
+    assert arrivals == loadtest.arrival_schedule(rate=100, duration=10, seed=1)
+    assert arrivals == sorted(arrivals) and arrivals[-1] < 10
+    ramp = sum(1 for t in arrivals if t < 2)
+    peak = sum(1 for t in arrivals if 4 <= t < 6)
+    assert peak > 2 * ramp
+
+
+def test_percentiles_and_summary():
+    assert loadtest.percentile([], 0.5) == 0.0
+    assert loadtest.percentile([10.0, 20.0, 30.0, 40.0], 0.5) == 25.0
+
+    samples = [loadtest.Sample("daily", 200, float(ms)) for ms in range(1, 101)]
+    samples.append(loadtest.Sample("pdf", 503, 5.0))
+    samples.append(loadtest.Sample("pdf", 0, 7.0, error="ConnectError"))
+    report = loadtest.summarize(samples, elapsed=2.0)
+
+    assert report["scenarios"]["daily"]["p50_ms"] == 50.5
+    assert report["scenarios"]["daily"]["p99_ms"] == 99.01
+    assert report["scenarios"]["pdf"]["errors"] == 2
+    assert report["scenarios"]["pdf"]["statuses"] == {"503": 1, "transport_error": 1}
+    assert report["overall"]["requests"] == 102
+    assert report["overall"]["throughput_rps"] == 51.0
+
+
+def test_parse_mix():
+    assert loadtest.parse_mix("pdf") == {"pdf": 1}
+    assert loadtest.parse_mix("daily=3,range") == {"daily": 3.0, "range": 1.0}
+    with pytest.raises(ValueError):
+        loadtest.parse_mix("daily=1,unknown=2")
+
+
+def test_local_stack_run():
+    with loadtest.local_stack(users=5, db_latency_ms=0) as (base_url, accounts):
+        samples, elapsed = asyncio.run(loadtest.run_load(
+            base_url, accounts, mix={"daily": 2, "logs": 1, "markdown": 1, "health": 1},
+            rate=20, duration=1.0, seed=3,
+        ))
+
+    report = loadtest.summarize(samples, elapsed)
+    assert report["overall"]["requests"] == len(loadtest.arrival_schedule(20, 1.0, 3))
+    assert report["overall"]["errors"] == 0
+    for name, stats in report["scenarios"].items():
+        assert set(stats["statuses"]) == {"200"}, name
@@ -0,0 +1,138 @@
+"""
+날짜별 Markdown/HTML 공유 캐시 테스트
+"""
+import itertools
+import os
+
+import pytest
+
+from src.content import markdown_cache
+from src.content.markdown_cache import MarkdownCache, render_markdown_html, resolve_daily_markdown
+
+pytest.importorskip("markdown")
+
+SAMPLE = "# 오늘의 안내\n\n## 흐름\n\n- 정리\n- 휴식\n\n1. 첫째\n\n문단입니다.\n\n---\n"
+
+
+def _legacy_render(text):
+    """기존 엔드포인트의 변환 (markdown + 연쇄 replace)"""
+    import markdown
+    html = markdown.markdown(text, extensions=['extra', 'nl2br', 'sane_lists'])
+    return html.replace(
+        '<h1>', '<h1 class="text-3xl font-bold mb-4">'
+    ).replace(
+        '<h2>', '<h2 class="text-2xl font-semibold mb-3 mt-6">'
+    ).replace(
+        '<h3>', '<h3 class="text-xl font-medium mb-2 mt-4">'
+    ).replace(
+        '<ul>', '<ul class="list-disc list-inside mb-4 space-y-1">'
+    ).replace(
+        '<ol>', '<ol class="list-decimal list-inside mb-4 space-y-1">'
+    ).replace(
+        '<p>', '<p class="mb-3 leading-relaxed">'
+    ).replace(
+        '<hr>', '<hr class="my-6 border-gray-300">'
+    )
+
+
+def test_render_matches_legacy_output():
+    assert render_markdown_html(SAMPLE) == _legacy_render(SAMPLE)
+
+
+def test_html_rendered_once_per_file_version(tmp_path):
+    path = tmp_path / "2026-01-31.md"
+    path.write_text(SAMPLE, encoding="utf-8")
+    cache = MarkdownCache()
+
+    first = cache.get_html(path)
+    assert cache.get_html(path) is first
+    assert cache.get_markdown(path) == SAMPLE
+    assert cache.renders == 1
+
+    # 파일이 바뀌면 새 버전으로 다시 읽고 변환
+    path.write_text("# 바뀐 내용\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "바뀐 내용" in cache.get_html(path)
+    assert cache.renders == 2
+    assert len(cache) == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = MarkdownCache(max_entries=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"# {name}\n", encoding="utf-8")
+        paths.append(path)
+
+    cache.get_markdown(paths[0])
+    cache.get_markdown(paths[1])
+    cache.get_markdown(paths[0])  # a를 최근 사용으로
+    cache.get_markdown(paths[2])  # b 제거
+
+    misses = cache.misses
+    cache.get_markdown(paths[0])
+    assert cache.misses == misses
+    cache.get_markdown(paths[1])
+    assert cache.misses == misses + 1
+
+
+def test_prerender_and_resolve(tmp_path):
+    (tmp_path / "2026-01-31.md").write_text(SAMPLE, encoding="utf-8")
+    (tmp_path / "2026-01-31_new_format.md").write_text("# 새 형식\n", encoding="utf-8")
+    (tmp_path / "2026-02-01.md").write_text(SAMPLE, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+
+    cache = MarkdownCache()
+    assert cache.prerender(tmp_path) == 3
+    assert cache.renders == 3
+
+    assert resolve_daily_markdown("2026-01-31", tmp_path).name == "2026-01-31_new_format.md"
+    assert resolve_daily_markdown("2026-02-01", tmp_path).name == "2026-02-01.md"
+    assert resolve_daily_markdown("2026-02-02", tmp_path) is None
+
+
+def test_endpoint_cache_shared_between_users(tmp_path, monkeypatch, stub_router_client):
+    from src.api import daily as api
+
+    (tmp_path / "2026-01-31.md").write_text(SAMPLE, encoding="utf-8")
+    cache = MarkdownCache()
+    users = itertools.cycle(["user-1", "user-2"])
+    monkeypatch.setattr(api, "get_markdown_cache", lambda: cache)
+    monkeypatch.setattr(api, "resolve_daily_markdown",
+                        lambda date_str: resolve_daily_markdown(date_str, tmp_path))
+
+    headers = {"Authorization": "Bearer token"}
+
+    with stub_router_client(api, user_id=lambda: next(users)) as client:
+        first = client.get("/api/daily/2026-01-31/markdown-html", headers=headers)
+        second = client.get("/api/daily/2026-01-31/markdown-html", headers=headers)
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert cache.renders == 1
+        assert len(cache) == 1
+
+        missing = client.get("/api/daily/2026-02-02/markdown", headers=headers)
+        assert missing.status_code == 404
+
+
+def test_app_startup_prerenders_once(monkeypatch):
+    from types import SimpleNamespace
+
+    from fastapi.testclient import TestClient
+
+    from src import main
+    from src.api import daily as api
+
+    renders = []
+    monkeypatch.setattr(api, "get_markdown_cache", lambda: SimpleNamespace(prerender=lambda: renders.append(1)))
+    monkeypatch.setattr(api, "_prerender_task", None)
+
+    async def wait_for_prerender():
+        await api._prerender_task
+
+    with TestClient(main.app) as client:
+        client.portal.call(wait_for_prerender)
+
+    assert renders == [1]
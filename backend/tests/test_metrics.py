@@ -0,0 +1,168 @@
+"""
+Prometheus 메트릭(src.utils.metrics) / /metrics 엔드포인트 테스트
+"""
+import datetime
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.utils import metrics
+from src.utils.metrics import MetricsMiddleware, MetricsRegistry
+
+
+def _sample_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+def _value(text, prefix):
+    for line in text.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} 없음")
+
+
+def test_registry_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "처리한 작업 수", ("kind",))
+    gauge = registry.gauge("queue_depth", "대기열 길이")
+    histogram = registry.histogram("latency_seconds", "지연", ("route",), buckets=(0.1, 1.0))
+
+    counter.inc(kind="daily")
+    counter.inc(2, kind="daily")
+    gauge.set(3)
+    gauge.dec()
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, route="/a")
+
+    text = registry.render()
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="daily"} 3.0' in text
+    assert "queue_depth 2.0" in text
+    assert "# TYPE latency_seconds histogram" in text
+    assert _sample_lines(text, "latency_seconds_bucket") == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 1.0',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3.0',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4.0',
+    ]
+    assert 'latency_seconds_sum{route="/a"} 6.05' in text
+    assert 'latency_seconds_count{route="/a"} 4.0' in text
+
+    with pytest.raises(ValueError):
+        counter.inc(route="/a")
+    with pytest.raises(ValueError):
+        registry.counter("jobs_total", "중복")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("odd_total", "x", ("path",)).inc(path='a"b\\c')
+    assert 'odd_total{path="a\\"b\\\\c"} 1.0' in registry.render()
+
+
+def test_middleware_route_labels_and_in_flight():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        assert metrics.HTTP_IN_FLIGHT.value() >= 1
+        return {"id": item_id}
+
+    before = metrics.HTTP_REQUESTS.value(method="GET", route="/items/{item_id}", status="200")
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+    assert metrics.HTTP_REQUESTS.value(method="GET", route="/items/{item_id}", status="200") == before + 2
+    assert metrics.HTTP_REQUESTS.value(method="GET", route="unmatched", status="404") >= 1
+    assert metrics.HTTP_LATENCY.count(method="GET", route="/items/{item_id}") >= 2
+    assert metrics.HTTP_IN_FLIGHT.value() == 0
+
+
+def test_metrics_endpoint_token(monkeypatch):
+    from src.api import metrics as api
+
+    app = FastAPI()
+    app.include_router(api.router)
+    client = TestClient(app)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE r3_http_requests_total counter" in response.text
+
+    monkeypatch.setenv("METRICS_TOKEN", "secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer secret"}).status_code == 200
+
+
+def test_engine_cache_metrics():
+    from benchmarks.suite import BIRTH_INFO, TARGET_DATE, saju_calculator
+    from src.rhythm.qimen import calculate_daily_qimen
+    from src.rhythm.saju import calculate_saju
+
+    hits = metrics.SAJU_CACHE_REQUESTS.value(result="hit")
+    misses = metrics.SAJU_CACHE_REQUESTS.value(result="miss")
+    with saju_calculator("stub"):
+        calculate_saju(BIRTH_INFO, TARGET_DATE)
+        calculate_saju(BIRTH_INFO, TARGET_DATE)
+        text = metrics.render_metrics()
+    assert metrics.SAJU_CACHE_REQUESTS.value(result="miss") == misses + 1
+    assert metrics.SAJU_CACHE_REQUESTS.value(result="hit") == hits + 1
+    assert _value(text, 'r3_cache_entries{cache="saju"}') >= 1
+
+    calculate_daily_qimen(BIRTH_INFO.birth_date, datetime.date(2026, 2, 1))
+    calculate_daily_qimen(BIRTH_INFO.birth_date, datetime.date(2026, 2, 1))
+    text = metrics.render_metrics()
+    assert _value(text, 'r3_cache_hits_total{cache="qimen_hourly"}') >= 1
+    assert "# TYPE r3_cache_misses_total counter" in text
+
+
+def test_render_pool_metrics(monkeypatch):
+    pool = SimpleNamespace(
+        max_workers=2,
+        stats=lambda: {"pending": 3, "max_queue": 16, "completed": 5, "failed": 1,
+                       "timeouts": 0, "rejected": 2, "restarts": 1},
+    )
+    monkeypatch.setitem(sys.modules, "render_pool", SimpleNamespace(_render_pool=pool))
+
+    text = metrics.render_metrics()
+    assert "r3_pdf_queue_depth 3.0" in text
+    assert "r3_pdf_queue_capacity 16.0" in text
+    assert "r3_pdf_pool_workers 2.0" in text
+    assert 'r3_pdf_jobs_total{outcome="rejected"} 2.0' in text
+    assert "r3_pdf_pool_restarts_total 1.0" in text
+
+
+def test_supabase_latency_observed():
+    from fastapi import HTTPException
+
+    from src.api.helpers import get_birth_data
+
+    class _Query:
+        def __init__(self, data):
+            self.data = data
+
+        def select(self, *args):
+            return self
+
+        def eq(self, *args):
+            return self
+
+        def execute(self):
+            return SimpleNamespace(data=self.data)
+
+    profile = {"name": "테스트", "birth_date": "1990-05-15", "birth_time": "14:30:00",
+               "gender": "male", "birth_place": "서울"}
+    ok_before = metrics.SUPABASE_LATENCY.count(operation="select.profiles", outcome="ok")
+    get_birth_data("user-1", None, SimpleNamespace(table=lambda name: _Query([profile])))
+    assert metrics.SUPABASE_LATENCY.count(operation="select.profiles", outcome="ok") == ok_before + 1
+
+    with pytest.raises(HTTPException):
+        get_birth_data("user-1", "recipient-1", SimpleNamespace(table=lambda name: _Query([])))
+    assert metrics.SUPABASE_LATENCY.count(operation="select.diary_recipients", outcome="ok") >= 1
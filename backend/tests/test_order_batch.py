@@ -0,0 +1,149 @@
+"""
+인쇄 주문 일괄 처리 (manifest, 체크섬, 재개) 테스트
+"""
+import hashlib
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("reportlab")
+pytest.importorskip("pypdf")
+
+sys.path.append(str(Path(__file__).parent.parent / "src" / "diary"))
+
+import orderBatch
+from orderBatch import calculate_period, order_file_name, run_batch, validate_order
+
+
+def _order(name, start="2026-04-01", **overrides):
+    order = {
+        "customerName": name,
+        "calendarType": "solar",
+        "gender": "female",
+        "birth": {"year": 1990, "month": 5, "day": 15, "hour": 14, "minute": 30},
+        "startDate": start,
+        "durationType": "1m",
+    }
+    order.update(overrides)
+    return order
+
+
+@pytest.fixture
+def orders_dir(tmp_path):
+    directory = tmp_path / "orders"
+    directory.mkdir()
+    orders = {
+        "a": _order("김다이어리"),
+        "b": _order("김다이어리", start="2026-05-01"),
+        "c": _order("이연구", birth={"year": 1985, "month": 1, "day": 2}),
+        "bad": _order("오류", durationType="2y"),
+        "dup": _order("김다이어리"),
+    }
+    for order_id, order in orders.items():
+        (directory / f"{order_id}.json").write_text(json.dumps(order, ensure_ascii=False), encoding="utf-8")
+    return directory
+
+
+def test_order_helpers():
+    assert calculate_period("2026-01-31", "1m")[1:] == (date(2026, 2, 28), 29)
+    assert order_file_name(_order("김 다이어리/A")) == "20260401_김_다이어리_A_1m_standard.pdf"
+    assert validate_order(_order("x", startDate="2026-02-30")) == "유효하지 않은 시작 날짜입니다"
+    assert validate_order(_order("x")) is None
+
+
+def test_validate_order_birth_time_and_enums():
+    birth = {"year": 1990, "month": 5, "day": 15}
+    assert validate_order(_order("x", birth={**birth, "hour": 24})) == "출생 시간이 유효하지 않습니다 (0-23)"
+    assert validate_order(_order("x", birth={**birth, "hour": -1})) == "출생 시간이 유효하지 않습니다 (0-23)"
+    assert validate_order(_order("x", birth={**birth, "hour": 23, "minute": 60})) == "출생 분이 유효하지 않습니다 (0-59)"
+    assert validate_order(_order("x", birth={**birth, "hour": 0, "minute": 0})) is None
+
+    assert validate_order(_order("x", calendarType="gregorian")) == "달력 유형은 solar, lunar 중 하나여야 합니다"
+    assert validate_order(_order("x", gender="other")) == "성별은 male, female 중 하나여야 합니다"
+    assert validate_order(_order("x", renderMode="tiny")) == "렌더링 모드는 standard, large 중 하나여야 합니다"
+    assert validate_order(_order("x", renderMode="large")) is None
+
+
+def test_validate_order_rejects_malformed_birth_types():
+    birth = {"year": 1990, "month": 5, "day": 15}
+    integer_error = "출생 정보(birth.year/month/day/hour/minute)는 정수여야 합니다"
+    assert validate_order(_order("x", birth={**birth, "year": "1990"})) == integer_error
+    assert validate_order(_order("x", birth={**birth, "minute": 30.5})) == integer_error
+    assert validate_order(_order("x", birth={**birth, "hour": True})) == integer_error
+    assert validate_order(_order("x", birth=[1990, 5, 15])) == "출생 정보(birth)는 객체여야 합니다"
+    assert validate_order(_order("x", durationType=["1m"])) == "기간 타입은 1m, 3m, 6m, 1y 중 하나여야 합니다"
+
+
+def test_malformed_orders_fail_in_manifest_without_aborting_pool(tmp_path):
+    directory = tmp_path / "orders"
+    directory.mkdir()
+    orders = {
+        "string_year": _order("문자", birth={"year": "1990", "month": 5, "day": 15}),
+        "list_birth": _order("목록", birth=[1990, 5, 15]),
+    }
+    for order_id, order in orders.items():
+        (directory / f"{order_id}.json").write_text(json.dumps(order, ensure_ascii=False), encoding="utf-8")
+
+    out = tmp_path / "out"
+    summary = run_batch(str(directory), str(out), workers=2)
+
+    assert summary == {**summary, "total": 2, "done": 0, "failed": 2}
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))["orders"]
+    assert "정수여야" in manifest["string_year"]["error"]
+    assert "객체여야" in manifest["list_birth"]["error"]
+
+
+def test_lunar_order_is_rejected_not_rendered_as_solar(monkeypatch):
+    monkeypatch.setattr(orderBatch, "_build_period_data", lambda order: pytest.fail("lunar order was built"))
+    result = orderBatch._process_order(_order("음력", calendarType="lunar", orderId="lunar"), "/tmp", "x.pdf")
+    assert result["status"] == "failed"
+    assert "음력(lunar)" in result["error"]
+
+
+def test_period_profile_uses_order_gender_and_birth_place(monkeypatch):
+    from types import SimpleNamespace
+
+    profiles = []
+
+    def generate_daily_content(profile, target_date):
+        profiles.append(profile)
+        return True, SimpleNamespace(schema_output={"summary": "요약"}), []
+
+    monkeypatch.setattr(orderBatch, "_engine", SimpleNamespace(generate_daily_content=generate_daily_content))
+    orderBatch._build_period_data(_order("x", gender="male", birthPlace="부산"))
+    orderBatch._build_period_data(_order("y"))
+
+    assert (profiles[0].gender, profiles[0].birth_place, profiles[0].birth_time) == ("male", "부산", "14:30")
+    assert (profiles[-1].gender, profiles[-1].birth_place) == ("female", orderBatch.DEFAULT_BIRTH_PLACE)
+
+
+@pytest.mark.pdf
+@pytest.mark.slow
+def test_batch_writes_manifest_and_resumes(orders_dir, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    summary = run_batch(str(orders_dir), str(out), workers=2)
+
+    assert summary == {**summary, "total": 5, "done": 4, "failed": 1, "skipped": 0}
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))["orders"]
+    assert manifest["bad"]["status"] == "failed"
+    assert manifest["dup"]["pdf"] == "20260401_김다이어리_1m_standard_dup.pdf"
+    for order_id in ("a", "b", "c", "dup"):
+        entry = manifest[order_id]
+        pdf = out / entry["pdf"]
+        assert entry["pageCount"] > 30
+        assert entry["sha256"] == hashlib.sha256(pdf.read_bytes()).hexdigest()
+    assert not list(out.glob("*.part.pdf"))
+
+    # 재실행: 완료된 주문은 건너뛰고, 지워진 PDF만 다시 생성
+    rendered = []
+    original = orderBatch._process_order
+    monkeypatch.setattr(orderBatch, "_process_order", lambda order, *args: rendered.append(order["orderId"]) or original(order, *args))
+    (out / manifest["b"]["pdf"]).unlink()
+
+    summary = run_batch(str(orders_dir), str(out), workers=1)
+    assert sorted(rendered) == ["b", "bad"]
+    assert summary["skipped"] == 3
+    assert summary["done"] == 1
@@ -0,0 +1,110 @@
+"""
+콘텐츠 주소 기반 PDF 캐시 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent.parent / "pdf-generator"))
+
+from pdf_cache import LocalPDFCache, S3PDFCache, pdf_cache_key, render_with_cache
+from render_pool import PDFOutput
+
+
+CONTENT = {"date": "2026-01-20", "summary": "오늘은 정리의 날입니다."}
+
+
+class _CountingPool:
+    """렌더링 횟수를 세는 가짜 풀"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def render(self, method, **kwargs):
+        self.calls += 1
+        return PDFOutput(size=4, data=b"%PDF")
+
+
+class _FakeS3Client:
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            error = Exception("NoSuchKey")
+            error.response = {"Error": {"Code": "NoSuchKey"}}
+            raise error
+
+        class _Body:
+            def __init__(self, data):
+                self.data = data
+
+            def read(self):
+                return self.data
+
+        return {"Body": _Body(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+
+def test_cache_key_depends_on_content_and_role():
+    base = pdf_cache_key("generate_daily_pdf", content=CONTENT, role="student")
+    assert base == pdf_cache_key("generate_daily_pdf", content=dict(CONTENT), role="student")
+    assert base != pdf_cache_key("generate_daily_pdf", content=CONTENT, role="freelancer")
+    assert base != pdf_cache_key("generate_daily_pdf", content={**CONTENT, "summary": "x"}, role="student")
+    assert base != pdf_cache_key("generate_monthly_pdf", content=CONTENT, role="student")
+    assert base != pdf_cache_key("generate_period_pdf", contents=[CONTENT], role="student")
+
+
+def test_local_cache_roundtrip(tmp_path):
+    cache = LocalPDFCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", b"%PDF-a")
+    assert cache.get("a") == b"%PDF-a"
+
+
+def test_local_cache_lru_eviction(tmp_path):
+    cache = LocalPDFCache(str(tmp_path), max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")  # a를 최근 사용으로
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.total_bytes == 8
+
+
+def test_local_cache_index_restored(tmp_path):
+    LocalPDFCache(str(tmp_path)).put("a", b"aaaa")
+    restored = LocalPDFCache(str(tmp_path))
+    assert restored.get("a") == b"aaaa"
+    assert restored.total_bytes == 4
+
+
+def test_s3_cache_with_injected_client():
+    cache = S3PDFCache(bucket="diary", client=_FakeS3Client())
+    assert cache.get("k") is None
+    cache.put("k", b"%PDF")
+    assert cache.get("k") == b"%PDF"
+
+
+async def test_render_with_cache_renders_once(tmp_path):
+    pool = _CountingPool()
+    cache = LocalPDFCache(str(tmp_path))
+
+    first = await render_with_cache(pool, cache, "generate_daily_pdf", content=CONTENT, role="student")
+    second = await render_with_cache(pool, cache, "generate_daily_pdf", content=CONTENT, role="student")
+
+    assert first.data == second.data == b"%PDF"
+    assert pool.calls == 1
+
+
+async def test_render_without_cache():
+    pool = _CountingPool()
+    await render_with_cache(pool, None, "generate_daily_pdf", content=CONTENT)
+    await render_with_cache(pool, None, "generate_daily_pdf", content=CONTENT)
+    assert pool.calls == 2
@@ -231,6 +231,73 @@ class TestPDFLayout:
         assert "page-break-inside" in css_content or "break-inside" in css_content
 
 
+@pytest.mark.pdf
+@pytest.mark.skipif(not WEASYPRINT_AVAILABLE, reason="WeasyPrint required")
+class TestPDFResourceCache:
+    """스타일시트/템플릿 캐시 테스트"""
+
+    @pytest.fixture
+    def generator(self):
+        return PDFGenerator()
+
+    def test_stylesheets_parsed_once(self, generator):
+        """styles.css가 변경되지 않으면 같은 파싱 결과 재사용"""
+        first = generator._get_stylesheets()
+        assert generator._get_stylesheets() is first
+
+    def test_stylesheets_reloaded_on_mtime_change(self, generator):
+        """mtime이 바뀌면 다시 파싱"""
+        first = generator._get_stylesheets()
+        generator._styles_mtime = -1
+        assert generator._get_stylesheets() is not first
+
+    def test_templates_compiled_once(self, generator):
+        """컴파일된 템플릿 재사용"""
+        template = generator._get_template("daily.html")
+        assert generator._get_template("daily.html") is template
+
+    def test_no_reload_when_disabled(self):
+        """auto_reload=False면 mtime을 확인하지 않음"""
+        generator = PDFGenerator(auto_reload=False)
+        first = generator._get_stylesheets()
+        generator._styles_mtime = -1
+        assert generator._get_stylesheets() is first
+
+
+@pytest.mark.pdf
+@pytest.mark.skipif(not WEASYPRINT_AVAILABLE, reason="WeasyPrint required")
+class TestPeriodPDF:
+    """여러 날짜 단일 문서 렌더링 테스트"""
+
+    @pytest.fixture
+    def generator(self):
+        return PDFGenerator()
+
+    def test_period_pdf_in_memory(self, generator, sample_daily_content):
+        """여러 날짜를 한 PDF로 렌더링하고 통계 기록"""
+        day = sample_daily_content.model_dump()
+        contents = [{**day, "date": f"2026-01-{d:02d}"} for d in range(1, 4)]
+
+        pdf_bytes = generator.generate_period_pdf(contents, role="student")
+
+        assert pdf_bytes.startswith(b"%PDF")
+        stats = generator.last_period_stats
+        assert stats["days"] == 3
+        assert stats["pages"] >= 3
+        assert stats["pages_per_second"] > 0
+
+    def test_period_pdf_tolerates_partial_content(self, generator):
+        """생성 실패 자리표시 콘텐츠도 렌더링"""
+        pdf_bytes = generator.generate_period_pdf(
+            [{"date": "2026-01-01", "summary": "콘텐츠 생성 실패"}]
+        )
+        assert pdf_bytes.startswith(b"%PDF")
+
+    def test_period_pdf_requires_contents(self, generator):
+        with pytest.raises(ValueError):
+            generator.generate_period_pdf([])
+
+
 @pytest.mark.pdf
 @pytest.mark.slow
 @pytest.mark.skipif(not WEASYPRINT_AVAILABLE, reason="WeasyPrint required")
@@ -0,0 +1,163 @@
+"""
+비동기 PDF 작업 저장소/관리자 테스트
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent.parent / "pdf-generator"))
+
+from pdf_jobs import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    LocalJobStore,
+    PDFJob,
+    PDFJobLimitError,
+    PDFJobManager,
+)
+from render_pool import PDFOutput, PDFQueueFullError
+
+
+async def _wait_done(manager, job_id, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        job = manager.get(job_id)
+        if not job.is_active:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PDFJobManager(LocalJobStore(str(tmp_path)), max_active_per_user=1, queue_retry_delay=0.01)
+
+
+async def test_job_reports_progress_and_stores_result(manager):
+    seen = []
+
+    async def build(report):
+        report(0.5, "콘텐츠 생성 중")
+        seen.append(manager.get(job.id).progress)
+        return PDFOutput(size=4, data=b"%PDF")
+
+    job = manager.create("user-1", "monthly", "R3_Diary_2026_01.pdf", build)
+    done = await _wait_done(manager, job.id)
+
+    assert seen == [0.5]
+    assert done.status == JOB_SUCCEEDED
+    assert done.progress == 1.0
+    assert Path(manager.result_path(done)).read_bytes() == b"%PDF"
+
+
+async def test_spilled_output_is_moved_into_store(manager, tmp_path):
+    spilled = tmp_path / "spill.pdf"
+    spilled.write_bytes(b"%PDF-large")
+
+    async def build(report):
+        return PDFOutput(size=10, path=str(spilled))
+
+    job = manager.create("user-1", "customer_period", "a.pdf", build)
+    done = await _wait_done(manager, job.id)
+
+    assert not spilled.exists()
+    assert Path(manager.result_path(done)).read_bytes() == b"%PDF-large"
+
+
+async def test_per_user_limit(manager):
+    release = asyncio.Event()
+
+    async def build(report):
+        await release.wait()
+        return PDFOutput(size=4, data=b"%PDF")
+
+    first = manager.create("user-1", "monthly", "a.pdf", build)
+    with pytest.raises(PDFJobLimitError):
+        manager.create("user-1", "monthly", "b.pdf", build)
+    # 다른 사용자는 영향 없음
+    other = manager.create("user-2", "monthly", "c.pdf", build)
+
+    release.set()
+    await _wait_done(manager, first.id)
+    await _wait_done(manager, other.id)
+    manager.create("user-1", "monthly", "d.pdf", build)
+    await manager.shutdown()
+
+
+async def test_queue_full_is_retried(manager):
+    attempts = []
+
+    async def build(report):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise PDFQueueFullError("full")
+        return PDFOutput(size=4, data=b"%PDF")
+
+    job = manager.create("user-1", "monthly", "a.pdf", build)
+    done = await _wait_done(manager, job.id)
+
+    assert done.status == JOB_SUCCEEDED
+    assert len(attempts) == 3
+
+
+async def test_failure_records_error(manager):
+    async def build(report):
+        raise RuntimeError("렌더링 실패")
+
+    job = manager.create("user-1", "monthly", "a.pdf", build)
+    done = await _wait_done(manager, job.id)
+
+    assert done.status == JOB_FAILED
+    assert done.error == "렌더링 실패"
+    assert manager.result_path(done) is None
+
+
+def test_owner_check_and_restart_recovery(tmp_path):
+    store = LocalJobStore(str(tmp_path))
+    store.save(PDFJob(id="j1", owner="user-1", kind="monthly", filename="a.pdf", status="running"))
+
+    restored = PDFJobManager(LocalJobStore(str(tmp_path)))
+    assert restored.get("j1", owner="user-2") is None
+    job = restored.get("j1", owner="user-1")
+    assert job.status == JOB_FAILED
+    assert job.error
+
+
+def test_job_api_roundtrip(tmp_path, monkeypatch, stub_router_client):
+    import time
+
+    from src.api import pdf_jobs as api
+
+    job_manager = PDFJobManager(LocalJobStore(str(tmp_path)))
+    monkeypatch.setattr(api, "get_job_manager", lambda: job_manager)
+    monkeypatch.setattr(api, "build_monthly_content", lambda *args: {"month": 1})
+
+    async def fake_render(method, **kwargs):
+        assert method == "generate_monthly_pdf"
+        return PDFOutput(size=4, data=b"%PDF")
+
+    monkeypatch.setattr(api, "_render", fake_render)
+
+    headers = {"Authorization": "Bearer token"}
+
+    with stub_router_client(api) as client:
+        response = client.post("/api/pdf/jobs", json={"kind": "monthly", "year": 2026, "month": 1}, headers=headers)
+        assert response.status_code == 202
+        status_url = response.json()["status_url"]
+
+        for _ in range(100):
+            status = client.get(status_url, headers=headers).json()
+            if status["status"] == "succeeded":
+                break
+            time.sleep(0.01)
+        assert status["result_url"] == f"{status_url}/result"
+
+        result = client.get(status["result_url"], headers=headers)
+        assert result.status_code == 200
+        assert result.content == b"%PDF"
+        assert "R3_Diary_2026_01.pdf" in result.headers["content-disposition"]
+
+        assert client.get("/api/pdf/jobs/unknown", headers=headers).status_code == 404
+        bad = client.post("/api/pdf/jobs", json={"kind": "customer_period"}, headers=headers)
+        assert bad.status_code == 400
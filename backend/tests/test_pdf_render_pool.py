@@ -0,0 +1,128 @@
+"""
+PDF 렌더링 워커 풀 테스트
+
+WeasyPrint 없이 동작하도록 가짜 생성기를 워커에 주입합니다.
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent.parent / "pdf-generator"))
+
+from render_pool import PDFRenderPool, PDFQueueFullError, PDFRenderTimeoutError
+from src.api.helpers import pdf_response
+
+
+class _FakeGenerator:
+    """generate_daily_pdf 시그니처를 흉내내는 생성기 (워커 pid를 기록)"""
+
+    def generate_daily_pdf(self, content, output_path=None, role=None, is_markdown=False):
+        time.sleep(content.get("sleep", 0))
+        data = f"{os.getpid()}:{role}".encode() + b"%" * content.get("padding", 0)
+        if output_path is None:
+            return data
+        Path(output_path).write_bytes(data)
+        return output_path
+
+
+def _fake_factory():
+    return _FakeGenerator()
+
+
+@pytest.fixture
+def pool():
+    pool = PDFRenderPool(
+        max_workers=1,
+        max_queue=2,
+        job_timeout=5.0,
+        max_jobs_per_worker=2,
+        spill_threshold=1024,
+        generator_factory=_fake_factory,
+    )
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.pdf
+async def test_render_daily_runs_in_worker(pool):
+    output = await pool.render_daily(content={}, role="student")
+
+    assert output.path is None
+    pid, role = output.data.decode().split(":")
+    assert int(pid) != os.getpid()
+    assert role == "student"
+    assert pool.stats()["completed"] == 1
+
+
+@pytest.mark.pdf
+async def test_submit_writes_to_path(pool, tmp_path):
+    out = tmp_path / "a.pdf"
+    result = await pool.submit("generate_daily_pdf", content={}, output_path=str(out))
+    assert result == str(out)
+    assert out.exists()
+
+
+@pytest.mark.pdf
+async def test_large_pdf_spills_to_disk_and_is_removed(pool):
+    output = await pool.render_daily(content={"padding": 4096})
+    assert output.data is None
+    assert output.size > 4096
+    assert os.path.exists(output.path)
+
+    response = pdf_response(output, "R3_Diary.pdf")
+    await response.background()
+    assert not os.path.exists(output.path)
+
+
+def test_pdf_response_in_memory_korean_filename():
+    class _Output:
+        data = b"%PDF"
+        path = None
+
+    response = pdf_response(_Output(), "R3_Diary_홍길동.pdf")
+    assert response.body == b"%PDF"
+    assert response.headers["content-disposition"].startswith("attachment; filename*=utf-8''")
+
+
+@pytest.mark.pdf
+async def test_workers_recycled_after_max_jobs(pool):
+    pids = []
+    for _ in range(3):
+        output = await pool.render_daily(content={})
+        pids.append(output.data.decode().split(":")[0])
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[0]
+
+
+@pytest.mark.pdf
+async def test_queue_full_rejected(pool):
+    jobs = [asyncio.ensure_future(pool.render_daily(content={"sleep": 0.5})) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(PDFQueueFullError):
+        await pool.render_daily(content={})
+    await asyncio.gather(*jobs)
+
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["pending"] == 0
+
+
+@pytest.mark.pdf
+async def test_timeout_restarts_pool(pool, tmp_path):
+    with pytest.raises(PDFRenderTimeoutError):
+        await pool.submit(
+            "generate_daily_pdf",
+            timeout=0.5,
+            content={"sleep": 10},
+            output_path=str(tmp_path / "slow.pdf"),
+        )
+    # 새 풀에서 다음 작업은 정상 처리
+    output = await pool.render_daily(content={})
+
+    assert output.data
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["restarts"] == 1
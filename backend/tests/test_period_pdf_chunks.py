@@ -0,0 +1,65 @@
+"""
+기간 다이어리 월 단위 청크 렌더링 테스트
+"""
+import json
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("reportlab")
+pypdf = pytest.importorskip("pypdf")
+
+sys.path.append(str(Path(__file__).parent.parent / "src" / "diary"))
+
+from simplePdfConverter import SimplePdfConverter
+
+
+def _period(days, start=date(2026, 1, 28)):
+    entry = {"content": {"summary": "집중과 정리의 날 " * 20, "keywords": ["집중", "정리"]}}
+    return {
+        "totalDays": days,
+        "entries": [
+            {**entry, "date": (start + timedelta(days=i)).isoformat()}
+            for i in range(days)
+        ],
+    }
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "period.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.pdf
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_chunked_matches_single_story(tmp_path, max_workers):
+    data = _period(40)
+    converter = SimplePdfConverter()
+
+    result = converter.convert_period_json_to_pdf(
+        _write(tmp_path, data), str(tmp_path / "chunked.pdf"), max_workers=max_workers
+    )
+    single_pages = converter._build_period_single(data, str(tmp_path / "single.pdf"))
+
+    assert result["success"], result.get("error")
+    assert result["pageCount"] == len(pypdf.PdfReader(result["outputPath"]).pages)
+    assert result["pageCount"] == single_pages
+
+
+@pytest.mark.pdf
+def test_index_page_numbers_point_to_daily_pages(tmp_path):
+    data = _period(40)
+    result = SimplePdfConverter().convert_period_json_to_pdf(
+        _write(tmp_path, data), str(tmp_path / "period.pdf"), max_workers=1
+    )
+    pages = [page.extract_text() for page in pypdf.PdfReader(result["outputPath"]).pages]
+    index_text = "\n".join(pages[1:3])
+
+    for entry in data["entries"]:
+        match = re.search(entry["date"] + r"\s*\S*\s*p\.(\d+)", index_text)
+        assert match, entry["date"]
+        assert entry["date"] in pages[int(match.group(1)) - 1].split("\n")[0]
@@ -0,0 +1,58 @@
+"""
+기문 최적 시간대 인덱스 테스트
+"""
+import datetime
+
+import pytest
+
+from src.rhythm.qimen import calculate_daily_qimen
+from src.rhythm.qimen_index import find_best_windows, get_qimen_index
+
+BIRTH_DATES = [datetime.date(1971, 11, 17), datetime.date(1990, 5, 15), datetime.date(1985, 1, 3)]
+
+
+def _scan(birth_date, start, end):
+    """날짜별 calculate_daily_qimen 결과 전체 (date 포함)"""
+    slots = []
+    day = start
+    while day <= end:
+        for result in calculate_daily_qimen(birth_date, day):
+            slots.append({"date": day.isoformat(), **result.to_dict()})
+        day += datetime.timedelta(days=1)
+    return slots
+
+
+@pytest.mark.parametrize("birth_date", BIRTH_DATES)
+def test_index_matches_daily_qimen(birth_date):
+    index = get_qimen_index(birth_date, 2024)
+    expected = _scan(birth_date, datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))
+    actual = [index.slot(day, slot) for day in range(366) for slot in range(12)]
+    assert actual == expected
+
+
+@pytest.mark.parametrize("quality,direction", [(None, None), ("good", None), ("avoid", "SW"), (None, "북동")])
+def test_best_windows_match_scan(quality, direction):
+    birth_date = BIRTH_DATES[0]
+    start, end = datetime.date(2025, 12, 20), datetime.date(2026, 1, 12)
+
+    slots = [
+        slot for slot in _scan(birth_date, start, end)
+        if (quality is None or slot["quality"] == quality)
+        and (direction is None or direction in (slot["direction"], slot["direction_en"]))
+    ]
+    # 에너지 내림차순, 동점은 날짜·슬롯 순 (sorted는 안정 정렬)
+    expected = sorted(slots, key=lambda slot: -slot["energy_level"])[:7]
+
+    assert find_best_windows(birth_date, start, end, k=7, quality=quality, direction=direction) == expected
+
+
+def test_best_windows_filters():
+    birth_date = BIRTH_DATES[1]
+    start, end = datetime.date(2026, 3, 2), datetime.date(2026, 3, 8)
+
+    assert find_best_windows(birth_date, start, end, k=3, min_energy=11) == []
+    assert find_best_windows(birth_date, end, start) == []
+    with pytest.raises(ValueError):
+        find_best_windows(birth_date, start, end, quality="great")
+    with pytest.raises(ValueError):
+        find_best_windows(birth_date, start, end, direction="위")
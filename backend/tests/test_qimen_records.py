@@ -0,0 +1,68 @@
+"""
+기문 결과 레코드(코드화된 불변 레코드) 테스트
+"""
+import dataclasses
+import datetime
+
+import pytest
+
+from src.rhythm.qimen import calculate_daily_qimen, get_daily_summary
+from src.rhythm.qimen_complete import (
+    GATE_NAMES,
+    calculate_complete_qimen,
+    get_daily_complete_qimen,
+)
+
+BIRTH_DATE = datetime.date(1971, 11, 17)
+
+
+def test_hourly_result_is_compact_and_shared():
+    first = calculate_daily_qimen(BIRTH_DATE, datetime.date(2026, 2, 19))
+    # 60일 뒤는 같은 일진·같은 양둔이므로 같은 레코드를 공유
+    again = calculate_daily_qimen(BIRTH_DATE, datetime.date(2026, 4, 20))
+
+    assert not hasattr(first[0], "__dict__")
+    assert all(a is b for a, b in zip(first, again))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].energy_level = 1
+
+
+def test_hourly_result_serialization():
+    result = calculate_daily_qimen(BIRTH_DATE, datetime.date(2026, 2, 19))[0]
+    assert result.to_dict() == {
+        "hour_start": 23,
+        "hour_end": 1,
+        "quality": "neutral",
+        "direction": "동",
+        "direction_en": "E",
+        "energy_level": 7,
+        "label": "창의적 활동에 적합한 시간",
+    }
+
+
+def test_daily_summary_reuses_hourly_results():
+    target = datetime.date(2026, 2, 19)
+    hourly = calculate_daily_qimen(BIRTH_DATE, target)
+    assert get_daily_summary(BIRTH_DATE, target, hourly) == get_daily_summary(BIRTH_DATE, target)
+
+
+def test_complete_result_codes_and_names():
+    result = calculate_complete_qimen(BIRTH_DATE, datetime.date(2026, 3, 28), 9)
+
+    assert len(result.palaces) == 9
+    palace = result.palaces[0]
+    assert not hasattr(palace, "__dict__")
+    assert palace.gate == GATE_NAMES[palace.gate_code]
+    assert result.best_palace.quality_score == max(p.quality_score for p in result.palaces)
+    assert result.user_guidance.startswith("09시(사시)는 ")
+
+    data = result.to_dict()
+    assert data["palaces"][0]["gate"] == palace.gate
+    assert data["user_guidance"] == result.user_guidance
+
+
+def test_complete_results_shared_across_dates():
+    day = get_daily_complete_qimen(BIRTH_DATE, datetime.date(2026, 3, 28))
+    assert len(day) == 12
+    # 같은 날 다시 계산하면 새로 할당하지 않고 캐시된 결과를 반환
+    assert all(a is b for a, b in zip(day, get_daily_complete_qimen(BIRTH_DATE, datetime.date(2026, 3, 28))))
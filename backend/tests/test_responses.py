@@ -0,0 +1,137 @@
+"""
+orjson 응답 직렬화 / brotli·gzip 응답 압축 테스트
+"""
+import datetime
+import gzip
+import json
+from enum import Enum
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.utils import compression
+from src.utils.compression import CompressionMiddleware, choose_encoding
+from src.utils.responses import dumps, json_response
+
+BIG = {"items": [{"text": "오늘의 흐름은 안정적입니다", "score": i} for i in range(200)]}
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Item(BaseModel):
+    name: str
+    when: datetime.date
+
+
+def test_dumps_matches_jsonable_encoder():
+    payload = {
+        "date": datetime.date(2026, 1, 20),
+        "time": datetime.time(9, 30),
+        "color": Color.RED,
+        "item": Item(name="하루", when=datetime.date(2026, 1, 21)),
+        "tags": ("a", "b"),
+        "none": None,
+        "float": 0.1,
+    }
+    assert json.loads(dumps(payload)) == jsonable_encoder(payload)
+    assert json.loads(dumps({"energy": np.array([1, 2, 3])})) == {"energy": [1, 2, 3]}
+    assert json.loads(dumps({"set": {1}})) == {"set": [1]}
+    with pytest.raises(TypeError):
+        dumps({"bad": object()})
+
+
+def test_json_response_keeps_injected_headers():
+    injected = Response()
+    injected.headers["ETag"] = 'W/"abc"'
+    injected.headers["Cache-Control"] = "private"
+
+    result = json_response({"a": "가"}, injected, headers={"X-Extra": "1"})
+    assert result.body == '{"a":"가"}'.encode()
+    assert result.headers["etag"] == 'W/"abc"'
+    assert result.headers["cache-control"] == "private"
+    assert result.headers["x-extra"] == "1"
+    assert result.headers["content-length"] == str(len(result.body))
+
+
+def test_choose_encoding():
+    assert choose_encoding(None) is None
+    assert choose_encoding("gzip, deflate, br", brotli_enabled=True) == "br"
+    assert choose_encoding("gzip, deflate, br", brotli_enabled=False) == "gzip"
+    assert choose_encoding("br;q=0.5, gzip", brotli_enabled=True) == "gzip"
+    assert choose_encoding("gzip;q=0, identity", brotli_enabled=True) is None
+    assert choose_encoding("*", brotli_enabled=True) == "br"
+    assert choose_encoding("*;q=0, gzip;q=0.1", brotli_enabled=True) == "gzip"
+
+
+def _compressed_client(**kwargs):
+    def stream():
+        body = json.dumps(BIG).encode()
+        for start in range(0, len(body), 500):
+            yield body[start:start + 500]
+
+    routes = [
+        Route("/big", lambda request: JSONResponse(BIG)),
+        Route("/small", lambda request: JSONResponse({"ok": True})),
+        Route("/pdf", lambda request: Response(b"%PDF" * 1000, media_type="application/pdf")),
+        Route("/stream", lambda request: StreamingResponse(stream(), media_type="application/json")),
+        Route("/encoded", lambda request: PlainTextResponse("x" * 5000, headers={"Content-Encoding": "identity"})),
+        Route("/not-modified", lambda request: Response(status_code=304, headers={"ETag": 'W/"x"'})),
+    ]
+    return TestClient(CompressionMiddleware(Starlette(routes=routes), **kwargs))
+
+
+def test_compression_negotiation():
+    client = _compressed_client()
+
+    plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == BIG
+
+    gzipped = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert int(gzipped.headers["content-length"]) < len(plain.content) // 5
+    assert gzipped.json() == BIG
+
+    if compression.BROTLI_AVAILABLE:
+        brotlied = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+        assert brotlied.headers["content-encoding"] == "br"
+        assert brotlied.json() == BIG
+
+
+def test_compression_skips():
+    client = _compressed_client(minimum_size=1024)
+    headers = {"Accept-Encoding": "gzip"}
+
+    for path in ("/small", "/pdf", "/encoded", "/not-modified"):
+        response = client.get(path, headers=headers)
+        assert response.headers.get("content-encoding") in (None, "identity"), path
+        assert "vary" not in response.headers, path
+
+    streamed = client.get("/stream", headers=headers)
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert "content-length" not in streamed.headers
+    assert streamed.json() == BIG
+
+
+def test_gzip_stream_is_valid():
+    client = _compressed_client()
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert json.loads(gzip.decompress(raw)) == BIG
+
+
+def test_serialization_benchmark_runs():
+    from benchmarks import serialization
+
+    report = serialization.run(days=2, rounds=1)
+    assert report["sizes"]["gzip"] < report["sizes"]["identity"]
+    assert set(report["results"]) >= {"jsonable_encoder", "orjson", "gzip"}
@@ -0,0 +1,176 @@
+"""
+Single-flight 요청 합치기 테스트
+"""
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.api.helpers import share_pdf_output
+from src.utils.metrics import SINGLEFLIGHT_CALLS
+from src.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_thread_singleflight_shares_result_and_error():
+    flight = SingleFlight("test_thread")
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "k", compute)
+        started.wait()
+        followers = [pool.submit(flight.do, "k", compute) for _ in range(4)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+    assert SINGLEFLIGHT_CALLS.value(flight="test_thread", result="shared") == 4
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    started.clear()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(flight.do, "err", fail)
+        started.wait()
+        second = pool.submit(flight.do, "err", fail)
+        for future in (first, second):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    # 끝난 계산은 저장하지 않음
+    flight.do("k", compute)
+    assert len(calls) == 2
+
+
+def test_async_singleflight_coalesces_and_survives_leader_cancel():
+    flight = AsyncSingleFlight("test_async")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return ["result"]
+
+    async def scenario():
+        leader = asyncio.create_task(flight.do("k", compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", compute, share=list)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert results == [["result"]] * 3
+    assert results[0] is not results[1]
+    assert flight.in_flight() == 0
+
+
+def test_async_singleflight_propagates_errors():
+    flight = AsyncSingleFlight("test_async_error")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad")
+
+    async def scenario():
+        return await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert SINGLEFLIGHT_CALLS.value(flight="test_async_error", result="leader") == 1
+
+
+def test_share_pdf_output(tmp_path):
+    from dataclasses import dataclass
+    from typing import Optional
+
+    @dataclass
+    class Output:
+        size: int
+        data: Optional[bytes] = None
+        path: Optional[str] = None
+
+    in_memory = Output(size=4, data=b"%PDF")
+    assert share_pdf_output(in_memory) is in_memory
+
+    original = tmp_path / "render.pdf"
+    original.write_bytes(b"%PDF-large")
+    shared = share_pdf_output(Output(size=10, path=str(original)))
+    assert shared.path != str(original)
+    original.unlink()
+    with open(shared.path, "rb") as f:
+        assert f.read() == b"%PDF-large"
+
+
+def test_saju_calculator_runs_once_for_concurrent_callers(monkeypatch):
+    from benchmarks.suite import BIRTH_INFO, SAJU_FIXTURE, TARGET_DATE
+    from src.rhythm import saju
+
+    fixture = SAJU_FIXTURE.read_text(encoding="utf-8")
+    runs = []
+
+    def slow_calculator(input_data):
+        runs.append(input_data)
+        time.sleep(0.1)
+        return json.loads(fixture)
+
+    monkeypatch.setattr(saju, "_run_calculator", slow_calculator)
+    saju._saju_cache.clear()
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: saju.calculate_saju(BIRTH_INFO, TARGET_DATE), range(4)))
+    finally:
+        saju._saju_cache.clear()
+
+    assert len(runs) == 1
+    assert all(result["사주"] == results[0]["사주"] for result in results)
+
+
+def test_concurrent_daily_requests_share_pipeline(monkeypatch, stub_router_client):
+    from benchmarks.suite import saju_calculator
+    from src.api import daily as api
+
+    calls = []
+    original = api.calculate_saju
+
+    def slow_saju(*args):
+        calls.append(args)
+        time.sleep(0.1)
+        return original(*args)
+
+    monkeypatch.setattr(api, "calculate_saju", slow_saju)
+    app = stub_router_client(api).app
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [
+                client.get("/api/daily/2026-01-20?role=student", headers={"Authorization": "Bearer token"})
+                for _ in range(3)
+            ]
+            return await asyncio.gather(*requests)
+
+    with saju_calculator("stub"):
+        responses = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert len({response.content for response in responses}) == 1
+    assert len(calls) == 1
@@ -0,0 +1,47 @@
+"""
+콜드 스타트 예산 테스트
+
+새 인터프리터에서 src.main을 import할 때 무거운 의존성이 로드되지 않고,
+누적 import 시간이 예산(STARTUP_IMPORT_BUDGET_MS, 기본 3000ms) 안인지 확인합니다.
+"""
+import os
+
+import pytest
+
+from benchmarks.import_profile import parse_importtime, profile_imports, summarize
+
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "3000"))
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:      2160 |      91102 |         numpy
+import time:      1814 |      92915 |       src.rhythm.calendar_rhythm
+import time:      4588 |    1371724 | src.main
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(SAMPLE)
+    assert [t.module for t in timings] == ["_io", "numpy", "src.rhythm.calendar_rhythm", "src.main"]
+    assert timings[1].self_us == 2160
+    assert timings[1].cumulative_us == 91102
+    assert [t.depth for t in timings] == [2, 4, 3, 0]
+
+    report = summarize(timings, top=2)
+    assert report["total_ms"] == 1371.7
+    assert report["heavy_loaded"] == ["numpy"]
+    assert [row["module"] for row in report["top"]] == ["src.main", "src.rhythm.calendar_rhythm"]
+
+
+@pytest.fixture(scope="module")
+def startup_report():
+    return summarize(profile_imports("src.main"))
+
+
+def test_heavy_modules_not_loaded_at_startup(startup_report):
+    assert startup_report["heavy_loaded"] == [], f"시작 시 로드된 무거운 의존성: {startup_report['heavy_loaded']}"
+
+
+def test_startup_import_budget(startup_report):
+    assert 0 < startup_report["total_ms"] <= STARTUP_IMPORT_BUDGET_MS, startup_report["top"][:10]
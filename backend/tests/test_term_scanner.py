@@ -0,0 +1,56 @@
+"""
+다중 용어 스캐너 (Aho-Corasick) 테스트
+"""
+from src.utils.term_scanner import TermScanner, TermMatch, get_term_scanner
+from src.skills.personalization_engine.personalizer import _FORBIDDEN_TERMS
+from src.skills.personalization_engine.rhythm_integrator import RhythmIntegrator
+from src.rhythm.signals import RhythmAnalyzer
+
+
+def test_find_all_reports_overlapping_offsets():
+    scanner = TermScanner(["사주", "사주명리", "명리"])
+    matches = scanner.find_all("오늘 사주명리 이야기")
+    assert TermMatch("사주", 3, 5) in matches
+    assert TermMatch("사주명리", 3, 7) in matches
+    assert TermMatch("명리", 5, 7) in matches
+
+
+def test_found_terms_matches_naive_loop():
+    scanner = TermScanner(_FORBIDDEN_TERMS)
+    texts = [
+        "천간과 지지, 기문둔갑 엔진",
+        "평범한 하루의 흐름",
+        "NLP 알고리즘과 분석 모듈",
+        "",
+    ]
+    for text in texts:
+        assert scanner.found_terms(text) == [t for t in _FORBIDDEN_TERMS if t in text]
+        assert scanner.contains_any(text) == any(t in text for t in _FORBIDDEN_TERMS)
+
+
+def test_scrub_leftmost_longest():
+    scanner = TermScanner(["오행", "사주"], replacements={"오행 조화": "에너지 조화"}, default_replacement="흐름")
+    assert scanner.scrub("오행 조화와 사주") == "에너지 조화와 흐름"
+    assert scanner.scrub("변화 없음") == "변화 없음"
+
+
+def test_scrub_without_default_keeps_unmapped_terms():
+    scanner = TermScanner(["사주"], replacements={"금 오행 활용": "결단·실행 에너지 활용"})
+    assert scanner.scrub("사주와 금 오행 활용") == "사주와 결단·실행 에너지 활용"
+
+
+def test_get_term_scanner_is_cached():
+    assert get_term_scanner(("시험", "과제")) is get_term_scanner(("시험", "과제"))
+
+
+def test_rhythm_integrator_scrub():
+    scrubbed = RhythmIntegrator._scrub_text("금 오행 활용, 오행 충돌, 사주명리")
+    assert scrubbed == "집중력 강화, 에너지 충돌, 흐름"
+
+
+def test_sanitize_ohaeng_terms():
+    analyzer = RhythmAnalyzer()
+    assert analyzer._sanitize_ohaeng_terms(["목 오행 활용", "꾸준한 루틴"]) == [
+        "성장·확장 에너지 활용",
+        "꾸준한 루틴",
+    ]
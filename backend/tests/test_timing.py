@@ -0,0 +1,89 @@
+"""
+구간 타이머 / Server-Timing 미들웨어 테스트
+"""
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.utils.timing import ServerTimingMiddleware, TimingRecorder, current_recorder, span
+
+
+def _parse_server_timing(value):
+    metrics = {}
+    for item in value.split(","):
+        name, dur = item.strip().split(";dur=")
+        metrics[name] = float(dur)
+    return metrics
+
+
+def test_span_is_noop_outside_request():
+    assert current_recorder() is None
+    assert span("saju") is span("qimen")
+    with span("saju") as active:
+        assert active is None
+
+
+def test_recorder_aggregates_and_formats():
+    recorder = TimingRecorder()
+    recorder.add("saju", 1.25)
+    recorder.add("qimen", 2.0, depth=1)
+    recorder.add("saju", 0.75)
+    recorder.add("bad name/x", 0.5)
+
+    assert recorder.as_dict()["saju"] == {"ms": 2.0, "count": 2, "depth": 0}
+    assert recorder.as_dict()["qimen"]["depth"] == 1
+    assert recorder.header_value(10) == "saju;dur=2.0, qimen;dur=2.0, bad_name_x;dur=0.5, total;dur=10.0"
+
+
+def test_middleware_adds_header_and_log(caplog):
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/work")
+    async def work():
+        with span("outer"):
+            with span("inner"):
+                pass
+            with span("inner"):
+                pass
+        return {"ok": True}
+
+    @app.get("/sync")
+    def sync_work():
+        with span("threaded"):
+            return {"ok": True}
+
+    with caplog.at_level(logging.INFO, logger="src.utils.timing"):
+        with TestClient(app) as client:
+            response = client.get("/work")
+            sync_response = client.get("/sync")
+
+    metrics = _parse_server_timing(response.headers["server-timing"])
+    assert list(metrics) == ["inner", "outer", "total"]
+    assert metrics["total"] >= metrics["outer"] >= metrics["inner"] >= 0
+    assert "threaded" in _parse_server_timing(sync_response.headers["server-timing"])
+
+    records = [json.loads(r.getMessage()) for r in caplog.records if r.name == "src.utils.timing"]
+    assert records[0]["event"] == "request_timing"
+    assert records[0]["path"] == "/work"
+    assert records[0]["status"] == 200
+    assert records[0]["spans"]["inner"]["count"] == 2
+    assert records[0]["spans"]["inner"]["depth"] == 1
+    assert records[0]["spans"]["outer"]["depth"] == 0
+    assert current_recorder() is None
+
+
+def test_daily_endpoint_stages(monkeypatch, stub_router_client):
+    from benchmarks.suite import saju_calculator
+    from src.api import daily as api
+
+    with saju_calculator("stub"), stub_router_client(api, middleware=[ServerTimingMiddleware]) as client:
+        response = client.get("/api/daily/2026-01-20?role=student", headers={"Authorization": "Bearer token"})
+
+    assert response.status_code == 200
+    metrics = _parse_server_timing(response.headers["server-timing"])
+    for stage in ("auth", "profile", "saju", "saju_node", "fortune", "qimen",
+                  "assembly", "assembly_lifestyle", "translation", "total"):
+        assert stage in metrics, stage
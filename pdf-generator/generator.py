@@ -3,28 +3,73 @@ PDF Generator for R³ Diary System
 Uses WeasyPrint and Jinja2 to convert HTML templates to PDF
 """
 from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
-from typing import Dict, Any, Optional
+from weasyprint.text.fonts import FontConfiguration
+from jinja2 import Environment, FileSystemLoader, Template
+from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
 from datetime import datetime
+import logging
 import markdown
 import re
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _empty_daily_content() -> Dict[str, Any]:
+    """DAILY_CONTENT_SCHEMA 형태의 빈 콘텐츠 (템플릿이 참조하는 모든 필드 포함)"""
+    return {
+        'date': '',
+        'summary': '',
+        'keywords': [],
+        'rhythm_description': '',
+        'focus_caution': {'focus': [], 'caution': []},
+        'action_guide': {'do': [], 'avoid': []},
+        'time_direction': {
+            'good_time': '',
+            'avoid_time': '',
+            'good_direction': '',
+            'avoid_direction': ''
+        },
+        'state_trigger': {'gesture': '', 'phrase': '', 'how_to': ''},
+        'meaning_shift': '',
+        'rhythm_question': ''
+    }
 
 
 class PDFGenerator:
     """PDF generation engine for diary pages"""
 
-    def __init__(self):
+    def __init__(self, auto_reload: bool = True):
+        """
+        Args:
+            auto_reload: True면 렌더링마다 styles.css/템플릿 mtime을 확인하여
+                         변경 시 다시 로드 (개발용). False면 최초 로드 결과를 계속 사용.
+        """
         self.base_dir = Path(__file__).parent
         self.template_dir = self.base_dir / "templates"
         self.styles_path = self.base_dir / "styles.css"
+        self.auto_reload = auto_reload
 
         # Jinja2 환경 설정
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=True
+            autoescape=True,
+            auto_reload=auto_reload,
         )
 
+        # 생성기 수명 동안 재사용하는 렌더링 자원
+        # - 폰트 설정: WeasyPrint가 렌더링마다 폰트 구성을 다시 만들지 않도록 공유
+        # - 스타일시트: styles.css 파싱 결과 (mtime 변경 시 재파싱)
+        # - 템플릿: 컴파일된 Jinja2 템플릿 (파일 변경 시 재컴파일)
+        self.font_config = FontConfiguration()
+        self._stylesheets: Optional[List[CSS]] = None
+        self._styles_mtime: Optional[float] = None
+        self._templates: Dict[str, Template] = {}
+
+        # 마지막 generate_period_pdf 렌더링 통계
+        self.last_period_stats: Dict[str, Any] = {}
+
         # 역할 한글 매핑
         self.role_display_map = {
             "student": "학생",
@@ -46,23 +91,7 @@ class PDFGenerator:
             Dictionary with parsed content
         """
         lines = md_content.split('\n')
-        content = {
-            'date': '',
-            'summary': '',
-            'keywords': [],
-            'rhythm_description': '',
-            'focus_caution': {'focus': [], 'caution': []},
-            'action_guide': {'do': [], 'avoid': []},
-            'time_direction': {
-                'good_time': '',
-                'avoid_time': '',
-                'good_direction': '',
-                'avoid_direction': ''
-            },
-            'state_trigger': {'gesture': '', 'phrase': '', 'how_to': ''},
-            'meaning_shift': '',
-            'rhythm_question': ''
-        }
+        content = _empty_daily_content()
 
         current_section = None
         current_subsection = None
@@ -196,24 +225,58 @@ class PDFGenerator:
                 items.append(item)
         return items
 
+    def _get_stylesheets(self) -> List[CSS]:
+        """파싱된 스타일시트 반환 (styles.css가 바뀌었을 때만 다시 파싱)"""
+        if self._stylesheets is not None and not self.auto_reload:
+            return self._stylesheets
+
+        mtime = self.styles_path.stat().st_mtime
+        if self._stylesheets is None or mtime != self._styles_mtime:
+            self._stylesheets = [
+                CSS(filename=str(self.styles_path), font_config=self.font_config)
+            ]
+            self._styles_mtime = mtime
+        return self._stylesheets
+
+    def _get_template(self, name: str) -> Template:
+        """컴파일된 템플릿 반환 (auto_reload면 파일 변경 시 다시 컴파일)"""
+        template = self._templates.get(name)
+        if template is None or (self.auto_reload and not template.is_up_to_date):
+            template = self.jinja_env.get_template(name)
+            self._templates[name] = template
+        return template
+
+    def _write_pdf(self, html_content: str, output_path: Optional[str] = None) -> Union[str, bytes]:
+        """
+        HTML 문자열을 캐시된 스타일시트/폰트 설정으로 PDF 변환
+
+        output_path가 None이면 파일을 쓰지 않고 PDF bytes를 반환합니다.
+        """
+        pdf = HTML(string=html_content, base_url=str(self.base_dir)).write_pdf(
+            output_path,
+            stylesheets=self._get_stylesheets(),
+            font_config=self.font_config,
+        )
+        return output_path if output_path is not None else pdf
+
     def generate_daily_pdf(
         self,
         content: Dict[str, Any],
-        output_path: str,
+        output_path: Optional[str] = None,
         role: Optional[str] = None,
         is_markdown: bool = False
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Generate daily page PDF from DailyContent
 
         Args:
             content: DailyContent 딕셔너리 (DAILY_CONTENT_SCHEMA 준수) 또는 Markdown 문자열
-            output_path: PDF 저장 경로
+            output_path: PDF 저장 경로 (None이면 메모리에서 렌더링)
             role: 역할 (student, office_worker, freelancer)
             is_markdown: True if content is Markdown string, False if dict
 
         Returns:
-            생성된 PDF 파일 경로
+            생성된 PDF 파일 경로 (output_path가 None이면 PDF bytes)
 
         Example:
             generator = PDFGenerator()
@@ -231,7 +294,7 @@ class PDFGenerator:
                 raise ValueError("When is_markdown=True, content must be a string")
 
         # 템플릿 로드
-        template = self.jinja_env.get_template("daily.html")
+        template = self._get_template("daily.html")
 
         # 템플릿 변수 준비
         template_vars = {
@@ -245,29 +308,24 @@ class PDFGenerator:
         html_content = template.render(**template_vars)
 
         # PDF 생성
-        HTML(string=html_content, base_url=str(self.base_dir)).write_pdf(
-            output_path,
-            stylesheets=[CSS(filename=str(self.styles_path))]
-        )
-
-        return output_path
+        return self._write_pdf(html_content, output_path)
 
     def generate_monthly_pdf(
         self,
         content: Dict[str, Any],
-        output_path: str,
+        output_path: Optional[str] = None,
         role: Optional[str] = None
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Generate monthly page PDF
 
         Args:
             content: MonthlyContent 딕셔너리
-            output_path: PDF 저장 경로
+            output_path: PDF 저장 경로 (None이면 메모리에서 렌더링)
             role: 역할 (student, office_worker, freelancer)
 
         Returns:
-            생성된 PDF 파일 경로
+            생성된 PDF 파일 경로 (output_path가 None이면 PDF bytes)
 
         Example:
             generator = PDFGenerator()
@@ -278,7 +336,7 @@ class PDFGenerator:
             )
         """
         # 템플릿 로드
-        template = self.jinja_env.get_template("monthly.html")
+        template = self._get_template("monthly.html")
 
         # 템플릿 변수 준비
         template_vars = {
@@ -292,12 +350,81 @@ class PDFGenerator:
         html_content = template.render(**template_vars)
 
         # PDF 생성
-        HTML(string=html_content, base_url=str(self.base_dir)).write_pdf(
-            output_path,
-            stylesheets=[CSS(filename=str(self.styles_path))]
+        return self._write_pdf(html_content, output_path)
+
+    def generate_period_pdf(
+        self,
+        contents: List[Dict[str, Any]],
+        output_path: Optional[str] = None,
+        role: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> Union[str, bytes]:
+        """
+        Generate many daily pages as one PDF document
+
+        날짜마다 generate_daily_pdf를 호출하면 HTML 레이아웃, 스타일 캐스케이드,
+        폰트 설정을 매번 반복합니다. 이 메서드는 모든 날짜를 period.html 한 문서에
+        (daily_body.html 반복 + 페이지 나눔) 넣어 한 번에 렌더링합니다.
+
+        렌더링 통계는 self.last_period_stats에 기록됩니다:
+        days, pages, seconds, pages_per_second
+
+        Args:
+            contents: DailyContent 딕셔너리 리스트 (날짜 순서)
+            output_path: PDF 저장 경로 (None이면 메모리에서 렌더링)
+            role: 역할 (student, office_worker, freelancer)
+            title: 문서 제목 (None이면 "첫 날짜 ~ 마지막 날짜")
+
+        Returns:
+            생성된 PDF 파일 경로 (output_path가 None이면 PDF bytes)
+
+        Example:
+            generator = PDFGenerator()
+            pdf_path = generator.generate_period_pdf(
+                contents=[day1, day2, ...],
+                output_path="output/2026-01_daily.pdf",
+                role="student"
+            )
+        """
+        if not contents:
+            raise ValueError("contents must contain at least one day")
+
+        # 일부 필드가 없는 콘텐츠(생성 실패 자리표시 등)도 렌더링되도록 기본값 채움
+        pages = [{**_empty_daily_content(), **content} for content in contents]
+        if title is None:
+            title = f"{pages[0]['date']} ~ {pages[-1]['date']}"
+
+        start = time.perf_counter()
+
+        template = self._get_template("period.html")
+        html_content = template.render(
+            contents=pages,
+            title=title,
+            role=role,
+            role_display=self.role_display_map.get(role, ""),
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M")
+        )
+
+        document = HTML(string=html_content, base_url=str(self.base_dir)).render(
+            stylesheets=self._get_stylesheets(),
+            font_config=self.font_config,
+        )
+        pdf = document.write_pdf(output_path)
+
+        seconds = time.perf_counter() - start
+        page_count = len(document.pages)
+        self.last_period_stats = {
+            "days": len(pages),
+            "pages": page_count,
+            "seconds": round(seconds, 3),
+            "pages_per_second": round(page_count / seconds, 2) if seconds > 0 else 0.0,
+        }
+        logger.info(
+            f"Period PDF rendered: {len(pages)} days, {page_count} pages, "
+            f"{seconds:.2f}s ({self.last_period_stats['pages_per_second']} pages/s)"
         )
 
-        return output_path
+        return output_path if output_path is not None else pdf
 
     def generate_from_content_model(
         self,
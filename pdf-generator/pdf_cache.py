@@ -0,0 +1,327 @@
+"""
+Content-Addressed PDF Cache for R³ Diary System
+
+같은 사용자/역할/날짜의 PDF를 다운로드할 때마다 다시 렌더링하지 않도록
+렌더링 결과를 콘텐츠 해시로 저장합니다.
+
+캐시 키 = SHA-256(생성기 메서드, 조합된 콘텐츠 등 렌더링 인자, 역할, 템플릿 버전, CSS 버전)
+- 템플릿/CSS 파일이 바뀌면 버전 해시가 바뀌어 자연히 새 키가 됩니다.
+
+백엔드:
+- LocalPDFCache: 로컬 디렉토리, 총 용량 상한 LRU 제거
+- S3PDFCache: S3 호환 오브젝트 스토리지 (boto3 필요, 선택)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from render_pool import PDFOutput
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent
+TEMPLATE_DIR = BASE_DIR / "templates"
+STYLES_PATH = BASE_DIR / "styles.css"
+
+
+# ----------------------------------------------------------------------
+# 캐시 키
+# ----------------------------------------------------------------------
+
+_version_memo: Dict[str, Any] = {}
+_version_lock = threading.Lock()
+
+
+def _file_set_version(paths) -> str:
+    """파일 목록 내용 해시 (mtime이 바뀐 경우에만 다시 계산)"""
+    paths = sorted(paths)
+    stamp = tuple((str(p), p.stat().st_mtime_ns) for p in paths)
+    key = "|".join(str(p) for p in paths)
+    with _version_lock:
+        memo = _version_memo.get(key)
+        if memo and memo[0] == stamp:
+            return memo[1]
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    version = digest.hexdigest()[:16]
+    with _version_lock:
+        _version_memo[key] = (stamp, version)
+    return version
+
+
+def template_version() -> str:
+    """templates/ 디렉토리 전체의 내용 해시"""
+    return _file_set_version(TEMPLATE_DIR.glob("*.html"))
+
+
+def css_version() -> str:
+    """styles.css 내용 해시"""
+    return _file_set_version([STYLES_PATH])
+
+
+def pdf_cache_key(method: str, role: Optional[str] = None, **render_args) -> str:
+    """
+    PDF 캐시 키 계산
+
+    Args:
+        method: PDFGenerator 메서드 이름 (generate_daily_pdf 등)
+        role: 역할
+        **render_args: 나머지 렌더링 인자 (content/contents, is_markdown, title 등)
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    payload = {
+        "method": method,
+        "role": role,
+        "args": render_args,
+        "template_version": template_version(),
+        "css_version": css_version(),
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------------------------
+# 백엔드
+# ----------------------------------------------------------------------
+
+class PDFCacheBackend(ABC):
+    """PDF 캐시 백엔드 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 PDF (없으면 None)"""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """PDF 저장"""
+
+    def put_file(self, key: str, path: str) -> None:
+        """파일로 렌더링된(큰) PDF 저장"""
+        with open(path, "rb") as f:
+            self.put(key, f.read())
+
+
+class LocalPDFCache(PDFCacheBackend):
+    """
+    로컬 디렉토리 PDF 캐시 (총 용량 상한 LRU)
+
+    Args:
+        directory: 캐시 디렉토리
+        max_bytes: 총 용량 상한 (초과 시 가장 오래 사용하지 않은 PDF부터 삭제)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = 0
+        # key -> size, 오래 사용하지 않은 순서 (재시작 시 mtime으로 복원)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        entries = sorted(self.directory.glob("*.pdf"), key=lambda p: p.stat().st_mtime)
+        for path in entries:
+            size = path.stat().st_size
+            self._index[path.stem] = size
+            self._total += size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # 재시작 후에도 LRU 순서 유지
+            return data
+        except FileNotFoundError:
+            with self._lock:
+                self._total -= self._index.pop(key, 0)
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        tmp = self.directory / f".{key}.{threading.get_ident()}.tmp"
+        tmp.write_bytes(data)
+        self._commit(key, tmp, len(data))
+
+    def put_file(self, key: str, path: str) -> None:
+        tmp = self.directory / f".{key}.{threading.get_ident()}.tmp"
+        shutil.copyfile(path, tmp)
+        self._commit(key, tmp, tmp.stat().st_size)
+
+    def _commit(self, key: str, tmp: Path, size: int) -> None:
+        """임시 파일을 원자적으로 교체하고 용량 상한까지 LRU 제거"""
+        os.replace(tmp, self._path(key))
+        with self._lock:
+            self._total += size - self._index.pop(key, 0)
+            self._index[key] = size
+            evicted = []
+            while self._total > self.max_bytes and len(self._index) > 1:
+                old_key, old_size = self._index.popitem(last=False)
+                self._total -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                self._path(old_key).unlink()
+            except FileNotFoundError:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+
+class S3PDFCache(PDFCacheBackend):
+    """
+    S3 호환 오브젝트 스토리지 PDF 캐시
+
+    용량 관리는 버킷 수명 주기 규칙(lifecycle)에 맡깁니다.
+
+    Args:
+        bucket: 버킷 이름
+        prefix: 키 접두사
+        client: boto3 S3 클라이언트 (None이면 endpoint_url로 생성)
+        endpoint_url: S3 호환 엔드포인트 (R2, MinIO 등)
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "pdf-cache/",
+        client: Any = None,
+        endpoint_url: Optional[str] = None,
+    ):
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError("S3PDFCache를 사용하려면 boto3를 설치하세요") from e
+            client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}.pdf"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as e:
+            # botocore ClientError(NoSuchKey/404) 및 네트워크 오류는 캐시 미스로 처리
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code not in ("NoSuchKey", "404"):
+                logger.warning(f"PDF 캐시 조회 실패: {e}")
+            return None
+        return response["Body"].read()
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(key),
+            Body=data,
+            ContentType="application/pdf",
+        )
+
+
+# ----------------------------------------------------------------------
+# 렌더링 연동
+# ----------------------------------------------------------------------
+
+async def render_with_cache(
+    pool: Any,
+    cache: Optional[PDFCacheBackend],
+    method: str,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> PDFOutput:
+    """
+    캐시에 있으면 반환하고, 없으면 렌더링 후 저장
+
+    캐시 조회/저장 오류는 렌더링을 막지 않습니다.
+
+    Args:
+        pool: PDFRenderPool
+        cache: 캐시 백엔드 (None이면 캐시 없이 렌더링)
+        method: PDFGenerator 메서드 이름
+        timeout: 렌더링 타임아웃 (None이면 풀 기본값, 캐시 키에는 포함되지 않음)
+        **kwargs: 렌더링 인자 (content, role, is_markdown 등)
+
+    Returns:
+        PDFOutput
+    """
+    if cache is None:
+        return await pool.render(method, timeout=timeout, **kwargs)
+
+    key = pdf_cache_key(method, **kwargs)
+    try:
+        data = await asyncio.to_thread(cache.get, key)
+    except Exception as e:
+        logger.warning(f"PDF 캐시 조회 실패: {e}")
+        data = None
+    if data is not None:
+        return PDFOutput(size=len(data), data=data)
+
+    output = await pool.render(method, timeout=timeout, **kwargs)
+    try:
+        if output.data is not None:
+            await asyncio.to_thread(cache.put, key, output.data)
+        elif output.path:
+            await asyncio.to_thread(cache.put_file, key, output.path)
+    except Exception as e:
+        logger.warning(f"PDF 캐시 저장 실패: {e}")
+    return output
+
+
+_pdf_cache: Optional[PDFCacheBackend] = None
+_pdf_cache_loaded = False
+_pdf_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> Optional[PDFCacheBackend]:
+    """
+    프로세스 전역 PDF 캐시 (최초 호출 시 환경변수로 설정)
+
+    - PDF_CACHE_BACKEND: local (기본) | s3 | none
+    - PDF_CACHE_DIR: 로컬 캐시 디렉토리 (기본 {tmp}/r3_pdf_cache)
+    - PDF_CACHE_MAX_BYTES: 로컬 캐시 용량 상한 (기본 2GB)
+    - PDF_CACHE_S3_BUCKET / PDF_CACHE_S3_PREFIX / PDF_CACHE_S3_ENDPOINT
+    """
+    global _pdf_cache, _pdf_cache_loaded
+    with _pdf_cache_lock:
+        if _pdf_cache_loaded:
+            return _pdf_cache
+
+        backend = os.getenv("PDF_CACHE_BACKEND", "local").lower()
+        if backend == "local":
+            _pdf_cache = LocalPDFCache(
+                os.getenv("PDF_CACHE_DIR", str(Path(tempfile.gettempdir()) / "r3_pdf_cache")),
+                max_bytes=int(os.getenv("PDF_CACHE_MAX_BYTES", str(2 * 1024 ** 3))),
+            )
+        elif backend == "s3":
+            _pdf_cache = S3PDFCache(
+                bucket=os.environ["PDF_CACHE_S3_BUCKET"],
+                prefix=os.getenv("PDF_CACHE_S3_PREFIX", "pdf-cache/"),
+                endpoint_url=os.getenv("PDF_CACHE_S3_ENDPOINT") or None,
+            )
+        else:
+            _pdf_cache = None
+        _pdf_cache_loaded = True
+        return _pdf_cache
@@ -0,0 +1,326 @@
+"""
+Asynchronous PDF Job Store for R³ Diary System
+
+월간/기간/고객 배치 PDF는 렌더링이 길어 동기 요청이 프록시에서 시간 초과됩니다.
+이 모듈은 렌더링을 백그라운드 작업으로 실행하고 상태를 저장합니다:
+
+- POST로 작업 생성 → job_id 반환 (202)
+- GET으로 상태/진행률 조회
+- 완료 후 GET으로 결과 PDF 다운로드
+
+작업 메타데이터(JSON)와 결과 PDF는 로컬 디렉토리에 저장되어
+같은 호스트에서는 재시작 후에도 조회할 수 있습니다.
+렌더링 자체는 PDFRenderPool 워커에서 실행됩니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from render_pool import PDFOutput, PDFQueueFullError
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+# 진행률 보고 콜백: report(progress 0~1, message)
+ProgressCallback = Callable[[float, str], None]
+
+# 작업 본문: 진행률 콜백을 받아 렌더링 결과를 반환하는 코루틴 함수
+JobBuilder = Callable[[ProgressCallback], Awaitable[PDFOutput]]
+
+
+class PDFJobLimitError(Exception):
+    """사용자별 동시 작업 수 초과"""
+
+
+@dataclass
+class PDFJob:
+    """
+    PDF 렌더링 작업 상태
+
+    Attributes:
+        id: 작업 ID
+        owner: 작업을 만든 사용자 ID
+        kind: 작업 종류 (monthly, customer_monthly, customer_period)
+        filename: 다운로드 파일명
+        status: queued | running | succeeded | failed
+        progress: 진행률 (0~1)
+        message: 현재 단계 설명
+        size: 결과 PDF 크기 (bytes)
+        error: 실패 사유
+    """
+    id: str
+    owner: str
+    kind: str
+    filename: str
+    status: str = JOB_QUEUED
+    progress: float = 0.0
+    message: str = "대기 중"
+    size: int = 0
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class LocalJobStore:
+    """
+    로컬 디렉토리 작업 저장소
+
+    {directory}/{job_id}.json 에 메타데이터, {job_id}.pdf 에 결과를 저장합니다.
+
+    Args:
+        directory: 저장 디렉토리
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, PDFJob] = {}
+        self._load()
+
+    def _meta_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def result_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.pdf"
+
+    def _load(self) -> None:
+        """저장된 작업 복원 (실행 중이던 작업은 재시작으로 중단된 것으로 처리)"""
+        for path in self.directory.glob("*.json"):
+            try:
+                job = PDFJob(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                continue
+            if job.is_active:
+                job.status = JOB_FAILED
+                job.error = "서버 재시작으로 작업이 중단되었습니다."
+                self._write(job)
+            self._jobs[job.id] = job
+
+    def _write(self, job: PDFJob) -> None:
+        tmp = self.directory / f".{job.id}.{threading.get_ident()}.tmp"
+        tmp.write_text(json.dumps(job.to_dict(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self._meta_path(job.id))
+
+    def save(self, job: PDFJob) -> None:
+        job.updated_at = time.time()
+        with self._lock:
+            self._jobs[job.id] = job
+        self._write(job)
+
+    def get(self, job_id: str) -> Optional[PDFJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_for_owner(self, owner: str) -> List[PDFJob]:
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.owner == owner]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def store_result(self, job: PDFJob, output: PDFOutput) -> None:
+        """렌더링 결과를 작업 결과 파일로 저장 (임시 파일은 이동)"""
+        target = self.result_path(job.id)
+        if output.path:
+            shutil.move(output.path, target)
+        else:
+            tmp = self.directory / f".{job.id}.pdf.tmp"
+            tmp.write_bytes(output.data)
+            os.replace(tmp, target)
+        job.size = output.size
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        for path in (self._meta_path(job_id), self.result_path(job_id)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def cleanup(self, max_age: float) -> int:
+        """
+        끝난 지 오래된 작업과 결과 파일 삭제
+
+        Args:
+            max_age: 완료/실패 후 보관 시간 (초)
+
+        Returns:
+            삭제한 작업 수
+        """
+        cutoff = time.time() - max_age
+        with self._lock:
+            expired = [
+                job.id for job in self._jobs.values()
+                if not job.is_active and job.updated_at < cutoff
+            ]
+        for job_id in expired:
+            self.delete(job_id)
+        return len(expired)
+
+
+class PDFJobManager:
+    """
+    PDF 작업 실행 관리자
+
+    Args:
+        store: 작업 저장소
+        max_active_per_user: 사용자별 동시(대기+실행) 작업 상한
+        result_ttl: 끝난 작업 보관 시간 (초)
+        queue_retry_delay: 렌더링 풀 대기열이 가득 찼을 때 재시도 간격 (초)
+        queue_retries: 대기열 초과 재시도 횟수
+
+    Example:
+        job = manager.create(user_id, "monthly", "R3_Diary_2026_01.pdf", build)
+        manager.get(job.id).progress
+    """
+
+    def __init__(
+        self,
+        store: LocalJobStore,
+        max_active_per_user: int = 2,
+        result_ttl: float = 24 * 3600,
+        queue_retry_delay: float = 5.0,
+        queue_retries: int = 12,
+    ):
+        self.store = store
+        self.max_active_per_user = max_active_per_user
+        self.result_ttl = result_ttl
+        self.queue_retry_delay = queue_retry_delay
+        self.queue_retries = queue_retries
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def create(self, owner: str, kind: str, filename: str, build: JobBuilder) -> PDFJob:
+        """
+        작업 생성 및 백그라운드 실행 (이벤트 루프 안에서 호출)
+
+        Args:
+            owner: 사용자 ID
+            kind: 작업 종류
+            filename: 다운로드 파일명
+            build: 진행률 콜백을 받아 PDFOutput을 반환하는 코루틴 함수
+
+        Returns:
+            생성된 작업 (queued)
+
+        Raises:
+            PDFJobLimitError: 사용자별 동시 작업 수 초과
+        """
+        self.store.cleanup(self.result_ttl)
+
+        active = [job for job in self.store.list_for_owner(owner) if job.is_active]
+        if len(active) >= self.max_active_per_user:
+            raise PDFJobLimitError(
+                f"진행 중인 PDF 작업이 {len(active)}개 있습니다 (최대 {self.max_active_per_user}개)"
+            )
+
+        job = PDFJob(id=uuid.uuid4().hex, owner=owner, kind=kind, filename=filename)
+        self.store.save(job)
+        task = asyncio.create_task(self._run(job, build))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    def get(self, job_id: str, owner: Optional[str] = None) -> Optional[PDFJob]:
+        """작업 조회 (owner가 주어지면 소유자가 다른 작업은 None)"""
+        job = self.store.get(job_id)
+        if job is None or (owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def result_path(self, job: PDFJob) -> Optional[str]:
+        """완료된 작업의 결과 파일 경로"""
+        if job.status != JOB_SUCCEEDED:
+            return None
+        path = self.store.result_path(job.id)
+        return str(path) if path.exists() else None
+
+    async def _run(self, job: PDFJob, build: JobBuilder) -> None:
+        def report(progress: float, message: str) -> None:
+            job.progress = max(job.progress, min(progress, 1.0))
+            job.message = message
+            self.store.save(job)
+
+        job.status = JOB_RUNNING
+        report(0.0, "시작")
+        try:
+            for attempt in range(self.queue_retries + 1):
+                try:
+                    output = await build(report)
+                    break
+                except PDFQueueFullError:
+                    # 비동기 작업은 503 대신 풀에 자리가 날 때까지 기다립니다.
+                    if attempt == self.queue_retries:
+                        raise
+                    report(job.progress, "렌더링 대기 중")
+                    await asyncio.sleep(self.queue_retry_delay)
+
+            await asyncio.to_thread(self.store.store_result, job, output)
+            job.status = JOB_SUCCEEDED
+            report(1.0, "완료")
+        except Exception as e:
+            logger.error(f"PDF 작업 실패 ({job.id}, {job.kind}): {e}", exc_info=True)
+            job.status = JOB_FAILED
+            # HTTPException 등은 detail에 사용자용 메시지가 있습니다.
+            job.error = str(getattr(e, "detail", "") or e) or e.__class__.__name__
+            self.store.save(job)
+
+    async def shutdown(self) -> None:
+        """실행 중인 작업 취소 (애플리케이션 종료 시)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_job_manager: Optional[PDFJobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> PDFJobManager:
+    """
+    프로세스 전역 PDF 작업 관리자 (최초 호출 시 환경변수로 설정)
+
+    - PDF_JOB_DIR: 작업 저장 디렉토리 (기본 {tmp}/r3_pdf_jobs)
+    - PDF_JOB_MAX_PER_USER: 사용자별 동시 작업 상한 (기본 2)
+    - PDF_JOB_RESULT_TTL: 끝난 작업 보관 시간 (초, 기본 86400)
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = PDFJobManager(
+                LocalJobStore(os.getenv("PDF_JOB_DIR", str(Path(tempfile.gettempdir()) / "r3_pdf_jobs"))),
+                max_active_per_user=int(os.getenv("PDF_JOB_MAX_PER_USER", "2")),
+                result_ttl=float(os.getenv("PDF_JOB_RESULT_TTL", str(24 * 3600))),
+            )
+        return _job_manager
+
+
+async def shutdown_job_manager() -> None:
+    """전역 작업 관리자의 실행 중인 작업 취소"""
+    global _job_manager
+    with _job_manager_lock:
+        manager, _job_manager = _job_manager, None
+    if manager is not None:
+        await manager.shutdown()
@@ -0,0 +1,356 @@
+"""
+PDF Render Worker Pool for R³ Diary System
+
+WeasyPrint 렌더링(HTML(...).write_pdf)은 CPU를 수 초간 점유하므로
+async 핸들러에서 직접 호출하면 이벤트 루프 전체가 멈춥니다.
+
+이 모듈은 렌더링 전용 프로세스 풀을 제공합니다:
+- 워커 프로세스마다 PDFGenerator를 한 번만 생성
+- 대기열 상한 (초과 시 PDFQueueFullError → 503)
+- 작업별 타임아웃 (초과 시 PDFRenderTimeoutError → 504, 풀 재생성)
+- N개 작업 후 워커 교체 (WeasyPrint 메모리 증가 억제)
+- 메모리 렌더링: PDF bytes를 바로 반환하고, spill_threshold를 넘는
+  큰 문서만 임시 파일로 내려 경로를 반환 (PDFOutput)
+
+WeasyPrint는 워커 프로세스 안에서만 import하므로
+이 모듈 자체는 WeasyPrint 없이도 import할 수 있습니다.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 임시 파일로 내릴 PDF 크기 기준 (기본 8MB)
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024
+
+# 큰 PDF 임시 파일 디렉토리 (응답 전송 후 삭제, 남은 파일은 풀 생성 시 정리)
+SPILL_DIR = Path(tempfile.gettempdir()) / "r3_pdf_spill"
+
+
+class PDFRenderError(Exception):
+    """PDF 렌더링 실패"""
+
+
+class PDFQueueFullError(PDFRenderError):
+    """렌더링 대기열이 가득 참"""
+
+
+class PDFRenderTimeoutError(PDFRenderError):
+    """렌더링 작업 시간 초과"""
+
+
+@dataclass
+class PDFOutput:
+    """
+    렌더링 결과
+
+    data와 path 중 하나만 채워집니다.
+    path가 있으면 호출자가 전송 후 삭제해야 합니다.
+    """
+    size: int
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+
+# ----------------------------------------------------------------------
+# 워커 프로세스 측
+# ----------------------------------------------------------------------
+
+_worker_generator = None
+
+
+def _default_generator_factory():
+    """워커 프로세스에서 PDFGenerator 생성 (WeasyPrint import 포함)"""
+    from generator import PDFGenerator
+    # 운영 환경에서는 스타일시트/템플릿 mtime 확인 생략
+    return PDFGenerator(auto_reload=os.getenv("ENVIRONMENT", "development") != "production")
+
+
+def _init_worker(generator_factory: Callable[[], Any]) -> None:
+    """워커 프로세스 초기화: 생성기 인스턴스를 프로세스 수명 동안 재사용"""
+    global _worker_generator
+    _worker_generator = generator_factory()
+
+
+def _run_job(method: str, kwargs: Dict[str, Any]) -> Any:
+    """워커 프로세스에서 생성기 메서드 실행"""
+    return getattr(_worker_generator, method)(**kwargs)
+
+
+def _run_render_job(method: str, kwargs: Dict[str, Any], spill_threshold: int) -> PDFOutput:
+    """워커 프로세스에서 메모리 렌더링 (큰 문서는 임시 파일로 내려 경로만 반환)"""
+    data = getattr(_worker_generator, method)(output_path=None, **kwargs)
+    if len(data) <= spill_threshold:
+        return PDFOutput(size=len(data), data=data)
+
+    SPILL_DIR.mkdir(parents=True, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=str(SPILL_DIR))
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return PDFOutput(size=len(data), path=path)
+
+
+def cleanup_spill_files(max_age: float = 3600.0) -> int:
+    """
+    전송되지 못하고 남은 임시 PDF 파일 정리
+
+    Args:
+        max_age: 이 시간(초)보다 오래된 파일 삭제
+
+    Returns:
+        삭제한 파일 수
+    """
+    if not SPILL_DIR.exists():
+        return 0
+    removed = 0
+    cutoff = time.time() - max_age
+    for path in SPILL_DIR.glob("*.pdf"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+# ----------------------------------------------------------------------
+# 이벤트 루프 측
+# ----------------------------------------------------------------------
+
+class PDFRenderPool:
+    """
+    PDF 렌더링 전용 프로세스 풀
+
+    Args:
+        max_workers: 워커 프로세스 수
+        max_queue: 실행 중 + 대기 중 작업 상한
+        job_timeout: 작업별 타임아웃 (초)
+        max_jobs_per_worker: 워커 교체 주기 (작업 수)
+        spill_threshold: 이 크기(bytes)를 넘는 PDF는 임시 파일로 반환
+        generator_factory: 워커에서 생성기를 만드는 함수 (pickle 가능한 최상위 함수)
+
+    Example:
+        pool = PDFRenderPool(max_workers=2)
+        output = await pool.render_daily(content=content, role="student")
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        job_timeout: float = 60.0,
+        max_jobs_per_worker: int = 50,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        generator_factory: Callable[[], Any] = _default_generator_factory,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.job_timeout = job_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.spill_threshold = spill_threshold
+        self.generator_factory = generator_factory
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._stats = {"completed": 0, "failed": 0, "timeouts": 0, "rejected": 0, "restarts": 0}
+
+    # -- 풀 관리 --------------------------------------------------------
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # max_tasks_per_child는 spawn 계열 시작 방식에서만 지원됩니다.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.generator_factory,),
+                    max_tasks_per_child=self.max_jobs_per_worker,
+                )
+            return self._executor
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """멈춘 워커를 종료하고 다음 작업부터 새 풀 사용"""
+        with self._lock:
+            if self._executor is not broken:
+                return  # 이미 다른 작업이 재생성함
+            self._executor = None
+            self._stats["restarts"] += 1
+
+        # 실행 중인 작업은 취소할 수 없으므로 프로세스를 직접 종료합니다.
+        processes = list((getattr(broken, "_processes", None) or {}).values())
+        broken.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def shutdown(self) -> None:
+        """풀 종료 (애플리케이션 종료 시 호출)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        """풀 상태 (대기 작업 수, 누적 통계)"""
+        return {"pending": self._pending, "max_queue": self.max_queue, **self._stats}
+
+    # -- 작업 제출 ------------------------------------------------------
+
+    async def submit(self, method: str, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        워커에서 생성기 메서드를 실행하고 결과를 기다림 (이벤트 루프 비차단)
+
+        Args:
+            method: PDFGenerator 메서드 이름 (generate_daily_pdf 등)
+            timeout: 작업 타임아웃 (None이면 job_timeout)
+            **kwargs: 메서드 인자 (pickle 가능해야 함)
+
+        Returns:
+            메서드 반환값
+
+        Raises:
+            PDFQueueFullError: 대기열 초과
+            PDFRenderTimeoutError: 시간 초과
+            PDFRenderError: 워커 비정상 종료
+        """
+        return await self._dispatch(_run_job, (method, kwargs), timeout)
+
+    async def render(self, method: str, timeout: Optional[float] = None, **kwargs) -> PDFOutput:
+        """
+        워커에서 메모리 렌더링 (output_path 없이 호출)
+
+        Args:
+            method: PDFGenerator 메서드 이름
+            timeout: 작업 타임아웃 (None이면 job_timeout)
+            **kwargs: output_path를 제외한 메서드 인자
+
+        Returns:
+            PDFOutput (spill_threshold 초과 시 path, 아니면 data)
+
+        Raises:
+            submit()과 동일
+        """
+        return await self._dispatch(_run_render_job, (method, kwargs, self.spill_threshold), timeout)
+
+    async def _dispatch(self, fn: Callable[..., Any], args: tuple, timeout: Optional[float]) -> Any:
+        """대기열 상한/타임아웃/재시도를 적용하여 워커에서 fn(*args) 실행"""
+        with self._lock:
+            if self._pending >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise PDFQueueFullError(f"PDF 렌더링 대기열이 가득 찼습니다 ({self.max_queue})")
+            self._pending += 1
+
+        timeout = self.job_timeout if timeout is None else timeout
+        try:
+            # 다른 작업의 타임아웃으로 풀이 재생성되면 한 번만 재시도
+            for attempt in range(2):
+                executor = self._get_executor()
+                future = asyncio.wrap_future(executor.submit(fn, *args))
+                try:
+                    result = await asyncio.wait_for(future, timeout=timeout)
+                except asyncio.TimeoutError:
+                    self._stats["timeouts"] += 1
+                    self._restart(executor)
+                    raise PDFRenderTimeoutError(f"PDF 렌더링 시간 초과 ({timeout}초)")
+                except BrokenProcessPool:
+                    self._restart(executor)
+                    if attempt == 0:
+                        continue
+                    raise PDFRenderError("PDF 렌더링 워커가 비정상 종료되었습니다")
+                self._stats["completed"] += 1
+                return result
+        except PDFRenderError:
+            self._stats["failed"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def render_daily(
+        self,
+        content: Any,
+        role: Optional[str] = None,
+        is_markdown: bool = False,
+    ) -> PDFOutput:
+        """PDFGenerator.generate_daily_pdf를 워커에서 메모리 렌더링"""
+        return await self.render(
+            "generate_daily_pdf",
+            content=content,
+            role=role,
+            is_markdown=is_markdown,
+        )
+
+    async def render_monthly(
+        self,
+        content: Dict[str, Any],
+        role: Optional[str] = None,
+    ) -> PDFOutput:
+        """PDFGenerator.generate_monthly_pdf를 워커에서 메모리 렌더링"""
+        return await self.render(
+            "generate_monthly_pdf",
+            content=content,
+            role=role,
+        )
+
+    async def render_period(
+        self,
+        contents: List[Dict[str, Any]],
+        role: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> PDFOutput:
+        """PDFGenerator.generate_period_pdf를 워커에서 메모리 렌더링 (여러 날짜를 한 문서로)"""
+        return await self.render(
+            "generate_period_pdf",
+            contents=contents,
+            role=role,
+            title=title,
+        )
+
+
+_render_pool: Optional[PDFRenderPool] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> PDFRenderPool:
+    """
+    프로세스 전역 렌더링 풀 (최초 호출 시 환경변수로 설정)
+
+    - PDF_POOL_WORKERS (기본 2)
+    - PDF_POOL_MAX_QUEUE (기본 16)
+    - PDF_JOB_TIMEOUT (초, 기본 60)
+    - PDF_WORKER_MAX_JOBS (기본 50)
+    - PDF_SPILL_THRESHOLD_BYTES (기본 8MB)
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # 이전 프로세스가 남긴 임시 파일 정리
+            cleanup_spill_files()
+            _render_pool = PDFRenderPool(
+                max_workers=int(os.getenv("PDF_POOL_WORKERS", "2")),
+                max_queue=int(os.getenv("PDF_POOL_MAX_QUEUE", "16")),
+                job_timeout=float(os.getenv("PDF_JOB_TIMEOUT", "60")),
+                max_jobs_per_worker=int(os.getenv("PDF_WORKER_MAX_JOBS", "50")),
+                spill_threshold=int(os.getenv("PDF_SPILL_THRESHOLD_BYTES", str(DEFAULT_SPILL_THRESHOLD))),
+            )
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """전역 렌더링 풀 종료 (생성된 경우에만)"""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown()